@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Niveles de Análisis
+Selección del nivel de análisis (quick / standard / deep) según tamaño y complejidad
+
+- quick: solo estructura y metadatos de accessors (conteos, vértices, triángulos)
+- standard: agrega análisis de nombres (elementos de prenda, tallas) y materiales
+- deep: agrega geometría, texturas y costuras
+
+El nivel se elige automáticamente con el tamaño del archivo y el número de
+elementos; se puede forzar por parámetro o con la variable de entorno
+MOVING_ANALYSIS_TIER. Con un presupuesto de latencia (subidas interactivas) los
+niveles superiores solo se ejecutan si el presupuesto no se agotó.
+"""
+
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+TIER_ENV_VAR = 'MOVING_ANALYSIS_TIER'
+
+QUICK = 'quick'
+STANDARD = 'standard'
+DEEP = 'deep'
+TIERS = (QUICK, STANDARD, DEEP)
+
+# Presupuesto de latencia de las subidas interactivas (segundos)
+INTERACTIVE_LATENCY_BUDGET = 5.0
+
+TIER_LABELS = {
+    QUICK: 'Screening rápido',
+    STANDARD: 'Estándar',
+    DEEP: 'Profundo'
+}
+
+def tier_rank(tier: str) -> int:
+    return TIERS.index(tier)
+
+def normalize_tier(value: Optional[str]) -> Optional[str]:
+    """Validar un nivel pedido; None, '' o 'auto' significan selección automática"""
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if value in ('', 'auto'):
+        return None
+    if value not in TIERS:
+        raise ValueError(f"Nivel de análisis desconocido: {value}. Opciones: auto, {', '.join(TIERS)}")
+    return value
+
+def tier_from_env() -> Optional[str]:
+    """Nivel forzado por MOVING_ANALYSIS_TIER"""
+    return normalize_tier(os.getenv(TIER_ENV_VAR))
+
+@dataclass
+class TierThresholds:
+    """Límites de la selección automática"""
+    deep_max_mb: float = 25.0
+    standard_max_mb: float = 120.0
+    deep_max_elements: int = 5000
+    standard_max_elements: int = 50000
+
+@dataclass
+class TierDecision:
+    """Nivel elegido y motivo"""
+    tier: str
+    reason: str
+    requested: Optional[str] = None
+    budget_seconds: Optional[float] = None
+    downgraded_from: Optional[str] = None
+
+    @property
+    def automatic(self) -> bool:
+        return self.requested is None
+
+    def allows(self, tier: str) -> bool:
+        return tier_rank(self.tier) >= tier_rank(tier)
+
+    def downgrade(self, tier: str, reason: str):
+        """Bajar de nivel (p. ej. por presupuesto de latencia agotado)"""
+        if self.downgraded_from is None:
+            self.downgraded_from = self.tier
+        self.tier = tier
+        self.reason = reason
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def structure_counts(gltf_data: Dict[str, Any]) -> Dict[str, int]:
+    """Conteos de estructura y metadatos de accessors (sin leer buffers)"""
+    accessors = gltf_data.get('accessors', [])
+    primitives = 0
+    vertices = 0
+    triangles = 0
+    for mesh in gltf_data.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            primitives += 1
+            position = primitive.get('attributes', {}).get('POSITION')
+            if isinstance(position, int) and position < len(accessors):
+                vertices += accessors[position].get('count', 0)
+            # Solo modo TRIANGLES (4, por defecto)
+            if primitive.get('mode', 4) == 4:
+                indices = primitive.get('indices')
+                if isinstance(indices, int) and indices < len(accessors):
+                    triangles += accessors[indices].get('count', 0) // 3
+                elif isinstance(position, int) and position < len(accessors):
+                    triangles += accessors[position].get('count', 0) // 3
+
+    return {
+        'accessors': len(accessors),
+        'buffer_views': len(gltf_data.get('bufferViews', [])),
+        'meshes': len(gltf_data.get('meshes', [])),
+        'primitives': primitives,
+        'materials': len(gltf_data.get('materials', [])),
+        'nodes': len(gltf_data.get('nodes', [])),
+        'textures': len(gltf_data.get('textures', [])),
+        'images': len(gltf_data.get('images', [])),
+        'vertices': vertices,
+        'triangles': triangles
+    }
+
+def element_count(counts: Dict[str, int]) -> int:
+    """Elementos que recorren los análisis estándar y profundo"""
+    return sum(counts.get(key, 0) for key in ('accessors', 'primitives', 'materials', 'nodes', 'images'))
+
+def choose_tier(
+    file_size_mb: float,
+    counts: Optional[Dict[str, int]] = None,
+    requested: Optional[str] = None,
+    thresholds: TierThresholds = None,
+    budget_seconds: Optional[float] = None
+) -> TierDecision:
+    """Elegir el nivel: el pedido explícitamente o el que permiten tamaño y complejidad"""
+    requested = normalize_tier(requested)
+    if requested is not None:
+        return TierDecision(tier=requested, reason='solicitado explícitamente',
+                            requested=requested, budget_seconds=budget_seconds)
+
+    thresholds = thresholds or TierThresholds()
+    elements = element_count(counts or {})
+
+    if file_size_mb > thresholds.standard_max_mb:
+        tier, reason = QUICK, f"archivo de {file_size_mb:.1f}MB > {thresholds.standard_max_mb:.0f}MB"
+    elif elements > thresholds.standard_max_elements:
+        tier, reason = QUICK, f"{elements} elementos > {thresholds.standard_max_elements}"
+    elif file_size_mb > thresholds.deep_max_mb:
+        tier, reason = STANDARD, f"archivo de {file_size_mb:.1f}MB > {thresholds.deep_max_mb:.0f}MB"
+    elif elements > thresholds.deep_max_elements:
+        tier, reason = STANDARD, f"{elements} elementos > {thresholds.deep_max_elements}"
+    else:
+        tier, reason = DEEP, f"archivo de {file_size_mb:.1f}MB con {elements} elementos"
+
+    return TierDecision(tier=tier, reason=reason, budget_seconds=budget_seconds)
@@ -12,15 +12,54 @@ Mejoras implementadas:
 """
 
 import json
+import os
 import re
+import struct
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Optional
+from dataclasses import dataclass, field
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from analysis_tiers import DEEP, QUICK, STANDARD, choose_tier, structure_counts
+from config.logging_config import configure_logging
+from cancellation import NEVER_CANCELLED, CancellationToken
+from compact_results import GarmentElementTable, MaterialTable, SizeVariationTable
+from instrumentation import StageTimer
+from stage_cache import StageCache, fingerprint, section_fingerprints
+
+# Análisis vectorizados de metadatos CLO3D y geometría (requieren NumPy)
+try:
+    from closure_hardware import detect_closure_hardware
+    from fabric_physics import FabricPhysicsTable, join_materials
+    from gltf_buffers import GLTFBuffers
+    from primitive_analysis import PrimitiveTable
+    from scene_graph import SceneIndex
+    from seam_graph import analyze_seam_graph
+    from size_grading import analyze_size_grading
+    from texture_analysis import analyze_texture_images
+    NUMPY_ANALYSIS_AVAILABLE = True
+except ImportError:
+    NUMPY_ANALYSIS_AVAILABLE = False
+
+# Logger del módulo (la configuración la hace el punto de entrada: config.logging_config)
 logger = logging.getLogger(__name__)
 
+GLB_MAGIC = b'glTF'
+GLB_JSON_CHUNK = 0x4E4F534A
+
+def load_gltf_document(file_path: str) -> Dict[str, Any]:
+    """Cargar el JSON de un archivo .gltf o del chunk JSON de un .glb"""
+    with open(file_path, 'rb') as f:
+        if f.read(4) == GLB_MAGIC:
+            f.read(8)
+            chunk_length, chunk_type = struct.unpack('<II', f.read(8))
+            if chunk_type != GLB_JSON_CHUNK:
+                raise ValueError("Archivo GLB inválido: el primer chunk no es JSON")
+            return json.loads(f.read(chunk_length))
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        return json.load(f)
+
 @dataclass
 class GLTFAnalysisResult:
     """Resultado del análisis GLTF mejorado"""
@@ -28,17 +67,194 @@ class GLTFAnalysisResult:
     gltf_version: str
     generator: str
     confidence_score: float
-    garment_elements: List[Dict[str, Any]]
+    # Tablas compactas (compact_results): cada fila se lee como un diccionario
+    garment_elements: GarmentElementTable
     fabric_properties: Dict[str, Any]
-    size_variations: List[Dict[str, Any]]
+    size_variations: SizeVariationTable
     accessibility_features: List[Dict[str, Any]]
     validation_sources: List[str]
     false_positive_flags: List[str]
+    stage_breakdown: Dict[str, Any] = field(default_factory=dict)
+    analysis_tier: str = STANDARD
+    tier_decision: Dict[str, Any] = field(default_factory=dict)
+    structure: Dict[str, Any] = field(default_factory=dict)
+    deep_analysis: Dict[str, Any] = field(default_factory=dict)
+    cache_report: Dict[str, Any] = field(default_factory=dict)
+
+# Secciones del documento de las que depende cada etapa cacheable
+STAGE_DEPENDENCIES = {
+    # Por primitiva: nombres de material y de patrón (MeshList), counts y límites de los accessors
+    'gltf.garment_elements': ('meshes', 'materials', 'accessors', 'extras'),
+    # extras: PhysicalPropertyList y MeshList; meshes: material de cada patrón
+    'gltf.fabric_properties': ('materials', 'textures', 'images', 'extras', 'meshes'),
+    # Los límites de mundo de cada variante usan los min/max de los accessors de sus meshes
+    'gltf.size_variations': ('nodes', 'meshes', 'accessors'),
+    # Elementos de prenda (meshes) y herrajes de cierre: nombres, PBR, física de CLO y límites de las primitivas
+    'gltf.accessibility_features': ('meshes', 'materials', 'nodes', 'accessors', 'extras'),
+    'gltf.geometry': ('meshes', 'accessors', 'nodes'),
+    'gltf.textures': ('materials', 'textures', 'images'),
+    # Las longitudes usan las posiciones de los vértices del buffer binario ('buffers' incluye su contenido)
+    'gltf.seams': ('extras', 'meshes', 'accessors', 'bufferViews', 'buffers'),
+    # Agrupa instancias de mesh por forma; el área exacta sale de los triángulos del buffer ('buffers' incluye su contenido)
+    'gltf.size_grading': ('nodes', 'meshes', 'accessors', 'bufferViews', 'buffers')
+}
+
+# Nombres de cierre en español -> tipo de herraje
+CLOSURE_SYNONYMS = {'cremallera': 'zipper', 'botón': 'button'}
+
+# Patrones de materiales con validación contextual
+FABRIC_INDICATORS = {
+    'natural_fibers': {
+        'cotton': ['cotton', 'algodón', 'coton'],
+        'wool': ['wool', 'lana', 'laine'],
+        'silk': ['silk', 'seda', 'soie'],
+        'linen': ['linen', 'lino', 'lin']
+    },
+    'synthetic_fibers': {
+        'polyester': ['polyester', 'poliéster'],
+        'nylon': ['nylon', 'nilón'],
+        'acrylic': ['acrylic', 'acrílico']
+    },
+    'stretch_materials': {
+        'elastane': ['elastane', 'elastano', 'spandex', 'lycra'],
+        'elastic': ['elastic', 'elástico', 'stretch', 'estirable']
+    }
+}
+
+# Clasificaciones PBR memorizadas, compartidas entre archivos
+MATERIAL_CLASSIFIER_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=MATERIAL_CLASSIFIER_CACHE_SIZE)
+def fabric_name_indicator(name: str) -> Optional[str]:
+    """Tipo de tela indicado por el nombre (primer indicador encontrado) o None"""
+    name = name.lower()
+    for fabrics in FABRIC_INDICATORS.values():
+        for fabric_type, indicators in fabrics.items():
+            if any(indicator in name for indicator in indicators):
+                return fabric_type
+    return None
+
+def material_signature(material: Dict[str, Any], mat_name: str, physics_row: int) -> tuple:
+    """Firma canónica de un material: todo lo que determina su análisis
+
+    Del nombre solo cuenta el indicador de tela que contiene ('FABRIC 1_3463'
+    y 'Material45756_12' valen lo mismo); además factores PBR, extensión
+    CLO_material_properties, texturas referenciadas y fila de propiedades
+    físicas. Los materiales con la misma firma se analizan una vez.
+    """
+    pbr = material.get('pbrMetallicRoughness') or {}
+    extensions = material.get('extensions') or {}
+    clo_ext = extensions.get('CLO_material_properties') if isinstance(extensions, dict) else None
+    return (
+        fabric_name_indicator(mat_name),
+        (pbr.get('roughnessFactor', 0.5), pbr.get('metallicFactor', 0.0)) if pbr else None,
+        repr(sorted(clo_ext.items())) if isinstance(clo_ext, dict) and clo_ext else None,
+        _texture_index(pbr.get('baseColorTexture')),
+        _texture_index(pbr.get('metallicRoughnessTexture')),
+        _texture_index(material.get('normalTexture')),
+        physics_row
+    )
+
+def _texture_index(ref: Any) -> Optional[int]:
+    return ref.get('index', -1) if isinstance(ref, dict) else None
+
+@lru_cache(maxsize=MATERIAL_CLASSIFIER_CACHE_SIZE)
+def _classify_fabric_cached(roughness: float, metallic: float, fabric_name_match: Optional[str]) -> Dict[str, Any]:
+    """Clasificar tipo de tela basado en propiedades PBR y nombre"""
+    classification = {
+        'type': 'unknown',
+        'confidence': 0.0,
+        'reasoning': []
+    }
+    
+    # Verificar si es material metálico (hardware)
+    if metallic > 0.7:
+        classification.update({
+            'type': 'metallic_hardware',
+            'confidence': 0.9,
+            'reasoning': ['High metallic factor indicates metal hardware']
+        })
+        return classification
+    
+    # Clasificar basado en roughness para materiales no metálicos
+    if metallic < 0.2:  # Definitivamente no metálico
+        if roughness > 0.8:
+            fabric_type = 'rough_fabric'
+            confidence = 0.7
+            reasoning = ['High roughness suggests rough woven fabric']
+            
+            if fabric_name_match in ['cotton', 'linen']:
+                fabric_type = fabric_name_match
+                confidence = 0.9
+                reasoning.append(f'Name validation supports {fabric_name_match}')
+                
+        elif roughness < 0.3:
+            fabric_type = 'smooth_fabric'
+            confidence = 0.6
+            reasoning = ['Low roughness suggests smooth fabric']
+            
+            if fabric_name_match in ['silk']:
+                fabric_type = fabric_name_match
+                confidence = 0.9
+                reasoning.append(f'Name validation supports {fabric_name_match}')
+                
+        else:
+            fabric_type = 'standard_fabric'
+            confidence = 0.5
+            reasoning = ['Medium roughness suggests standard fabric']
+        
+        classification.update({
+            'type': fabric_type,
+            'confidence': confidence,
+            'reasoning': reasoning
+        })
+    
+    return classification
+
+def _with_primitives(detected_elements: List[Dict[str, Any]], primitives: int) -> List[Dict[str, Any]]:
+    """Copia de los elementos detectados en un nombre, con las primitivas que lo usan"""
+    return [
+        {**category, 'elements': [{**element, 'primitives': primitives} for element in category['elements']]}
+        for category in detected_elements
+    ]
+
+def _merge_detected_elements(current: List[Dict[str, Any]], found: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Unir detecciones por categoría y elemento (mayor confianza, primitivas sumadas)"""
+    if not found:
+        return current
+    by_category = {category['category']: {element['element']: element for element in category['elements']}
+                   for category in current}
+    for category in found:
+        elements = by_category.setdefault(category['category'], {})
+        for element in category['elements']:
+            previous = elements.get(element['element'])
+            if previous is None:
+                elements[element['element']] = dict(element)
+                continue
+            merged = dict(max(previous, element, key=lambda item: item['confidence']))
+            if 'primitives' in previous or 'primitives' in element:
+                merged['primitives'] = previous.get('primitives', 0) + element.get('primitives', 0)
+            elements[element['element']] = merged
+    return [
+        {
+            'category': category,
+            'elements': list(elements.values()),
+            'category_confidence': max(element['confidence'] for element in elements.values())
+        }
+        for category, elements in by_category.items()
+    ]
 
 class ImprovedGLTFAnalyzer:
     """Analizador GLTF mejorado con reducción de falsos positivos"""
     
-    def __init__(self):
+    def __init__(self, stage_cache: Optional[StageCache] = None):
+        # Caché de etapas para re-análisis incremental (None: sin caché)
+        self.stage_cache = stage_cache
+        # Token del análisis en curso: las etapas lo consultan entre elementos
+        self.cancel_token: CancellationToken = NEVER_CANCELLED
+        # Índice de escena del documento en análisis (se construye en el primer uso)
+        self._scene: Optional[tuple] = None
+        
         # Patrones contextuales mejorados para reducir falsos positivos
         self.garment_context_patterns = {
             'closures': {
@@ -59,60 +275,173 @@ class ImprovedGLTFAnalyzer:
         }
         
         # Patrones de materiales con validación contextual
-        self.fabric_indicators = {
-            'natural_fibers': {
-                'cotton': ['cotton', 'algodón', 'coton'],
-                'wool': ['wool', 'lana', 'laine'],
-                'silk': ['silk', 'seda', 'soie'],
-                'linen': ['linen', 'lino', 'lin']
-            },
-            'synthetic_fibers': {
-                'polyester': ['polyester', 'poliéster'],
-                'nylon': ['nylon', 'nilón'],
-                'acrylic': ['acrylic', 'acrílico']
-            },
-            'stretch_materials': {
-                'elastane': ['elastane', 'elastano', 'spandex', 'lycra'],
-                'elastic': ['elastic', 'elástico', 'stretch', 'estirable']
-            }
-        }
+        self.fabric_indicators = FABRIC_INDICATORS
     
-    def analyze_gltf_file(self, file_path: str) -> GLTFAnalysisResult:
-        """Analizar archivo GLTF con análisis mejorado"""
-        logger.info(f"🔍 Iniciando análisis GLTF mejorado: {file_path}")
+    def analyze_gltf_file(
+        self,
+        file_path: str,
+        timer: Optional[StageTimer] = None,
+        tier: Optional[str] = None,
+        deadline: Optional[float] = None,
+        on_section: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> GLTFAnalysisResult:
+        """Analizar archivo GLTF con análisis mejorado
+
+        Si se pasa un StageTimer (p. ej. el de CLO3DAnalyzer) las etapas se
+        registran en él; si no, se usa uno propio configurado por MOVING_PROFILE.
+
+        ``tier`` fuerza el nivel (quick / standard / deep); si es None se elige
+        por tamaño y complejidad. ``deadline`` (reloj time.perf_counter) es el
+        límite del presupuesto de latencia: con selección automática, los
+        niveles superiores no se inician una vez superado.
+
+        ``on_section(section, payload)`` se llama al terminar cada sección
+        (asset, garment_elements, materials, sizes, accessibility, deep); el
+        payload incluye ``totals`` con los conteos acumulados y la confianza
+        provisional.
+
+        ``cancel_token`` se consulta entre etapas y entre elementos de cada
+        etapa; al cancelarse se lanza AnalysisCancelled.
+        """
+        logger.info("🔍 Iniciando análisis GLTF mejorado: %s", file_path)
+        own_timer = timer is None
+        timer = timer or StageTimer.from_env()
+        self.cancel_token = cancel_token if cancel_token is not None else NEVER_CANCELLED
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                gltf_data = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parseando JSON GLTF: {e}")
-            raise ValueError(f"Archivo GLTF inválido: {e}")
+        with timer.stage('gltf.parse'):
+            try:
+                gltf_data = load_gltf_document(file_path)
+            except json.JSONDecodeError as e:
+                logger.error("Error parseando JSON GLTF: %s", e)
+                raise ValueError(f"Archivo GLTF inválido: {e}")
+        self.cancel_token.check()
         
         # Información básica del archivo
         asset_info = gltf_data.get('asset', {})
         gltf_version = asset_info.get('version', 'Unknown')
         generator = asset_info.get('generator', 'Unknown')
         
-        logger.info(f"📊 GLTF v{gltf_version} generado por: {generator}")
+        logger.debug("📊 GLTF v%s generado por: %s", gltf_version, generator)
         
-        # Análisis semántico avanzado
-        garment_elements = self._analyze_garment_elements_contextual(gltf_data)
-        fabric_properties = self._analyze_fabric_properties_advanced(gltf_data)
-        size_variations = self._analyze_size_variations_validated(gltf_data)
-        accessibility_features = self._analyze_accessibility_features(gltf_data, garment_elements)
+        # Nivel quick: estructura y metadatos de accessors
+        with timer.stage('gltf.structure'):
+            structure = {'counts': structure_counts(gltf_data)}
+            file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+            budget_seconds = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            decision = choose_tier(file_size_mb, structure['counts'], tier, budget_seconds=budget_seconds)
         
-        # Calcular confianza general
-        confidence_score = self._calculate_overall_confidence(
-            garment_elements, fabric_properties, size_variations, accessibility_features
-        )
+        logger.info("🎚️ Nivel de análisis: %s (%s)", decision.tier, decision.reason)
+        
+        # Huellas por sección para reutilizar etapas cuyas entradas no cambiaron
+        fingerprints: Dict[str, str] = {}
+        cache_report: Dict[str, Any] = {}
+        if self.stage_cache is not None:
+            with timer.stage('gltf.fingerprint'):
+                fingerprints = section_fingerprints(gltf_data)
+            cache_report = {'hits': [], 'misses': []}
+        
+        def run_stage(name: str, compute: Callable[[], Any]) -> Any:
+            """Ejecutar una etapa o reutilizar su resultado cacheado"""
+            self.cancel_token.check()
+            with timer.stage(name):
+                if self.stage_cache is None:
+                    return compute()
+                value, hit = self.stage_cache.get_or_compute(name, fingerprints, STAGE_DEPENDENCIES[name], compute)
+                if hit:
+                    logger.debug("♻️ Etapa reutilizada desde caché: %s", name)
+            cache_report['hits' if hit else 'misses'].append(name)
+            return value
+        
+        garment_elements = GarmentElementTable()
+        fabric_properties: Dict[str, Any] = {
+            'materials': MaterialTable(), 'confidence_distribution': {}, 'validation_methods': []
+        }
+        size_variations = SizeVariationTable()
+        accessibility_features: List[Dict[str, Any]] = []
+        deep_analysis: Dict[str, Any] = {}
+        
+        def emit(section: str, payload: Dict[str, Any]):
+            """Notificar una sección terminada con los totales acumulados"""
+            if on_section is None:
+                return
+            payload['totals'] = {
+                'garment_elements': len(garment_elements),
+                'materials': len(fabric_properties.get('materials', {})),
+                'size_variations': len(size_variations),
+                'accessibility_features': len(accessibility_features),
+                'confidence': self._calculate_overall_confidence(
+                    garment_elements, fabric_properties, size_variations, accessibility_features
+                )
+            }
+            on_section(section, payload)
         
-        # Recopilar fuentes de validación
-        validation_sources = self._collect_validation_sources(fabric_properties, garment_elements)
+        emit('asset', {
+            'gltf_version': gltf_version,
+            'generator': generator,
+            'analysis_tier': decision.tier,
+            'structure': structure['counts']
+        })
+        
+        # Nivel standard: nombres y materiales
+        if decision.allows(STANDARD) and not self._budget_exhausted(decision, deadline, QUICK):
+            garment_elements = run_stage(
+                'gltf.garment_elements', lambda: self._analyze_garment_elements_contextual(gltf_data))
+            emit('garment_elements', {'elements': [element['mesh_name'] for element in garment_elements]})
+            fabric_properties = run_stage(
+                'gltf.fabric_properties', lambda: self._analyze_fabric_properties_advanced(gltf_data))
+            emit('materials', {'confidence_distribution': fabric_properties.get('confidence_distribution', {})})
+            size_variations = run_stage(
+                'gltf.size_variations', lambda: self._analyze_size_variations_validated(gltf_data))
+            emit('sizes', {'sizes': [variation['node_name'] for variation in size_variations]})
+            accessibility_features = run_stage(
+                'gltf.accessibility_features',
+                lambda: self._analyze_accessibility_features(gltf_data, garment_elements))
+            emit('accessibility', {'features': [feature['element'] for feature in accessibility_features]})
+        
+        # Nivel deep: geometría, texturas y costuras
+        if decision.allows(DEEP) and not self._budget_exhausted(decision, deadline, STANDARD):
+            deep_analysis['geometry'] = run_stage('gltf.geometry', lambda: self._analyze_geometry(gltf_data))
+            deep_analysis['textures'] = run_stage('gltf.textures', lambda: self._analyze_textures(gltf_data))
+            buffers = GLTFBuffers(gltf_data, file_path) if NUMPY_ANALYSIS_AVAILABLE else None
+            if buffers is not None and self.stage_cache is not None:
+                # La sección JSON 'buffers' solo tiene URI y byteLength: la huella incluye los bytes
+                with timer.stage('gltf.buffer_fingerprint'):
+                    fingerprints['buffers'] = fingerprint([fingerprints['buffers'], buffers.content_fingerprint()])
+            deep_analysis['seams'] = run_stage('gltf.seams', lambda: self._analyze_seams(gltf_data, buffers))
+            deep_analysis['size_grading'] = run_stage(
+                'gltf.size_grading', lambda: self._analyze_size_grading(gltf_data, buffers))
+            # Las imágenes externas no forman parte de las huellas de sección:
+            # esta etapa se cachea por hash de contenido de cada imagen
+            with timer.stage('gltf.texture_images'):
+                deep_analysis['texture_images'] = self._analyze_texture_images(gltf_data, buffers)
+            emit('deep', {
+                'scene_extent': deep_analysis['geometry'].get('scene_extent'),
+                'textures': deep_analysis['textures'],
+                'seams': deep_analysis['seams'],
+                'size_grading': [grading['ladder'] for grading in deep_analysis['size_grading']['gradings']],
+                'texture_images': {
+                    key: deep_analysis['texture_images'].get(key)
+                    for key in ('analyzed', 'cache_hits', 'surface_classes')
+                }
+            })
+        
+        # Calcular confianza general
+        self.cancel_token.check()
+        with timer.stage('gltf.confidence'):
+            confidence_score = self._calculate_overall_confidence(
+                garment_elements, fabric_properties, size_variations, accessibility_features
+            )
+            
+            # Recopilar fuentes de validación
+            validation_sources = self._collect_validation_sources(fabric_properties, garment_elements)
         
         # Detectar posibles falsos positivos
-        false_positive_flags = self._detect_false_positives(gltf_data, garment_elements, fabric_properties)
+        with timer.stage('gltf.false_positives'):
+            false_positive_flags = self._detect_false_positives(gltf_data, garment_elements, fabric_properties)
         
-        logger.info(f"✅ Análisis completado - Confianza: {confidence_score:.2f}")
+        logger.info("✅ Análisis completado - Confianza: %.2f", confidence_score)
+        self._scene = None  # no retener el documento después del análisis
         
         return GLTFAnalysisResult(
             file_path=file_path,
@@ -124,84 +453,243 @@ class ImprovedGLTFAnalyzer:
             size_variations=size_variations,
             accessibility_features=accessibility_features,
             validation_sources=validation_sources,
-            false_positive_flags=false_positive_flags
+            false_positive_flags=false_positive_flags,
+            stage_breakdown=timer.breakdown() if own_timer else {},
+            analysis_tier=decision.tier,
+            tier_decision=decision.to_dict(),
+            structure={**structure, 'fingerprints': fingerprints} if fingerprints else structure,
+            deep_analysis=deep_analysis,
+            cache_report=cache_report
         )
     
-    def _analyze_garment_elements_contextual(self, gltf_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Análisis contextual de elementos de prenda con validación"""
-        garment_elements = []
+    def _budget_exhausted(self, decision, deadline: Optional[float], fallback_tier: str) -> bool:
+        """Bajar al nivel anterior si el presupuesto de latencia se agotó (solo en modo automático)"""
+        if deadline is None or not decision.automatic or time.perf_counter() < deadline:
+            return False
+        logger.warning("⏱️ Presupuesto de latencia agotado: se entrega el nivel %s", fallback_tier)
+        decision.downgrade(fallback_tier, 'presupuesto de latencia agotado')
+        return True
+    
+    def _analyze_geometry(self, gltf_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Geometría por mesh a partir de los límites (min/max) de los accessors POSITION"""
+        accessors = gltf_data.get('accessors', [])
+        scene = self._scene_index(gltf_data)
+        meshes = []
+        scene_min = [float('inf')] * 3
+        scene_max = [float('-inf')] * 3
+        
+        for i, mesh in self.cancel_token.checked(enumerate(gltf_data.get('meshes', []))):
+            mesh_min = [float('inf')] * 3
+            mesh_max = [float('-inf')] * 3
+            vertices = 0
+            triangles = 0
+            for primitive in self.cancel_token.checked(mesh.get('primitives', [])):
+                position = primitive.get('attributes', {}).get('POSITION')
+                if not isinstance(position, int) or position >= len(accessors):
+                    continue
+                accessor = accessors[position]
+                vertices += accessor.get('count', 0)
+                indices = primitive.get('indices')
+                if isinstance(indices, int) and indices < len(accessors):
+                    triangles += accessors[indices].get('count', 0) // 3
+                if len(accessor.get('min', [])) == 3 and len(accessor.get('max', [])) == 3:
+                    mesh_min = [min(a, b) for a, b in zip(mesh_min, accessor['min'])]
+                    mesh_max = [max(a, b) for a, b in zip(mesh_max, accessor['max'])]
+            
+            entry = {'mesh_name': mesh.get('name', f'mesh_{i}'), 'mesh_index': i,
+                     'vertices': vertices, 'triangles': triangles}
+            if scene is not None:
+                entry['instances'] = len(scene.nodes_of_mesh(i))
+            if mesh_min[0] != float('inf'):
+                entry['extent'] = [round(b - a, 4) for a, b in zip(mesh_min, mesh_max)]
+                scene_min = [min(a, b) for a, b in zip(scene_min, mesh_min)]
+                scene_max = [max(a, b) for a, b in zip(scene_max, mesh_max)]
+            meshes.append(entry)
+        
+        geometry = {'meshes': meshes}
+        if scene_min[0] != float('inf'):
+            geometry['scene_extent'] = [round(b - a, 4) for a, b in zip(scene_min, scene_max)]
+        if scene is not None:
+            # Con las transformaciones de los nodos (escala y rotación heredadas)
+            world_bounds = scene.world_bounds(scene.preorder)
+            if world_bounds is not None:
+                geometry['world_extent'] = [round(float(value), 4) for value in world_bounds[1] - world_bounds[0]]
+            geometry['scene_graph'] = scene.summary()
+        logger.debug("📐 Geometría analizada: %d meshes", len(meshes))
+        return geometry
+    
+    def _analyze_textures(self, gltf_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Inventario de texturas: imágenes, formatos y materiales que las usan"""
+        images = gltf_data.get('images', [])
+        textures = gltf_data.get('textures', [])
+        used_textures = set()
+        
+        for material in self.cancel_token.checked(gltf_data.get('materials', [])):
+            pbr = material.get('pbrMetallicRoughness', {})
+            for ref in (pbr.get('baseColorTexture'), pbr.get('metallicRoughnessTexture'),
+                        material.get('normalTexture'), material.get('occlusionTexture'),
+                        material.get('emissiveTexture')):
+                if ref and isinstance(ref.get('index'), int):
+                    used_textures.add(ref['index'])
+        
+        formats: Dict[str, int] = {}
+        for image in images:
+            name = image.get('uri') or image.get('name') or ''
+            extension = os.path.splitext(name)[1].lower().lstrip('.') or image.get('mimeType', 'embedded')
+            formats[extension] = formats.get(extension, 0) + 1
+        
+        return {
+            'images': len(images),
+            'textures': len(textures),
+            'textures_in_use': len(used_textures),
+            'unused_textures': len([i for i in range(len(textures)) if i not in used_textures]),
+            'image_formats': formats
+        }
+    
+    def _analyze_texture_images(self, gltf_data: Dict[str, Any], buffers=None) -> Dict[str, Any]:
+        """Estadísticas de píxeles de las imágenes (relieve de los mapas de normales, color)"""
+        if not NUMPY_ANALYSIS_AVAILABLE or buffers is None:
+            return {'available': False, 'images': len(gltf_data.get('images', []))}
+        return analyze_texture_images(gltf_data, buffers, cancel_token=self.cancel_token)
+    
+    def _analyze_size_grading(self, gltf_data: Dict[str, Any], buffers=None) -> Dict[str, Any]:
+        """Variantes de talla por geometría (aunque los nodos tengan nombres genéricos)"""
+        if not NUMPY_ANALYSIS_AVAILABLE:
+            return {'available': False, 'instances': 0, 'gradings': []}
+        return analyze_size_grading(gltf_data, self._scene_index(gltf_data), buffers)
+    
+    def _analyze_seams(self, gltf_data: Dict[str, Any], buffers=None) -> Dict[str, Any]:
+        """Grafo de costuras de los metadatos CLO3D (SeamLinePairList)
+
+        Con ``buffers`` (GLTFBuffers) se miden además las longitudes a partir
+        de las posiciones de los vértices.
+        """
+        if NUMPY_ANALYSIS_AVAILABLE:
+            return analyze_seam_graph(gltf_data, buffers)
+        
+        metadata = gltf_data.get('extras', {}).get('MetaData', {})
+        seam_pairs = metadata.get('SeamLinePairList', [])
+        if not isinstance(seam_pairs, list):
+            seam_pairs = []
+        return {
+            'available': bool(seam_pairs),
+            'seam_pairs': len(seam_pairs)
+        }
+    
+    def _analyze_garment_elements_contextual(self, gltf_data: Dict[str, Any]) -> GarmentElementTable:
+        """Análisis contextual de elementos de prenda con validación
+
+        Además del nombre de la mesh se evalúan los nombres de material y de
+        patrón de cada primitiva (tabla de primitivas): en ``Cloth_mesh`` cada
+        patrón es una primitiva con su material.
+        """
+        garment_elements = GarmentElementTable()
+        table = self._primitive_table(gltf_data)
+        material_names = [material.get('name') or '' if isinstance(material, dict) else ''
+                          for material in gltf_data.get('materials', [])]
+        name_matches: Dict[str, List[Dict[str, Any]]] = {}
         
-        for i, mesh in enumerate(gltf_data.get('meshes', [])):
-            mesh_name = mesh.get('name', '').lower()
-            if not mesh_name:
+        def match(name: str) -> List[Dict[str, Any]]:
+            if name not in name_matches:
+                name_matches[name] = self._match_garment_context(name)
+            return name_matches[name]
+        
+        for i, mesh in self.cancel_token.checked(enumerate(gltf_data.get('meshes', []))):
+            mesh_name = mesh.get('name', '')
+            detected_elements = match(mesh_name.lower()) if mesh_name else []
+            if table is not None:
+                detected_elements = _merge_detected_elements(
+                    detected_elements, self._primitive_elements(table, i, material_names, match)
+                )
+            if not detected_elements:
                 continue
             
-            element_analysis = {
-                'mesh_name': mesh.get('name'),
+            garment_elements.append({
+                'mesh_name': mesh_name or f'mesh_{i}',
                 'mesh_index': i,
-                'detected_elements': [],
-                'confidence_score': 0.0,
-                'validation_context': {}
-            }
+                'detected_elements': detected_elements,
+                # Confianza general del mesh
+                'confidence_score': max(cat['category_confidence'] for cat in detected_elements)
+            })
+        
+        if table is not None:
+            # Resumen por primitiva bajo demanda, solo con las filas de las meshes con elementos
+            garment_elements.primitives = table.restrict(garment_elements.mesh_index)
+        
+        logger.debug("🔍 Elementos de prenda detectados: %d", len(garment_elements))
+        return garment_elements
+    
+    def _primitive_elements(self, table: 'PrimitiveTable', mesh: int, material_names: List[str],
+                            match: Callable[[str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Elementos detectados en los nombres de material y de patrón de las primitivas de una mesh"""
+        detected: List[Dict[str, Any]] = []
+        # Cada nombre distinto se evalúa una vez, con el número de primitivas que lo usan
+        for name, primitives in table.name_usage(mesh, material_names).items():
+            found = match(name.lower())
+            if found:
+                detected = _merge_detected_elements(detected, _with_primitives(found, primitives))
+        return detected
+    
+    def _match_garment_context(self, name: str) -> List[Dict[str, Any]]:
+        """Categorías de elementos detectadas en un nombre (en minúsculas) con validación contextual"""
+        detected_elements = []
+        
+        # Analizar cada categoría con validación contextual
+        for category, patterns in self.garment_context_patterns.items():
+            category_elements = []
             
-            # Analizar cada categoría con validación contextual
-            for category, patterns in self.garment_context_patterns.items():
-                category_elements = []
-                
-                for keyword in patterns['primary']:
-                    if keyword in mesh_name:
-                        # Calcular confianza base
-                        base_confidence = 0.8
-                        
-                        # Validar contexto positivo
-                        context_boost = 0.0
-                        context_matches = []
-                        for context_word in patterns['context']:
-                            if context_word in mesh_name:
-                                context_boost += 0.1
-                                context_matches.append(context_word)
-                        
-                        # Penalizar exclusiones
-                        exclusion_penalty = 0.0
-                        exclusion_matches = []
-                        for exclusion in patterns['exclusions']:
-                            if exclusion in mesh_name:
-                                exclusion_penalty += 0.3
-                                exclusion_matches.append(exclusion)
-                        
-                        # Calcular confianza final
-                        final_confidence = min(1.0, max(0.0, base_confidence + context_boost - exclusion_penalty))
-                        
-                        if final_confidence > 0.5:  # Umbral de confianza
-                            category_elements.append({
-                                'element': keyword,
-                                'confidence': final_confidence,
-                                'context_matches': context_matches,
-                                'exclusion_flags': exclusion_matches,
-                                'validated': len(context_matches) > 0 and len(exclusion_matches) == 0
-                            })
-                
-                if category_elements:
-                    element_analysis['detected_elements'].append({
-                        'category': category,
-                        'elements': category_elements,
-                        'category_confidence': max(elem['confidence'] for elem in category_elements)
-                    })
+            for keyword in patterns['primary']:
+                if keyword in name:
+                    # Calcular confianza base
+                    base_confidence = 0.8
+                    
+                    # Validar contexto positivo
+                    context_boost = 0.0
+                    context_matches = []
+                    for context_word in patterns['context']:
+                        if context_word in name:
+                            context_boost += 0.1
+                            context_matches.append(context_word)
+                    
+                    # Penalizar exclusiones
+                    exclusion_penalty = 0.0
+                    exclusion_matches = []
+                    for exclusion in patterns['exclusions']:
+                        if exclusion in name:
+                            exclusion_penalty += 0.3
+                            exclusion_matches.append(exclusion)
+                    
+                    # Calcular confianza final
+                    final_confidence = min(1.0, max(0.0, base_confidence + context_boost - exclusion_penalty))
+                    
+                    if final_confidence > 0.5:  # Umbral de confianza
+                        category_elements.append({
+                            'element': keyword,
+                            'confidence': final_confidence,
+                            'context_matches': context_matches,
+                            'exclusion_flags': exclusion_matches,
+                            'validated': len(context_matches) > 0 and len(exclusion_matches) == 0
+                        })
             
-            # Calcular confianza general del mesh
-            if element_analysis['detected_elements']:
-                element_analysis['confidence_score'] = max(
-                    cat['category_confidence'] for cat in element_analysis['detected_elements']
-                )
-                garment_elements.append(element_analysis)
+            if category_elements:
+                detected_elements.append({
+                    'category': category,
+                    'elements': category_elements,
+                    'category_confidence': max(elem['confidence'] for elem in category_elements)
+                })
         
-        logger.info(f"🔍 Elementos de prenda detectados: {len(garment_elements)}")
-        return garment_elements
+        return detected_elements
+    
+    def _primitive_table(self, gltf_data: Dict[str, Any]) -> Optional['PrimitiveTable']:
+        """Tabla de primitivas del documento (None sin NumPy)"""
+        if not NUMPY_ANALYSIS_AVAILABLE:
+            return None
+        return PrimitiveTable.from_gltf(gltf_data, self._scene_index(gltf_data))
     
     def _analyze_fabric_properties_advanced(self, gltf_data: Dict[str, Any]) -> Dict[str, Any]:
         """Análisis avanzado de propiedades de tela con validación cruzada"""
         fabric_analysis = {
-            'materials': {},
+            'materials': MaterialTable(),
             'confidence_distribution': {},
             'validation_methods': []
         }
@@ -210,67 +698,31 @@ class ImprovedGLTFAnalyzer:
         textures = gltf_data.get('textures', [])
         images = gltf_data.get('images', [])
         
-        for i, material in enumerate(materials):
+        # Propiedades físicas de todas las telas, clasificadas en un solo paso
+        physics_records, physics_rows = self._load_fabric_physics(gltf_data, materials, fabric_analysis)
+        
+        # Materiales repetidos (mismo nombre base, PBR, extensiones y texturas) se analizan una vez
+        analyzed_signatures: Dict[tuple, Dict[str, Any]] = {}
+        for i, material in self.cancel_token.checked(enumerate(materials)):
             mat_name = material.get('name', f'material_{i}')
+            signature = material_signature(material, mat_name, physics_rows[i])
+            template = analyzed_signatures.get(signature)
+            if template is None:
+                template = self._analyze_material(
+                    material, mat_name, i, physics_records[physics_rows[i]] if physics_rows[i] >= 0 else None,
+                    textures, images
+                )
+                analyzed_signatures[signature] = template
             
-            material_analysis = {
-                'name': mat_name,
-                'index': i,
-                'properties': {},
-                'confidence': 0.0,
-                'validation_sources': []
-            }
-            
-            # Análisis de extensiones CLO3D (máxima confianza)
-            if 'extensions' in material:
-                clo_ext = material['extensions'].get('CLO_material_properties', {})
-                if clo_ext:
-                    material_analysis['properties'].update({
-                        'stretch_warp': clo_ext.get('Stretch-Warp', 0),
-                        'stretch_weft': clo_ext.get('Stretch-Weft', 0),
-                        'weight': clo_ext.get('Weight', 0),
-                        'thickness': clo_ext.get('Thickness', 0),
-                        'has_stretch': clo_ext.get('Stretch-Warp', 0) > 100000 or clo_ext.get('Stretch-Weft', 0) > 100000
-                    })
-                    material_analysis['confidence'] = 0.95
-                    material_analysis['validation_sources'].append('CLO3D_extension')
-                    fabric_analysis['validation_methods'].append('CLO3D_extension')
-            
-            # Análisis de propiedades PBR con clasificación inteligente
-            pbr = material.get('pbrMetallicRoughness', {})
-            if pbr:
-                roughness = pbr.get('roughnessFactor', 0.5)
-                metallic = pbr.get('metallicFactor', 0.0)
-                
-                fabric_classification = self._classify_fabric_from_pbr(roughness, metallic, mat_name.lower())
-                
-                material_analysis['properties'].update({
-                    'roughness': roughness,
-                    'metallic': metallic,
-                    'fabric_type': fabric_classification['type'],
-                    'pbr_confidence': fabric_classification['confidence']
-                })
-                
-                if material_analysis['confidence'] < fabric_classification['confidence']:
-                    material_analysis['confidence'] = fabric_classification['confidence']
-                
-                material_analysis['validation_sources'].append('PBR_analysis')
-                fabric_analysis['validation_methods'].append('PBR_analysis')
-            
-            # Validación cruzada con texturas
-            texture_validation = self._validate_material_with_textures(material, textures, images)
-            if texture_validation['confidence'] > 0:
-                material_analysis['properties'].update(texture_validation['properties'])
-                material_analysis['confidence'] = max(material_analysis['confidence'], texture_validation['confidence'])
-                material_analysis['validation_sources'].extend(texture_validation['sources'])
-                fabric_analysis['validation_methods'].extend(texture_validation['sources'])
+            fabric_analysis['validation_methods'].extend(template['validation_sources'])
             
-            # Solo incluir materiales con confianza mínima
-            if material_analysis['confidence'] > 0.3:
-                fabric_analysis['materials'][mat_name] = material_analysis
+            # Solo incluir materiales con confianza mínima (los de la misma firma comparten el análisis)
+            if template['confidence'] > 0.3:
+                fabric_analysis['materials'].add(mat_name, i, template, signature)
+        fabric_analysis['unique_materials'] = len(analyzed_signatures)
         
         # Calcular distribución de confianza
-        confidences = [mat['confidence'] for mat in fabric_analysis['materials'].values()]
+        confidences = fabric_analysis['materials'].confidences()
         if confidences:
             fabric_analysis['confidence_distribution'] = {
                 'high_confidence': len([c for c in confidences if c > 0.8]),
@@ -279,70 +731,93 @@ class ImprovedGLTFAnalyzer:
                 'average': sum(confidences) / len(confidences)
             }
         
-        logger.info(f"🧵 Materiales analizados: {len(fabric_analysis['materials'])}")
+        logger.debug("🧵 Materiales analizados: %d (%d firmas únicas)",
+                     len(fabric_analysis['materials']), len(analyzed_signatures))
         return fabric_analysis
     
-    def _classify_fabric_from_pbr(self, roughness: float, metallic: float, mat_name: str) -> Dict[str, Any]:
-        """Clasificar tipo de tela basado en propiedades PBR y nombre"""
-        classification = {
-            'type': 'unknown',
+    def _analyze_material(self, material: Dict[str, Any], mat_name: str, index: int,
+                          physics_record: Optional[Dict[str, Any]], textures: List[Dict[str, Any]],
+                          images: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Análisis de un material: extensión CLO3D, propiedades físicas, PBR y texturas"""
+        material_analysis = {
+            'name': mat_name,
+            'index': index,
+            'properties': {},
             'confidence': 0.0,
-            'reasoning': []
+            'validation_sources': []
         }
         
-        # Verificar si es material metálico (hardware)
-        if metallic > 0.7:
-            classification.update({
-                'type': 'metallic_hardware',
-                'confidence': 0.9,
-                'reasoning': ['High metallic factor indicates metal hardware']
-            })
-            return classification
-        
-        # Buscar indicadores en el nombre
-        fabric_name_match = None
-        for category, fabrics in self.fabric_indicators.items():
-            for fabric_type, indicators in fabrics.items():
-                if any(indicator in mat_name for indicator in indicators):
-                    fabric_name_match = fabric_type
-                    break
-            if fabric_name_match:
-                break
-        
-        # Clasificar basado en roughness para materiales no metálicos
-        if metallic < 0.2:  # Definitivamente no metálico
-            if roughness > 0.8:
-                fabric_type = 'rough_fabric'
-                confidence = 0.7
-                reasoning = ['High roughness suggests rough woven fabric']
-                
-                if fabric_name_match in ['cotton', 'linen']:
-                    fabric_type = fabric_name_match
-                    confidence = 0.9
-                    reasoning.append(f'Name validation supports {fabric_name_match}')
-                    
-            elif roughness < 0.3:
-                fabric_type = 'smooth_fabric'
-                confidence = 0.6
-                reasoning = ['Low roughness suggests smooth fabric']
-                
-                if fabric_name_match in ['silk']:
-                    fabric_type = fabric_name_match
-                    confidence = 0.9
-                    reasoning.append(f'Name validation supports {fabric_name_match}')
-                    
-            else:
-                fabric_type = 'standard_fabric'
-                confidence = 0.5
-                reasoning = ['Medium roughness suggests standard fabric']
+        # Análisis de extensiones CLO3D (máxima confianza)
+        if 'extensions' in material:
+            clo_ext = material['extensions'].get('CLO_material_properties', {})
+            if clo_ext:
+                material_analysis['properties'].update({
+                    'stretch_warp': clo_ext.get('Stretch-Warp', 0),
+                    'stretch_weft': clo_ext.get('Stretch-Weft', 0),
+                    'weight': clo_ext.get('Weight', 0),
+                    'thickness': clo_ext.get('Thickness', 0),
+                    'has_stretch': clo_ext.get('Stretch-Warp', 0) > 100000 or clo_ext.get('Stretch-Weft', 0) > 100000
+                })
+                material_analysis['confidence'] = 0.95
+                material_analysis['validation_sources'].append('CLO3D_extension')
+        
+        # Propiedades físicas CLO3D (PhysicalPropertyList) unidas por nombre
+        if physics_record is not None:
+            material_analysis['properties'].update(physics_record)
+            material_analysis['confidence'] = max(material_analysis['confidence'], 0.9)
+            material_analysis['validation_sources'].append('CLO3D_physical_properties')
+        
+        # Análisis de propiedades PBR con clasificación inteligente
+        pbr = material.get('pbrMetallicRoughness', {})
+        if pbr:
+            roughness = pbr.get('roughnessFactor', 0.5)
+            metallic = pbr.get('metallicFactor', 0.0)
+            
+            fabric_classification = self._classify_fabric_from_pbr(roughness, metallic, mat_name.lower())
             
-            classification.update({
-                'type': fabric_type,
-                'confidence': confidence,
-                'reasoning': reasoning
+            material_analysis['properties'].update({
+                'roughness': roughness,
+                'metallic': metallic,
+                'fabric_type': fabric_classification['type'],
+                'pbr_confidence': fabric_classification['confidence']
             })
+            
+            if material_analysis['confidence'] < fabric_classification['confidence']:
+                material_analysis['confidence'] = fabric_classification['confidence']
+            
+            material_analysis['validation_sources'].append('PBR_analysis')
         
-        return classification
+        # Validación cruzada con texturas
+        texture_validation = self._validate_material_with_textures(material, textures, images)
+        if texture_validation['confidence'] > 0:
+            material_analysis['properties'].update(texture_validation['properties'])
+            material_analysis['confidence'] = max(material_analysis['confidence'], texture_validation['confidence'])
+            material_analysis['validation_sources'].extend(texture_validation['sources'])
+        
+        return material_analysis
+    
+    def _load_fabric_physics(self, gltf_data: Dict[str, Any], materials: List[Dict[str, Any]],
+                             fabric_analysis: Dict[str, Any]):
+        """Registros físicos clasificados y fila de la tabla para cada material (-1: sin datos)"""
+        no_rows = [-1] * len(materials)
+        if not NUMPY_ANALYSIS_AVAILABLE:
+            return [], no_rows
+        
+        table = FabricPhysicsTable.from_gltf(gltf_data)
+        if not len(table):
+            return [], no_rows
+        
+        rows, _ = join_materials(
+            table, gltf_data, [material.get('name', f'material_{i}') for i, material in enumerate(materials)]
+        )
+        fabric_analysis['physical_properties'] = table.summary()
+        logger.debug("🧪 Propiedades físicas: %d telas, %d materiales unidos", len(table), int((rows >= 0).sum()))
+        return [table.record(row) for row in range(len(table))], rows.tolist()
+    
+    def _classify_fabric_from_pbr(self, roughness: float, metallic: float, mat_name: str) -> Dict[str, Any]:
+        """Clasificar tipo de tela basado en propiedades PBR y nombre (memorizado entre archivos)"""
+        classification = _classify_fabric_cached(roughness, metallic, fabric_name_indicator(mat_name))
+        return {**classification, 'reasoning': list(classification['reasoning'])}
     
     def _validate_material_with_textures(self, material: Dict[str, Any], textures: List[Dict[str, Any]], images: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Validar material mediante análisis de texturas asociadas"""
@@ -396,9 +871,9 @@ class ImprovedGLTFAnalyzer:
         
         return validation
     
-    def _analyze_size_variations_validated(self, gltf_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _analyze_size_variations_validated(self, gltf_data: Dict[str, Any]) -> SizeVariationTable:
         """Análisis de variaciones de talla con validación geométrica"""
-        size_variations = []
+        size_variations = SizeVariationTable()
         
         # Patrones de talla mejorados
         size_patterns = {
@@ -406,8 +881,9 @@ class ImprovedGLTFAnalyzer:
             'numeric_sizes': r'\b(size[_\s]*\d+|talla[_\s]*\d+|\d+[_\s]*size)\b',
             'scale_variants': r'\b(scale[_\s]*[\d.]+|variant[_\s]*\d+|escala[_\s]*[\d.]+)\b'
         }
+        scene = self._scene_index(gltf_data)
         
-        for i, node in enumerate(gltf_data.get('nodes', [])):
+        for i, node in self.cancel_token.checked(enumerate(gltf_data.get('nodes', []))):
             node_name = node.get('name', '').lower()
             if not node_name:
                 continue
@@ -431,17 +907,14 @@ class ImprovedGLTFAnalyzer:
                         'confidence': confidence
                     } for match in matches])
             
-            # Validación geométrica
-            if 'scale' in node:
+            # Validación geométrica: escala de mundo (incluye la heredada) y meshes del subárbol
+            if scene is not None:
+                if size_analysis['size_indicators']:
+                    size_analysis['geometric_validation'] = self._world_size_validation(scene, i, node)
+            elif 'scale' in node:
                 scale = node['scale']
                 if isinstance(scale, list) and len(scale) == 3:
-                    scale_variance = max(scale) - min(scale)
-                    size_analysis['geometric_validation'] = {
-                        'has_scale': True,
-                        'uniform_scale': scale_variance < 0.1,
-                        'scale_factor': sum(scale) / 3,
-                        'scale_variance': scale_variance
-                    }
+                    size_analysis['geometric_validation'] = self._scale_validation(scale)
             
             # Calcular confianza final
             if size_analysis['size_indicators']:
@@ -452,18 +925,68 @@ class ImprovedGLTFAnalyzer:
             if size_analysis['confidence'] > 0.5:
                 size_variations.append(size_analysis)
         
-        logger.info(f"📏 Variaciones de talla detectadas: {len(size_variations)}")
+        logger.debug("📏 Variaciones de talla detectadas: %d", len(size_variations))
         return size_variations
     
-    def _analyze_accessibility_features(self, gltf_data: Dict[str, Any], garment_elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _scene_index(self, gltf_data: Dict[str, Any]) -> Optional['SceneIndex']:
+        """Índice de escena del documento (una construcción por documento, compartida por las etapas)"""
+        if not NUMPY_ANALYSIS_AVAILABLE:
+            return None
+        if self._scene is None or self._scene[0] is not gltf_data:
+            self._scene = (gltf_data, SceneIndex.from_gltf(gltf_data))
+        return self._scene[1]
+    
+    def _scale_validation(self, scale: List[float]) -> Dict[str, Any]:
+        scale_variance = max(scale) - min(scale)
+        return {
+            'has_scale': True,
+            'uniform_scale': scale_variance < 0.1,
+            'scale_factor': sum(scale) / 3,
+            'scale_variance': scale_variance
+        }
+    
+    def _world_size_validation(self, scene: 'SceneIndex', node_index: int, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Escala de mundo del nodo y tamaño de las meshes de su subárbol en espacio de escena"""
+        validation: Dict[str, Any] = {}
+        if scene.scaled[node_index]:
+            validation = self._scale_validation(scene.world_scale(node_index).tolist())
+            validation['inherited_scale'] = 'scale' not in node
+        
+        meshes = scene.subtree_meshes(node_index)
+        if len(meshes):
+            validation['meshes'] = meshes.tolist()
+            bounds = scene.world_bounds(scene.subtree(node_index))
+            if bounds is not None:
+                validation['world_extent'] = [round(float(value), 4) for value in bounds[1] - bounds[0]]
+        return validation
+    
+    def _analyze_accessibility_features(self, gltf_data: Dict[str, Any], garment_elements: GarmentElementTable) -> List[Dict[str, Any]]:
         """Analizar características de accesibilidad"""
         accessibility_features = []
         
+        # Herrajes de cierre por material y geometría: un elemento por tipo, con conteo real
+        hardware = self._detect_closure_hardware(gltf_data)
+        detected_types = {closure['type'] for closure in hardware.get('closures', [])}
+        for closure in hardware.get('closures', []):
+            accessibility_features.append({
+                'type': 'closure_hardware',
+                'element': closure['type'],
+                'mesh_name': ', '.join(closure['meshes']),
+                'count': closure['count'],
+                'accessibility_score': self._evaluate_closure_accessibility(closure['type']),
+                'confidence': closure['confidence'],
+                'validated': True,
+                'evidence': closure['evidence']
+            })
+        
         # Evaluar cierres para accesibilidad
         for element in garment_elements:
             for category_info in element.get('detected_elements', []):
                 if category_info['category'] == 'closures':
                     for closure_element in category_info['elements']:
+                        # Ya contado por los herrajes (p. ej. cada pieza Zipper_1_* de una cremallera)
+                        if CLOSURE_SYNONYMS.get(closure_element['element'], closure_element['element']) in detected_types:
+                            continue
                         accessibility_score = self._evaluate_closure_accessibility(closure_element['element'])
                         if accessibility_score > 0:
                             accessibility_features.append({
@@ -475,9 +998,15 @@ class ImprovedGLTFAnalyzer:
                                 'validated': closure_element.get('validated', False)
                             })
         
-        logger.info(f"♿ Características de accesibilidad: {len(accessibility_features)}")
+        logger.debug("♿ Características de accesibilidad: %d", len(accessibility_features))
         return accessibility_features
     
+    def _detect_closure_hardware(self, gltf_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Botones, cremalleras y broches con su conteo (materiales metálicos/herraje y geometría)"""
+        if not NUMPY_ANALYSIS_AVAILABLE:
+            return {'available': False, 'closures': []}
+        return detect_closure_hardware(gltf_data, self._scene_index(gltf_data))
+    
     def _evaluate_closure_accessibility(self, closure_type: str) -> float:
         """Evaluar accesibilidad de diferentes tipos de cierre"""
         accessibility_scores = {
@@ -494,27 +1023,27 @@ class ImprovedGLTFAnalyzer:
         
         return accessibility_scores.get(closure_type, 0.0)
     
-    def _calculate_overall_confidence(self, garment_elements: List[Dict[str, Any]], 
+    def _calculate_overall_confidence(self, garment_elements: GarmentElementTable, 
                                     fabric_properties: Dict[str, Any], 
-                                    size_variations: List[Dict[str, Any]], 
+                                    size_variations: SizeVariationTable, 
                                     accessibility_features: List[Dict[str, Any]]) -> float:
         """Calcular confianza general del análisis"""
         confidence_factors = []
         
-        # Confianza de elementos de prenda (40% peso)
+        # Confianza de elementos de prenda (40% peso), leída de las columnas de las tablas
         if garment_elements:
-            avg_garment_confidence = sum(elem['confidence_score'] for elem in garment_elements) / len(garment_elements)
+            avg_garment_confidence = sum(garment_elements.confidence_score) / len(garment_elements)
             confidence_factors.append(avg_garment_confidence * 0.4)
         
         # Confianza de materiales (30% peso)
-        materials = fabric_properties.get('materials', {})
+        materials = fabric_properties.get('materials', MaterialTable())
         if materials:
-            avg_material_confidence = sum(mat['confidence'] for mat in materials.values()) / len(materials)
+            avg_material_confidence = sum(materials.confidences()) / len(materials)
             confidence_factors.append(avg_material_confidence * 0.3)
         
         # Confianza de variaciones de talla (20% peso)
         if size_variations:
-            avg_size_confidence = sum(var['confidence'] for var in size_variations) / len(size_variations)
+            avg_size_confidence = sum(size_variations.confidence) / len(size_variations)
             confidence_factors.append(avg_size_confidence * 0.2)
         
         # Confianza de accesibilidad (10% peso)
@@ -524,24 +1053,20 @@ class ImprovedGLTFAnalyzer:
         
         return sum(confidence_factors) if confidence_factors else 0.0
     
-    def _collect_validation_sources(self, fabric_properties: Dict[str, Any], garment_elements: List[Dict[str, Any]]) -> List[str]:
+    def _collect_validation_sources(self, fabric_properties: Dict[str, Any], garment_elements: GarmentElementTable) -> List[str]:
         """Recopilar fuentes de validación utilizadas"""
         sources = set()
         
         # Fuentes de materiales
-        for material in fabric_properties.get('materials', {}).values():
-            sources.update(material.get('validation_sources', []))
+        sources.update(fabric_properties.get('materials', MaterialTable()).source_names())
         
         # Fuentes de elementos de prenda
-        for element in garment_elements:
-            for category_info in element.get('detected_elements', []):
-                for elem in category_info['elements']:
-                    if elem.get('validated'):
-                        sources.add('contextual_validation')
+        if any(garment_elements.validated):
+            sources.add('contextual_validation')
         
         return list(sources)
     
-    def _detect_false_positives(self, gltf_data: Dict[str, Any], garment_elements: List[Dict[str, Any]], fabric_properties: Dict[str, Any]) -> List[str]:
+    def _detect_false_positives(self, gltf_data: Dict[str, Any], garment_elements: GarmentElementTable, fabric_properties: Dict[str, Any]) -> List[str]:
         """Detectar posibles falsos positivos"""
         flags = []
         
@@ -551,7 +1076,7 @@ class ImprovedGLTFAnalyzer:
             flags.append('generator_not_fashion_specific')
         
         # Verificar coherencia de elementos detectados
-        total_elements = sum(len(elem.get('detected_elements', [])) for elem in garment_elements)
+        total_elements = len(garment_elements.category)
         if total_elements > len(gltf_data.get('meshes', [])) * 0.8:
             flags.append('too_many_garment_elements_detected')
         
@@ -571,6 +1096,7 @@ def main():
         print("Uso: python analyzer_gltf_improved.py <archivo.gltf>")
         sys.exit(1)
     
+    configure_logging()
     file_path = sys.argv[1]
     analyzer = ImprovedGLTFAnalyzer()
     
@@ -612,7 +1138,7 @@ def main():
                 print(f"  • {flag}")
         
     except Exception as e:
-        logger.error(f"Error en análisis: {e}")
+        logger.error("Error en análisis: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
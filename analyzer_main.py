@@ -2,23 +2,50 @@
 """
 Moving Accessibility Analyzer - Analizador Principal
 Análisis avanzado de archivos de diseño para inclusividad y accesibilidad
+
+Motor único de análisis: cada formato se resuelve en el registro de
+``formats`` (por contenido, leyendo solo la cabecera) y su handler se carga en
+el primer uso. Los archivos no soportados o corruptos se rechazan antes de
+calcular el hash.
 """
 
 import os
 import sys
-import json
-import re
 import hashlib
 import logging
+import queue
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from dataclasses import dataclass
-from datetime import datetime
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from analysis_tiers import normalize_tier, tier_from_env
+from cancellation import NEVER_CANCELLED, AnalysisCancelled, CancellationToken, timeout_from_env
+from config.logging_config import bind_log_context, configure_logging, log_context
+from formats import FORMAT_REGISTRY, UnsupportedFormatError
+from instrumentation import StageTimer, profiling_flags_from_env
+from stage_cache import DEFAULT_STAGE_CACHE, StageCache, stage_cache_enabled_from_env
+import metrics
+
+# Logger del módulo (la configuración la hace el punto de entrada: config.logging_config)
 logger = logging.getLogger(__name__)
 
+# Métricas de throughput del analizador
+ANALYSES_TOTAL = metrics.counter(
+    'moving_analyses_total', 'Análisis realizados por tipo de archivo y resultado', ['file_type', 'outcome']
+)
+ANALYSIS_DURATION = metrics.histogram(
+    'moving_analysis_duration_seconds', 'Duración de analyze_file por tipo de archivo', ['file_type'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+ANALYSIS_FILE_SIZE = metrics.histogram(
+    'moving_analysis_file_size_bytes', 'Tamaño de los archivos analizados', ['file_type'],
+    buckets=(1e5, 1e6, 1e7, 5e7, 1e8, 5e8, 1e9)
+)
+ANALYSES_IN_PROGRESS = metrics.gauge('moving_analyses_in_progress', 'Análisis en curso')
+
 @dataclass
 class SizingMetrics:
     """Métricas de tallas y medidas"""
@@ -98,175 +125,225 @@ class AnalysisResults:
     raw_data_summary: Dict[str, Any]
     screening_report: ScreeningReport
 
+# Secciones de los resultados parciales, en orden de emisión
+PROGRESS_SECTIONS = ('asset', 'garment_elements', 'materials', 'sizes', 'accessibility', 'deep', 'screening')
+
+@dataclass
+class AnalysisProgress:
+    """Resultado parcial emitido al terminar una sección del análisis"""
+    section: str
+    data: Dict[str, Any]
+    elapsed_seconds: float
+    final: bool = False
+    results: Optional[AnalysisResults] = None
+
+    @property
+    def fraction(self) -> float:
+        """Avance aproximado (0-1) según la sección"""
+        if self.final:
+            return 1.0
+        if self.section not in PROGRESS_SECTIONS:
+            return 0.0
+        return (PROGRESS_SECTIONS.index(self.section) + 1) / len(PROGRESS_SECTIONS)
+
 class CLO3DAnalyzer:
     """Analizador principal de archivos de diseño"""
     
-    def __init__(self, debug: bool = False):
+    def __init__(
+        self,
+        debug: bool = False,
+        profile: bool = None,
+        trace_memory: bool = None,
+        tier: Optional[str] = None,
+        latency_budget: Optional[float] = None,
+        stage_cache: Optional[StageCache] = None,
+        use_stage_cache: Optional[bool] = None,
+        timeout: Optional[float] = None
+    ):
         self.debug = debug
         self.start_time = None
         self.file_hash = None
+        self.timer = None
+        self.deadline = None
+        self.on_progress: Optional[Callable[[AnalysisProgress], None]] = None
+        self.cancel_token: CancellationToken = NEVER_CANCELLED
+        
+        # Nivel de análisis: explícito, MOVING_ANALYSIS_TIER o automático (None)
+        self.tier = normalize_tier(tier) if tier is not None else tier_from_env()
+        # Presupuesto de latencia (segundos) para subidas interactivas
+        self.latency_budget = latency_budget
+        # Tiempo máximo (segundos) por análisis: al superarlo se interrumpe
+        self.timeout = timeout if timeout is not None else timeout_from_env()
+        
+        # Caché de etapas para re-análisis incremental (por defecto la del proceso)
+        if use_stage_cache is None:
+            use_stage_cache = stage_cache_enabled_from_env()
+        if not use_stage_cache:
+            self.stage_cache = None
+        else:
+            self.stage_cache = stage_cache if stage_cache is not None else DEFAULT_STAGE_CACHE
+        
+        # Captura opcional de cProfile / tracemalloc (por defecto según MOVING_PROFILE)
+        env_profile, env_trace_memory = profiling_flags_from_env()
+        self.profile = env_profile if profile is None else profile
+        self.trace_memory = env_trace_memory if trace_memory is None else trace_memory
+    
+    def analyze_file(
+        self,
+        file_path: str,
+        on_progress: Optional[Callable[[AnalysisProgress], None]] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> AnalysisResults:
+        """Analizar archivo de diseño
+
+        ``on_progress`` recibe un AnalysisProgress al terminar cada sección
+        (información del asset, elementos de prenda, materiales, tallas,
+        accesibilidad y screening final con los resultados completos). Se
+        llama en el mismo hilo; sus excepciones interrumpen el análisis.
+
+        ``cancel_token`` permite interrumpir el análisis desde otro hilo; si
+        no se pasa se crea uno con el ``timeout`` del analizador (y
+        ``cancel()`` lo cancela). Al cancelar o vencer el plazo, las etapas lo
+        detectan entre elementos y se lanza AnalysisCancelled.
+        """
+        file_type = Path(file_path).suffix.lower().lstrip('.') or 'unknown'
+        self.on_progress = on_progress
+        self.cancel_token = cancel_token if cancel_token is not None else CancellationToken(timeout=self.timeout)
+        
+        # Los logs del análisis llevan el archivo (y luego su hash) como campos de contexto
+        with log_context(file_name=Path(file_path).name), ANALYSES_IN_PROGRESS.track_inprogress():
+            try:
+                results = self._run_analysis(file_path)
+            except UnsupportedFormatError:
+                ANALYSES_TOTAL.labels(file_type, 'rejected').inc()
+                raise
+            except AnalysisCancelled as e:
+                logger.warning("🛑 Análisis interrumpido (%s)", e.reason)
+                ANALYSES_TOTAL.labels(file_type, 'cancelled').inc()
+                raise
+            except Exception:
+                ANALYSES_TOTAL.labels(file_type, 'error').inc()
+                raise
+        
+        ANALYSES_TOTAL.labels(file_type, 'success').inc()
+        ANALYSIS_DURATION.labels(file_type).observe(results.processing_time)
+        ANALYSIS_FILE_SIZE.labels(file_type).observe(results.file_size_mb * 1024 * 1024)
+        return results
+    
+    def cancel(self, reason: str = 'cancelado por el usuario'):
+        """Cancelar el análisis en curso (seguro desde otro hilo)"""
+        if self.cancel_token is not NEVER_CANCELLED:
+            self.cancel_token.cancel(reason)
+    
+    def iter_analysis(
+        self,
+        file_path: str,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> Iterator[AnalysisProgress]:
+        """Analizar en un hilo aparte y devolver los resultados parciales a medida que llegan
+
+        El último elemento tiene ``final=True`` y los resultados completos; los
+        errores del análisis se relanzan en el consumidor. Si el consumidor
+        abandona el generador (close(), rerun de Streamlit, sesión cerrada) el
+        análisis se cancela y el worker termina en la siguiente consulta.
+        """
+        token = cancel_token if cancel_token is not None else CancellationToken(timeout=self.timeout)
+        events: "queue.Queue" = queue.Queue()
+        done = object()
+        
+        def worker():
+            try:
+                self.analyze_file(file_path, on_progress=events.put, cancel_token=token)
+            except BaseException as e:
+                events.put(e)
+            finally:
+                events.put(done)
+        
+        thread = threading.Thread(target=worker, name='analysis-worker', daemon=True)
+        thread.start()
+        finished = False
+        try:
+            while True:
+                event = events.get()
+                if event is done:
+                    finished = True
+                    break
+                if isinstance(event, BaseException):
+                    finished = True
+                    raise event
+                yield event
+        finally:
+            if not finished:
+                token.cancel('el consumidor abandonó el análisis')
+        thread.join()
+    
+    def emit_progress(self, section: str, data: Dict[str, Any], results: Optional[AnalysisResults] = None):
+        """Notificar un resultado parcial (sin coste si no hay callback)"""
+        if self.on_progress is None:
+            return
+        self.on_progress(AnalysisProgress(
+            section=section,
+            data=data,
+            elapsed_seconds=time.perf_counter() - self.start_time,
+            final=results is not None,
+            results=results
+        ))
     
-    def analyze_file(self, file_path: str) -> AnalysisResults:
-        """Analizar archivo de diseño"""
-        self.start_time = datetime.now()
+    def _run_analysis(self, file_path: str) -> AnalysisResults:
+        """Pipeline de análisis (dentro del contexto de logging del archivo)"""
+        self.start_time = time.perf_counter()
+        self.timer = StageTimer(profile=self.profile, trace_memory=self.trace_memory)
+        self.deadline = None if self.latency_budget is None else self.start_time + self.latency_budget
         
-        logger.info(f"🔍 Iniciando análisis: {file_path}")
+        logger.info("🔍 Iniciando análisis: %s", file_path)
         
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Archivo no encontrado: {file_path}")
         
         file_size = os.path.getsize(file_path)
         file_size_mb = file_size / (1024 * 1024)
-        file_ext = Path(file_path).suffix.lower()
         
-        self.file_hash = self._calculate_file_hash(file_path)
+        # Detectar el formato por contenido antes de leer el archivo completo
+        with self.timer.stage('sniff'):
+            file_format = FORMAT_REGISTRY.resolve(file_path)
+        self.cancel_token.check()
         
-        # Análisis según tipo de archivo
-        if file_ext == '.gltf':
-            results = self._analyze_gltf(file_path, file_size_mb)
-        else:
-            results = self._analyze_other_format(file_path, file_size_mb, file_ext)
+        with self.timer.stage('hash'):
+            self.file_hash = self._calculate_file_hash(file_path)
+        bind_log_context(file_hash=self.file_hash[:16])
         
-        # Calcular tiempo de procesamiento
-        processing_time = (datetime.now() - self.start_time).total_seconds()
-        results.processing_time = processing_time
+        # Análisis con el handler del formato (se importa en el primer uso)
+        with self.timer.stage('analysis'):
+            self.cancel_token.check()
+            handler = file_format.load()
+            results = handler(self, file_path, file_size_mb, file_format)
+        self.cancel_token.check()
         
-        logger.info(f"✅ Análisis completado en {processing_time:.2f}s")
+        # Calcular tiempo de procesamiento (reloj monotónico)
+        processing_time = time.perf_counter() - self.start_time
+        results.processing_time = processing_time
+        results.technical_details.setdefault('analysis_timestamp', datetime.now().isoformat())
+        results.technical_details['stage_breakdown'] = self.timer.breakdown(total_seconds=processing_time)
+        
+        logger.info("✅ Análisis completado en %.2fs", processing_time)
+        self.emit_progress('screening', {
+            'scores': {
+                'inclusivity_score': results.inclusivity_score,
+                'accessibility_score': results.accessibility_score,
+                'sustainability_score': results.sustainability_score
+            },
+            'validation_items': len(results.screening_report.validation_checklist)
+        }, results=results)
         return results
     
     def _calculate_file_hash(self, file_path: str) -> str:
-        """Calcular hash SHA-256 del archivo"""
+        """Calcular hash SHA-256 del archivo (consultando la cancelación cada ~1MB)"""
         hash_sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in self.cancel_token.checked(iter(lambda: f.read(4096), b""), every=256):
                 hash_sha256.update(chunk)
         return hash_sha256.hexdigest()
     
-    def _analyze_gltf(self, file_path: str, file_size_mb: float) -> AnalysisResults:
-        """Analizar archivo GLTF"""
-        try:
-            # Intentar usar analizador GLTF mejorado
-            from analyzer_gltf_improved import ImprovedGLTFAnalyzer
-            
-            gltf_analyzer = ImprovedGLTFAnalyzer()
-            gltf_result = gltf_analyzer.analyze_gltf_file(file_path)
-            
-            return self._convert_gltf_result(gltf_result, file_size_mb)
-            
-        except ImportError:
-            logger.warning("Analizador GLTF mejorado no disponible")
-            return self._analyze_gltf_basic(file_path, file_size_mb)
-    
-    def _convert_gltf_result(self, gltf_result, file_size_mb: float) -> AnalysisResults:
-        """Convertir resultado GLTF al formato estándar"""
-        
-        # Métricas de tallas
-        size_variations = gltf_result.size_variations
-        sizing_metrics = SizingMetrics(
-            size_range=f"{len(size_variations)} variaciones" if size_variations else "Modelo único",
-            adaptability="Alta" if len(size_variations) >= 3 else "Media" if len(size_variations) >= 1 else "Limitada",
-            inclusive_design=len(size_variations) >= 3,
-            detected_sizes=[var.get('node_name', '') for var in size_variations],
-            grading_system=any('scale' in str(var) for var in size_variations),
-            size_count=len(size_variations)
-        )
-        
-        # Métricas de materiales
-        materials = gltf_result.fabric_properties.get('materials', {})
-        fabric_metrics = FabricMetrics(
-            elasticity="Propiedades GLTF analizadas",
-            comfort="Basado en análisis PBR",
-            materials_found=list(materials.keys())[:10],
-            stretch_properties=any('stretch' in str(mat) for mat in materials.values()),
-            weight_info="Propiedades virtuales",
-            breathability="Análisis contextual",
-            texture_quality="Texturas validadas"
-        )
-        
-        # Métricas de cierres
-        closure_elements = []
-        for element in gltf_result.garment_elements:
-            for category in element.get('detected_elements', []):
-                if category['category'] == 'closures':
-                    closure_elements.extend([elem['element'] for elem in category['elements']])
-        
-        closure_metrics = ClosureMetrics(
-            buttonhole_size=f"{len([c for c in closure_elements if 'button' in c])} botones",
-            zipper_accessibility=f"{len([c for c in closure_elements if 'zipper' in c])} cremalleras",
-            closure_types=list(set(closure_elements)),
-            adaptive_features=[],
-            ease_of_use="Evaluado por tipos detectados"
-        )
-        
-        # Métricas de comodidad
-        comfort_metrics = ComfortMetrics(
-            mobility="Basado en materiales",
-            sensory_friendly="Evaluado por superficie",
-            adaptive_features=[feat['element'] for feat in gltf_result.accessibility_features],
-            ergonomic_design=len(gltf_result.accessibility_features) > 0,
-            universal_design=gltf_result.confidence_score > 0.7
-        )
-        
-        # Puntuaciones
-        inclusivity_score = min(100, int(gltf_result.confidence_score * 60 + len(size_variations) * 10))
-        accessibility_score = min(100, int(len(gltf_result.accessibility_features) * 15 + gltf_result.confidence_score * 40))
-        sustainability_score = min(100, int(len(materials) * 5 + gltf_result.confidence_score * 50))
-        
-        # Recomendaciones
-        recommendations = self._generate_recommendations(gltf_result)
-        
-        # Screening report
-        screening_report = self._create_screening_report(gltf_result)
-        
-        return AnalysisResults(
-            file_type=f"GLTF 3D Model (v{gltf_result.gltf_version})",
-            status="Análisis GLTF mejorado completado",
-            file_size_mb=file_size_mb,
-            processing_time=0.0,
-            inclusivity_score=inclusivity_score,
-            accessibility_score=accessibility_score,
-            sustainability_score=sustainability_score,
-            sizing=sizing_metrics,
-            fabrics=fabric_metrics,
-            closures=closure_metrics,
-            comfort=comfort_metrics,
-            recommendations=recommendations,
-            technical_details={
-                'gltf_version': gltf_result.gltf_version,
-                'generator': gltf_result.generator,
-                'confidence_score': gltf_result.confidence_score,
-                'validation_sources': gltf_result.validation_sources,
-                'file_hash': self.file_hash
-            },
-            raw_data_summary={
-                'garment_elements': len(gltf_result.garment_elements),
-                'materials': len(materials),
-                'size_variations': len(size_variations)
-            },
-            screening_report=screening_report
-        )
-    
-    def _analyze_gltf_basic(self, file_path: str, file_size_mb: float) -> AnalysisResults:
-        """Análisis básico de GLTF"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                gltf_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Archivo GLTF inválido: {e}")
-        
-        return self._create_basic_results("GLTF 3D Model (análisis básico)", file_size_mb)
-    
-    def _analyze_other_format(self, file_path: str, file_size_mb: float, file_ext: str) -> AnalysisResults:
-        """Análisis de otros formatos"""
-        format_names = {
-            '.zprj': 'CLO3D Project',
-            '.zpac': 'CLO3D Package',
-            '.obj': 'Wavefront OBJ'
-        }
-        
-        file_type = format_names.get(file_ext, f"Archivo {file_ext}")
-        return self._create_basic_results(file_type, file_size_mb)
-    
     def _create_basic_results(self, file_type: str, file_size_mb: float) -> AnalysisResults:
         """Crear resultados básicos"""
         
@@ -348,55 +425,6 @@ class CLO3DAnalyzer:
             raw_data_summary={'analysis_type': 'basic'},
             screening_report=screening_report
         )
-    
-    def _generate_recommendations(self, gltf_result) -> List[str]:
-        """Generar recomendaciones"""
-        recommendations = []
-        
-        if gltf_result.confidence_score < 0.5:
-            recommendations.append("Validación manual recomendada por baja confianza")
-        
-        if len(gltf_result.size_variations) == 0:
-            recommendations.append("Considerar variaciones de talla para inclusividad")
-        
-        if len(gltf_result.accessibility_features) < 3:
-            recommendations.append("Evaluar más características de accesibilidad")
-        
-        return recommendations[:5]
-    
-    def _create_screening_report(self, gltf_result) -> ScreeningReport:
-        """Crear reporte de screening"""
-        
-        validation_checklist = []
-        
-        # Validación de elementos con baja confianza
-        for element in gltf_result.garment_elements:
-            if element['confidence_score'] < 0.8:
-                validation_checklist.append(HumanValidationItem(
-                    category="elementos_prenda",
-                    priority="MEDIA",
-                    finding=f"Elemento {element['mesh_name']} con confianza {element['confidence_score']:.2f}",
-                    validation_needed="Verificar elemento de prenda",
-                    estimated_time_minutes=5,
-                    expert_type="diseñador"
-                ))
-        
-        total_time = sum(item.estimated_time_minutes for item in validation_checklist)
-        
-        return ScreeningReport(
-            automated_findings={
-                'garment_elements': len(gltf_result.garment_elements),
-                'confidence_score': gltf_result.confidence_score
-            },
-            confidence_levels={
-                'overall_analysis': gltf_result.confidence_score
-            },
-            validation_checklist=validation_checklist,
-            priority_areas=['elementos_prenda'] if validation_checklist else [],
-            estimated_validation_time=max(total_time, 10),
-            recommended_experts=['diseñador'],
-            risk_flags=gltf_result.false_positive_flags
-        )
 
 def main():
     """Función principal para testing"""
@@ -404,6 +432,7 @@ def main():
         print("Uso: python analyzer_main.py <archivo>")
         sys.exit(1)
     
+    configure_logging()
     analyzer = CLO3DAnalyzer(debug=True)
     result = analyzer.analyze_file(sys.argv[1])
     
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Índice de Assets
+Índice persistente (SQLite) de texturas analizadas, por hash de contenido
+
+Las exportaciones de CLO reutilizan los mismos mapas de tela en muchas
+prendas (p. ej. Cotton_14_Wale_Corduroy_NRM.jpg). Cada textura se decodifica
+y clasifica una sola vez; los análisis posteriores, en este u otro proceso,
+toman las estadísticas del índice. El costo del análisis de texturas crece
+con las texturas únicas, no con las prendas.
+
+    data/asset_index.sqlite
+
+    SELECT first_name, json_extract(stats_json, '$.surface_class'), references_count
+    FROM texture_assets ORDER BY references_count DESC
+
+La base se abre en el primer uso (los archivos sin imágenes no la crean).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ASSET_INDEX_ENV_VAR = 'MOVING_ASSET_INDEX'
+DEFAULT_ASSET_INDEX_PATH = os.path.join('data', 'asset_index.sqlite')
+
+# Máximo de variables por consulta (límite conservador de SQLite)
+LOOKUP_BATCH = 500
+
+AssetKey = Tuple[str, str, int, int]  # (hash de contenido, tipo, lado máximo, versión del análisis)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texture_assets (
+    content_hash TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    max_size INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    stats_json TEXT NOT NULL,
+    first_name TEXT,
+    created_at TEXT NOT NULL,
+    last_used_at TEXT NOT NULL,
+    references_count INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (content_hash, kind, max_size, version)
+)
+"""
+
+def asset_index_path_from_env() -> Optional[str]:
+    """Ruta del índice (MOVING_ASSET_INDEX); None si está desactivado ('0', 'off'...)"""
+    value = os.getenv(ASSET_INDEX_ENV_VAR, '').strip()
+    if value.lower() in ('0', 'false', 'no', 'off'):
+        return None
+    return value or DEFAULT_ASSET_INDEX_PATH
+
+class AssetIndex:
+    """Estadísticas de texturas persistidas por hash de contenido"""
+
+    def __init__(self, path: str = DEFAULT_ASSET_INDEX_PATH):
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(_SCHEMA)
+            connection.commit()
+            self._connection = connection
+            logger.debug("Índice de assets abierto: %s", self.path)
+        return self._connection
+
+    def get_many(self, keys: Iterable[AssetKey]) -> Dict[AssetKey, Dict[str, Any]]:
+        """Estadísticas de las claves presentes (registra una referencia más a cada una)"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        found: Dict[AssetKey, Dict[str, Any]] = {}
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(keys), LOOKUP_BATCH):
+                batch = keys[start:start + LOOKUP_BATCH]
+                hashes = sorted({key[0] for key in batch})
+                rows = connection.execute(
+                    "SELECT content_hash, kind, max_size, version, stats_json FROM texture_assets "
+                    f"WHERE content_hash IN ({','.join('?' * len(hashes))})",
+                    hashes
+                ).fetchall()
+                wanted = set(batch)
+                for content_hash, kind, max_size, version, stats_json in rows:
+                    key = (content_hash, kind, max_size, version)
+                    if key in wanted:
+                        found[key] = json.loads(stats_json)
+            if found:
+                connection.executemany(
+                    "UPDATE texture_assets SET references_count = references_count + 1, last_used_at = ? "
+                    "WHERE content_hash = ? AND kind = ? AND max_size = ? AND version = ?",
+                    [(now, *key) for key in found]
+                )
+                connection.commit()
+        return found
+
+    def put_many(self, entries: Iterable[Tuple[AssetKey, Dict[str, Any], Optional[str]]]):
+        """Guardar (clave, estadísticas, nombre de la imagen) en una sola transacción"""
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = [
+            (*key, json.dumps(stats, ensure_ascii=False), name, now, now)
+            for key, stats, name in entries
+        ]
+        if not rows:
+            return
+        with self._lock:
+            connection = self._connect()
+            # Otro proceso pudo guardar la misma textura entretanto: se conserva la primera
+            connection.executemany(
+                "INSERT OR IGNORE INTO texture_assets "
+                "(content_hash, kind, max_size, version, stats_json, first_name, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            connection.commit()
+        logger.debug("🗂️ %d texturas agregadas al índice de assets", len(rows))
+
+    def summary(self) -> Dict[str, Any]:
+        """Texturas únicas indexadas y referencias acumuladas"""
+        with self._lock:
+            count, references = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(references_count), 0) FROM texture_assets"
+            ).fetchone()
+        return {'unique_textures': count, 'references': references}
+
+    def most_referenced(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Texturas más compartidas entre análisis"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT content_hash, kind, first_name, references_count, stats_json FROM texture_assets "
+                "ORDER BY references_count DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [{
+            'content_hash': content_hash,
+            'kind': kind,
+            'name': name,
+            'references': references,
+            'stats': json.loads(stats_json)
+        } for content_hash, kind, name, references, stats_json in rows]
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,8 @@
+"""
+Benchmarks del pipeline de análisis
+Generador de archivos GLTF sintéticos estilo CLO3D y medición de rendimiento
+"""
+
+from .synthetic_gltf import SyntheticGLTFSpec, PROFILES, generate_gltf, write_gltf
+
+__all__ = ['SyntheticGLTFSpec', 'PROFILES', 'generate_gltf', 'write_gltf']
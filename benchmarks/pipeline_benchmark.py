@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Benchmark del pipeline de análisis GLTF
+
+Mide cada etapa de ImprovedGLTFAnalyzer y CLO3DAnalyzer.analyze_file de
+extremo a extremo sobre archivos sintéticos, registra el pico de memoria
+(tracemalloc) y compara contra baselines guardados localmente.
+
+Uso:
+    python -m benchmarks.pipeline_benchmark --profile test01 --repeat 5
+    python -m benchmarks.pipeline_benchmark --profile small --save-baseline
+    python -m benchmarks.pipeline_benchmark --profile small --compare
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import pickle
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from analysis_tiers import DEEP, structure_counts
+from analyzer_gltf_improved import ImprovedGLTFAnalyzer
+from analyzer_main import CLO3DAnalyzer
+from fabric_physics import FabricPhysicsTable
+from gltf_buffers import GLTFBuffers
+from primitive_analysis import PrimitiveTable
+from scene_graph import SceneIndex
+
+from .synthetic_gltf import PROFILES, SyntheticGLTFSpec, write_gltf
+
+DEFAULT_BASELINE_DIR = os.path.join(os.path.dirname(__file__), 'baselines')
+
+# Una medición es regresión si supera al baseline en este factor
+DEFAULT_TOLERANCE = 1.25
+
+# Por debajo de este tiempo (s) las diferencias son ruido de medición
+MIN_SIGNIFICANT_SECONDS = 0.003
+
+@dataclass
+class CaseResult:
+    """Resultado de un caso de benchmark"""
+    name: str
+    runs: int
+    min_seconds: float
+    median_seconds: float
+    max_seconds: float
+    peak_memory_mb: float
+
+@dataclass
+class BenchmarkReport:
+    """Reporte completo de una ejecución"""
+    profile: str
+    spec: Dict[str, Any]
+    gltf_size_mb: float
+    bin_size_mb: float
+    created_at: str
+    python_version: str
+    cases: List[CaseResult] = field(default_factory=list)
+
+    def case(self, name: str) -> Optional[CaseResult]:
+        return next((case for case in self.cases if case.name == name), None)
+
+@contextmanager
+def _quiet_logging():
+    """Silenciar los logs INFO de los analizadores durante la medición"""
+    root = logging.getLogger()
+    previous = root.level
+    root.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        root.setLevel(previous)
+
+def _stage_cases(gltf_path: str) -> List[Tuple[str, Callable[[], Any]]]:
+    """Etapas de ImprovedGLTFAnalyzer, en el orden de analyze_gltf_file"""
+    analyzer = ImprovedGLTFAnalyzer()
+
+    def load():
+        with open(gltf_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    gltf_data = load()
+    garment_elements = analyzer._analyze_garment_elements_contextual(gltf_data)
+    fabric_properties = analyzer._analyze_fabric_properties_advanced(gltf_data)
+    size_variations = analyzer._analyze_size_variations_validated(gltf_data)
+    accessibility_features = analyzer._analyze_accessibility_features(gltf_data, garment_elements)
+
+    return [
+        ('gltf.load_json', load),
+        ('gltf.structure', lambda: structure_counts(gltf_data)),
+        ('gltf.garment_elements', lambda: analyzer._analyze_garment_elements_contextual(gltf_data)),
+        ('gltf.fabric_physics', lambda: FabricPhysicsTable.from_gltf(gltf_data).classify()),
+        ('gltf.fabric_properties', lambda: analyzer._analyze_fabric_properties_advanced(gltf_data)),
+        ('gltf.scene_index', lambda: SceneIndex.from_gltf(gltf_data)),
+        ('gltf.primitive_table', lambda: PrimitiveTable.from_gltf(gltf_data, SceneIndex.from_gltf(gltf_data))),
+        ('gltf.size_variations', lambda: analyzer._analyze_size_variations_validated(gltf_data)),
+        ('gltf.closure_hardware', lambda: analyzer._detect_closure_hardware(gltf_data)),
+        ('gltf.accessibility_features',
+         lambda: analyzer._analyze_accessibility_features(gltf_data, garment_elements)),
+        ('gltf.overall_confidence', lambda: analyzer._calculate_overall_confidence(
+            garment_elements, fabric_properties, size_variations, accessibility_features)),
+        ('gltf.validation_sources',
+         lambda: analyzer._collect_validation_sources(fabric_properties, garment_elements)),
+        ('gltf.false_positives',
+         lambda: analyzer._detect_false_positives(gltf_data, garment_elements, fabric_properties)),
+        ('gltf.geometry', lambda: analyzer._analyze_geometry(gltf_data)),
+        ('gltf.textures', lambda: analyzer._analyze_textures(gltf_data)),
+        ('gltf.seams', lambda: analyzer._analyze_seams(gltf_data, GLTFBuffers(gltf_data, gltf_path))),
+        ('gltf.size_grading',
+         lambda: analyzer._analyze_size_grading(gltf_data, GLTFBuffers(gltf_data, gltf_path))),
+        # Ida y vuelta por pickle de los resultados por elemento (coste de pasarlos entre procesos)
+        ('gltf.result_pickle', lambda: pickle.loads(pickle.dumps(
+            (garment_elements, fabric_properties, size_variations), protocol=pickle.HIGHEST_PROTOCOL))),
+        # Nivel fijo y sin caché de etapas: si no, la medición dependería del perfil y de las repeticiones
+        ('gltf.analyze_gltf_file', lambda: analyzer.analyze_gltf_file(gltf_path, tier=DEEP)),
+        ('pipeline.analyze_file',
+         lambda: CLO3DAnalyzer(tier=DEEP, use_stage_cache=False).analyze_file(gltf_path))
+    ]
+
+def _measure(name: str, func: Callable[[], Any], repeat: int, warmup: int = 1) -> CaseResult:
+    """Medir tiempos (sin tracemalloc) y luego el pico de memoria en una pasada aparte"""
+    for _ in range(warmup):
+        func()
+
+    # Igual que timeit: el GC se desactiva para que sus pausas no contaminen la medición
+    timings = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return CaseResult(
+        name=name,
+        runs=repeat,
+        min_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+        max_seconds=max(timings),
+        peak_memory_mb=peak / (1024 * 1024)
+    )
+
+def run_benchmark(profile: str = 'small', spec: SyntheticGLTFSpec = None, repeat: int = 10,
+                  work_dir: str = None) -> BenchmarkReport:
+    """Generar el archivo sintético del perfil y medir todas las etapas"""
+    spec = spec or PROFILES[profile]
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp_dir:
+        gltf_path = write_gltf(spec, tmp_dir, name=profile)
+        bin_path = os.path.splitext(gltf_path)[0] + '.bin'
+
+        report = BenchmarkReport(
+            profile=profile,
+            spec=asdict(spec),
+            gltf_size_mb=os.path.getsize(gltf_path) / (1024 * 1024),
+            bin_size_mb=os.path.getsize(bin_path) / (1024 * 1024),
+            created_at=datetime.now().isoformat(timespec='seconds'),
+            python_version=platform.python_version()
+        )
+
+        with _quiet_logging():
+            for name, func in _stage_cases(gltf_path):
+                report.cases.append(_measure(name, func, repeat))
+
+    return report
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+def baseline_path(profile: str, baseline_dir: str = DEFAULT_BASELINE_DIR) -> str:
+    return os.path.join(baseline_dir, f"{profile}.json")
+
+def save_baseline(report: BenchmarkReport, baseline_dir: str = DEFAULT_BASELINE_DIR) -> str:
+    """Guardar un reporte como baseline del perfil"""
+    os.makedirs(baseline_dir, exist_ok=True)
+    path = baseline_path(report.profile, baseline_dir)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(asdict(report), f, indent=2, ensure_ascii=False)
+    return path
+
+def load_baseline(profile: str, baseline_dir: str = DEFAULT_BASELINE_DIR) -> Optional[BenchmarkReport]:
+    """Cargar el baseline de un perfil (None si no existe)"""
+    path = baseline_path(profile, baseline_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['cases'] = [CaseResult(**case) for case in data['cases']]
+    return BenchmarkReport(**data)
+
+def compare_reports(current: BenchmarkReport, baseline: BenchmarkReport,
+                    tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Listar regresiones de tiempo o memoria respecto al baseline
+
+    El tiempo se compara por el mínimo de las repeticiones, que es el
+    estimador menos sensible a ruido del sistema.
+    """
+    regressions = []
+    for case in current.cases:
+        reference = baseline.case(case.name)
+        if reference is None:
+            continue
+        if (case.min_seconds > reference.min_seconds * tolerance
+                and case.min_seconds - reference.min_seconds > MIN_SIGNIFICANT_SECONDS):
+            regressions.append(
+                f"{case.name}: tiempo {reference.min_seconds * 1000:.2f}ms → {case.min_seconds * 1000:.2f}ms"
+            )
+        if case.peak_memory_mb > reference.peak_memory_mb * tolerance and case.peak_memory_mb - reference.peak_memory_mb > 1.0:
+            regressions.append(
+                f"{case.name}: memoria {reference.peak_memory_mb:.1f}MB → {case.peak_memory_mb:.1f}MB"
+            )
+    return regressions
+
+def format_report(report: BenchmarkReport) -> str:
+    """Tabla de resultados legible"""
+    lines = [
+        f"📊 Perfil '{report.profile}' - GLTF {report.gltf_size_mb:.2f}MB + BIN {report.bin_size_mb:.1f}MB",
+        f"{'Etapa':<32}{'mediana':>12}{'mín':>12}{'máx':>12}{'pico mem':>12}"
+    ]
+    for case in report.cases:
+        lines.append(
+            f"{case.name:<32}{case.median_seconds * 1000:>10.2f}ms{case.min_seconds * 1000:>10.2f}ms"
+            f"{case.max_seconds * 1000:>10.2f}ms{case.peak_memory_mb:>10.2f}MB"
+        )
+    return '\n'.join(lines)
+
+def main(argv: List[str] = None) -> int:
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Benchmark del pipeline de análisis GLTF")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='small')
+    parser.add_argument('--scale', type=float, default=1.0, help="Factor de escala sobre el perfil")
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--compare', action='store_true', help="Comparar contra el baseline guardado")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--baseline-dir', default=DEFAULT_BASELINE_DIR)
+    args = parser.parse_args(argv)
+
+    spec = PROFILES[args.profile]
+    profile = args.profile
+    if args.scale != 1.0:
+        spec = spec.scaled(args.scale)
+        profile = f"{args.profile}_x{args.scale:g}"
+
+    report = run_benchmark(profile, spec=spec, repeat=args.repeat)
+    print(format_report(report))
+
+    exit_code = 0
+    if args.compare:
+        baseline = load_baseline(profile, args.baseline_dir)
+        if baseline is None:
+            print(f"\n⚠️ No hay baseline para '{profile}' - usa --save-baseline")
+        else:
+            regressions = compare_reports(report, baseline, args.tolerance)
+            if regressions:
+                print(f"\n❌ Regresiones detectadas (tolerancia x{args.tolerance}):")
+                for regression in regressions:
+                    print(f"  • {regression}")
+                exit_code = 1
+            else:
+                print(f"\n✅ Sin regresiones respecto al baseline ({baseline.created_at})")
+
+    if args.save_baseline:
+        print(f"\n💾 Baseline guardado: {save_baseline(report, args.baseline_dir)}")
+
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Generador determinista de archivos GLTF sintéticos estilo CLO3D
+
+Produce un .gltf + .bin con la misma estructura que exporta CLO3D (mallas con
+muchas primitivas, materiales FABRIC/Zipper, nodos con tallas, extras.MetaData
+con MeshList, PhysicalPropertyList, PBRMaterial y SeamLinePairList) y permite
+escalar cada dimensión de forma independiente.
+
+El perfil 'test01' reproduce los conteos de test01.gltf (8 mallas, 174
+materiales, 12 nodos, 199 pares de costura y ~60MB de buffer binario).
+"""
+
+import json
+import os
+import random
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List
+
+import numpy as np
+
+# Tipos de componente GLTF
+FLOAT = 5126
+UNSIGNED_INT = 5125
+
+# Bytes por vértice: POSITION (12) + NORMAL (12) + TEXCOORD_0 (8)
+VERTEX_BYTES = 32
+INDEX_BYTES = 4
+
+@dataclass(frozen=True)
+class SyntheticGLTFSpec:
+    """Dimensiones del archivo sintético"""
+    meshes: int = 8
+    primitives: int = 128
+    vertices_per_primitive: int = 9918
+    indices_per_primitive: int = 37668
+    materials: int = 174
+    nodes: int = 12
+    images: int = 17
+    physical_properties: int = 2
+    pattern_pieces: int = 38
+    seam_pairs: int = 199
+    points_per_seam: int = 47
+    internal_shapes_per_piece: int = 13
+    seed: int = 0
+
+    def scaled(self, factor: float) -> "SyntheticGLTFSpec":
+        """Escalar todas las dimensiones por un factor (mínimo 1 de cada)"""
+        def scale(value: int) -> int:
+            return max(1, int(round(value * factor)))
+        return replace(
+            self,
+            meshes=scale(self.meshes),
+            primitives=scale(self.primitives),
+            vertices_per_primitive=scale(self.vertices_per_primitive),
+            indices_per_primitive=max(3, scale(self.indices_per_primitive) // 3 * 3),
+            materials=scale(self.materials),
+            nodes=scale(self.nodes),
+            images=scale(self.images),
+            physical_properties=scale(self.physical_properties),
+            pattern_pieces=scale(self.pattern_pieces),
+            seam_pairs=scale(self.seam_pairs),
+            points_per_seam=max(2, scale(self.points_per_seam)),
+            internal_shapes_per_piece=scale(self.internal_shapes_per_piece)
+        )
+
+    @property
+    def bin_size_bytes(self) -> int:
+        """Tamaño del buffer binario resultante"""
+        per_primitive = self.vertices_per_primitive * VERTEX_BYTES + self.indices_per_primitive * INDEX_BYTES
+        return self.primitives * per_primitive
+
+# Perfiles predefinidos
+PROFILES: Dict[str, SyntheticGLTFSpec] = {
+    'tiny': SyntheticGLTFSpec(
+        meshes=3, primitives=6, vertices_per_primitive=64, indices_per_primitive=192,
+        materials=8, nodes=6, images=3, pattern_pieces=4, seam_pairs=10,
+        points_per_seam=8, internal_shapes_per_piece=2
+    ),
+    'small': SyntheticGLTFSpec().scaled(0.1),
+    'test01': SyntheticGLTFSpec(),
+    'large': SyntheticGLTFSpec().scaled(4.0)
+}
+
+# Nombres representativos de exportaciones CLO3D
+_MESH_NAMES = [
+    'Cloth_mesh', 'Zipper_front', 'Button_cuff_left', 'Velcro_closure_side', 'Sleeve_left',
+    'Sleeve_right', 'Collar_main', 'Snap_pocket', 'Hem_lower', 'Waist_binding'
+]
+_MATERIAL_NAMES = [
+    'FABRIC 1_{id}', 'Cotton_Jersey_{id}', 'Polyester_Lining_{id}', 'Elastane_Rib_{id}',
+    'Zipper 1_TapeFabric_{id}', 'Zipper 1_Teeth_{id}', 'Button_Metal_{id}', '{id}_{id2}'
+]
+_NODE_SIZES = ['xs', 's', 'm', 'l', 'xl', 'xxl']
+_PHYSICAL_PROPERTY_NAMES = ['Trim_Hardware', 'Cotton_Jersey', 'Elastane_Rib', 'Denim_Twill', 'Silk_Charmeuse']
+
+def _material(index: int, rng: random.Random) -> Dict[str, Any]:
+    template = _MATERIAL_NAMES[index % len(_MATERIAL_NAMES)]
+    name = template.format(id=3000 + index, id2=147000 + index * 52)
+    metallic = 0.9 if ('Teeth' in name or 'Metal' in name) else 0.0
+    material = {
+        'doubleSided': True,
+        'name': name,
+        'pbrMetallicRoughness': {
+            'baseColorFactor': [round(rng.random(), 6)] * 3 + [1.0],
+            'metallicFactor': metallic,
+            'roughnessFactor': round(rng.uniform(0.2, 0.95), 6)
+        }
+    }
+    if index % 3 == 0:
+        material['extensions'] = {'KHR_materials_specular': {'specularFactor': 0.15}}
+    return material
+
+def _metadata(spec: SyntheticGLTFSpec, rng: random.Random) -> Dict[str, Any]:
+    vertices = spec.vertices_per_primitive
+
+    def point_list(count: int) -> str:
+        start = rng.randrange(0, max(1, vertices - count))
+        return '/'.join(str(start + offset) for offset in range(count))
+
+    physical_properties = []
+    for i in range(spec.physical_properties):
+        stretch = rng.choice([40000.0, 120000.0, 320000.0])
+        physical_properties.append({
+            'Bending-Warp': round(rng.uniform(100, 50000), 4),
+            'Bending-Weft': round(rng.uniform(100, 50000), 4),
+            'BucklingRatio-Warp': 0.01,
+            'BucklingRatio-Weft': 0.01,
+            'BucklingStiffness-Warp': 0.99,
+            'BucklingStiffness-Weft': 0.99,
+            'Density': round(rng.uniform(0.0001, 0.05), 6),
+            'FrictionCoefficient': 0.03,
+            'InternalDamping': 0.0001,
+            'PhysicalPropertyName': f"{_PHYSICAL_PROPERTY_NAMES[i % len(_PHYSICAL_PROPERTY_NAMES)]}_{i}",
+            'Shear': stretch * 2,
+            'Stretch-Warp': stretch,
+            'Stretch-Weft': stretch
+        })
+
+    mesh_list = []
+    for i in range(spec.pattern_pieces):
+        mesh_list.append({
+            'InternalShapeList': [{
+                'FoldAngle': 0.0,
+                'Hole': 'false',
+                'InnerBKScale': 1.0,
+                'Line': {'MeshPointIndex': point_list(rng.randint(2, 24))},
+                'RenderFold': 'true'
+            } for _ in range(spec.internal_shapes_per_piece)],
+            'MeshEndIndex': vertices,
+            'MeshIndex': i,
+            'MeshName': f"Pattern2D_{2100 + i}",
+            'MeshStartIndex': 0,
+            'PhysicalPropertyName': physical_properties[i % len(physical_properties)]['PhysicalPropertyName']
+        })
+
+    seam_pairs = []
+    for _ in range(spec.seam_pairs):
+        seam_pairs.append({
+            'BKScale': 1.0,
+            'FoldAngle': 0.0,
+            'SeamLine': [{
+                'MeshIndex': rng.randrange(spec.pattern_pieces),
+                'MeshPointIndex': point_list(spec.points_per_seam)
+            } for _ in range(2)]
+        })
+
+    pbr_materials = [{
+        'Name': f"FABRIC 1_FRONT_{3459 + i}",
+        'NormalMap': {
+            'Angle': 90.0, 'AngleUnit': 'degree',
+            'FilePath': f"texture_{i}_NRM.jpg", 'FilePathWithIntensity': f"texture_{i}_NRM_100.jpg",
+            'Height': 1024, 'HeightUnit': 'px', 'NormalIntensityInPercentage': 100,
+            'Width': 1024, 'WidthUnit': 'px'
+        },
+        'Opacity': 100,
+        'globalColor': {'B': 62, 'G': 62, 'Intensity': 1, 'Name': '(None)', 'R': 62}
+    } for i in range(min(spec.materials, 2))]
+
+    return {
+        'MeshList': mesh_list,
+        'PBRMaterial': pbr_materials,
+        'PhysicalPropertyList': physical_properties,
+        'SeamLinePairList': seam_pairs
+    }
+
+def generate_gltf(spec: SyntheticGLTFSpec, bin_uri: str = 'synthetic.bin') -> Dict[str, Any]:
+    """Generar el documento JSON del GLTF (sin el buffer binario)"""
+    rng = random.Random(spec.seed)
+
+    materials = [_material(i, rng) for i in range(spec.materials)]
+
+    # Distribuir primitivas entre mallas (la primera concentra la mayoría, como CLO)
+    mesh_count = min(spec.meshes, spec.primitives)
+    primitive_counts = [1] * mesh_count
+    for i in range(spec.primitives - mesh_count):
+        primitive_counts[0 if i % 2 == 0 else (i // 2) % mesh_count] += 1
+
+    accessors: List[Dict[str, Any]] = []
+    buffer_views: List[Dict[str, Any]] = []
+    meshes = []
+    offset = 0
+    vertices = spec.vertices_per_primitive
+    indices = spec.indices_per_primitive
+
+    def add_view(byte_length: int) -> int:
+        nonlocal offset
+        buffer_views.append({'buffer': 0, 'byteLength': byte_length, 'byteOffset': offset})
+        offset += byte_length
+        return len(buffer_views) - 1
+
+    for mesh_index, count in enumerate(primitive_counts):
+        primitives = []
+        for _ in range(count):
+            base = len(accessors)
+            accessors.append({'bufferView': add_view(indices * INDEX_BYTES), 'componentType': UNSIGNED_INT,
+                              'count': indices, 'max': [vertices - 1], 'min': [0], 'type': 'SCALAR'})
+            accessors.append({'bufferView': add_view(vertices * 12), 'componentType': FLOAT, 'count': vertices,
+                              'max': [0.5, 1.8, 0.3], 'min': [-0.5, 0.0, -0.3], 'type': 'VEC3'})
+            accessors.append({'bufferView': add_view(vertices * 12), 'componentType': FLOAT, 'count': vertices,
+                              'max': [1.0, 1.0, 1.0], 'min': [-1.0, -1.0, -1.0], 'type': 'VEC3'})
+            accessors.append({'bufferView': add_view(vertices * 8), 'componentType': FLOAT, 'count': vertices,
+                              'max': [1.0, 1.0], 'min': [0.0, 0.0], 'type': 'VEC2'})
+            primitives.append({
+                'attributes': {'NORMAL': base + 2, 'POSITION': base + 1, 'TEXCOORD_0': base + 3},
+                'indices': base,
+                'material': rng.randrange(spec.materials)
+            })
+        name = _MESH_NAMES[mesh_index % len(_MESH_NAMES)]
+        meshes.append({'name': name if mesh_index < len(_MESH_NAMES) else f"{name}_{mesh_index}", 'primitives': primitives})
+
+    nodes: List[Dict[str, Any]] = [{'children': list(range(1, spec.nodes)), 'name': 'synthetic_Scene_Node'}]
+    for i in range(1, spec.nodes):
+        node: Dict[str, Any] = {'name': f"Garment_{_NODE_SIZES[i % len(_NODE_SIZES)]}_{i}"}
+        if i - 1 < mesh_count:
+            node['mesh'] = i - 1
+        if i % 2 == 0:
+            factor = round(0.9 + 0.05 * (i % len(_NODE_SIZES)), 4)
+            node['scale'] = [factor, factor, factor]
+        else:
+            node['translation'] = [round(rng.uniform(-0.1, 0.1), 6), round(rng.uniform(0.5, 1.6), 6), 0.0]
+        nodes.append(node)
+
+    images = [{'uri': f"texture_{i}.jpg"} for i in range(spec.images)]
+    textures = [{'name': 'Texture', 'sampler': 0, 'source': i} for i in range(spec.images)]
+    for i, material in enumerate(materials[:spec.images]):
+        material['normalTexture'] = {'index': i}
+
+    return {
+        'accessors': accessors,
+        'asset': {'generator': 'CLO Standalone Synthetic Benchmark', 'version': '2.0'},
+        'bufferViews': buffer_views,
+        'buffers': [{'byteLength': offset, 'uri': bin_uri}],
+        'extensionsRequired': ['KHR_texture_transform'],
+        'extensionsUsed': ['KHR_materials_specular', 'KHR_texture_transform'],
+        'extras': {'MetaData': _metadata(spec, rng)},
+        'images': images,
+        'materials': materials,
+        'meshes': meshes,
+        'nodes': nodes,
+        'samplers': [{'magFilter': 9729, 'minFilter': 9987}],
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'textures': textures
+    }
+
+def _write_bin(spec: SyntheticGLTFSpec, path: str):
+    """Escribir el buffer binario primitiva a primitiva (memoria acotada)"""
+    rng = np.random.default_rng(spec.seed)
+    vertices = spec.vertices_per_primitive
+    with open(path, 'wb') as f:
+        for _ in range(spec.primitives):
+            f.write(rng.integers(0, vertices, spec.indices_per_primitive, dtype=np.uint32).tobytes())
+            positions = rng.uniform((-0.5, 0.0, -0.3), (0.5, 1.8, 0.3), (vertices, 3)).astype(np.float32)
+            f.write(positions.tobytes())
+            normals = rng.normal(size=(vertices, 3)).astype(np.float32)
+            normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-6)
+            f.write(normals.tobytes())
+            f.write(rng.random((vertices, 2), dtype=np.float32).tobytes())
+
+def write_gltf(spec: SyntheticGLTFSpec, directory: str, name: str = 'synthetic', write_bin: bool = True) -> str:
+    """Escribir el .gltf (y su .bin) en un directorio; devuelve la ruta del .gltf"""
+    os.makedirs(directory, exist_ok=True)
+    gltf_path = os.path.join(directory, f"{name}.gltf")
+    bin_name = f"{name}.bin"
+
+    with open(gltf_path, 'w', encoding='utf-8') as f:
+        json.dump(generate_gltf(spec, bin_uri=bin_name), f, separators=(',', ':'))
+    if write_bin:
+        _write_bin(spec, os.path.join(directory, bin_name))
+    return gltf_path
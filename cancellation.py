@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Cancelación Cooperativa
+Tokens de cancelación y plazos (deadline) para interrumpir análisis en curso
+
+Un análisis no se puede matar desde fuera sin dejar el proceso en mal estado,
+así que cada etapa consulta el token entre elementos (meshes, materiales,
+nodos, bloques del hash). Cancelar o superar el plazo hace que la siguiente
+consulta lance AnalysisCancelled, liberando el worker en milisegundos.
+
+El plazo usa el reloj time.perf_counter; MOVING_ANALYSIS_TIMEOUT fija un
+tiempo máximo (segundos) por defecto para cada análisis.
+"""
+
+import os
+import threading
+import time
+from typing import Iterable, Iterator, Optional, TypeVar
+
+ANALYSIS_TIMEOUT_ENV_VAR = 'MOVING_ANALYSIS_TIMEOUT'
+
+# Elementos procesados entre consultas al token en los bucles largos
+CHECK_INTERVAL = 32
+
+T = TypeVar('T')
+
+class AnalysisCancelled(Exception):
+    """El análisis se interrumpió por cancelación o por superar el plazo"""
+
+    def __init__(self, reason: str = 'cancelado'):
+        super().__init__(f"Análisis interrumpido: {reason}")
+        self.reason = reason
+
+def timeout_from_env() -> Optional[float]:
+    """Tiempo máximo por análisis según MOVING_ANALYSIS_TIMEOUT (None: sin límite)"""
+    value = os.getenv(ANALYSIS_TIMEOUT_ENV_VAR, '').strip()
+    if not value:
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        raise ValueError(f"{ANALYSIS_TIMEOUT_ENV_VAR} debe ser un número de segundos: {value!r}")
+    return timeout if timeout > 0 else None
+
+class CancellationToken:
+    """Token compartido entre quien lanza el análisis y las etapas que lo ejecutan"""
+
+    def __init__(self, timeout: Optional[float] = None, deadline: Optional[float] = None):
+        self._event = threading.Event()
+        self._reason: Optional[str] = None
+        if timeout is not None:
+            timeout_deadline = time.perf_counter() + timeout
+            deadline = timeout_deadline if deadline is None else min(deadline, timeout_deadline)
+        self.deadline = deadline
+
+    def cancel(self, reason: str = 'cancelado por el usuario'):
+        """Pedir la cancelación (seguro desde cualquier hilo)"""
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.cancel('plazo máximo superado')
+            return True
+        return False
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self._reason
+
+    def remaining(self) -> Optional[float]:
+        """Segundos hasta el plazo (None si no hay plazo)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.perf_counter())
+
+    def check(self):
+        """Lanzar AnalysisCancelled si se pidió la cancelación o venció el plazo"""
+        if self.cancelled:
+            raise AnalysisCancelled(self._reason)
+
+    def checked(self, items: Iterable[T], every: int = CHECK_INTERVAL) -> Iterator[T]:
+        """Iterar consultando el token cada ``every`` elementos"""
+        for i, item in enumerate(items):
+            if i % every == 0:
+                self.check()
+            yield item
+
+class _NeverCancelled(CancellationToken):
+    """Token nulo para usos sin cancelación (las consultas no tienen coste)"""
+
+    def cancel(self, reason: str = 'cancelado por el usuario'):
+        raise RuntimeError("El token nulo no se puede cancelar; crear un CancellationToken")
+
+    @property
+    def cancelled(self) -> bool:
+        return False
+
+    def check(self):
+        pass
+
+    def checked(self, items: Iterable[T], every: int = CHECK_INTERVAL) -> Iterable[T]:
+        return items
+
+NEVER_CANCELLED = _NeverCancelled()
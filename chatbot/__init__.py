@@ -4,6 +4,7 @@ Chatbot module for Moving Accessibility Analyzer
 
 from .accessibility_chatbot import AccessibilityChatbot, ChatSession, accessibility_chatbot
 from .llm_client import LLMManager, LLMClient, llm_manager
+from .rate_limiter import ProviderRateLimiter, RateLimiterStats
 from .system_prompts import SystemPrompts
 
 # Importar LLMProvider desde config
@@ -19,6 +20,8 @@ __all__ = [
     'LLMManager', 
     'LLMClient', 
     'llm_manager',
+    'ProviderRateLimiter',
+    'RateLimiterStats',
     'SystemPrompts',
     'LLMProvider'
 ]
\ No newline at end of file
@@ -98,7 +98,7 @@ class AccessibilityChatbot:
         available_providers = self.llm_manager.get_available_providers()
         if available_providers:
             self.default_provider = available_providers[0]
-            logger.info(f"Proveedor por defecto: {self.default_provider.value}")
+            logger.info("Proveedor por defecto: %s", self.default_provider.value)
         else:
             logger.warning("No hay proveedores LLM disponibles")
     
@@ -107,7 +107,7 @@ class AccessibilityChatbot:
         session = ChatSession(analysis_results)
         self.active_sessions[session.session_id] = session
         
-        logger.info(f"Nueva sesión de chat creada: {session.session_id}")
+        logger.info("Nueva sesión de chat creada: %s", session.session_id)
         return session.session_id
     
     def get_session(self, session_id: str) -> Optional[ChatSession]:
@@ -151,12 +151,12 @@ class AccessibilityChatbot:
             # Agregar respuesta del asistente
             session.add_assistant_message(assistant_response)
             
-            logger.info(f"Chat procesado exitosamente en sesión {session_id}")
+            logger.info("Chat procesado exitosamente en sesión %s", session_id)
             return assistant_response, True
             
         except Exception as e:
             error_msg = f"Error procesando chat: {str(e)}"
-            logger.error(f"Error en chat {session_id}: {e}")
+            logger.error("Error en chat %s: %s", session_id, e)
             return error_msg, False
     
     def get_available_providers(self) -> List[Dict[str, Any]]:
@@ -225,7 +225,7 @@ class AccessibilityChatbot:
                 result = await self.llm_manager.test_connection(provider)
                 results[provider.value] = result
             except Exception as e:
-                logger.error(f"Error probando {provider.value}: {e}")
+                logger.error("Error probando %s: %s", provider.value, e)
                 results[provider.value] = False
         
         return results
@@ -242,7 +242,7 @@ class AccessibilityChatbot:
         
         for session_id in sessions_to_remove:
             del self.active_sessions[session_id]
-            logger.info(f"Sesión {session_id} eliminada por antigüedad")
+            logger.info("Sesión %s eliminada por antigüedad", session_id)
         
         return len(sessions_to_remove)
 
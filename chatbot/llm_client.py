@@ -6,24 +6,62 @@ Cliente que maneja múltiples proveedores de LLM de forma transparente
 
 import asyncio
 import logging
+import time
 from typing import Dict, Any, List, Optional, AsyncGenerator
 import httpx
 import json
 from dataclasses import asdict
 
 from config.llm_config import LLMProvider, LLMConfig, llm_config_manager
+from chatbot.rate_limiter import (
+    ProviderRateLimiter, RateLimiterStats, RETRYABLE_STATUS_CODES,
+    get_rate_limiter, get_all_rate_limiter_stats
+)
+import metrics
 
 logger = logging.getLogger(__name__)
 
+# Métricas de latencia y errores por proveedor
+LLM_REQUESTS_TOTAL = metrics.counter(
+    'moving_llm_requests_total', 'Solicitudes de chat completion por proveedor y resultado', ['provider', 'outcome']
+)
+LLM_REQUEST_DURATION = metrics.histogram(
+    'moving_llm_request_duration_seconds', 'Latencia de chat completion (incluye cola y reintentos)', ['provider'],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+)
+LLM_RETRIES_TOTAL = metrics.counter(
+    'moving_llm_retries_total', 'Reintentos por respuestas de saturación', ['provider', 'status_code']
+)
+LLM_IN_FLIGHT = metrics.gauge('moving_llm_in_flight', 'Solicitudes en curso por proveedor', ['provider'])
+LLM_QUEUE_DEPTH = metrics.gauge('moving_llm_queue_depth', 'Solicitudes esperando turno por proveedor', ['provider'])
+
+def _collect_rate_limiter_gauges():
+    """Actualizar gauges de concurrencia desde los limitadores activos"""
+    for stats in get_all_rate_limiter_stats():
+        LLM_IN_FLIGHT.labels(stats.provider).set(stats.in_flight)
+        LLM_QUEUE_DEPTH.labels(stats.provider).set(stats.queue_depth)
+
+metrics.REGISTRY.on_collect(_collect_rate_limiter_gauges)
+
 class LLMClient:
     """Cliente unificado para múltiples proveedores de LLM"""
     
-    def __init__(self, provider: LLMProvider):
+    def __init__(
+        self,
+        provider: LLMProvider,
+        config: Optional[LLMConfig] = None,
+        rate_limiter: Optional[ProviderRateLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         self.provider = provider
-        self.config = llm_config_manager.get_config(provider)
+        self.config = config or llm_config_manager.get_config(provider)
         
         if not self.config or not self.config.api_key:
             raise ValueError(f"No se encontró configuración válida para {provider.value}")
+        
+        # Limitador compartido por proveedor (todas las sesiones usan el mismo)
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.config)
+        self._transport = transport
     
     async def chat_completion(
         self, 
@@ -31,24 +69,64 @@ class LLMClient:
         stream: bool = False
     ) -> Dict[str, Any]:
         """Realizar chat completion con el proveedor configurado"""
-        
+        start = time.perf_counter()
         try:
-            if self.provider == LLMProvider.OPENAI:
-                return await self._openai_completion(messages, stream)
-            elif self.provider == LLMProvider.ANTHROPIC:
-                return await self._anthropic_completion(messages, stream)
-            elif self.provider == LLMProvider.GROQ:
-                return await self._groq_completion(messages, stream)
-            elif self.provider == LLMProvider.MISTRAL:
-                return await self._mistral_completion(messages, stream)
-            elif self.provider == LLMProvider.OPENROUTER:
-                return await self._openrouter_completion(messages, stream)
-            else:
-                raise ValueError(f"Proveedor no soportado: {self.provider}")
-                
-        except Exception as e:
-            logger.error(f"Error en chat completion con {self.provider.value}: {e}")
+            response = await self._chat_completion_with_retries(messages, stream)
+        except Exception:
+            LLM_REQUESTS_TOTAL.labels(self.provider.value, 'error').inc()
             raise
+        LLM_REQUESTS_TOTAL.labels(self.provider.value, 'success').inc()
+        LLM_REQUEST_DURATION.labels(self.provider.value).observe(time.perf_counter() - start)
+        return response
+    
+    async def _chat_completion_with_retries(
+        self, 
+        messages: List[Dict[str, str]], 
+        stream: bool
+    ) -> Dict[str, Any]:
+        """Enviar la solicitud respetando el limitador y reintentando ante saturación"""
+        attempt = 0
+        while True:
+            async with self.rate_limiter.slot():
+                try:
+                    return await self._dispatch_completion(messages, stream)
+                except httpx.HTTPStatusError as e:
+                    status_code = e.response.status_code
+                    if status_code not in RETRYABLE_STATUS_CODES or attempt >= self.config.max_retries:
+                        logger.error("Error en chat completion con %s: %s", self.provider.value, e)
+                        raise
+                    delay = self.rate_limiter.backoff_delay(attempt, e.response.headers.get("Retry-After"))
+                    self.rate_limiter.record_throttle(status_code, delay)
+                    LLM_RETRIES_TOTAL.labels(self.provider.value, status_code).inc()
+                except Exception as e:
+                    logger.error("Error en chat completion con %s: %s", self.provider.value, e)
+                    raise
+            
+            # Esperar fuera del slot para no bloquear a otras sesiones
+            attempt += 1
+            await asyncio.sleep(delay)
+    
+    async def _dispatch_completion(self, messages: List[Dict[str, str]], stream: bool) -> Dict[str, Any]:
+        """Enviar la solicitud al proveedor configurado"""
+        if self.provider == LLMProvider.OPENAI:
+            return await self._openai_completion(messages, stream)
+        elif self.provider == LLMProvider.ANTHROPIC:
+            return await self._anthropic_completion(messages, stream)
+        elif self.provider == LLMProvider.GROQ:
+            return await self._groq_completion(messages, stream)
+        elif self.provider == LLMProvider.MISTRAL:
+            return await self._mistral_completion(messages, stream)
+        elif self.provider == LLMProvider.OPENROUTER:
+            return await self._openrouter_completion(messages, stream)
+        else:
+            raise ValueError(f"Proveedor no soportado: {self.provider}")
+    
+    async def _post_json(self, url: str, headers: Dict[str, str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST JSON al proveedor y devolver la respuesta decodificada"""
+        async with httpx.AsyncClient(timeout=self.config.timeout, transport=self._transport) as client:
+            response = await client.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            return response.json()
     
     async def _openai_completion(self, messages: List[Dict[str, str]], stream: bool) -> Dict[str, Any]:
         """Completion para OpenAI"""
@@ -65,14 +143,7 @@ class LLMClient:
             "stream": stream
         }
         
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post_json("https://api.openai.com/v1/chat/completions", headers, payload)
     
     async def _anthropic_completion(self, messages: List[Dict[str, str]], stream: bool) -> Dict[str, Any]:
         """Completion para Anthropic Claude"""
@@ -103,14 +174,7 @@ class LLMClient:
         if system_message:
             payload["system"] = system_message
         
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post_json("https://api.anthropic.com/v1/messages", headers, payload)
     
     async def _groq_completion(self, messages: List[Dict[str, str]], stream: bool) -> Dict[str, Any]:
         """Completion para Groq"""
@@ -127,14 +191,7 @@ class LLMClient:
             "stream": stream
         }
         
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(
-                f"{self.config.base_url}/chat/completions",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post_json(f"{self.config.base_url}/chat/completions", headers, payload)
     
     async def _mistral_completion(self, messages: List[Dict[str, str]], stream: bool) -> Dict[str, Any]:
         """Completion para Mistral"""
@@ -151,14 +208,7 @@ class LLMClient:
             "stream": stream
         }
         
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(
-                f"{self.config.base_url}/chat/completions",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post_json(f"{self.config.base_url}/chat/completions", headers, payload)
     
     async def _openrouter_completion(self, messages: List[Dict[str, str]], stream: bool) -> Dict[str, Any]:
         """Completion para OpenRouter"""
@@ -177,14 +227,7 @@ class LLMClient:
             "stream": stream
         }
         
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(
-                f"{self.config.base_url}/chat/completions",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post_json(f"{self.config.base_url}/chat/completions", headers, payload)
     
     def get_response_text(self, response: Dict[str, Any]) -> str:
         """Extraer texto de respuesta según el proveedor"""
@@ -194,8 +237,12 @@ class LLMClient:
             else:
                 return response.get("choices", [{}])[0].get("message", {}).get("content", "")
         except (KeyError, IndexError) as e:
-            logger.error(f"Error extrayendo respuesta de {self.provider.value}: {e}")
+            logger.error("Error extrayendo respuesta de %s: %s", self.provider.value, e)
             return "Error procesando respuesta del LLM"
+    
+    def get_rate_limit_stats(self) -> RateLimiterStats:
+        """Métricas de cola y espera del limitador del proveedor"""
+        return self.rate_limiter.stats()
 
 class LLMManager:
     """Gestor de múltiples clientes LLM"""
@@ -211,14 +258,18 @@ class LLMManager:
         for provider in available_providers:
             try:
                 self.clients[provider] = LLMClient(provider)
-                logger.info(f"Cliente LLM inicializado: {provider.value}")
+                logger.info("Cliente LLM inicializado: %s", provider.value)
             except Exception as e:
-                logger.warning(f"No se pudo inicializar {provider.value}: {e}")
+                logger.warning("No se pudo inicializar %s: %s", provider.value, e)
     
     def get_available_providers(self) -> List[LLMProvider]:
         """Obtener proveedores disponibles"""
         return list(self.clients.keys())
     
+    def get_rate_limit_stats(self) -> List[RateLimiterStats]:
+        """Métricas de los limitadores de todos los proveedores"""
+        return get_all_rate_limiter_stats()
+    
     def get_client(self, provider: LLMProvider) -> Optional[LLMClient]:
         """Obtener cliente específico"""
         return self.clients.get(provider)
@@ -258,7 +309,7 @@ class LLMManager:
             response = await client.chat_completion(test_messages)
             return bool(response)
         except Exception as e:
-            logger.error(f"Test de conexión falló para {provider.value}: {e}")
+            logger.error("Test de conexión falló para %s: %s", provider.value, e)
             return False
 
 # Instancia global del gestor
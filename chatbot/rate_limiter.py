@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter para proveedores LLM
+Limitador de concurrencia y token bucket por proveedor, compartido entre sesiones
+
+Cada sesión de Streamlit ejecuta el chatbot en su propio hilo y event loop,
+por lo que el estado del limitador se protege con un lock de threading y los
+waiters se despiertan en su propio loop con ``call_soon_threadsafe``.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+from config.llm_config import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+# Códigos HTTP que indican saturación temporal del proveedor
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+@dataclass
+class RateLimiterStats:
+    """Métricas de un limitador de proveedor"""
+    provider: str
+    max_concurrent: int
+    requests_per_minute: int
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+    total_requests: int
+    throttled_responses: int
+    retries: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.total_requests if self.total_requests else 0.0
+
+class TokenBucket:
+    """Token bucket thread-safe con reservas (los tokens pueden quedar en negativo)"""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reservar un token y devolver los segundos a esperar antes de usarlo"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def pause(self, seconds: float):
+        """Bloquear el bucket (p. ej. tras un 429 con Retry-After)"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+class ProviderRateLimiter:
+    """Limitador de concurrencia + tasa para un proveedor LLM"""
+
+    def __init__(
+        self,
+        provider: str,
+        max_concurrent: int = 4,
+        requests_per_minute: int = 60,
+        burst: Optional[int] = None,
+        max_backoff: float = 60.0
+    ):
+        self.provider = provider
+        self.max_concurrent = max(1, max_concurrent)
+        self.requests_per_minute = max(1, requests_per_minute)
+        self.max_backoff = max_backoff
+        self._bucket = TokenBucket(
+            rate_per_second=self.requests_per_minute / 60.0,
+            capacity=burst if burst is not None else self.max_concurrent
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+        # Métricas
+        self._max_queue_depth = 0
+        self._total_requests = 0
+        self._throttled = 0
+        self._retries = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @classmethod
+    def from_config(cls, config: LLMConfig) -> "ProviderRateLimiter":
+        """Crear limitador a partir de la configuración del proveedor"""
+        return cls(
+            provider=config.provider.value,
+            max_concurrent=config.max_concurrent_requests,
+            requests_per_minute=config.requests_per_minute
+        )
+
+    @asynccontextmanager
+    async def slot(self):
+        """Context manager: esperar turno (concurrencia y tasa) y liberar al salir"""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self):
+        """Esperar un slot de concurrencia y un token de tasa"""
+        loop = asyncio.get_running_loop()
+        enqueued_at = time.monotonic()
+        entry = None
+
+        with self._lock:
+            if self._in_flight < self.max_concurrent and not self._waiters:
+                self._in_flight += 1
+            else:
+                entry = (loop, loop.create_future())
+                self._waiters.append(entry)
+                self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+
+        if entry is not None:
+            try:
+                await entry[1]
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._waiters.remove(entry)
+                        removed = True
+                    except ValueError:
+                        removed = False
+                # Si el slot ya nos fue asignado hay que devolverlo
+                if not removed and entry[1].done() and not entry[1].cancelled():
+                    self.release()
+                raise
+
+        try:
+            wait = self._bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.release()
+            raise
+
+        waited = time.monotonic() - enqueued_at
+        with self._lock:
+            self._total_requests += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+        if waited > 1.0:
+            logger.debug("Solicitud a %s esperó %.2fs en cola", self.provider, waited)
+
+    def release(self):
+        """Liberar un slot, cediéndolo al siguiente waiter si existe"""
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                if future.done():
+                    continue
+                # El slot se transfiere directamente: in_flight no cambia
+                loop.call_soon_threadsafe(self._wake, future)
+                return
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def _wake(self, future: asyncio.Future):
+        """Despertar a un waiter en su propio loop"""
+        if future.cancelled():
+            # El waiter abandonó la cola mientras el slot estaba en tránsito
+            self.release()
+        elif not future.done():
+            future.set_result(None)
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Calcular espera antes de reintentar (respeta Retry-After si existe)"""
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = min(self.max_backoff, (2 ** attempt) * 0.5)
+            delay += random.uniform(0, delay * 0.25)
+        return min(self.max_backoff, max(0.0, delay))
+
+    def record_throttle(self, status_code: int, delay: float):
+        """Registrar respuesta de saturación y pausar el bucket para todo el proveedor"""
+        with self._lock:
+            self._retries += 1
+            if status_code == 429:
+                self._throttled += 1
+        if status_code == 429:
+            self._bucket.pause(delay)
+        logger.warning(
+            "Proveedor %s respondió %s - reintento en %.2fs", self.provider, status_code, delay
+        )
+
+    def stats(self) -> RateLimiterStats:
+        """Obtener instantánea de métricas"""
+        with self._lock:
+            return RateLimiterStats(
+                provider=self.provider,
+                max_concurrent=self.max_concurrent,
+                requests_per_minute=self.requests_per_minute,
+                in_flight=self._in_flight,
+                queue_depth=len(self._waiters),
+                max_queue_depth=self._max_queue_depth,
+                total_requests=self._total_requests,
+                throttled_responses=self._throttled,
+                retries=self._retries,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait
+            )
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Interpretar cabecera Retry-After (segundos o fecha HTTP)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+# Registro global: un limitador por proveedor compartido por todas las sesiones
+_limiters: Dict[str, ProviderRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+def get_rate_limiter(config: LLMConfig) -> ProviderRateLimiter:
+    """Obtener (o crear) el limitador compartido de un proveedor"""
+    with _registry_lock:
+        limiter = _limiters.get(config.provider.value)
+        if limiter is None:
+            limiter = ProviderRateLimiter.from_config(config)
+            _limiters[config.provider.value] = limiter
+        return limiter
+
+def get_all_rate_limiter_stats() -> List[RateLimiterStats]:
+    """Métricas de todos los limitadores activos"""
+    with _registry_lock:
+        limiters = list(_limiters.values())
+    return [limiter.stats() for limiter in limiters]
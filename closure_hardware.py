@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Herrajes de Cierre
+Detección de botones, cremalleras y broches por material y geometría
+
+CLO exporta la prenda como ``Cloth_mesh``: los nombres de mesh casi nunca
+dicen "button" o "zipper". Cada primitiva instanciada (nodo × primitiva) se
+evalúa en una sola pasada vectorizada con:
+
+- Evidencia de herraje: nombre del material / mesh / nodo (slider, teeth,
+  button, snap...), material metálico (PBR) o propiedad física de herraje
+  (``Trim_Hardware`` en PhysicalPropertyList) en piezas pequeñas
+- Firma geométrica: tamaño (lado mayor de la caja en escala de mundo),
+  redondez (lado medio / mayor), espesor (lado menor / mayor) y repeticiones
+  (piezas con la misma firma y número de vértices)
+
+Los nombres deciden el tipo cuando existen; si no, la geometría: tiras largas
+y estrechas son cadenas de cremallera, discos planos botones y piezas
+redondas pequeñas y gruesas broches.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Dict, List
+
+import numpy as np
+
+from fabric_physics import FabricPhysicsTable, join_materials
+from scene_graph import SceneIndex
+
+logger = logging.getLogger(__name__)
+
+CLOSURE_TYPES = ('zipper', 'button', 'snap')
+
+# Roles por nombre, en orden de prioridad: (patrón, tipo de cierre, rol)
+_NAME_ROLES = (
+    (re.compile(r'slider|deslizador|cursor'), 'zipper', 'slider'),
+    (re.compile(r'teeth|\bchain\b|diente|\bcoil\b'), 'zipper', 'chain'),
+    # El tirador va unido al deslizador: no cuenta como otra cremallera
+    (re.compile(r'zipper|\bzip\b|cremallera|stopper|puller|tirador|\bcierre\b'), 'zipper', 'component'),
+    (re.compile(r'button|bot[oó]n'), 'button', 'button'),
+    (re.compile(r'\bsnaps?\b|press ?stud|popper|broche|corchete'), 'snap', 'snap')
+)
+ROLES = ('', 'slider', 'chain', 'component', 'button', 'snap')
+_ROLE_TYPE = np.array(['', 'zipper', 'zipper', 'zipper', 'button', 'snap'], dtype=object)
+
+# Factor metálico a partir del cual el material es metal
+METALLIC_MIN = 0.7
+# Piezas "pequeñas" (m): la propiedad física de herraje solo cuenta por debajo
+SMALL_PART_MAX = 0.04
+
+# Cadena de cremallera: larga y estrecha
+CHAIN_LENGTH_MIN = 0.05
+CHAIN_WIDTH_RATIO_MAX = 0.25
+# Botones y broches: redondos en su plano mayor
+ROUND_RATIO_MIN = 0.7
+BUTTON_SIZE_RANGE = (0.008, 0.04)
+SNAP_SIZE_MAX = 0.02
+# Espesor relativo que separa un disco (botón) de una pieza abombada (broche)
+FLAT_RATIO_MAX = 0.45
+
+# Tolerancia relativa de tamaño para considerar dos piezas repetidas
+REPEAT_TOLERANCE = 0.1
+
+# Confianza según la evidencia (más un extra si la pieza se repite)
+EVIDENCE_CONFIDENCE = {'name': 0.9, 'metallic': 0.75, 'physics': 0.6}
+REPEAT_BONUS = 0.1
+
+@lru_cache(maxsize=4096)
+def name_role(name: str) -> int:
+    """Rol de herraje (índice en ROLES) según un nombre; 0 si no indica herraje"""
+    cleaned = re.sub(r'[^a-záéíóúñ]+', ' ', name.lower())
+    for pattern, _, role in _NAME_ROLES:
+        if pattern.search(cleaned):
+            return ROLES.index(role)
+    return 0
+
+def _name_roles(items: List[Any]) -> np.ndarray:
+    """Rol de cada elemento por su nombre, con una fila extra (índice -1: sin elemento)"""
+    roles = [name_role(item.get('name') or '') if isinstance(item, dict) else 0 for item in items]
+    return np.array(roles + [0], dtype=np.int8)
+
+def _metallic_materials(materials: List[Any]) -> np.ndarray:
+    """Materiales metálicos (el factor por defecto de la especificación GLTF es 1.0)"""
+    metallic = []
+    for material in materials:
+        pbr = material.get('pbrMetallicRoughness') if isinstance(material, dict) else None
+        factor = pbr.get('metallicFactor', 1.0) if isinstance(pbr, dict) else 0.0
+        metallic.append(isinstance(factor, (int, float)) and factor >= METALLIC_MIN)
+    return np.array(metallic + [False], dtype=bool)
+
+def _physics_hardware_materials(gltf_data: Dict[str, Any], materials: List[Any]) -> np.ndarray:
+    """Materiales cuya propiedad física de CLO es de herraje"""
+    hardware = np.zeros(len(materials) + 1, dtype=bool)
+    table = FabricPhysicsTable.from_gltf(gltf_data)
+    if not len(table):
+        return hardware
+    names = [material.get('name', f'material_{i}') if isinstance(material, dict) else f'material_{i}'
+             for i, material in enumerate(materials)]
+    rows, _ = join_materials(table, gltf_data, names)
+    hardware[:-1] = (rows >= 0) & table.classify()['hardware'][np.maximum(rows, 0)]
+    return hardware
+
+def detect_closure_hardware(gltf_data: Dict[str, Any], scene: SceneIndex) -> Dict[str, Any]:
+    """Cierres (botones, cremalleras, broches) con su conteo a partir de las primitivas instanciadas"""
+    nodes, primitives = scene.primitive_instances()
+    if not len(primitives):
+        return {'available': False, 'parts': 0, 'counts': {kind: 0 for kind in CLOSURE_TYPES}, 'closures': []}
+
+    materials = gltf_data.get('materials', [])
+    meshes = gltf_data.get('meshes', [])
+    gltf_nodes = gltf_data.get('nodes', [])
+    part_material = scene.primitive_material[primitives]
+    part_mesh = scene.node_mesh[nodes]
+    part_parent = scene.parent[nodes]
+
+    # Rol por nombre: material, luego mesh, nodo y nodo padre (el primero que indique herraje)
+    role = _name_roles(materials)[part_material]
+    node_roles = _name_roles(gltf_nodes)
+    for roles, index in ((_name_roles(meshes), part_mesh), (node_roles, nodes), (node_roles, part_parent)):
+        role = np.where(role == 0, roles[index], role)
+
+    # Firma geométrica en escala de mundo (independiente de la rotación del nodo)
+    local = scene.primitive_bounds[primitives]
+    extents = np.sort((local[:, 1] - local[:, 0]) * scene.world_scale(nodes), axis=1)
+    known = ~np.isnan(extents).any(axis=1)
+    extents = np.where(known[:, np.newaxis], extents, 0.0)
+    length = extents[:, 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roundness = np.where(length > 0, extents[:, 1] / length, 0.0)
+        thickness = np.where(length > 0, extents[:, 0] / length, 0.0)
+
+    accessors = gltf_data.get('accessors', [])
+    counts = np.array([accessor.get('count', 0) if isinstance(accessor, dict) else 0 for accessor in accessors] + [0])
+    vertices = counts[scene.primitive_position[primitives]]
+    signature = np.column_stack([
+        vertices,
+        np.round(np.log(np.maximum(extents, 1e-6)) / np.log1p(REPEAT_TOLERANCE))
+    ])
+    _, group, group_size = np.unique(signature, axis=0, return_inverse=True, return_counts=True)
+    repeated = group_size[group.ravel()] >= 2
+
+    # Evidencia de herraje
+    named = role > 0
+    metallic = _metallic_materials(materials)[part_material]
+    physics = _physics_hardware_materials(gltf_data, materials)[part_material] & (length <= SMALL_PART_MAX)
+    hardware = known & (metallic | (physics & repeated))
+
+    # Tipo geométrico de las piezas de herraje sin nombre indicativo
+    chain = hardware & (length >= CHAIN_LENGTH_MIN) & (roundness <= CHAIN_WIDTH_RATIO_MAX)
+    round_part = hardware & (roundness >= ROUND_RATIO_MIN)
+    button = round_part & (length >= BUTTON_SIZE_RANGE[0]) & (length <= BUTTON_SIZE_RANGE[1]) & \
+        (thickness <= FLAT_RATIO_MAX)
+    snap = round_part & (length <= SNAP_SIZE_MAX) & (thickness > FLAT_RATIO_MAX)
+    geometric_role = np.select(
+        [chain, button, snap],
+        [ROLES.index('chain'), ROLES.index('button'), ROLES.index('snap')],
+        default=0
+    )
+    role = np.where(named, role, geometric_role).astype(np.int8)
+    kind = _ROLE_TYPE[role]
+
+    confidence = np.select(
+        [named, metallic, physics],
+        [EVIDENCE_CONFIDENCE['name'], EVIDENCE_CONFIDENCE['metallic'], EVIDENCE_CONFIDENCE['physics']],
+        default=0.0
+    ) + np.where(repeated, REPEAT_BONUS, 0.0)
+    confidence = np.minimum(confidence, 0.95)
+
+    closures = []
+    closure_counts = {}
+    for closure_type in CLOSURE_TYPES:
+        members = np.flatnonzero(kind == closure_type)
+        closure_counts[closure_type] = _closure_count(closure_type, role[members])
+        if not closure_counts[closure_type]:
+            continue
+        evidence = [name for name, mask in (('name', named), ('metallic', metallic), ('physics', physics))
+                    if mask[members].any()]
+        closures.append({
+            'type': closure_type,
+            'count': closure_counts[closure_type],
+            'parts': int(len(members)),
+            'evidence': evidence,
+            'size_mm': round(float(np.median(length[members])) * 1000, 1),
+            'repeated': bool(repeated[members].any()),
+            'confidence': round(float(confidence[members].mean()), 3),
+            'materials': _names(materials, part_material[members]),
+            'meshes': _names(meshes, part_mesh[members])
+        })
+
+    logger.debug("🔘 Herrajes de cierre: %s", closure_counts)
+    return {
+        'available': True,
+        'parts': int(len(primitives)),
+        'hardware_parts': int((kind != '').sum()),
+        'counts': closure_counts,
+        'closures': closures
+    }
+
+def _closure_count(closure_type: str, roles: np.ndarray) -> int:
+    """Cierres a partir de las piezas: una cremallera tiene un deslizador y dos cadenas"""
+    if not len(roles):
+        return 0
+    if closure_type != 'zipper':
+        return int(len(roles))
+    sliders = int((roles == ROLES.index('slider')).sum())
+    chains = int((roles == ROLES.index('chain')).sum())
+    return sliders or -(-chains // 2) or 1
+
+def _names(items: List[Any], indices: np.ndarray, limit: int = 10) -> List[str]:
+    names = [
+        (items[index].get('name') if isinstance(items[index], dict) else None) or f'#{index}'
+        for index in np.unique(indices[indices >= 0]).tolist()
+    ]
+    return list(dict.fromkeys(names))[:limit]
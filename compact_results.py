@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Resultados Compactos
+Tablas por columnas (struct-of-arrays) para los resultados por elemento del análisis GLTF
+
+``garment_elements``, ``size_variations`` y ``fabric_properties['materials']``
+eran listas de diccionarios anidados: en archivos grandes dominan la memoria y
+el tiempo de pickle al pasar resultados entre procesos. Aquí cada campo es una
+columna:
+
+- Números en ``array`` (4 u 8 bytes por valor, sin objetos Python)
+- Cadenas internadas y tuplas compartidas (``context_matches`` y
+  ``exclusion_flags`` se repiten entre elementos: pickle las serializa una vez)
+- Listas anidadas como offsets en columnas planas
+- Un análisis por firma de material, compartido por los materiales repetidos
+
+Los consumidores existentes siguen indexando con claves: cada fila se expone
+como una vista de solo lectura (``RecordView``) que construye el valor pedido
+al acceder a él. No requiere NumPy; la tabla de primitivas, si existe, la
+comparten todas las filas en lugar de copiar columnas por mesh.
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+class RecordView(Mapping):
+    """Fila de una tabla compacta con interfaz de diccionario de solo lectura"""
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: Any, row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        return self._table.field(self._row, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._table.record_keys(self._row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.record_keys(self._row))
+
+    def __len__(self) -> int:
+        return len(self._table.record_keys(self._row))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self._table.field(self._row, key) for key in self._table.record_keys(self._row)}
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+class _RecordTable(Sequence):
+    """Secuencia de filas (vistas) respaldada por columnas"""
+    __slots__ = ('_tuples',)
+
+    def __init__(self):
+        # Tuplas de cadenas compartidas entre filas (no se serializan: solo sirven al construir)
+        self._tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RecordView(self, row) for row in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return RecordView(self, index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, _RecordTable)):
+            return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_list()!r})"
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in _slot_names(type(self)) if name != '_tuples'}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._tuples = {}
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return [view.to_dict() for view in self]
+
+    def _shared(self, values: List[str]) -> Tuple[str, ...]:
+        return _shared(self._tuples, values)
+
+class GarmentElementTable(_RecordTable):
+    """Elementos de prenda por mesh: categorías y elementos detectados como columnas planas"""
+    __slots__ = (
+        'mesh_name', 'mesh_index', 'confidence_score', 'category_offsets',
+        'category', 'category_confidence', 'element_offsets',
+        'element', 'confidence', 'context_matches', 'exclusion_flags', 'validated', 'primitive_count',
+        'primitives'
+    )
+
+    def __init__(self, primitives: Any = None):
+        super().__init__()
+        self.mesh_name: List[str] = []
+        self.mesh_index = array('i')
+        self.confidence_score = array('d')
+        self.category_offsets = array('i', [0])     # categorías de la fila r: [offsets[r], offsets[r + 1])
+        self.category: List[str] = []
+        self.category_confidence = array('d')
+        self.element_offsets = array('i', [0])      # elementos de la categoría c
+        self.element: List[str] = []
+        self.confidence = array('d')
+        self.context_matches: List[Tuple[str, ...]] = []
+        self.exclusion_flags: List[Tuple[str, ...]] = []
+        self.validated = bytearray()
+        self.primitive_count = array('i')           # -1: el elemento no indica primitivas
+        # Tabla de primitivas de las meshes con elementos: resumen por mesh bajo demanda
+        self.primitives = primitives
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]], primitives: Any = None) -> 'GarmentElementTable':
+        table = cls(primitives)
+        for record in records:
+            table.append(record)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.mesh_index)
+
+    def append(self, record: Dict[str, Any]):
+        """Añadir un mesh con sus categorías detectadas (formato de _match_garment_context)"""
+        self.mesh_name.append(record['mesh_name'])
+        self.mesh_index.append(record['mesh_index'])
+        self.confidence_score.append(record['confidence_score'])
+        for category in record['detected_elements']:
+            self.category.append(sys.intern(category['category']))
+            self.category_confidence.append(category['category_confidence'])
+            for element in category['elements']:
+                self.element.append(sys.intern(element['element']))
+                self.confidence.append(element['confidence'])
+                self.context_matches.append(self._shared(element.get('context_matches', [])))
+                self.exclusion_flags.append(self._shared(element.get('exclusion_flags', [])))
+                self.validated.append(bool(element.get('validated', False)))
+                self.primitive_count.append(element.get('primitives', -1))
+            self.element_offsets.append(len(self.element))
+        self.category_offsets.append(len(self.category))
+
+    def record_keys(self, row: int) -> Tuple[str, ...]:
+        return _GARMENT_KEYS if self.primitives is None else _GARMENT_KEYS + ('primitives',)
+
+    def field(self, row: int, key: str) -> Any:
+        if key == 'mesh_name':
+            return self.mesh_name[row]
+        if key == 'mesh_index':
+            return self.mesh_index[row]
+        if key == 'confidence_score':
+            return self.confidence_score[row]
+        if key == 'detected_elements':
+            return [self._category(c) for c in range(self.category_offsets[row], self.category_offsets[row + 1])]
+        if key == 'validation_context':
+            return {}
+        if key == 'primitives' and self.primitives is not None:
+            return self.primitives.mesh_summary(self.mesh_index[row])
+        raise KeyError(key)
+
+    def _category(self, c: int) -> Dict[str, Any]:
+        return {
+            'category': self.category[c],
+            'elements': [self._element(e) for e in range(self.element_offsets[c], self.element_offsets[c + 1])],
+            'category_confidence': self.category_confidence[c]
+        }
+
+    def _element(self, e: int) -> Dict[str, Any]:
+        element = {
+            'element': self.element[e],
+            'confidence': self.confidence[e],
+            'context_matches': list(self.context_matches[e]),
+            'exclusion_flags': list(self.exclusion_flags[e]),
+            'validated': bool(self.validated[e])
+        }
+        if self.primitive_count[e] >= 0:
+            element['primitives'] = self.primitive_count[e]
+        return element
+
+_GARMENT_KEYS = ('mesh_name', 'mesh_index', 'detected_elements', 'confidence_score', 'validation_context')
+
+class SizeVariationTable(_RecordTable):
+    """Variaciones de talla por nodo con sus indicadores como columnas planas"""
+    __slots__ = (
+        'node_name', 'node_index', 'confidence', 'indicator_offsets',
+        'indicator_type', 'indicator_value', 'indicator_confidence', 'geometric_validation'
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.node_name: List[str] = []
+        self.node_index = array('i')
+        self.confidence = array('d')
+        self.indicator_offsets = array('i', [0])
+        self.indicator_type: List[str] = []
+        self.indicator_value: List[str] = []
+        self.indicator_confidence = array('d')
+        # Validación geométrica por fila; la lista de meshes del subárbol se guarda como array
+        self.geometric_validation: List[Optional[Dict[str, Any]]] = []
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'SizeVariationTable':
+        table = cls()
+        for record in records:
+            table.append(record)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.node_index)
+
+    def append(self, record: Dict[str, Any]):
+        self.node_name.append(record['node_name'])
+        self.node_index.append(record['node_index'])
+        self.confidence.append(record['confidence'])
+        for indicator in record['size_indicators']:
+            self.indicator_type.append(sys.intern(indicator['type']))
+            self.indicator_value.append(sys.intern(indicator['value']))
+            self.indicator_confidence.append(indicator['confidence'])
+        self.indicator_offsets.append(len(self.indicator_type))
+
+        validation = record.get('geometric_validation') or None
+        if validation is not None and isinstance(validation.get('meshes'), list):
+            validation = {**validation, 'meshes': array('i', validation['meshes'])}
+        self.geometric_validation.append(validation)
+
+    def record_keys(self, row: int) -> Tuple[str, ...]:
+        return _SIZE_KEYS
+
+    def field(self, row: int, key: str) -> Any:
+        if key == 'node_name':
+            return self.node_name[row]
+        if key == 'node_index':
+            return self.node_index[row]
+        if key == 'confidence':
+            return self.confidence[row]
+        if key == 'size_indicators':
+            return [
+                {'type': self.indicator_type[i], 'value': self.indicator_value[i],
+                 'confidence': self.indicator_confidence[i]}
+                for i in range(self.indicator_offsets[row], self.indicator_offsets[row + 1])
+            ]
+        if key == 'geometric_validation':
+            validation = self.geometric_validation[row]
+            if validation is None:
+                return {}
+            return {name: value.tolist() if isinstance(value, array) else value for name, value in validation.items()}
+        raise KeyError(key)
+
+_SIZE_KEYS = ('node_name', 'node_index', 'size_indicators', 'confidence', 'geometric_validation')
+
+class MaterialTable(Mapping):
+    """Materiales analizados por nombre; el análisis de cada firma se guarda una vez, por columnas"""
+    __slots__ = (
+        '_rows', '_tuples', '_signatures', 'name', 'index', 'analysis',
+        'confidence', 'validation_sources', 'property_keys', 'property_values', 'extra'
+    )
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self._tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self._signatures: Dict[Hashable, int] = {}
+        self.name: List[str] = []
+        self.index = array('i')
+        self.analysis = array('i')                      # análisis (firma) de cada material
+        # Columnas por análisis
+        self.confidence = array('d')
+        self.validation_sources: List[Tuple[str, ...]] = []
+        self.property_keys: List[Tuple[str, ...]] = []   # tuplas compartidas entre análisis
+        self.property_values: List[Tuple[Any, ...]] = []
+        self.extra: List[Optional[Dict[str, Any]]] = []  # otras claves del análisis (normalmente ninguna)
+
+    def add(self, name: str, index: int, analysis: Dict[str, Any], signature: Hashable = None):
+        """Registrar un material; los de la misma firma comparten la fila de análisis"""
+        analysis_row = self._signatures.get(signature) if signature is not None else None
+        if analysis_row is None:
+            analysis_row = self._add_analysis(analysis)
+            if signature is not None:
+                self._signatures[signature] = analysis_row
+        row = self._rows.get(name)
+        if row is None:
+            self._rows[name] = len(self.name)
+            self.name.append(name)
+            self.index.append(index)
+            self.analysis.append(analysis_row)
+        else:
+            # Nombre repetido: como en un diccionario, el último reemplaza al anterior
+            self.index[row] = index
+            self.analysis[row] = analysis_row
+
+    def _add_analysis(self, analysis: Dict[str, Any]) -> int:
+        properties = analysis.get('properties', {})
+        self.confidence.append(analysis.get('confidence', 0.0))
+        self.validation_sources.append(_shared(self._tuples, analysis.get('validation_sources', [])))
+        self.property_keys.append(_shared(self._tuples, properties))
+        self.property_values.append(tuple(properties.values()))
+        self.extra.append(None if _MATERIAL_KEY_SET.issuperset(analysis) else {
+            key: value for key, value in analysis.items() if key not in _MATERIAL_KEY_SET
+        })
+        return len(self.confidence) - 1
+
+    def __getitem__(self, name: str) -> RecordView:
+        return RecordView(self, self._rows[name])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"MaterialTable({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith('_')}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._rows = {name: row for row, name in enumerate(self.name)}
+        self._tuples = {}
+        self._signatures = {}
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: self[name].to_dict() for name in self._rows}
+
+    def confidences(self) -> List[float]:
+        """Confianza de cada material (sin construir vistas)"""
+        return [self.confidence[analysis] for analysis in self.analysis]
+
+    def source_names(self) -> set:
+        """Fuentes de validación usadas por algún material"""
+        return {source for analysis in set(self.analysis) for source in self.validation_sources[analysis]}
+
+    def record_keys(self, row: int) -> Tuple[str, ...]:
+        extra = self.extra[self.analysis[row]]
+        return _MATERIAL_KEYS if extra is None else _MATERIAL_KEYS + tuple(extra)
+
+    def field(self, row: int, key: str) -> Any:
+        if key == 'name':
+            return self.name[row]
+        if key == 'index':
+            return self.index[row]
+        analysis = self.analysis[row]
+        if key == 'properties':
+            return dict(zip(self.property_keys[analysis], self.property_values[analysis]))
+        if key == 'confidence':
+            return self.confidence[analysis]
+        if key == 'validation_sources':
+            return list(self.validation_sources[analysis])
+        extra = self.extra[analysis]
+        if extra is None or key not in extra:
+            raise KeyError(key)
+        return extra[key]
+
+_MATERIAL_KEYS = ('name', 'index', 'properties', 'confidence', 'validation_sources')
+_MATERIAL_KEY_SET = frozenset(_MATERIAL_KEYS)
+
+def _shared(pool: Dict[Tuple[str, ...], Tuple[str, ...]], values: Any) -> Tuple[str, ...]:
+    """Tupla de cadenas internadas, compartida entre filas iguales"""
+    key = tuple(values)
+    shared = pool.get(key)
+    if shared is None:
+        shared = pool[key] = tuple(sys.intern(value) for value in key)
+    return shared
+
+def _slot_names(cls) -> List[str]:
+    return [name for klass in cls.__mro__ for name in getattr(klass, '__slots__', ())]
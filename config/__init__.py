@@ -3,5 +3,6 @@ Configuration module for Moving Accessibility Analyzer
 """
 
 from .llm_config import LLMProvider, LLMConfig, llm_config_manager
+from .logging_config import configure_logging, log_context
 
-__all__ = ['LLMProvider', 'LLMConfig', 'llm_config_manager']
\ No newline at end of file
+__all__ = ['LLMProvider', 'LLMConfig', 'llm_config_manager', 'configure_logging', 'log_context']
\ No newline at end of file
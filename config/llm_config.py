@@ -34,6 +34,9 @@ class LLMConfig:
     max_tokens: int = 4000
     temperature: float = 0.7
     timeout: int = 30
+    max_concurrent_requests: int = 4
+    requests_per_minute: int = 60
+    max_retries: int = 3
 
 class LLMConfigManager:
     """Gestor de configuraciones de LLM"""
@@ -66,7 +69,8 @@ class LLMConfigManager:
                 base_url="https://api.groq.com/openai/v1",
                 model="llama-3.1-8b-instant",
                 max_tokens=4000,
-                temperature=0.7
+                temperature=0.7,
+                requests_per_minute=30
             ),
             
             LLMProvider.MISTRAL: LLMConfig(
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Logging Configuration
+Configuración de logging estructurado (texto o JSON) con niveles por subsistema
+
+Los módulos solo crean su logger con ``logging.getLogger(__name__)``; la
+configuración de handlers la hacen los puntos de entrada (Streamlit, CLI)
+llamando a ``configure_logging()``.
+
+Variables de entorno:
+- MOVING_LOG_FORMAT: "text" (por defecto) o "json"
+- MOVING_LOG_LEVEL: nivel global (por defecto INFO)
+- MOVING_LOG_LEVELS: niveles por subsistema, p. ej. "analyzer=WARNING,chatbot=DEBUG"
+"""
+
+import json
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, TextIO
+
+LOG_FORMAT_ENV = 'MOVING_LOG_FORMAT'
+LOG_LEVEL_ENV = 'MOVING_LOG_LEVEL'
+LOG_LEVELS_ENV = 'MOVING_LOG_LEVELS'
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Alias de subsistema -> loggers que lo componen
+SUBSYSTEM_LOGGERS = {
+    'analyzer': [
+        'analyzer', 'analyzer_main', 'analyzer_gltf_improved', 'formats',
+        'fabric_physics', 'seam_graph', 'gltf_buffers', 'texture_analysis', 'asset_index', 'scene_graph',
+        'size_grading', 'closure_hardware', 'primitive_analysis', 'stage_cache', 'cancellation'
+    ],
+    'chatbot': ['chatbot'],
+    'storage': ['results_store', 'serialization']
+}
+
+# Campos de contexto del análisis en curso (hash de archivo, etapa, sesión...)
+_log_context: ContextVar[Dict[str, Any]] = ContextVar('moving_log_context', default={})
+
+# Atributos estándar de LogRecord (no se emiten como campos extra)
+_RESERVED_ATTRS = set(logging.LogRecord('', 0, '', 0, '', (), None).__dict__) | {'message', 'asctime'}
+
+@contextmanager
+def log_context(**fields):
+    """Agregar campos de contexto a todos los logs emitidos dentro del bloque"""
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+def bind_log_context(**fields):
+    """Agregar campos al contexto actual (se descartan al salir del log_context que lo envuelve)"""
+    _log_context.set({**_log_context.get(), **fields})
+
+def get_log_context() -> Dict[str, Any]:
+    """Campos de contexto vigentes"""
+    return dict(_log_context.get())
+
+class ContextFilter(logging.Filter):
+    """Copiar los campos de contexto al LogRecord"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: value for key, value in record.__dict__.items() if key not in _RESERVED_ATTRS}
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro; el mensaje solo se formatea si se emite"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage()
+        }
+        payload.update(_extra_fields(record))
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str, separators=(',', ':'))
+
+class ContextTextFormatter(logging.Formatter):
+    """Formato de texto tradicional con los campos de contexto al final"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        fields = _extra_fields(record)
+        if fields:
+            message += ' [' + ' '.join(f"{key}={value}" for key, value in fields.items()) + ']'
+        return message
+
+def parse_levels(value: str) -> Dict[str, str]:
+    """Interpretar "analyzer=WARNING,chatbot=DEBUG" """
+    levels = {}
+    for item in (value or '').split(','):
+        if '=' in item:
+            name, level = item.split('=', 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+def set_subsystem_level(subsystem: str, level: str):
+    """Fijar el nivel de un subsistema (alias de SUBSYSTEM_LOGGERS o nombre de logger)"""
+    for logger_name in SUBSYSTEM_LOGGERS.get(subsystem, [subsystem]):
+        logging.getLogger(logger_name).setLevel(level)
+
+def configure_logging(
+    fmt: Optional[str] = None,
+    level: Optional[str] = None,
+    levels: Optional[Dict[str, str]] = None,
+    stream: Optional[TextIO] = None
+) -> logging.Handler:
+    """Configurar el logging de la aplicación (idempotente)
+
+    Reemplaza el handler instalado por una llamada anterior en lugar de
+    acumular handlers en cada rerun de Streamlit.
+    """
+    fmt = (fmt or os.getenv(LOG_FORMAT_ENV, 'text')).lower()
+    level = (level or os.getenv(LOG_LEVEL_ENV, 'INFO')).upper()
+    levels = {**parse_levels(os.getenv(LOG_LEVELS_ENV, '')), **(levels or {})}
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == 'json' else ContextTextFormatter(TEXT_FORMAT))
+    handler.addFilter(ContextFilter())
+    handler._moving_handler = True
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        if getattr(existing, '_moving_handler', False):
+            root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    for subsystem, subsystem_level in levels.items():
+        set_subsystem_level(subsystem, subsystem_level)
+
+    return handler
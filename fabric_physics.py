@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Física de Telas
+Propiedades físicas de CLO3D (extras.MetaData.PhysicalPropertyList) en tabla columnar
+
+CLO exporta por cada tela su rigidez de estiramiento (Stretch-Warp / Weft),
+flexión (Bending), cizalla (Shear), densidad y fricción. Todos los registros
+se cargan en una matriz NumPy (una fila por tela, una columna por propiedad)
+y las clases de elasticidad, caída y peso se calculan de una vez para todo el
+catálogo.
+
+La unión con los materiales glTF se hace por nombre: MeshList asigna a cada
+patrón (primitiva del mesh de tela, por MeshIndex) un PhysicalPropertyName,
+y cada primitiva tiene su material. Si un material se llama igual que una
+propiedad física, la unión es directa.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from gltf_buffers import cloth_primitives
+
+# Columnas de la tabla (claves de PhysicalPropertyList)
+PHYSICAL_COLUMNS = (
+    'Stretch-Warp', 'Stretch-Weft', 'Bending-Warp', 'Bending-Weft',
+    'Shear', 'Density', 'FrictionCoefficient', 'InternalDamping'
+)
+_COLUMN = {name: i for i, name in enumerate(PHYSICAL_COLUMNS)}
+
+# Densidad CLO en g/mm² -> gramaje en g/m²
+DENSITY_TO_GSM = 1e6
+
+# Umbrales de clasificación (unidades internas de CLO3D)
+STRETCH_HIGH_MAX = 30000.0      # por debajo: elasticidad alta (punto, elastano)
+STRETCH_MEDIUM_MAX = 90000.0    # por debajo: elasticidad media
+DRAPE_FLUID_MAX = 800.0         # flexión media por debajo: caída fluida
+DRAPE_MEDIUM_MAX = 5000.0       # flexión media por debajo: caída media
+WEIGHT_LIGHT_MAX = 150.0        # g/m²
+WEIGHT_MEDIUM_MAX = 350.0       # g/m²
+HARDWARE_STRETCH_MIN = 200000.0
+HARDWARE_BENDING_MIN = 20000.0
+
+STRETCH_CLASSES = ('alta', 'media', 'baja')
+DRAPE_CLASSES = ('fluida', 'media', 'rígida')
+WEIGHT_CLASSES = ('ligera', 'media', 'pesada')
+
+@dataclass
+class FabricPhysicsTable:
+    """Propiedades físicas de todas las telas de un archivo (una fila por tela)"""
+    names: List[str]
+    values: np.ndarray = field(repr=False)
+    _classes: Optional[Dict[str, np.ndarray]] = field(default=None, repr=False)
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'FabricPhysicsTable':
+        """Construir la tabla (los valores ausentes o no numéricos quedan como NaN)"""
+        records = [record for record in records if isinstance(record, dict)]
+        values = np.full((len(records), len(PHYSICAL_COLUMNS)), np.nan, dtype=np.float64)
+        names = []
+        for row, record in enumerate(records):
+            names.append(str(record.get('PhysicalPropertyName', f'physical_{row}')))
+            for column, key in enumerate(PHYSICAL_COLUMNS):
+                value = record.get(key)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    values[row, column] = value
+        return cls(names=names, values=values)
+
+    @classmethod
+    def from_gltf(cls, gltf_data: Dict[str, Any]) -> 'FabricPhysicsTable':
+        records = _metadata(gltf_data).get('PhysicalPropertyList', [])
+        return cls.from_records(records if isinstance(records, list) else [])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.values[:, _COLUMN[name]]
+
+    def classify(self) -> Dict[str, np.ndarray]:
+        """Clases de elasticidad, caída y peso de todas las telas (calculadas una vez)"""
+        if self._classes is not None:
+            return self._classes
+
+        stretch = _pair_mean(self.column('Stretch-Warp'), self.column('Stretch-Weft'))
+        bending = _pair_mean(self.column('Bending-Warp'), self.column('Bending-Weft'))
+        warp, weft = self.column('Stretch-Warp'), self.column('Stretch-Weft')
+        with np.errstate(invalid='ignore'):
+            anisotropy = np.fmax(warp, weft) / np.maximum(np.fmin(warp, weft), 1e-9)
+        weight_gsm = self.column('Density') * DENSITY_TO_GSM
+
+        stretch_class = _bucket(stretch, (STRETCH_HIGH_MAX, STRETCH_MEDIUM_MAX), STRETCH_CLASSES)
+        drape_class = _bucket(bending, (DRAPE_FLUID_MAX, DRAPE_MEDIUM_MAX), DRAPE_CLASSES)
+        weight_class = _bucket(weight_gsm, (WEIGHT_LIGHT_MAX, WEIGHT_MEDIUM_MAX), WEIGHT_CLASSES)
+
+        named_hardware = np.fromiter(
+            (('hardware' in name.lower() or 'trim' in name.lower()) for name in self.names),
+            dtype=bool, count=len(self)
+        )
+        with np.errstate(invalid='ignore'):
+            hardware = named_hardware | ((stretch >= HARDWARE_STRETCH_MIN) & (bending >= HARDWARE_BENDING_MIN))
+
+        self._classes = {
+            'stretch': stretch,
+            'bending': bending,
+            'anisotropy': anisotropy,
+            'weight_gsm': weight_gsm,
+            'stretch_class': stretch_class,
+            'drape_class': drape_class,
+            'weight_class': weight_class,
+            'hardware': hardware
+        }
+        return self._classes
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Fila clasificada como dict de tipos nativos (serializable)"""
+        classes = self.classify()
+        return {
+            'physical_property': self.names[row],
+            'stretch_warp': _native(self.values[row, _COLUMN['Stretch-Warp']]),
+            'stretch_weft': _native(self.values[row, _COLUMN['Stretch-Weft']]),
+            'bending': _native(classes['bending'][row]),
+            'weight_gsm': _native(classes['weight_gsm'][row]),
+            'stretch_class': str(classes['stretch_class'][row]),
+            'drape_class': str(classes['drape_class'][row]),
+            'weight_class': str(classes['weight_class'][row]),
+            'stretch_anisotropy': _native(classes['anisotropy'][row]),
+            'is_hardware': bool(classes['hardware'][row]),
+            'has_stretch': str(classes['stretch_class'][row]) == 'alta'
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumen por tela y distribución de clases"""
+        if not len(self):
+            return {'available': False, 'fabrics': {}}
+        classes = self.classify()
+        return {
+            'available': True,
+            'fabrics': {name: self.record(row) for row, name in enumerate(self.names)},
+            'stretch_classes': _counts(classes['stretch_class']),
+            'drape_classes': _counts(classes['drape_class']),
+            'weight_classes': _counts(classes['weight_class'])
+        }
+
+def material_property_names(gltf_data: Dict[str, Any]) -> Dict[str, str]:
+    """Propiedad física de cada material (por MeshList -> primitiva -> material)"""
+    metadata = _metadata(gltf_data)
+    mesh_list = metadata.get('MeshList', [])
+    meshes = gltf_data.get('meshes', [])
+    materials = gltf_data.get('materials', [])
+    if not isinstance(mesh_list, list) or not meshes:
+        return {}
+
+    primitives = cloth_primitives(meshes, len(mesh_list))
+    votes: Dict[str, Counter] = {}
+    for pattern in mesh_list:
+        if not isinstance(pattern, dict):
+            continue
+        index = pattern.get('MeshIndex')
+        property_name = pattern.get('PhysicalPropertyName')
+        if not isinstance(index, int) or not property_name or not 0 <= index < len(primitives):
+            continue
+        material_index = primitives[index].get('material')
+        if isinstance(material_index, int) and 0 <= material_index < len(materials):
+            material_name = materials[material_index].get('name', f'material_{material_index}')
+            votes.setdefault(material_name, Counter())[str(property_name)] += 1
+
+    # Un material usado por varios patrones toma la propiedad más frecuente
+    return {material: counter.most_common(1)[0][0] for material, counter in votes.items()}
+
+def join_materials(table: FabricPhysicsTable, gltf_data: Dict[str, Any],
+                   material_names: List[str]) -> Tuple[np.ndarray, Dict[str, str]]:
+    """Fila de la tabla para cada material (-1 si no tiene propiedades físicas)"""
+    by_pattern = material_property_names(gltf_data)
+    row_by_name = {name: row for row, name in enumerate(table.names)}
+    rows = np.full(len(material_names), -1, dtype=np.int64)
+    for i, material_name in enumerate(material_names):
+        property_name = by_pattern.get(material_name, material_name)
+        rows[i] = row_by_name.get(property_name, -1)
+    return rows, by_pattern
+
+def _metadata(gltf_data: Dict[str, Any]) -> Dict[str, Any]:
+    extras = gltf_data.get('extras') or {}
+    metadata = extras.get('MetaData') if isinstance(extras, dict) else None
+    return metadata if isinstance(metadata, dict) else {}
+
+def _pair_mean(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Media de urdimbre y trama ignorando el valor ausente"""
+    return np.where(np.isnan(a), b, np.where(np.isnan(b), a, (a + b) / 2))
+
+def _bucket(values: np.ndarray, limits: Tuple[float, float], labels: Tuple[str, str, str]) -> np.ndarray:
+    """Asignar clases por umbrales (NaN -> 'desconocida')"""
+    with np.errstate(invalid='ignore'):
+        conditions = [values < limits[0], values < limits[1], values >= limits[1]]
+    return np.select(conditions, labels, default='desconocida').astype(object)
+
+def _counts(labels: np.ndarray) -> Dict[str, int]:
+    names, counts = np.unique(labels.astype(str), return_counts=True)
+    return {str(name): int(count) for name, count in zip(names, counts)}
+
+def _native(value: float) -> Optional[float]:
+    value = float(value)
+    return None if np.isnan(value) else round(value, 4)
@@ -0,0 +1,147 @@
+"""
+Formatos soportados por el analizador
+Registro de handlers de formato con carga diferida
+
+Cada formato se declara con sus extensiones, el tipo de contenido que lo
+identifica (ver ``formats.sniffing``) y la ruta "modulo:funcion" de su handler.
+El formato se decide por el contenido: la extensión solo desempata entre
+formatos con el mismo contenido (p. ej. .zprj y .zpac, ambos ZIP). El módulo del
+handler solo se importa la primera vez que se analiza un archivo de ese formato,
+de modo que importar el analizador (o la app) no importa todos los parsers.
+
+Un handler recibe ``(analyzer, file_path, file_size_mb, file_format)`` y
+devuelve un AnalysisResults; ``analyzer`` aporta el hash del archivo, el
+temporizador de etapas y los resultados básicos compartidos.
+"""
+
+import importlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from formats.sniffing import (
+    GLB, GLTF_JSON, OBJ_TEXT, ZIP, UnsupportedFormatError, sniff_bytes, sniff_file
+)
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class FormatHandler:
+    """Declaración de un formato y de su handler"""
+    name: str
+    description: str
+    extensions: Tuple[str, ...]
+    loader: str
+    content: str
+    _handler: Optional[Callable] = field(default=None, init=False, repr=False)
+
+    def load(self) -> Callable:
+        """Importar el handler en el primer uso"""
+        if self._handler is None:
+            module_name, function_name = self.loader.split(':')
+            self._handler = getattr(importlib.import_module(module_name), function_name)
+        return self._handler
+
+    @property
+    def loaded(self) -> bool:
+        return self._handler is not None
+
+class FormatRegistry:
+    """Registro de formatos por tipo de contenido y extensión"""
+
+    def __init__(self):
+        self._handlers: Dict[str, FormatHandler] = {}
+        self._lock = threading.Lock()
+
+    def register(self, handler: FormatHandler) -> FormatHandler:
+        """Registrar (o reemplazar) un formato"""
+        with self._lock:
+            self._handlers[handler.name] = handler
+        return handler
+
+    def get(self, name: str) -> Optional[FormatHandler]:
+        return self._handlers.get(name)
+
+    def handlers(self) -> List[FormatHandler]:
+        return list(self._handlers.values())
+
+    @property
+    def extensions(self) -> List[str]:
+        return sorted(ext for handler in self._handlers.values() for ext in handler.extensions)
+
+    def find_by_extension(self, file_name: str) -> Optional[FormatHandler]:
+        suffix = Path(file_name).suffix.lower()
+        for handler in self._handlers.values():
+            if suffix in handler.extensions:
+                return handler
+        return None
+
+    def for_content(self, content: str, file_name: str) -> FormatHandler:
+        """Handler para un tipo de contenido; la extensión desempata entre candidatos"""
+        candidates = [handler for handler in self._handlers.values() if handler.content == content]
+        if not candidates:
+            raise UnsupportedFormatError(
+                f"Formato de archivo no soportado ({content}). "
+                f"Formatos soportados: {', '.join(self.extensions)}"
+            )
+
+        suffix = Path(file_name).suffix.lower()
+        for handler in candidates:
+            if suffix in handler.extensions:
+                return handler
+
+        handler = candidates[0]
+        logger.warning("⚠️ Extensión %s no coincide con el contenido (%s); se analiza como %s",
+                       suffix or '(sin extensión)', content, handler.description)
+        return handler
+
+    def resolve(self, file_path: str) -> FormatHandler:
+        """Elegir el handler leyendo solo la cabecera del archivo"""
+        return self.for_content(sniff_file(file_path), file_path)
+
+    def resolve_bytes(self, data: bytes, file_name: str) -> FormatHandler:
+        """Elegir el handler de un archivo en memoria (p. ej. una subida de Streamlit)"""
+        return self.for_content(sniff_bytes(data), file_name)
+
+# Registro global con los formatos incluidos
+FORMAT_REGISTRY = FormatRegistry()
+
+FORMAT_REGISTRY.register(FormatHandler(
+    name='gltf',
+    description='GLTF 3D Model',
+    extensions=('.gltf',),
+    loader='formats.gltf:analyze_gltf',
+    content=GLTF_JSON
+))
+FORMAT_REGISTRY.register(FormatHandler(
+    name='glb',
+    description='GLTF Binary Model',
+    extensions=('.glb',),
+    loader='formats.gltf:analyze_gltf',
+    content=GLB
+))
+FORMAT_REGISTRY.register(FormatHandler(
+    name='zprj',
+    description='CLO3D Project',
+    extensions=('.zprj',),
+    loader='formats.basic:analyze_basic',
+    content=ZIP
+))
+FORMAT_REGISTRY.register(FormatHandler(
+    name='zpac',
+    description='CLO3D Package',
+    extensions=('.zpac',),
+    loader='formats.basic:analyze_basic',
+    content=ZIP
+))
+FORMAT_REGISTRY.register(FormatHandler(
+    name='obj',
+    description='Wavefront OBJ',
+    extensions=('.obj',),
+    loader='formats.basic:analyze_basic',
+    content=OBJ_TEXT
+))
+
+__all__ = ['FormatHandler', 'FormatRegistry', 'FORMAT_REGISTRY', 'UnsupportedFormatError']
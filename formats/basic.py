@@ -0,0 +1,10 @@
+"""
+Handler básico
+Formatos sin analizador específico (.zprj, .zpac, .obj): resultados básicos con validación manual
+"""
+
+from analyzer_main import AnalysisResults
+
+def analyze_basic(analyzer, file_path: str, file_size_mb: float, file_format) -> AnalysisResults:
+    """Resultados básicos con el nombre del formato"""
+    return analyzer._create_basic_results(file_format.description, file_size_mb)
@@ -0,0 +1,323 @@
+"""
+Handler GLTF
+Análisis con ImprovedGLTFAnalyzer y conversión al formato estándar de resultados
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from analysis_tiers import QUICK, TIER_LABELS
+from analyzer_main import (
+    AnalysisResults, ClosureMetrics, ComfortMetrics, FabricMetrics,
+    HumanValidationItem, ScreeningReport, SizingMetrics
+)
+
+logger = logging.getLogger(__name__)
+
+def analyze_gltf(analyzer, file_path: str, file_size_mb: float, file_format) -> AnalysisResults:
+    """Analizar archivo GLTF (análisis básico si el analizador mejorado no está disponible)"""
+    try:
+        from analyzer_gltf_improved import ImprovedGLTFAnalyzer
+    except ImportError:
+        logger.warning("Analizador GLTF mejorado no disponible")
+        return analyze_gltf_basic(analyzer, file_path, file_size_mb)
+
+    def on_section(section: str, payload: Dict[str, Any]):
+        """Resultados parciales con puntuaciones provisionales"""
+        totals = payload['totals']
+        payload['scores'] = compute_scores(
+            totals['confidence'], totals['size_variations'],
+            totals['accessibility_features'], totals['materials']
+        )
+        analyzer.emit_progress(section, payload)
+
+    gltf_result = ImprovedGLTFAnalyzer(stage_cache=analyzer.stage_cache).analyze_gltf_file(
+        file_path, timer=analyzer.timer, tier=analyzer.tier, deadline=analyzer.deadline,
+        on_section=on_section if analyzer.on_progress is not None else None,
+        cancel_token=analyzer.cancel_token
+    )
+
+    with analyzer.timer.stage('convert'):
+        return convert_gltf_result(gltf_result, file_size_mb, analyzer.file_hash)
+
+def convert_gltf_result(gltf_result, file_size_mb: float, file_hash: str = None) -> AnalysisResults:
+    """Convertir resultado GLTF mejorado al formato estándar"""
+
+    # Métricas de tallas (por nombre; si no hay, la escala inferida por geometría)
+    size_variations = gltf_result.size_variations
+    grading = inferred_grading(gltf_result.deep_analysis.get('size_grading', {}))
+    if size_variations or grading is None:
+        sizing_metrics = SizingMetrics(
+            size_range=f"{len(size_variations)} variaciones detectadas" if size_variations else "Modelo único",
+            adaptability="Alta" if len(size_variations) >= 3 else "Media" if len(size_variations) >= 1 else "Limitada",
+            inclusive_design=len(size_variations) >= 3,
+            detected_sizes=[var.get('node_name', '') for var in size_variations],
+            grading_system=any('scale' in str(var) for var in size_variations),
+            size_count=len(size_variations)
+        )
+    else:
+        ladder = grading['ladder']
+        sizing_metrics = SizingMetrics(
+            size_range=f"{ladder[0]}–{ladder[-1]} (escala inferida por geometría)",
+            adaptability="Alta" if len(ladder) >= 3 else "Media",
+            inclusive_design=len(ladder) >= 3,
+            detected_sizes=[f"{size['size']}: {size['node_name']}" for size in grading['sizes']],
+            grading_system=True,
+            size_count=len(ladder)
+        )
+
+    # Métricas de materiales
+    materials = gltf_result.fabric_properties.get('materials', {})
+    physical = gltf_result.fabric_properties.get('physical_properties', {})
+    fabric_metrics = FabricMetrics(
+        elasticity=physical_elasticity(physical) or ("Propiedades detectadas" if materials else "Sin datos específicos"),
+        comfort="Análisis basado en propiedades PBR",
+        materials_found=list(materials.keys())[:10],
+        stretch_properties=any(
+            mat['properties'].get('has_stretch', 'stretch' in str(mat)) for mat in materials.values()
+        ),
+        weight_info=physical_weight(physical) or "Propiedades virtuales GLTF",
+        breathability="Análisis basado en clasificación de materiales",
+        texture_quality=texture_summary(gltf_result.deep_analysis.get('texture_images', {})) or "Texturas analizadas contextualmente"
+    )
+
+    # Métricas de cierres
+    closure_elements = []
+    for element in gltf_result.garment_elements:
+        for category in element.get('detected_elements', []):
+            if category['category'] == 'closures':
+                closure_elements.extend([elem['element'] for elem in category['elements']])
+
+    # Conteos de los herrajes detectados por geometría; si no hay, los de los nombres de mesh
+    hardware_counts = {
+        feature['element']: feature['count'] for feature in gltf_result.accessibility_features
+        if feature.get('type') == 'closure_hardware'
+    }
+    button_count = hardware_counts.get('button', len([c for c in closure_elements if 'button' in c]))
+    zipper_count = hardware_counts.get('zipper', len([c for c in closure_elements if 'zipper' in c]))
+    snap_count = hardware_counts.get('snap', 0)
+    closure_metrics = ClosureMetrics(
+        buttonhole_size=f"{button_count} botones detectados",
+        zipper_accessibility=f"{zipper_count} cremalleras detectadas"
+        + (f", {snap_count} broches" if snap_count else ""),
+        closure_types=sorted(set(closure_elements) | set(hardware_counts)),
+        adaptive_features=[],
+        ease_of_use="Evaluado según tipos de cierre detectados"
+    )
+
+    # Métricas de comodidad
+    comfort_metrics = ComfortMetrics(
+        mobility="Basado en análisis de materiales",
+        sensory_friendly=seam_summary(gltf_result.deep_analysis.get('seams', {})) or "Evaluado por propiedades de superficie",
+        adaptive_features=[feat['element'] for feat in gltf_result.accessibility_features],
+        ergonomic_design=len(gltf_result.accessibility_features) > 0,
+        universal_design=gltf_result.confidence_score > 0.7
+    )
+
+    # Puntuaciones
+    scores = compute_scores(
+        gltf_result.confidence_score, sizing_metrics.size_count,
+        len(gltf_result.accessibility_features), len(materials)
+    )
+
+    technical_details = {
+        'gltf_version': gltf_result.gltf_version,
+        'generator': gltf_result.generator,
+        'confidence_score': gltf_result.confidence_score,
+        'validation_sources': gltf_result.validation_sources,
+        'false_positive_flags': gltf_result.false_positive_flags,
+        'file_hash': file_hash,
+        'analysis_tier': gltf_result.analysis_tier,
+        'tier_decision': gltf_result.tier_decision,
+        'structure_summary': gltf_result.structure.get('counts', {})
+    }
+    if gltf_result.deep_analysis:
+        technical_details['deep_analysis'] = gltf_result.deep_analysis
+    if gltf_result.cache_report:
+        technical_details['stage_cache'] = gltf_result.cache_report
+        technical_details['section_fingerprints'] = gltf_result.structure.get('fingerprints', {})
+
+    status = "Análisis GLTF mejorado completado"
+    if gltf_result.analysis_tier == QUICK:
+        status = "Screening rápido GLTF completado (solo estructura)"
+
+    return AnalysisResults(
+        file_type=f"GLTF 3D Model (v{gltf_result.gltf_version})",
+        status=status,
+        file_size_mb=file_size_mb,
+        processing_time=0.0,
+        inclusivity_score=scores['inclusivity_score'],
+        accessibility_score=scores['accessibility_score'],
+        sustainability_score=scores['sustainability_score'],
+        sizing=sizing_metrics,
+        fabrics=fabric_metrics,
+        closures=closure_metrics,
+        comfort=comfort_metrics,
+        recommendations=generate_recommendations(gltf_result),
+        technical_details=technical_details,
+        raw_data_summary={
+            'garment_elements': len(gltf_result.garment_elements),
+            'materials_analyzed': len(materials),
+            'size_variations': len(size_variations),
+            'accessibility_features': len(gltf_result.accessibility_features)
+        },
+        screening_report=create_screening_report(gltf_result)
+    )
+
+def physical_elasticity(physical: Dict[str, Any]) -> str:
+    """Clase de elasticidad predominante según las propiedades físicas CLO3D"""
+    classes = physical.get('stretch_classes', {})
+    if not classes:
+        return ''
+    dominant = max(classes, key=classes.get)
+    return f"Elasticidad {dominant} ({sum(classes.values())} telas con propiedades físicas CLO3D)"
+
+def physical_weight(physical: Dict[str, Any]) -> str:
+    """Rango de gramaje de las telas con propiedades físicas"""
+    weights = [fabric['weight_gsm'] for fabric in physical.get('fabrics', {}).values() if fabric['weight_gsm'] is not None]
+    if not weights:
+        return ''
+    weight_range = f"{min(weights):.0f}" if min(weights) == max(weights) else f"{min(weights):.0f}-{max(weights):.0f}"
+    return f"Gramaje {weight_range} g/m² (propiedades físicas CLO3D)"
+
+def seam_summary(seams: Dict[str, Any]) -> str:
+    """Costuras y paneles (las costuras en zonas de contacto afectan la comodidad sensorial)"""
+    if not seams.get('panels'):
+        return ''
+    summary = f"{seams['seam_pairs']} costuras entre {seams['panels']} paneles (máx. {seams['max_panel_degree']} por panel)"
+    if seams.get('lengths_available'):
+        summary += f", {seams['total_length_m']:.2f} m en total"
+    return summary
+
+def inferred_grading(size_grading: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Escala de tallas con más niveles entre las inferidas por geometría"""
+    gradings = size_grading.get('gradings') or []
+    return max(gradings, key=lambda grading: len(grading['ladder'])) if gradings else None
+
+def texture_summary(texture_images: Dict[str, Any]) -> str:
+    """Relieve superficial según los mapas de normales decodificados"""
+    if not texture_images.get('analyzed'):
+        return ''
+    summary = f"{texture_images['analyzed']} texturas analizadas"
+    classes = texture_images.get('surface_classes', {})
+    if classes:
+        summary += ": superficie " + ", ".join(f"{name} ({count})" for name, count in sorted(classes.items()))
+    return summary
+
+def compute_scores(confidence: float, size_count: int, accessibility_count: int, materials_count: int) -> Dict[str, int]:
+    """Puntuaciones de inclusividad, accesibilidad y sostenibilidad"""
+    return {
+        'inclusivity_score': min(100, int(confidence * 60 + size_count * 10)),
+        'accessibility_score': min(100, int(accessibility_count * 15 + confidence * 40)),
+        'sustainability_score': min(100, int(materials_count * 5 + confidence * 50))
+    }
+
+def generate_recommendations(gltf_result) -> List[str]:
+    """Generar recomendaciones basadas en análisis GLTF"""
+    recommendations = []
+
+    if gltf_result.analysis_tier == QUICK:
+        recommendations.append(
+            f"Resultado de nivel {TIER_LABELS[QUICK].lower()}: ejecutar el análisis estándar o profundo "
+            "para evaluar materiales, tallas y cierres"
+        )
+
+    if gltf_result.confidence_score < 0.5:
+        recommendations.append("Considerar validación manual adicional debido a baja confianza del análisis automático")
+
+    if len(gltf_result.size_variations) == 0:
+        recommendations.append("Considerar crear variaciones de talla para mejorar inclusividad")
+
+    if len(gltf_result.accessibility_features) < 3:
+        recommendations.append("Evaluar agregar más características de accesibilidad (cierres fáciles, materiales suaves)")
+
+    if gltf_result.false_positive_flags:
+        recommendations.append("Revisar manualmente las alertas de falsos positivos detectadas")
+
+    materials_count = len(gltf_result.fabric_properties.get('materials', {}))
+    if materials_count > 50:
+        recommendations.append("Considerar simplificar la variedad de materiales para mejorar sostenibilidad")
+
+    return recommendations[:6]
+
+def create_screening_report(gltf_result) -> ScreeningReport:
+    """Crear reporte de screening para análisis GLTF"""
+
+    validation_checklist = []
+
+    # Elementos de prenda con baja confianza
+    for element in gltf_result.garment_elements:
+        if element['confidence_score'] < 0.8:
+            validation_checklist.append(HumanValidationItem(
+                category="elementos_prenda",
+                priority="MEDIA",
+                finding=f"Elemento {element['mesh_name']} detectado con confianza {element['confidence_score']:.2f}",
+                validation_needed="Verificar manualmente si es realmente un elemento de prenda",
+                estimated_time_minutes=5,
+                expert_type="diseñador"
+            ))
+
+    # Materiales con baja confianza
+    materials = gltf_result.fabric_properties.get('materials', {})
+    for mat_name, mat_info in materials.items():
+        if mat_info['confidence'] < 0.7:
+            validation_checklist.append(HumanValidationItem(
+                category="materiales",
+                priority="BAJA",
+                finding=f"Material {mat_name} clasificado con confianza {mat_info['confidence']:.2f}",
+                validation_needed="Verificar propiedades del material y clasificación",
+                estimated_time_minutes=3,
+                expert_type="materiales"
+            ))
+
+    total_time = sum(item.estimated_time_minutes for item in validation_checklist)
+
+    return ScreeningReport(
+        automated_findings={
+            'garment_elements': len(gltf_result.garment_elements),
+            'materials': len(materials),
+            'confidence_score': gltf_result.confidence_score
+        },
+        confidence_levels={
+            'overall_analysis': gltf_result.confidence_score,
+            'garment_detection': sum(elem['confidence_score'] for elem in gltf_result.garment_elements) / max(len(gltf_result.garment_elements), 1),
+            'material_analysis': sum(mat['confidence'] for mat in materials.values()) / max(len(materials), 1)
+        },
+        validation_checklist=validation_checklist,
+        priority_areas=['elementos_prenda', 'materiales'] if validation_checklist else [],
+        estimated_validation_time=max(total_time, 10),
+        recommended_experts=['diseñador', 'materiales'],
+        risk_flags=gltf_result.false_positive_flags
+    )
+
+def analyze_gltf_basic(analyzer, file_path: str, file_size_mb: float) -> AnalysisResults:
+    """Análisis básico de GLTF cuando el analizador mejorado no está disponible"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            gltf_data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Archivo GLTF inválido: {e}")
+
+    asset_info = gltf_data.get('asset', {})
+    meshes_count = len(gltf_data.get('meshes', []))
+    materials_count = len(gltf_data.get('materials', []))
+
+    results = analyzer._create_basic_results("GLTF 3D Model (análisis básico)", file_size_mb)
+    results.status = "Análisis básico completado - se recomienda análisis avanzado"
+    results.inclusivity_score = 40
+    results.accessibility_score = 30
+    results.fabrics.materials_found = [f"material_{i}" for i in range(min(materials_count, 5))]
+    results.recommendations = [
+        "Usar analizador GLTF mejorado para análisis más preciso",
+        "Validación manual recomendada para análisis básico",
+        "Considerar usar formato .zpac para mejor análisis"
+    ]
+    results.technical_details.update({
+        'gltf_version': asset_info.get('version', 'unknown'),
+        'generator': asset_info.get('generator', 'unknown')
+    })
+    results.raw_data_summary.update({'meshes': meshes_count, 'materials': materials_count})
+    results.screening_report.automated_findings.update({'meshes': meshes_count, 'materials': materials_count})
+    results.screening_report.recommended_experts = ['diseñador', 'accesibilidad']
+    return results
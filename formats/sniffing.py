@@ -0,0 +1,130 @@
+"""
+Detección de formato por contenido
+Reconoce glTF JSON, GLB, paquetes ZIP de CLO3D y OBJ leyendo solo la cabecera
+(y la cola en el caso de ZIP), para rechazar archivos no soportados o corruptos
+antes de calcular el hash o parsear el archivo completo.
+"""
+
+import struct
+from typing import Optional
+
+# Bytes leídos del inicio del archivo
+SNIFF_BYTES = 4096
+
+# El registro de fin de directorio ZIP está en los últimos 22 bytes + comentario (máx. 64KB)
+ZIP_TAIL_BYTES = 22 + 65535
+
+# Tipos de contenido reconocidos
+GLTF_JSON = 'gltf-json'
+GLB = 'glb'
+ZIP = 'zip'
+OBJ_TEXT = 'obj-text'
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+_ZIP_LOCAL_HEADER = b'PK\x03\x04'
+_ZIP_END_OF_DIRECTORY = b'PK\x05\x06'
+
+# Palabras clave de instrucciones Wavefront OBJ
+_OBJ_KEYWORDS = {
+    'v', 'vt', 'vn', 'vp', 'f', 'l', 'p', 'o', 'g', 's', 'mtllib', 'usemtl',
+    'cstype', 'deg', 'bmat', 'step', 'curv', 'curv2', 'surf', 'parm', 'trim',
+    'hole', 'scrv', 'sp', 'end', 'con', 'mg', 'call', 'csh', 'lod',
+    'shadow_obj', 'trace_obj', 'ctech', 'stech', 'bevel', 'c_interp', 'd_interp'
+}
+
+class UnsupportedFormatError(ValueError):
+    """Archivo con contenido no soportado o corrupto"""
+
+def _decode_text(header: bytes, complete: bool) -> Optional[str]:
+    """Decodificar la cabecera como UTF-8 (tolerando un carácter cortado al final)"""
+    if b'\x00' in header:
+        return None
+    try:
+        return header.decode('utf-8')
+    except UnicodeDecodeError as e:
+        if not complete and e.start >= len(header) - 3:
+            return header[:e.start].decode('utf-8')
+        return None
+
+def _check_glb(header: bytes, file_size: int) -> str:
+    if len(header) < 20:
+        raise UnsupportedFormatError("GLB corrupto: cabecera incompleta")
+    version, declared_length = struct.unpack_from('<II', header, 4)
+    if version != 2:
+        raise UnsupportedFormatError(f"GLB versión {version} no soportada (se requiere 2)")
+    if declared_length != file_size:
+        raise UnsupportedFormatError(
+            f"GLB truncado o corrupto: declara {declared_length} bytes y el archivo tiene {file_size}"
+        )
+    if header[16:20] != b'JSON':
+        raise UnsupportedFormatError("GLB corrupto: el primer chunk no es JSON")
+    return GLB
+
+def _check_zip(header: bytes, tail: Optional[bytes]) -> str:
+    if header.startswith(_ZIP_LOCAL_HEADER) and len(header) < 30:
+        raise UnsupportedFormatError("ZIP corrupto: cabecera local incompleta")
+    if tail is not None and _ZIP_END_OF_DIRECTORY not in tail:
+        raise UnsupportedFormatError("ZIP truncado o corrupto: falta el directorio central")
+    return ZIP
+
+def _looks_like_obj(text: str, complete: bool) -> bool:
+    lines = text.splitlines()
+    if not complete and lines:
+        # La última línea puede estar cortada
+        lines = lines[:-1]
+    statements = 0
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.split(None, 1)[0] not in _OBJ_KEYWORDS:
+            return False
+        statements += 1
+    return statements > 0
+
+def sniff_content(header: bytes, file_size: int, tail: Optional[bytes] = None) -> str:
+    """Tipo de contenido a partir de la cabecera (y la cola para ZIP)
+
+    Lanza UnsupportedFormatError si el contenido no es de un formato soportado
+    o si la estructura visible ya indica que el archivo está corrupto.
+    """
+    if file_size == 0:
+        raise UnsupportedFormatError("Archivo vacío")
+
+    if header.startswith(b'glTF'):
+        return _check_glb(header, file_size)
+    if header.startswith(_ZIP_LOCAL_HEADER) or header.startswith(_ZIP_END_OF_DIRECTORY):
+        return _check_zip(header, tail)
+
+    complete = len(header) >= file_size
+    text = _decode_text(header[len(_UTF8_BOM):] if header.startswith(_UTF8_BOM) else header, complete)
+    if text is None:
+        raise UnsupportedFormatError("Contenido binario no reconocido")
+
+    stripped = text.lstrip()
+    if stripped.startswith('{'):
+        body = stripped[1:].lstrip()
+        if body.startswith('"') or (not body and not complete):
+            return GLTF_JSON
+        raise UnsupportedFormatError("JSON inválido: se esperaba un objeto glTF")
+    if _looks_like_obj(text, complete):
+        return OBJ_TEXT
+    raise UnsupportedFormatError("Contenido de texto no reconocido")
+
+def sniff_file(file_path: str) -> str:
+    """Leer cabecera (y cola si es ZIP) del archivo y detectar su tipo de contenido"""
+    with open(file_path, 'rb') as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+        f.seek(0)
+        header = f.read(SNIFF_BYTES)
+        tail = None
+        if header.startswith(_ZIP_LOCAL_HEADER) or header.startswith(_ZIP_END_OF_DIRECTORY):
+            f.seek(max(0, file_size - ZIP_TAIL_BYTES))
+            tail = f.read()
+    return sniff_content(header, file_size, tail)
+
+def sniff_bytes(data: bytes) -> str:
+    """Detectar el tipo de contenido de un archivo ya cargado en memoria"""
+    tail = data[-ZIP_TAIL_BYTES:] if data[:4] in (_ZIP_LOCAL_HEADER, _ZIP_END_OF_DIRECTORY) else None
+    return sniff_content(data[:SNIFF_BYTES], len(data), tail)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Buffers GLTF
+Lectura de accessors como arrays NumPy sin copiar el buffer binario
+
+Los buffers se resuelven en el primer uso: archivos externos (.bin) y el
+chunk BIN de los .glb se mapean en memoria (np.memmap), y las data URIs se
+decodifican. Un accessor se devuelve como vista (count, componentes) sobre el
+buffer, respetando byteStride.
+
+Si el buffer no está disponible (p. ej. se subió el .gltf sin su .bin) las
+lecturas devuelven None y las etapas que dependen de la geometría se omiten.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import struct
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_DTYPES = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32
+}
+TYPE_COMPONENTS = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4, 'MAT2': 4, 'MAT3': 9, 'MAT4': 16}
+
+GLB_MAGIC = b'glTF'
+GLB_BIN_CHUNK = 0x004E4942
+
+def cloth_mesh_index(meshes: List[Dict[str, Any]], patterns: int = 0) -> int:
+    """Índice del mesh de tela de CLO3D (-1 si no hay candidato)"""
+    for i, mesh in enumerate(meshes):
+        if 'cloth' in mesh.get('name', '').lower():
+            return i
+    for i, mesh in enumerate(meshes):
+        if len(mesh.get('primitives', [])) >= max(patterns, 1):
+            return i
+    return -1
+
+def cloth_primitives(meshes: List[Dict[str, Any]], patterns: int = 0) -> List[Dict[str, Any]]:
+    """Primitivas del mesh de tela de CLO3D (MeshIndex de MeshList y de las costuras las indexa)"""
+    index = cloth_mesh_index(meshes, patterns)
+    return meshes[index].get('primitives', []) if index >= 0 else []
+
+def decode_data_uri(uri: str) -> Optional[bytes]:
+    """Contenido de una data URI en base64 (None si es inválida)"""
+    try:
+        return base64.b64decode(uri.split(',', 1)[1], validate=True)
+    except (IndexError, ValueError):
+        logger.warning("Data URI inválida")
+        return None
+
+class GLTFBuffers:
+    """Acceso perezoso a los buffers y accessors de un documento GLTF"""
+
+    def __init__(self, gltf_data: Dict[str, Any], file_path: Optional[str] = None):
+        self.gltf_data = gltf_data
+        self.file_path = file_path
+        self.base_dir = os.path.dirname(os.path.abspath(file_path)) if file_path else None
+        self._buffers: Dict[int, Optional[np.ndarray]] = {}
+
+    def buffer(self, index: int) -> Optional[np.ndarray]:
+        """Bytes del buffer (uint8) o None si no se puede resolver"""
+        if index not in self._buffers:
+            self._buffers[index] = self._load_buffer(index)
+        return self._buffers[index]
+
+    def content_fingerprint(self) -> str:
+        """Huella del contenido de todos los buffers (el .bin y el chunk BIN no están en el JSON)"""
+        digest = hashlib.blake2b(digest_size=16)
+        for index in range(len(self.gltf_data.get('buffers', []))):
+            data = self.buffer(index)
+            if data is None:
+                digest.update(b'missing;')
+                continue
+            digest.update(f'{data.size};'.encode('ascii'))
+            digest.update(memoryview(data))
+        return digest.hexdigest()
+
+    def read_buffer_view(self, index: int) -> Optional[bytes]:
+        """Bytes de un bufferView (p. ej. una imagen embebida en un .glb)"""
+        views = self.gltf_data.get('bufferViews', [])
+        if not isinstance(index, int) or not 0 <= index < len(views):
+            return None
+        view = views[index]
+        data = self.buffer(view.get('buffer', 0))
+        start = view.get('byteOffset', 0)
+        end = start + view.get('byteLength', 0)
+        if data is None or end > data.size:
+            return None
+        return data[start:end].tobytes()
+
+    def read_accessor(self, index: int) -> Optional[np.ndarray]:
+        """Datos del accessor como array (count, componentes); None si no están disponibles"""
+        accessors = self.gltf_data.get('accessors', [])
+        if not isinstance(index, int) or not 0 <= index < len(accessors):
+            return None
+        accessor = accessors[index]
+        dtype = COMPONENT_DTYPES.get(accessor.get('componentType'))
+        components = TYPE_COMPONENTS.get(accessor.get('type'))
+        view_index = accessor.get('bufferView')
+        count = accessor.get('count', 0)
+        if dtype is None or components is None or view_index is None or 'sparse' in accessor:
+            return None
+
+        views = self.gltf_data.get('bufferViews', [])
+        if not 0 <= view_index < len(views):
+            return None
+        view = views[view_index]
+        data = self.buffer(view.get('buffer', 0))
+        if data is None:
+            return None
+
+        itemsize = np.dtype(dtype).itemsize
+        element_size = itemsize * components
+        stride = view.get('byteStride') or element_size
+        start = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+        end = start + stride * (count - 1) + element_size if count else start
+        if end > view.get('byteOffset', 0) + view.get('byteLength', 0) or end > data.size:
+            logger.warning("Accessor %d fuera de los límites de su buffer", index)
+            return None
+
+        if stride == element_size:
+            return np.frombuffer(data, dtype=dtype, count=count * components, offset=start).reshape(count, components)
+        return np.ndarray(
+            shape=(count, components), dtype=dtype, buffer=data, offset=start, strides=(stride, itemsize)
+        )
+
+    def _load_buffer(self, index: int) -> Optional[np.ndarray]:
+        buffers = self.gltf_data.get('buffers', [])
+        if not 0 <= index < len(buffers):
+            return None
+        uri = buffers[index].get('uri')
+
+        if uri is None:
+            return self._glb_bin_chunk() if index == 0 else None
+        if uri.startswith('data:'):
+            data = decode_data_uri(uri)
+            return None if data is None else np.frombuffer(data, dtype=np.uint8)
+
+        path = self.resolve_path(uri)
+        if path is None or os.path.getsize(path) == 0:
+            logger.debug("Buffer %d no disponible: %s", index, uri)
+            return None
+        return np.memmap(path, dtype=np.uint8, mode='r')
+
+    def resolve_path(self, uri: str) -> Optional[str]:
+        """Ruta de un recurso externo (solo dentro del directorio del archivo y si existe)"""
+        if self.base_dir is None or not uri or uri.startswith('data:'):
+            return None
+        path = os.path.normpath(os.path.join(self.base_dir, unquote(uri)))
+        if os.path.commonpath([path, self.base_dir]) != self.base_dir:
+            logger.warning("Recurso fuera del directorio del archivo: %s", uri)
+            return None
+        return path if os.path.isfile(path) else None
+
+    def read_image(self, index: int) -> Optional[bytes]:
+        """Bytes codificados de una imagen (archivo externo, data URI o bufferView)"""
+        images = self.gltf_data.get('images', [])
+        if not isinstance(index, int) or not 0 <= index < len(images):
+            return None
+        image = images[index]
+        if 'bufferView' in image:
+            return self.read_buffer_view(image['bufferView'])
+        uri = image.get('uri', '')
+        if uri.startswith('data:'):
+            return decode_data_uri(uri)
+        path = self.resolve_path(uri)
+        if path is None:
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _glb_bin_chunk(self) -> Optional[np.ndarray]:
+        """Chunk BIN de un .glb (sigue al chunk JSON)"""
+        if not self.file_path:
+            return None
+        with open(self.file_path, 'rb') as f:
+            header = f.read(20)
+            if len(header) < 20 or header[:4] != GLB_MAGIC:
+                return None
+            json_length = struct.unpack_from('<I', header, 12)[0]
+            f.seek(20 + json_length)
+            chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            return None
+        bin_length, chunk_type = struct.unpack('<II', chunk_header)
+        if chunk_type != GLB_BIN_CHUNK:
+            return None
+        return np.memmap(self.file_path, dtype=np.uint8, mode='r', offset=28 + json_length, shape=(bin_length,))
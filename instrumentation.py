@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Instrumentación
+Temporizadores monotónicos por etapa con captura opcional de cProfile y tracemalloc
+
+Uso típico:
+
+    timer = StageTimer(profile=True)
+    with timer.stage('parse'):
+        ...
+    breakdown = timer.breakdown()
+
+La captura de perfiles se activa por parámetro o con la variable de entorno
+MOVING_PROFILE (valores: "cprofile", "tracemalloc" o ambos separados por coma).
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.logging_config import log_context
+import metrics
+
+PROFILE_ENV_VAR = 'MOVING_PROFILE'
+
+# Funciones incluidas en el resumen de cProfile
+DEFAULT_PROFILE_TOP = 15
+
+STAGE_DURATION = metrics.histogram(
+    'moving_stage_duration_seconds', 'Duración de cada etapa del pipeline de análisis', ['stage'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+def profiling_flags_from_env() -> Tuple[bool, bool]:
+    """Leer (cprofile, tracemalloc) desde MOVING_PROFILE"""
+    value = os.getenv(PROFILE_ENV_VAR, '').lower()
+    flags = {flag.strip() for flag in value.split(',') if flag.strip()}
+    enable_all = bool(flags & {'1', 'true', 'all'})
+    return enable_all or 'cprofile' in flags, enable_all or 'tracemalloc' in flags
+
+@dataclass
+class StageTiming:
+    """Medición de una etapa"""
+    name: str
+    depth: int
+    seconds: float
+    peak_memory_kb: Optional[float] = None
+
+class StageTimer:
+    """Temporizador de etapas (anidables) de un análisis"""
+
+    def __init__(self, profile: bool = False, trace_memory: bool = False, profile_top: int = DEFAULT_PROFILE_TOP):
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.profile_top = profile_top
+        self.stages: List[StageTiming] = []
+        self._stack: List[List[Any]] = []
+        self._profiler: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+
+    @classmethod
+    def from_env(cls) -> "StageTimer":
+        """Crear temporizador con los flags de MOVING_PROFILE"""
+        profile, trace_memory = profiling_flags_from_env()
+        return cls(profile=profile, trace_memory=trace_memory)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Medir una etapa; las etapas anidadas se registran con mayor profundidad"""
+        self._enter()
+        index = len(self.stages)
+        self.stages.append(StageTiming(name=name, depth=len(self._stack), seconds=0.0))
+        # [inicio, pico de memoria de las etapas hijas]
+        frame = [time.perf_counter(), 0]
+        self._stack.append(frame)
+        try:
+            with log_context(stage=name):
+                yield
+        finally:
+            seconds = time.perf_counter() - frame[0]
+            self._stack.pop()
+            self.stages[index].seconds = seconds
+            STAGE_DURATION.labels(name).observe(seconds)
+            if self.trace_memory:
+                peak = max(tracemalloc.get_traced_memory()[1], frame[1])
+                self.stages[index].peak_memory_kb = peak / 1024
+                tracemalloc.reset_peak()
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], peak)
+            self._exit()
+
+    def _enter(self):
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            if self._stack:
+                # Conservar el pico acumulado por la etapa padre antes de reiniciarlo
+                self._stack[-1][1] = max(self._stack[-1][1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        if self.profile and not self._stack:
+            if self._profiler is None:
+                self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def _exit(self):
+        if self.profile and not self._stack and self._profiler is not None:
+            self._profiler.disable()
+        if self._started_tracemalloc and not self._stack:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @property
+    def total_seconds(self) -> float:
+        """Suma de las etapas de primer nivel"""
+        return sum(stage.seconds for stage in self.stages if stage.depth == 0)
+
+    def profile_summary(self) -> List[Dict[str, Any]]:
+        """Funciones más costosas (tiempo acumulado) según cProfile"""
+        if self._profiler is None:
+            return []
+        stats = pstats.Stats(self._profiler, stream=io.StringIO())
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        summary = []
+        for func in stats.fcn_list[:self.profile_top]:
+            primitive_calls, total_calls, own_time, cumulative_time, _ = stats.stats[func]
+            filename, line, function_name = func
+            summary.append({
+                'function': f"{os.path.basename(filename)}:{line}({function_name})",
+                'calls': total_calls,
+                'own_seconds': round(own_time, 6),
+                'cumulative_seconds': round(cumulative_time, 6)
+            })
+        return summary
+
+    def breakdown(self, total_seconds: float = None) -> Dict[str, Any]:
+        """Desglose estructurado para technical_details"""
+        total = total_seconds if total_seconds is not None else self.total_seconds
+        stages = []
+        for stage in self.stages:
+            entry = {
+                'name': stage.name,
+                'depth': stage.depth,
+                'seconds': round(stage.seconds, 6),
+                'share': round(stage.seconds / total, 4) if total > 0 else 0.0
+            }
+            if stage.peak_memory_kb is not None:
+                entry['peak_memory_kb'] = round(stage.peak_memory_kb, 1)
+            stages.append(entry)
+
+        breakdown = {'total_seconds': round(total, 6), 'stages': stages}
+        if self.profile:
+            breakdown['profile'] = self.profile_summary()
+        return breakdown
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Métricas
+Registro de métricas (counters, gauges, histogramas) en formato de texto Prometheus
+
+Sin dependencias externas: las métricas se registran con las funciones
+``counter()``, ``gauge()`` e ``histogram()`` (idempotentes, seguras ante
+recargas de módulos en Streamlit) y se exponen con ``start_metrics_server()``
+en ``http://<host>:<port>/metrics``.
+
+El servidor se activa en la aplicación con la variable de entorno
+MOVING_METRICS_PORT (y opcionalmente MOVING_METRICS_ADDR, por defecto 127.0.0.1).
+"""
+
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_PORT_ENV = 'MOVING_METRICS_PORT'
+METRICS_ADDR_ENV = 'MOVING_METRICS_ADDR'
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Buckets por defecto (segundos), los mismos que usa Prometheus
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Tuple[str, str] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+class _Metric:
+    """Base: una familia de métricas con etiquetas"""
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values, **labelvalues):
+        """Obtener la serie de una combinación de etiquetas"""
+        if labelvalues:
+            values = tuple(labelvalues[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} espera etiquetas {self.labelnames}")
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._new_child()
+                self._children[key] = child
+            return child
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requiere etiquetas: usa .labels()")
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _series(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for key, child in self._series():
+            lines.extend(self._render_child(key, child))
+        return lines
+
+    def _render_child(self, key: Tuple[str, ...], child) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.get())}"]
+
+class _Value:
+    """Valor numérico thread-safe"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = float(value)
+
+    def get(self) -> float:
+        with self._lock:
+            return self._value
+
+    @contextmanager
+    def track_inprogress(self):
+        """Incrementar mientras dura el bloque"""
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+class Counter(_Metric):
+    """Contador monotónico"""
+    type_name = 'counter'
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        if amount < 0:
+            raise ValueError("Un counter solo puede incrementarse")
+        self._default().inc(amount)
+
+class Gauge(_Metric):
+    """Valor que sube y baja"""
+    type_name = 'gauge'
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default().dec(amount)
+
+    def set(self, value: float):
+        self._default().set(value)
+
+    def track_inprogress(self):
+        return self._default().track_inprogress()
+
+class _HistogramValue:
+    """Buckets acumulables de un histograma"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self._counts = [0] * len(buckets)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            if index < len(self._counts):
+                self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @contextmanager
+    def time(self):
+        """Observar la duración del bloque (reloj monotónico)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self._counts), self._sum, self._count
+
+class Histogram(_Metric):
+    """Histograma con buckets acumulativos (percentiles con histogram_quantile)"""
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+    def _render_child(self, key: Tuple[str, ...], child) -> List[str]:
+        counts, total, count = child.snapshot()
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.labelnames, key, ('le', _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key, ('le', '+Inf'))
+        lines.append(f"{self.name}_bucket{labels} {count}")
+        base_labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{base_labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{base_labels} {count}")
+        return lines
+
+class MetricsRegistry:
+    """Registro de familias de métricas"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collect_callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str] = (), **kwargs):
+        """Registrar una métrica o devolver la existente con ese nombre"""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Métrica {name} ya registrada con otro tipo o etiquetas")
+            return metric
+
+    def on_collect(self, callback: Callable[[], None]):
+        """Registrar una función que actualiza gauges justo antes de exponerlos"""
+        with self._lock:
+            if callback not in self._collect_callbacks:
+                self._collect_callbacks.append(callback)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Exposición en formato de texto Prometheus"""
+        with self._lock:
+            callbacks = list(self._collect_callbacks)
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("Error actualizando métricas: %s", e)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+# Registro global del proceso
+REGISTRY = MetricsRegistry()
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = (), registry: MetricsRegistry = REGISTRY) -> Counter:
+    return registry.get_or_create(Counter, name, documentation, labelnames)
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = (), registry: MetricsRegistry = REGISTRY) -> Gauge:
+    return registry.get_or_create(Gauge, name, documentation, labelnames)
+
+def histogram(name: str, documentation: str, labelnames: Sequence[str] = (),
+              buckets: Sequence[float] = DEFAULT_BUCKETS, registry: MetricsRegistry = REGISTRY) -> Histogram:
+    return registry.get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+# ---------------------------------------------------------------------------
+# Endpoint HTTP
+# ---------------------------------------------------------------------------
+
+def _handler_for(registry: MetricsRegistry):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/metrics', '/'):
+                self.send_error(404)
+                return
+            payload = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            logger.debug("metrics %s", format % args)
+
+    return MetricsHandler
+
+def start_metrics_server(port: int, addr: str = '127.0.0.1', registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """Servir /metrics en un hilo daemon; devuelve el servidor (server_address tiene el puerto real)"""
+    server = ThreadingHTTPServer((addr, port), _handler_for(registry))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True)
+    thread.start()
+    logger.info("📈 Métricas disponibles en http://%s:%d/metrics", *server.server_address[:2])
+    return server
+
+def start_metrics_server_from_env() -> Optional[ThreadingHTTPServer]:
+    """Iniciar el endpoint si MOVING_METRICS_PORT está definido"""
+    port = os.getenv(METRICS_PORT_ENV)
+    if not port:
+        return None
+    return start_metrics_server(int(port), os.getenv(METRICS_ADDR_ENV, '127.0.0.1'))
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Análisis por Primitiva
+Tabla de primitivas (struct-of-arrays) con material, accessors y clase geométrica
+
+CLO exporta la prenda como un solo ``Cloth_mesh`` con una primitiva por
+patrón, cada una con su material: a nivel de nombre de mesh casi toda la
+estructura es invisible. La tabla tiene una fila por primitiva de todas las
+meshes, construida en una sola pasada:
+
+- Material, vértices (count del accessor POSITION) y triángulos (índices / 3)
+- Límites locales (min/max del accessor) y clase geométrica: panel, tira,
+  pieza de detalle, pieza pequeña o avatar
+- Nombre de patrón de CLO (MeshList.MeshName -> MeshIndex de la malla de tela)
+
+Las clases se asignan con operaciones sobre arrays completos; el único
+recorrido en Python es la lectura del JSON (atributos de cada primitiva).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+
+from gltf_buffers import cloth_mesh_index
+from scene_graph import SceneIndex
+
+logger = logging.getLogger(__name__)
+
+GEOMETRIC_CLASSES = ('panel', 'strip', 'detail', 'small_part', 'avatar', 'unknown')
+
+# Lado mayor (m) desde el que una pieza es un panel de la prenda
+PANEL_SIZE_MIN = 0.15
+# Lado mayor (m) por debajo del cual es una pieza pequeña (botones, herrajes)
+SMALL_PART_SIZE_MAX = 0.04
+# Tiras (vivos, cintillas, cintas de cremallera): lado medio / mayor
+STRIP_RATIO_MAX = 0.25
+STRIP_SIZE_MIN = 0.05
+
+# Meshes del avatar de CLO (no son prenda)
+AVATAR_MARKERS = ('avatar',)
+
+TRIANGLES_MODE = 4
+
+@dataclass
+class PrimitiveTable:
+    """Primitivas de todas las meshes, una fila por primitiva (orden de SceneIndex)"""
+    offsets: np.ndarray = field(repr=False)          # int64, filas de la mesh m: [offsets[m], offsets[m + 1])
+    mesh: np.ndarray = field(repr=False)             # int32
+    material: np.ndarray = field(repr=False)         # int32, -1 sin material
+    vertices: np.ndarray = field(repr=False)         # int32
+    triangles: np.ndarray = field(repr=False)        # int32, 0 si no es una lista de triángulos
+    extents: np.ndarray = field(repr=False)          # float32 (primitivas, 3), caja local (NaN: desconocida)
+    pattern: np.ndarray = field(repr=False)          # object, nombre de patrón de CLO ('' sin patrón)
+    geometric_class: np.ndarray = field(repr=False)  # int8, índice en GEOMETRIC_CLASSES
+
+    @classmethod
+    def from_gltf(cls, gltf_data: Dict[str, Any], scene: SceneIndex) -> 'PrimitiveTable':
+        meshes = [mesh if isinstance(mesh, dict) else {} for mesh in gltf_data.get('meshes', [])]
+        accessors = gltf_data.get('accessors', [])
+        primitives = [primitive if isinstance(primitive, dict) else {}
+                      for mesh in meshes for primitive in mesh.get('primitives', []) or []]
+        count = len(primitives)
+
+        counts = np.array([accessor.get('count', 0) if isinstance(accessor, dict) else 0 for accessor in accessors] + [0],
+                          dtype=np.int64)
+        index_accessor = np.fromiter(
+            (_accessor_index(primitive.get('indices'), len(accessors)) for primitive in primitives),
+            dtype=np.int64, count=count
+        )
+        mode = np.fromiter((_mode(primitive.get('mode', TRIANGLES_MODE)) for primitive in primitives),
+                           dtype=np.int64, count=count)
+        mesh = np.repeat(np.arange(len(meshes), dtype=np.int32), np.diff(scene.primitive_offsets))
+
+        vertices = counts[scene.primitive_position]
+        # Sin índices, los vértices se toman de tres en tres
+        corners = np.where(index_accessor >= 0, counts[index_accessor], vertices)
+        triangles = np.where(mode == TRIANGLES_MODE, corners // 3, 0)
+
+        bounds = scene.primitive_bounds
+        extents = bounds[:, 1] - bounds[:, 0]
+
+        avatar_mesh = np.array(
+            [any(marker in (m.get('name') or '').lower() for marker in AVATAR_MARKERS) for m in meshes] + [False],
+            dtype=bool
+        )
+        return cls(
+            offsets=scene.primitive_offsets,
+            mesh=mesh,
+            material=scene.primitive_material,
+            # Columnas estrechas: la tabla viaja con los resultados de garment_elements
+            vertices=vertices.astype(np.int32),
+            triangles=triangles.astype(np.int32),
+            extents=extents.astype(np.float32),
+            pattern=_pattern_names(gltf_data, meshes, scene.primitive_offsets, count),
+            geometric_class=classify_extents(extents, avatar_mesh[mesh])
+        )
+
+    def __len__(self) -> int:
+        return len(self.mesh)
+
+    def restrict(self, meshes: Any) -> 'PrimitiveTable':
+        """Tabla con solo las filas de las meshes indicadas (la numeración de meshes se conserva)"""
+        counts = np.diff(self.offsets)
+        keep = np.zeros(len(counts), dtype=bool)
+        keep[np.asarray(meshes, dtype=np.int64)] = True
+        rows = np.repeat(keep, counts)
+        offsets = np.concatenate([[0], np.cumsum(np.where(keep, counts, 0))]).astype(np.int64)
+        return PrimitiveTable(
+            offsets=offsets,
+            mesh=self.mesh[rows],
+            material=self.material[rows],
+            vertices=self.vertices[rows],
+            triangles=self.triangles[rows],
+            extents=self.extents[rows],
+            pattern=self.pattern[rows],
+            geometric_class=self.geometric_class[rows]
+        )
+
+    def mesh_rows(self, mesh: int) -> slice:
+        return slice(int(self.offsets[mesh]), int(self.offsets[mesh + 1]))
+
+    def class_counts(self, rows: slice) -> Dict[str, int]:
+        counts = np.bincount(self.geometric_class[rows], minlength=len(GEOMETRIC_CLASSES))
+        return {name: int(total) for name, total in zip(GEOMETRIC_CLASSES, counts) if total}
+
+    def name_usage(self, mesh: int, material_names: List[str]) -> Dict[str, int]:
+        """Nombres de material y de patrón de las primitivas de una mesh -> primitivas que los usan"""
+        rows = self.mesh_rows(mesh)
+        usage: Dict[str, int] = {}
+        materials = self.material[rows]
+        used, counts = np.unique(materials[materials >= 0], return_counts=True)
+        for material, total in zip(used.tolist(), counts.tolist()):
+            name = material_names[material]
+            if name:
+                usage[name] = usage.get(name, 0) + total
+        patterns, counts = np.unique(self.pattern[rows].astype(str), return_counts=True)
+        for pattern, total in zip(patterns.tolist(), counts.tolist()):
+            if pattern:
+                usage[pattern] = usage.get(pattern, 0) + total
+        return usage
+
+    def mesh_summary(self, mesh: int) -> Dict[str, Any]:
+        """Resumen y columnas por primitiva de una mesh"""
+        rows = self.mesh_rows(mesh)
+        materials = self.material[rows]
+        extents = np.round(np.nan_to_num(self.extents[rows].astype(np.float64)) * 1000, 1)
+        return {
+            'count': int(rows.stop - rows.start),
+            'classes': self.class_counts(rows),
+            'unique_materials': int(len(np.unique(materials[materials >= 0]))),
+            'vertices': int(self.vertices[rows].sum()),
+            'triangles': int(self.triangles[rows].sum()),
+            'columns': {
+                'material': materials.tolist(),
+                'pattern': self.pattern[rows].tolist(),
+                'vertices': self.vertices[rows].tolist(),
+                'triangles': self.triangles[rows].tolist(),
+                'extent_mm': extents.tolist(),
+                'geometric_class': [GEOMETRIC_CLASSES[value] for value in self.geometric_class[rows].tolist()]
+            }
+        }
+
+def classify_extents(extents: np.ndarray, avatar: np.ndarray) -> np.ndarray:
+    """Clase geométrica de cada primitiva por el tamaño y la forma de su caja local"""
+    ordered = np.sort(extents, axis=1)
+    length = ordered[:, 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        width_ratio = np.where(length > 0, ordered[:, 1] / length, 0.0)
+    known = ~np.isnan(ordered).any(axis=1)
+    return np.select(
+        [
+            avatar,
+            ~known,
+            length < SMALL_PART_SIZE_MAX,
+            (length >= STRIP_SIZE_MIN) & (width_ratio <= STRIP_RATIO_MAX),
+            length >= PANEL_SIZE_MIN
+        ],
+        [GEOMETRIC_CLASSES.index(name) for name in ('avatar', 'unknown', 'small_part', 'strip', 'panel')],
+        default=GEOMETRIC_CLASSES.index('detail')
+    ).astype(np.int8)
+
+def _pattern_names(gltf_data: Dict[str, Any], meshes: List[Dict[str, Any]],
+                   offsets: np.ndarray, count: int) -> np.ndarray:
+    """Nombre de patrón de CLO de cada primitiva de la malla de tela"""
+    names = np.full(count, '', dtype=object)
+    extras = gltf_data.get('extras') or {}
+    metadata = extras.get('MetaData') if isinstance(extras, dict) else None
+    mesh_list = metadata.get('MeshList') if isinstance(metadata, dict) else None
+    if not isinstance(mesh_list, list) or not mesh_list:
+        return names
+
+    cloth = cloth_mesh_index(meshes, len(mesh_list))
+    if cloth < 0:
+        return names
+    cloth_count = int(offsets[cloth + 1] - offsets[cloth])
+    for pattern in mesh_list:
+        if not isinstance(pattern, dict):
+            continue
+        index, name = pattern.get('MeshIndex'), pattern.get('MeshName')
+        if isinstance(index, int) and 0 <= index < cloth_count and name:
+            names[offsets[cloth] + index] = str(name)
+    return names
+
+def _accessor_index(value: Any, size: int) -> int:
+    return value if isinstance(value, int) and 0 <= value < size else -1
+
+def _mode(value: Any) -> int:
+    return value if isinstance(value, int) else -1
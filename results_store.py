@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Almacén de Resultados
+Almacén columnar local (Parquet particionado) con el histórico de análisis
+
+Cada AnalysisResults se agrega como una fila con columnas planas para
+consultas agregadas (scores, confianza, generador, cierres, materiales...)
+y una columna `results_json` con el resultado completo serializado.
+
+El layout es Parquet con particionado estilo Hive, legible directamente por
+DuckDB o Polars:
+
+    data/warehouse/analysis_date=2025-01-31/part-<timestamp>-<id>.parquet
+
+    SELECT generator, avg(accessibility_score)
+    FROM read_parquet('data/warehouse/**/*.parquet', hive_partitioning = true)
+    GROUP BY generator
+"""
+
+import glob
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List
+
+from analyzer_main import AnalysisResults
+import serialization
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WAREHOUSE_DIR = os.path.join('data', 'warehouse')
+
+# Número de archivos por partición a partir del cual se compacta automáticamente
+AUTO_COMPACT_FILES = 64
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Almacén de resultados no disponible: instala 'pyarrow'")
+    return pyarrow
+
+def warehouse_schema():
+    """Esquema de las filas del almacén"""
+    pa = _require_pyarrow()
+    return pa.schema([
+        pa.field('analysis_id', pa.string()),
+        pa.field('analyzed_at', pa.timestamp('us')),
+        pa.field('file_name', pa.string()),
+        pa.field('file_hash', pa.string()),
+        pa.field('file_type', pa.string()),
+        pa.field('status', pa.string()),
+        pa.field('generator', pa.string()),
+        pa.field('is_gltf', pa.bool_()),
+        pa.field('file_size_mb', pa.float64()),
+        pa.field('processing_time', pa.float64()),
+        pa.field('inclusivity_score', pa.int32()),
+        pa.field('accessibility_score', pa.int32()),
+        pa.field('sustainability_score', pa.int32()),
+        pa.field('confidence_score', pa.float64()),
+        pa.field('size_count', pa.int32()),
+        pa.field('detected_sizes', pa.list_(pa.string())),
+        pa.field('materials_found', pa.list_(pa.string())),
+        pa.field('stretch_properties', pa.bool_()),
+        pa.field('closure_types', pa.list_(pa.string())),
+        pa.field('adaptive_features', pa.list_(pa.string())),
+        pa.field('validation_items', pa.int32()),
+        pa.field('estimated_validation_time', pa.int32()),
+        pa.field('risk_flags', pa.list_(pa.string())),
+        pa.field('results_json', pa.string())
+    ])
+
+def results_confidence(results: AnalysisResults) -> float:
+    """Confianza general de un análisis (misma regla que la interfaz)"""
+    if 'confidence_score' in results.technical_details:
+        return float(results.technical_details['confidence_score'])
+    if results.screening_report and results.screening_report.confidence_levels:
+        return float(results.screening_report.confidence_levels.get('overall_analysis', 0.0))
+    return 0.0
+
+def results_to_row(results: AnalysisResults, file_name: str = None, analyzed_at: datetime = None) -> Dict[str, Any]:
+    """Aplanar un AnalysisResults a una fila del almacén"""
+    tech_details = results.technical_details
+    return {
+        'analysis_id': uuid.uuid4().hex,
+        'analyzed_at': analyzed_at or datetime.now(),
+        'file_name': file_name,
+        'file_hash': tech_details.get('file_hash'),
+        'file_type': results.file_type,
+        'status': results.status,
+        'generator': tech_details.get('generator', 'Unknown'),
+        'is_gltf': results.file_type.startswith("GLTF"),
+        'file_size_mb': results.file_size_mb,
+        'processing_time': results.processing_time,
+        'inclusivity_score': results.inclusivity_score,
+        'accessibility_score': results.accessibility_score,
+        'sustainability_score': results.sustainability_score,
+        'confidence_score': results_confidence(results),
+        'size_count': results.sizing.size_count,
+        'detected_sizes': list(results.sizing.detected_sizes),
+        'materials_found': list(results.fabrics.materials_found),
+        'stretch_properties': results.fabrics.stretch_properties,
+        'closure_types': list(results.closures.closure_types),
+        'adaptive_features': list(results.comfort.adaptive_features),
+        'validation_items': len(results.screening_report.validation_checklist),
+        'estimated_validation_time': results.screening_report.estimated_validation_time,
+        'risk_flags': list(results.screening_report.risk_flags),
+        'results_json': serialization.dumps_json(results)
+    }
+
+class ResultsWarehouse:
+    """Almacén columnar de resultados de análisis"""
+
+    def __init__(self, root: str = None):
+        _require_pyarrow()
+        self.root = root or os.getenv('MOVING_WAREHOUSE_DIR', DEFAULT_WAREHOUSE_DIR)
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+
+    def append(self, results: AnalysisResults, file_name: str = None, analyzed_at: datetime = None) -> str:
+        """Agregar un análisis al almacén; devuelve la ruta del archivo escrito"""
+        return self.append_batch([results_to_row(results, file_name, analyzed_at)])
+
+    def append_batch(self, rows: List[Dict[str, Any]]) -> str:
+        """Agregar varias filas ya aplanadas (todas en la partición de la primera)"""
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        partition = rows[0]['analyzed_at'].strftime('%Y-%m-%d')
+        partition_dir = os.path.join(self.root, f"analysis_date={partition}")
+        file_name = f"part-{datetime.now().strftime('%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:8]}.parquet"
+        path = os.path.join(partition_dir, file_name)
+
+        table = pa.Table.from_pylist(rows, schema=warehouse_schema())
+        with self._lock:
+            os.makedirs(partition_dir, exist_ok=True)
+            tmp_path = path + '.tmp'
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+
+        logger.debug("Análisis agregado al almacén: %s", path)
+
+        if len(self._partition_files(partition_dir)) >= AUTO_COMPACT_FILES:
+            self.compact(partition)
+        return path
+
+    def compact(self, partition: str = None) -> int:
+        """Fusionar los archivos pequeños de cada partición en uno solo"""
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        partitions = [partition] if partition else self.partitions()
+        compacted = 0
+        with self._lock:
+            for name in partitions:
+                partition_dir = os.path.join(self.root, f"analysis_date={name}")
+                files = self._partition_files(partition_dir)
+                if len(files) < 2:
+                    continue
+
+                table = pa.concat_tables([pq.read_table(path, schema=warehouse_schema()) for path in files])
+                merged_path = os.path.join(
+                    partition_dir, f"part-{datetime.now().strftime('%Y%m%d%H%M%S%f')}-compacted.parquet"
+                )
+                pq.write_table(table, merged_path + '.tmp', compression='zstd')
+                os.replace(merged_path + '.tmp', merged_path)
+                for path in files:
+                    os.remove(path)
+                compacted += len(files)
+
+        if compacted:
+            logger.info("Almacén compactado: %d archivos fusionados", compacted)
+        return compacted
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    def partitions(self) -> List[str]:
+        """Particiones (fechas) existentes"""
+        prefix = 'analysis_date='
+        return sorted(
+            name[len(prefix):] for name in os.listdir(self.root)
+            if name.startswith(prefix) and os.path.isdir(os.path.join(self.root, name))
+        )
+
+    def _partition_files(self, partition_dir: str) -> List[str]:
+        return sorted(glob.glob(os.path.join(partition_dir, '*.parquet')))
+
+    def table(self, columns: List[str] = None, filter=None):
+        """Leer el almacén (proyectando solo las columnas necesarias)"""
+        pa = _require_pyarrow()
+        import pyarrow.dataset as ds
+
+        with self._lock:
+            files = glob.glob(os.path.join(self.root, 'analysis_date=*', '*.parquet'))
+            if not files:
+                schema = warehouse_schema()
+                selected = columns or schema.names
+                return schema.empty_table().select(selected)
+            dataset = ds.dataset(files, schema=warehouse_schema(), format='parquet')
+            return dataset.to_table(columns=columns, filter=filter)
+
+    def load_results(self, filter=None) -> List[AnalysisResults]:
+        """Reconstruir los AnalysisResults completos"""
+        table = self.table(columns=['results_json'], filter=filter)
+        return [serialization.loads_json(payload) for payload in table.column('results_json').to_pylist()]
+
+    # ------------------------------------------------------------------
+    # Consultas agregadas
+    # ------------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        """Estadísticas globales (usadas por la barra lateral)"""
+        import pyarrow.compute as pc
+
+        table = self.table(columns=['is_gltf', 'confidence_score'])
+        total = table.num_rows
+        return {
+            'total_analyses': total,
+            'gltf_analyses': pc.sum(table.column('is_gltf')).as_py() or 0 if total else 0,
+            'average_confidence': pc.mean(table.column('confidence_score')).as_py() if total else 0.0
+        }
+
+    def average_score_by(self, group_by: str = 'generator', score: str = 'accessibility_score') -> List[Dict[str, Any]]:
+        """Promedio de un score agrupado por una columna (p. ej. generador)"""
+        table = self.table(columns=[group_by, score])
+        if table.num_rows == 0:
+            return []
+        grouped = table.group_by(group_by).aggregate([(score, 'mean'), (score, 'count')])
+        rows = grouped.rename_columns({f'{score}_count': 'analyses'}).to_pylist()
+        return sorted(rows, key=lambda row: row['analyses'], reverse=True)
+
+    def find_by_closure(self, closure_type: str, columns: List[str] = None) -> List[Dict[str, Any]]:
+        """Análisis cuyos cierres detectados incluyen un tipo (p. ej. 'velcro')"""
+        import pyarrow.compute as pc
+
+        columns = columns or ['analyzed_at', 'file_name', 'file_hash', 'closure_types', 'accessibility_score']
+        table = self.table(columns=list(dict.fromkeys(columns + ['closure_types'])))
+        if table.num_rows == 0:
+            return []
+
+        closures = table.column('closure_types')
+        flat = pc.list_flatten(closures)
+        parents = pc.list_parent_indices(closures)
+        matches = pc.filter(parents, pc.equal(pc.utf8_lower(flat), closure_type.lower()))
+        rows = pc.unique(matches)
+        return table.take(rows).select(columns).to_pylist()
+
+    def confidence_distribution(self, bin_width: float = 0.1, by_day: bool = True) -> List[Dict[str, Any]]:
+        """Distribución de confianza (histograma), opcionalmente por día"""
+        import pyarrow.compute as pc
+
+        table = self.table(columns=['analyzed_at', 'confidence_score'])
+        if table.num_rows == 0:
+            return []
+
+        bins = pc.multiply(pc.floor(pc.divide(table.column('confidence_score'), bin_width)), bin_width)
+        keys = ['confidence_bin']
+        table = table.append_column('confidence_bin', pc.round(bins, 4))
+        if by_day:
+            table = table.append_column('day', pc.strftime(table.column('analyzed_at'), format='%Y-%m-%d'))
+            keys = ['day', 'confidence_bin']
+
+        grouped = table.group_by(keys).aggregate([('confidence_score', 'count')])
+        rows = grouped.rename_columns({'confidence_score_count': 'analyses'}).to_pylist()
+        return sorted(rows, key=lambda row: tuple(row[key] for key in keys))
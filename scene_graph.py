@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Índice de Escena
+Jerarquía de nodos, transformaciones de mundo y adyacencia nodo ↔ mesh ↔ material
+
+El índice se construye en una pasada sobre ``nodes`` y ``meshes``:
+
+- ``parent`` y ``depth`` por nodo, y el recorrido en preorden: el subárbol de
+  un nodo es un tramo contiguo de ``preorder`` (consulta O(1))
+- ``local`` y ``world``: matrices 4×4 apiladas (nodos, 4, 4); las de mundo se
+  componen por niveles de profundidad con un solo matmul por nivel
+- Adyacencias en formato CSR (offsets + valores): hijos de cada nodo, nodos
+  que instancian cada mesh, materiales de cada mesh y meshes de cada material
+
+Con las transformaciones de mundo la escala heredada de los nodos padre se
+aplica a los límites de las meshes, de modo que las variantes de talla se
+comparan en el espacio de la escena.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Tolerancia para considerar unitaria la escala de una matriz
+UNIT_SCALE_TOLERANCE = 1e-6
+
+@dataclass
+class SceneIndex:
+    """Índice de la escena GLTF (todas las consultas son O(1) o un tramo de array)"""
+    parent: np.ndarray = field(repr=False)              # int32, -1 en las raíces
+    depth: np.ndarray = field(repr=False)               # int32, -1 si el nodo está en un ciclo
+    preorder: np.ndarray = field(repr=False)            # int32, nodos en preorden
+    preorder_position: np.ndarray = field(repr=False)   # int64, posición de cada nodo en preorder
+    subtree_size: np.ndarray = field(repr=False)        # int64, nodos del subárbol (incluido el propio)
+    local: np.ndarray = field(repr=False)               # float64 (nodos, 4, 4)
+    world: np.ndarray = field(repr=False)               # float64 (nodos, 4, 4)
+    scaled: np.ndarray = field(repr=False)              # bool, el nodo o un ancestro declara escala
+    node_mesh: np.ndarray = field(repr=False)           # int32, -1 sin mesh
+    mesh_bounds: np.ndarray = field(repr=False)         # float64 (meshes, 2, 3), límites locales (NaN: desconocidos)
+    primitive_offsets: np.ndarray = field(repr=False)   # int64, primitivas de la mesh m: [offsets[m], offsets[m + 1])
+    primitive_material: np.ndarray = field(repr=False)  # int32 por primitiva, -1 sin material
+    primitive_position: np.ndarray = field(repr=False)  # int64 por primitiva, accessor POSITION (-1 sin posiciones)
+    primitive_bounds: np.ndarray = field(repr=False)    # float64 (primitivas, 2, 3), límites locales (NaN: desconocidos)
+    _children: Tuple[np.ndarray, np.ndarray] = field(repr=False)
+    _mesh_nodes: Tuple[np.ndarray, np.ndarray] = field(repr=False)
+    _mesh_materials: Tuple[np.ndarray, np.ndarray] = field(repr=False)
+    _material_meshes: Tuple[np.ndarray, np.ndarray] = field(repr=False)
+
+    @classmethod
+    def from_gltf(cls, gltf_data: Dict[str, Any]) -> 'SceneIndex':
+        nodes = [node if isinstance(node, dict) else {} for node in gltf_data.get('nodes', [])]
+        meshes = [mesh if isinstance(mesh, dict) else {} for mesh in gltf_data.get('meshes', [])]
+        node_count, mesh_count = len(nodes), len(meshes)
+        material_count = len(gltf_data.get('materials', []))
+
+        parent = np.full(node_count, -1, dtype=np.int32)
+        node_mesh = np.full(node_count, -1, dtype=np.int32)
+        for i, node in enumerate(nodes):
+            for child in node.get('children', []) or []:
+                if not isinstance(child, int) or not 0 <= child < node_count or child == i:
+                    continue
+                if parent[child] >= 0:
+                    logger.warning("Nodo %d con más de un padre: se conserva el primero", child)
+                    continue
+                parent[child] = i
+            mesh = node.get('mesh')
+            if isinstance(mesh, int) and 0 <= mesh < mesh_count:
+                node_mesh[i] = mesh
+
+        children = _csr(parent, np.arange(node_count, dtype=np.int32), node_count, mask=parent >= 0)
+        preorder, depth, subtree_size = _traverse(parent, children, node_count)
+        preorder_position = np.empty(node_count, dtype=np.int64)
+        preorder_position[preorder] = np.arange(node_count)
+
+        local, declared_scale = _local_matrices(nodes)
+        world = local.copy()
+        scaled = declared_scale.copy()
+        for level in range(1, int(depth.max()) + 1 if node_count else 0):
+            level_nodes = np.flatnonzero(depth == level)
+            world[level_nodes] = world[parent[level_nodes]] @ local[level_nodes]
+            scaled[level_nodes] |= scaled[parent[level_nodes]]
+
+        primitive_counts = np.fromiter(
+            (len(mesh.get('primitives', []) or []) for mesh in meshes), dtype=np.int64, count=mesh_count
+        )
+        primitive_offsets = np.zeros(mesh_count + 1, dtype=np.int64)
+        np.cumsum(primitive_counts, out=primitive_offsets[1:])
+        accessors = gltf_data.get('accessors', [])
+        primitives = [primitive if isinstance(primitive, dict) else {}
+                      for mesh in meshes for primitive in mesh.get('primitives', []) or []]
+        primitive_material = np.fromiter(
+            (_index(primitive.get('material'), material_count) for primitive in primitives),
+            dtype=np.int32, count=len(primitives)
+        )
+        primitive_position = np.fromiter(
+            (_index((primitive.get('attributes') or {}).get('POSITION'), len(accessors)) for primitive in primitives),
+            dtype=np.int64, count=len(primitives)
+        )
+        primitive_mesh = np.repeat(np.arange(mesh_count, dtype=np.int32), primitive_counts)
+        primitive_bounds = _primitive_bounds(accessors, primitive_position)
+
+        # Pares (mesh, material) únicos para las adyacencias en ambos sentidos
+        used = primitive_material >= 0
+        pairs = np.unique(np.stack([primitive_mesh[used], primitive_material[used]], axis=1), axis=0) \
+            if used.any() else np.empty((0, 2), dtype=np.int32)
+
+        return cls(
+            parent=parent,
+            depth=depth,
+            preorder=preorder,
+            preorder_position=preorder_position,
+            subtree_size=subtree_size,
+            local=local,
+            world=world,
+            scaled=scaled,
+            node_mesh=node_mesh,
+            mesh_bounds=_mesh_bounds(primitive_bounds, primitive_mesh, mesh_count),
+            primitive_offsets=primitive_offsets,
+            primitive_material=primitive_material,
+            primitive_position=primitive_position,
+            primitive_bounds=primitive_bounds,
+            _children=children,
+            _mesh_nodes=_csr(node_mesh, np.arange(node_count, dtype=np.int32), mesh_count, mask=node_mesh >= 0),
+            _mesh_materials=_csr(pairs[:, 0], pairs[:, 1], mesh_count),
+            _material_meshes=_csr(pairs[:, 1], pairs[:, 0], material_count)
+        )
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def children(self, node: int) -> np.ndarray:
+        return _row(self._children, node)
+
+    def subtree(self, node: int) -> np.ndarray:
+        """Nodo y todos sus descendientes"""
+        start = self.preorder_position[node]
+        return self.preorder[start:start + self.subtree_size[node]]
+
+    def nodes_of_mesh(self, mesh: int) -> np.ndarray:
+        return _row(self._mesh_nodes, mesh)
+
+    def materials_of_mesh(self, mesh: int) -> np.ndarray:
+        return _row(self._mesh_materials, mesh)
+
+    def meshes_of_material(self, material: int) -> np.ndarray:
+        return _row(self._material_meshes, material)
+
+    def primitive_materials(self, mesh: int) -> np.ndarray:
+        """Material de cada primitiva de la mesh (-1 sin material)"""
+        return self.primitive_material[self.primitive_offsets[mesh]:self.primitive_offsets[mesh + 1]]
+
+    def world_scale(self, nodes: Optional[np.ndarray] = None) -> np.ndarray:
+        """Escala de mundo por eje (norma de las columnas de la parte lineal)"""
+        world = self.world if nodes is None else self.world[nodes]
+        return np.linalg.norm(world[..., :3, :3], axis=-2)
+
+    def subtree_meshes(self, node: int) -> np.ndarray:
+        meshes = self.node_mesh[self.subtree(node)]
+        return np.unique(meshes[meshes >= 0])
+
+    def instance_bounds(self, nodes: np.ndarray) -> np.ndarray:
+        """Caja (nodos, 2, 3) en espacio de mundo de la mesh de cada nodo (NaN: sin mesh o sin límites)"""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        meshes = self.node_mesh[nodes]
+        bounds = np.where((meshes >= 0)[:, np.newaxis, np.newaxis], self.mesh_bounds[meshes], np.nan)
+        return _transform_boxes(bounds, self.world[nodes])
+
+    def primitive_instances(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Cada primitiva de cada nodo con mesh: (nodo, primitiva)"""
+        nodes = np.flatnonzero(self.node_mesh >= 0)
+        meshes = self.node_mesh[nodes]
+        counts = self.primitive_offsets[meshes + 1] - self.primitive_offsets[meshes]
+        instance_nodes = np.repeat(nodes, counts)
+        # Índice de primitiva: inicio de la mesh del nodo + posición dentro de la mesh
+        starts = np.repeat(self.primitive_offsets[meshes] - np.cumsum(counts) + counts, counts)
+        primitives = starts + np.arange(counts.sum())
+        return instance_nodes, primitives
+
+    def world_bounds(self, nodes: np.ndarray) -> Optional[np.ndarray]:
+        """Caja (2, 3) en espacio de mundo de las meshes instanciadas por ``nodes``"""
+        bounds = self.instance_bounds(nodes)
+        known = ~np.isnan(bounds).any(axis=(1, 2))
+        if not known.any():
+            return None
+        return np.stack([bounds[known, 0].min(axis=0), bounds[known, 1].max(axis=0)])
+
+    def summary(self) -> Dict[str, Any]:
+        roots = int((self.parent < 0).sum())
+        return {
+            'nodes': len(self),
+            'roots': roots,
+            'max_depth': int(self.depth.max()) if len(self) else 0,
+            'instanced_meshes': int((self.node_mesh >= 0).sum()),
+            'scaled_nodes': int(self.scaled.sum()),
+            'cyclic_nodes': int((self.depth < 0).sum())
+        }
+
+def _index(value: Any, size: int) -> int:
+    return value if isinstance(value, int) and 0 <= value < size else -1
+
+def _csr(keys: np.ndarray, values: np.ndarray, size: int, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Agrupar ``values`` por ``keys`` (0..size-1): (offsets, valores ordenados por clave)"""
+    keys = np.asarray(keys, dtype=np.int64)
+    values = np.asarray(values)
+    if mask is not None:
+        keys, values = keys[mask], values[mask]
+    order = np.argsort(keys, kind='stable')
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size)[:size], out=offsets[1:])
+    return offsets, values[order]
+
+def _row(csr: Tuple[np.ndarray, np.ndarray], key: int) -> np.ndarray:
+    offsets, values = csr
+    if not 0 <= key < len(offsets) - 1:
+        return values[:0]
+    return values[offsets[key]:offsets[key + 1]]
+
+def _traverse(parent: np.ndarray, children: Tuple[np.ndarray, np.ndarray], node_count: int):
+    """Preorden, profundidad y tamaño de subárbol (recorrido iterativo desde las raíces)"""
+    depth = np.full(node_count, -1, dtype=np.int32)
+    subtree_size = np.ones(node_count, dtype=np.int64)
+    preorder: List[int] = []
+    offsets, values = children
+    for root in np.flatnonzero(parent < 0).tolist():
+        stack = [root]
+        depth[root] = 0
+        while stack:
+            node = stack.pop()
+            preorder.append(node)
+            kids = values[offsets[node]:offsets[node + 1]].tolist()
+            depth[kids] = depth[node] + 1
+            stack.extend(reversed(kids))
+
+    # Nodos en ciclos (sin raíz): se agregan al final como subárboles de un nodo
+    reached = depth >= 0
+    if not reached.all():
+        logger.warning("%d nodos en ciclos de la jerarquía: se tratan como aislados", int((~reached).sum()))
+        preorder.extend(np.flatnonzero(~reached).tolist())
+    preorder = np.asarray(preorder, dtype=np.int32)
+
+    # Tamaño de subárbol: acumular de las hojas hacia la raíz (preorden inverso)
+    for node in preorder[::-1].tolist():
+        if reached[node] and parent[node] >= 0:
+            subtree_size[parent[node]] += subtree_size[node]
+    return preorder, depth, subtree_size
+
+def _local_matrices(nodes: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Matrices locales (matrix o TRS compuestas en bloque) y si el nodo declara escala"""
+    count = len(nodes)
+    local = np.tile(np.eye(4), (count, 1, 1))
+    translation = np.zeros((count, 3))
+    rotation = np.tile([0.0, 0.0, 0.0, 1.0], (count, 1))
+    scale = np.ones((count, 3))
+    has_matrix = np.zeros(count, dtype=bool)
+    declared_scale = np.zeros(count, dtype=bool)
+
+    for i, node in enumerate(nodes):
+        matrix = _vector(node.get('matrix'), 16)
+        if matrix is not None:
+            local[i] = np.reshape(matrix, (4, 4)).T  # GLTF guarda las matrices por columnas
+            has_matrix[i] = True
+            continue
+        values = _vector(node.get('translation'), 3)
+        if values is not None:
+            translation[i] = values
+        values = _vector(node.get('rotation'), 4)
+        if values is not None:
+            rotation[i] = values
+        values = _vector(node.get('scale'), 3)
+        if values is not None:
+            scale[i] = values
+            declared_scale[i] = True
+
+    norms = np.linalg.norm(rotation, axis=1, keepdims=True)
+    x, y, z, w = (rotation / np.where(norms > 0, norms, 1.0)).T
+    rotation_matrix = np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)], axis=-1),
+        np.stack([2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)], axis=-1),
+        np.stack([2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)], axis=-1)
+    ], axis=1)
+    trs = ~has_matrix
+    local[trs, :3, :3] = rotation_matrix[trs] * scale[trs][:, np.newaxis, :]
+    local[trs, :3, 3] = translation[trs]
+
+    if has_matrix.any():
+        matrix_scale = np.linalg.norm(local[has_matrix, :3, :3], axis=1)
+        declared_scale[has_matrix] = (np.abs(matrix_scale - 1.0) > UNIT_SCALE_TOLERANCE).any(axis=1)
+    return local, declared_scale
+
+def _vector(value: Any, size: int) -> Optional[List[float]]:
+    if isinstance(value, list) and len(value) == size and all(
+        isinstance(item, (int, float)) and not isinstance(item, bool) for item in value
+    ):
+        return value
+    return None
+
+def _primitive_bounds(accessors: List[Dict[str, Any]], primitive_position: np.ndarray) -> np.ndarray:
+    """Límites locales de cada primitiva (min/max de su accessor POSITION)"""
+    used = np.unique(primitive_position[primitive_position >= 0])
+    accessor_bounds = np.full((len(accessors) + 1, 2, 3), np.nan)  # la última fila: sin POSITION
+    try:
+        # Caso habitual: todos los accessors usados tienen min/max de 3 componentes
+        limits = np.array([(accessors[position]['min'], accessors[position]['max']) for position in used.tolist()],
+                          dtype=np.float64)
+        if limits.shape != (len(used), 2, 3):
+            raise ValueError(limits.shape)
+        accessor_bounds[used] = limits
+    except (KeyError, TypeError, ValueError):
+        for position in used.tolist():
+            low = _vector(accessors[position].get('min'), 3)
+            high = _vector(accessors[position].get('max'), 3)
+            if low is not None and high is not None:
+                accessor_bounds[position] = (low, high)
+    return accessor_bounds[primitive_position]
+
+def _mesh_bounds(primitive_bounds: np.ndarray, primitive_mesh: np.ndarray, mesh_count: int) -> np.ndarray:
+    """Límites locales de cada mesh (unión de los de sus primitivas)"""
+    bounds = np.full((mesh_count, 2, 3), np.nan)
+    with np.errstate(invalid='ignore'):
+        np.fmin.at(bounds[:, 0], primitive_mesh, primitive_bounds[:, 0])
+        np.fmax.at(bounds[:, 1], primitive_mesh, primitive_bounds[:, 1])
+    return bounds
+
+def _transform_boxes(bounds: np.ndarray, world: np.ndarray) -> np.ndarray:
+    """Cajas (K, 2, 3) transformadas por sus matrices (K, 4, 4): caja de las 8 esquinas"""
+    selector = np.array([[i >> axis & 1 for axis in range(3)] for i in range(8)], dtype=bool)
+    corners = np.where(selector[np.newaxis], bounds[:, 1][:, np.newaxis], bounds[:, 0][:, np.newaxis])
+    transformed = corners @ np.swapaxes(world[:, :3, :3], 1, 2) + world[:, np.newaxis, :3, 3]
+    return np.stack([transformed.min(axis=1), transformed.max(axis=1)], axis=1)
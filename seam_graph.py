@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Grafo de Costuras
+Costuras de CLO3D (extras.MetaData.SeamLinePairList) en arrays compactos
+
+Cada par de costura une dos líneas, cada una con el patrón (MeshIndex) y los
+puntos de malla como texto "64/65/66/...". Todas las líneas se concatenan y
+se convierten a enteros en una sola llamada de NumPy; el resultado es un
+array plano de puntos (uint32) con offsets por línea.
+
+Con esos arrays se construye el grafo entre paneles (patrones unidos por
+costuras) y, si el buffer binario está disponible, la longitud de cada
+costura a partir de las posiciones de los vértices: MeshIndex indexa las
+primitivas del mesh de tela y MeshPointIndex sus vértices.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from gltf_buffers import GLTFBuffers, cloth_primitives
+
+logger = logging.getLogger(__name__)
+
+# Diferencia de longitud entre los dos lados de un par a partir de la cual hay embebido/fruncido
+EASED_SEAM_RATIO = 1.05
+
+# Costuras más largas incluidas en el resumen
+TOP_SEAMS = 5
+
+@dataclass
+class SeamLines:
+    """Líneas de costura: puntos concatenados con offsets y patrón de cada línea"""
+    points: np.ndarray = field(repr=False)      # uint32, todos los puntos de todas las líneas
+    offsets: np.ndarray = field(repr=False)     # int64, len = líneas + 1
+    line_mesh: np.ndarray = field(repr=False)   # int32, patrón (MeshIndex) de cada línea
+    pair_lines: np.ndarray = field(repr=False)  # int64 (pares, 2), líneas de cada par
+    fold_angle: np.ndarray = field(repr=False)  # float32 por par
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_mesh)
+
+    @property
+    def pair_count(self) -> int:
+        return len(self.pair_lines)
+
+    def line_points(self, line: int) -> np.ndarray:
+        return self.points[self.offsets[line]:self.offsets[line + 1]]
+
+    def line_lengths(self, positions_by_mesh: Dict[int, np.ndarray]) -> Optional[np.ndarray]:
+        """Longitud de cada línea (suma de segmentos entre puntos consecutivos)
+
+        ``positions_by_mesh`` tiene las posiciones (N, 3) de cada patrón; las
+        líneas de patrones sin posiciones o con índices fuera de rango quedan
+        como NaN. Devuelve None si no hay ninguna posición.
+        """
+        if not positions_by_mesh or not len(self.points):
+            return None
+
+        counts = np.diff(self.offsets)
+        point_mesh = np.repeat(self.line_mesh, counts)
+        coords = np.full((len(self.points), 3), np.nan, dtype=np.float64)
+        for mesh, positions in positions_by_mesh.items():
+            mask = point_mesh == mesh
+            indices = self.points[mask]
+            valid = indices < len(positions)
+            selected = np.flatnonzero(mask)
+            coords[selected[valid]] = positions[indices[valid], :3]
+
+        segments = np.zeros(len(self.points), dtype=np.float64)
+        segments[1:] = np.linalg.norm(np.diff(coords, axis=0), axis=1)
+        segments[self.offsets[:-1]] = 0.0  # el primer punto de cada línea no tiene segmento previo
+        return np.add.reduceat(segments, self.offsets[:-1])
+
+def parse_seam_pairs(seam_pairs: List[Dict[str, Any]]) -> SeamLines:
+    """Convertir SeamLinePairList a arrays (una sola conversión de texto a enteros)"""
+    texts: List[str] = []
+    meshes: List[int] = []
+    pair_lines: List[List[int]] = []
+    fold_angles: List[float] = []
+
+    for pair in seam_pairs if isinstance(seam_pairs, list) else []:
+        lines = pair.get('SeamLine', []) if isinstance(pair, dict) else []
+        valid = [
+            line for line in lines
+            if isinstance(line, dict) and isinstance(line.get('MeshIndex'), int)
+            and isinstance(line.get('MeshPointIndex'), str) and line['MeshPointIndex'].strip()
+        ]
+        if len(valid) != 2:
+            continue
+        pair_lines.append([len(texts), len(texts) + 1])
+        for line in valid:
+            texts.append(line['MeshPointIndex'].strip())
+            meshes.append(line['MeshIndex'])
+        fold_angles.append(float(pair.get('FoldAngle', 0.0) or 0.0))
+
+    counts = np.fromiter((text.count('/') + 1 for text in texts), dtype=np.int64, count=len(texts))
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    try:
+        points = np.fromstring('/'.join(texts), dtype=np.int64, sep='/') if texts else np.empty(0, dtype=np.int64)
+    except ValueError:
+        points = None
+    if points is None or len(points) != offsets[-1] or (len(points) and points.min() < 0):
+        # Algún punto no numérico: conversión línea a línea descartando las inválidas
+        return _parse_lines_individually(texts, meshes, pair_lines, fold_angles)
+
+    return SeamLines(
+        points=points.astype(np.uint32),
+        offsets=offsets,
+        line_mesh=np.asarray(meshes, dtype=np.int32),
+        pair_lines=np.asarray(pair_lines, dtype=np.int64).reshape(-1, 2),
+        fold_angle=np.asarray(fold_angles, dtype=np.float32)
+    )
+
+def _parse_lines_individually(texts, meshes, pair_lines, fold_angles) -> SeamLines:
+    logger.warning("⚠️ SeamLinePairList con puntos no numéricos: se descartan los pares inválidos")
+    kept_texts, kept_meshes, kept_angles = [], [], []
+    for (first, second), angle in zip(pair_lines, fold_angles):
+        parsed = [_parse_points(texts[first]), _parse_points(texts[second])]
+        if any(points is None for points in parsed):
+            continue
+        kept_texts.extend(parsed)
+        kept_meshes.extend([meshes[first], meshes[second]])
+        kept_angles.append(angle)
+
+    counts = np.array([len(points) for points in kept_texts], dtype=np.int64)
+    offsets = np.zeros(len(kept_texts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    points = np.concatenate(kept_texts) if kept_texts else np.empty(0, dtype=np.int64)
+    return SeamLines(
+        points=points.astype(np.uint32),
+        offsets=offsets,
+        line_mesh=np.asarray(kept_meshes, dtype=np.int32),
+        pair_lines=np.arange(len(kept_texts), dtype=np.int64).reshape(-1, 2),
+        fold_angle=np.asarray(kept_angles, dtype=np.float32)
+    )
+
+def _parse_points(text: str) -> Optional[np.ndarray]:
+    try:
+        points = np.array([int(value) for value in text.split('/')], dtype=np.int64)
+    except ValueError:
+        return None
+    return points if len(points) and points.min() >= 0 else None
+
+def cloth_positions(gltf_data: Dict[str, Any], buffers: GLTFBuffers, meshes: np.ndarray) -> Dict[int, np.ndarray]:
+    """Posiciones de los patrones usados por las costuras (primitivas del mesh de tela)"""
+    primitives = cloth_primitives(gltf_data.get('meshes', []), int(meshes.max()) + 1 if len(meshes) else 0)
+    positions = {}
+    for mesh in np.unique(meshes).tolist():
+        if 0 <= mesh < len(primitives):
+            data = buffers.read_accessor(primitives[mesh].get('attributes', {}).get('POSITION'))
+            if data is not None and data.shape[1] >= 3:
+                positions[mesh] = data
+    return positions
+
+def connected_components(nodes: int, edges: np.ndarray) -> np.ndarray:
+    """Componente de cada nodo (propagación vectorizada de la etiqueta mínima)"""
+    labels = np.arange(nodes)
+    if not len(edges):
+        return labels
+    a, b = edges[:, 0], edges[:, 1]
+    while True:
+        previous = labels.copy()
+        lowest = np.minimum(labels[a], labels[b])
+        np.minimum.at(labels, a, lowest)
+        np.minimum.at(labels, b, lowest)
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            return labels
+
+def analyze_seam_graph(gltf_data: Dict[str, Any], buffers: Optional[GLTFBuffers] = None) -> Dict[str, Any]:
+    """Grafo de costuras entre paneles y longitudes (si hay posiciones de vértices)"""
+    metadata = (gltf_data.get('extras') or {}).get('MetaData') or {}
+    seams = parse_seam_pairs(metadata.get('SeamLinePairList', []) if isinstance(metadata, dict) else [])
+    if not seams.pair_count:
+        return {'available': False, 'seam_pairs': 0}
+
+    # Paneles: patrones que participan en costuras, renumerados 0..n-1
+    panels, line_panel = np.unique(seams.line_mesh, return_inverse=True)
+    edges = line_panel[seams.pair_lines]
+    self_seams = edges[:, 0] == edges[:, 1]
+    connections = np.unique(np.sort(edges[~self_seams], axis=1), axis=0)
+    degree = np.bincount(connections.ravel(), minlength=len(panels)) if len(connections) else np.zeros(len(panels), dtype=np.int64)
+    components = connected_components(len(panels), connections)
+
+    summary: Dict[str, Any] = {
+        'available': True,
+        'seam_pairs': seams.pair_count,
+        'seam_lines': seams.line_count,
+        'points': int(len(seams.points)),
+        'panels': int(len(panels)),
+        'connections': int(len(connections)),
+        'components': int(len(np.unique(components))),
+        'self_seams': int(self_seams.sum()),
+        'folded_seams': int((seams.fold_angle != 0).sum()),
+        'max_panel_degree': int(degree.max()) if len(degree) else 0,
+        'panel_degree': {str(panel): int(count) for panel, count in zip(panels, degree)},
+        'lengths_available': False
+    }
+
+    lengths = None
+    if buffers is not None:
+        lengths = seams.line_lengths(cloth_positions(gltf_data, buffers, panels))
+    if lengths is not None and not np.isnan(lengths).all():
+        pair_lengths = lengths[seams.pair_lines]
+        valid = ~np.isnan(pair_lengths).any(axis=1)
+        longest = np.fmax(pair_lengths[:, 0], pair_lengths[:, 1])
+        shortest = np.fmin(pair_lengths[:, 0], pair_lengths[:, 1])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            eased = valid & (longest > shortest * EASED_SEAM_RATIO)
+        mean_pair = np.nanmean(pair_lengths[valid], axis=1) if valid.any() else np.empty(0)
+        top = np.argsort(-np.where(valid, longest, -np.inf))[:min(TOP_SEAMS, int(valid.sum()))]
+        summary.update({
+            'lengths_available': True,
+            'measured_pairs': int(valid.sum()),
+            'total_length_m': round(float(mean_pair.sum()), 4),
+            'mean_length_m': round(float(mean_pair.mean()), 4) if len(mean_pair) else 0.0,
+            'eased_seams': int(eased.sum()),
+            'longest_seams': [{
+                'pair': int(pair),
+                'panels': [int(panels[edges[pair, 0]]), int(panels[edges[pair, 1]])],
+                'length_m': round(float(longest[pair]), 4)
+            } for pair in top]
+        })
+    return summary
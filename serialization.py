@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Serialización de Resultados
+Serializador tipado para el árbol completo de AnalysisResults
+
+Formatos soportados:
+- JSON compacto (biblioteca estándar)
+- MessagePack (requiere `msgpack`)
+- Arrow / Parquet para lotes de análisis (requiere `pyarrow`)
+
+La conversión se guía por las anotaciones de tipo de los dataclasses, de modo
+que la ida y vuelta reconstruye SizingMetrics, ScreeningReport,
+HumanValidationItem, etc. en lugar de sus representaciones en texto. Las
+tuplas, conjuntos y claves no textuales (``Dict[int, ...]``) se recuperan
+según su anotación; los valores anotados como ``Any`` vuelven como tipos JSON.
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Set, Tuple, Union, get_args, get_origin, get_type_hints
+
+from analyzer_main import AnalysisResults
+
+# Versión del esquema serializado (incrementar ante cambios incompatibles)
+SCHEMA_VERSION = 1
+
+@lru_cache(maxsize=None)
+def _dataclass_fields(cls) -> Tuple[Tuple[str, Any], ...]:
+    """Campos y tipos resueltos de un dataclass (cacheado por clase)"""
+    hints = get_type_hints(cls)
+    return tuple((field.name, hints[field.name]) for field in dataclasses.fields(cls))
+
+def _encode(value: Any) -> Any:
+    """Convertir un valor a tipos primitivos serializables"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if dataclasses.is_dataclass(value):
+        return {name: _encode(getattr(value, name)) for name, _ in _dataclass_fields(type(value))}
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(_encode(item) for item in value)
+    if isinstance(value, Enum):
+        return _encode(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, 'item'):
+        # Escalares de NumPy
+        return value.item()
+    # Último recurso: mantener compatibilidad con el export anterior (default=str)
+    return str(value)
+
+def _decode(value: Any, hint: Any) -> Any:
+    """Reconstruir un valor a partir de su anotación de tipo"""
+    if value is None or hint is Any:
+        return value
+
+    origin = get_origin(hint)
+    if origin is Union:
+        candidates = [arg for arg in get_args(hint) if arg is not type(None)]
+        return _decode(value, candidates[0]) if len(candidates) == 1 else value
+    if origin in (list, List):
+        (item_hint,) = get_args(hint) or (Any,)
+        return [_decode(item, item_hint) for item in value]
+    if origin in (tuple, Tuple):
+        item_hints = get_args(hint)
+        if len(item_hints) == 2 and item_hints[1] is Ellipsis:
+            return tuple(_decode(item, item_hints[0]) for item in value)
+        if item_hints:
+            return tuple(_decode(item, item_hint) for item, item_hint in zip(value, item_hints))
+        return tuple(value)
+    if origin in (set, Set, frozenset, FrozenSet):
+        (item_hint,) = get_args(hint) or (Any,)
+        return origin(_decode(item, item_hint) for item in value)
+    if origin in (dict, Dict):
+        key_hint, item_hint = get_args(hint) or (str, Any)
+        return {_decode_key(key, key_hint): _decode(item, item_hint) for key, item in value.items()}
+    if dataclasses.is_dataclass(hint):
+        return hint(**{name: _decode(value.get(name), field_hint) for name, field_hint in _dataclass_fields(hint)})
+    if hint is float and isinstance(value, int):
+        return float(value)
+    return value
+
+def _decode_key(key: Any, hint: Any) -> Any:
+    """Las claves se serializan como texto: recuperar int/float/bool según la anotación"""
+    if not isinstance(key, str):
+        return key
+    if hint is bool:
+        return key == 'True'
+    if hint in (int, float):
+        return hint(key)
+    return key
+
+def results_to_dict(results: AnalysisResults) -> Dict[str, Any]:
+    """Convertir AnalysisResults a un diccionario de tipos primitivos"""
+    return _encode(results)
+
+def results_from_dict(data: Dict[str, Any]) -> AnalysisResults:
+    """Reconstruir AnalysisResults (con todos sus dataclasses anidados)"""
+    return _decode(data, AnalysisResults)
+
+# ---------------------------------------------------------------------------
+# JSON
+# ---------------------------------------------------------------------------
+
+def dumps_json(results: AnalysisResults, indent: int = None) -> str:
+    """Serializar a JSON (compacto por defecto)"""
+    separators = (',', ':') if indent is None else (',', ': ')
+    return json.dumps(results_to_dict(results), ensure_ascii=False, indent=indent, separators=separators)
+
+def dump_json(results: AnalysisResults, stream, indent: int = None):
+    """Escribir JSON en un stream de texto de forma incremental"""
+    separators = (',', ':') if indent is None else (',', ': ')
+    json.dump(results_to_dict(results), stream, ensure_ascii=False, indent=indent, separators=separators)
+
+def loads_json(text: Union[str, bytes]) -> AnalysisResults:
+    """Deserializar desde JSON"""
+    return results_from_dict(json.loads(text))
+
+# ---------------------------------------------------------------------------
+# MessagePack
+# ---------------------------------------------------------------------------
+
+def _require_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError("Serialización MessagePack no disponible: instala 'msgpack'")
+    return msgpack
+
+def dumps_msgpack(results: AnalysisResults) -> bytes:
+    """Serializar a MessagePack"""
+    msgpack = _require_msgpack()
+    return msgpack.packb(results_to_dict(results), use_bin_type=True)
+
+def loads_msgpack(payload: bytes) -> AnalysisResults:
+    """Deserializar desde MessagePack"""
+    msgpack = _require_msgpack()
+    return results_from_dict(msgpack.unpackb(payload, raw=False, strict_map_key=False))
+
+# ---------------------------------------------------------------------------
+# Arrow / Parquet (lotes)
+# ---------------------------------------------------------------------------
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Serialización Arrow/Parquet no disponible: instala 'pyarrow'")
+    return pyarrow
+
+def _is_free_form(hint: Any) -> bool:
+    """Diccionarios con valores Any no tienen esquema fijo: se guardan como JSON"""
+    return get_origin(hint) in (dict, Dict) and get_args(hint)[1] is Any
+
+def _arrow_type(hint: Any):
+    """Tipo Arrow equivalente a una anotación de tipo"""
+    pa = _require_pyarrow()
+
+    if _is_free_form(hint):
+        return pa.string()
+    origin = get_origin(hint)
+    if origin in (list, List):
+        return pa.list_(_arrow_type(get_args(hint)[0]))
+    if origin in (dict, Dict):
+        key_hint, item_hint = get_args(hint)
+        return pa.map_(_arrow_type(key_hint), _arrow_type(item_hint))
+    if dataclasses.is_dataclass(hint):
+        return pa.struct([pa.field(name, _arrow_type(field_hint)) for name, field_hint in _dataclass_fields(hint)])
+    primitives = {str: pa.string(), int: pa.int64(), float: pa.float64(), bool: pa.bool_()}
+    if hint in primitives:
+        return primitives[hint]
+    return pa.string()
+
+@lru_cache(maxsize=1)
+def arrow_schema():
+    """Esquema Arrow del árbol de AnalysisResults"""
+    pa = _require_pyarrow()
+    fields = [pa.field(name, _arrow_type(hint)) for name, hint in _dataclass_fields(AnalysisResults)]
+    return pa.schema(fields, metadata={b'schema_version': str(SCHEMA_VERSION).encode()})
+
+def _to_arrow_value(value: Any, hint: Any) -> Any:
+    """Adaptar valores primitivos a la representación Arrow del esquema"""
+    if value is None:
+        return None
+    if _is_free_form(hint):
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    origin = get_origin(hint)
+    if origin in (list, List):
+        item_hint = get_args(hint)[0]
+        return [_to_arrow_value(item, item_hint) for item in value]
+    if origin in (dict, Dict):
+        item_hint = get_args(hint)[1]
+        return [(key, _to_arrow_value(item, item_hint)) for key, item in value.items()]
+    if dataclasses.is_dataclass(hint):
+        return {name: _to_arrow_value(value.get(name), field_hint) for name, field_hint in _dataclass_fields(hint)}
+    return value
+
+def _from_arrow_value(value: Any, hint: Any) -> Any:
+    """Inversa de _to_arrow_value"""
+    if value is None:
+        return None
+    if _is_free_form(hint):
+        return json.loads(value)
+    origin = get_origin(hint)
+    if origin in (list, List):
+        item_hint = get_args(hint)[0]
+        return [_from_arrow_value(item, item_hint) for item in value]
+    if origin in (dict, Dict):
+        item_hint = get_args(hint)[1]
+        return {key: _from_arrow_value(item, item_hint) for key, item in value}
+    if dataclasses.is_dataclass(hint):
+        return {name: _from_arrow_value(value.get(name), field_hint) for name, field_hint in _dataclass_fields(hint)}
+    return value
+
+def results_to_arrow(results_batch: List[AnalysisResults]):
+    """Convertir un lote de resultados a una tabla Arrow"""
+    pa = _require_pyarrow()
+    fields = _dataclass_fields(AnalysisResults)
+    rows = [results_to_dict(results) for results in results_batch]
+    columns = {
+        name: [_to_arrow_value(row[name], hint) for row in rows]
+        for name, hint in fields
+    }
+    return pa.Table.from_pydict(columns, schema=arrow_schema())
+
+def results_from_arrow(table) -> List[AnalysisResults]:
+    """Reconstruir un lote de resultados desde una tabla Arrow"""
+    fields = _dataclass_fields(AnalysisResults)
+    return [
+        results_from_dict({name: _from_arrow_value(row[name], hint) for name, hint in fields})
+        for row in table.to_pylist()
+    ]
+
+def write_parquet(results_batch: List[AnalysisResults], path: str, compression: str = 'zstd'):
+    """Escribir un lote de resultados en Parquet"""
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+    pq.write_table(results_to_arrow(results_batch), path, compression=compression)
+
+def read_parquet(path: str) -> List[AnalysisResults]:
+    """Leer un lote de resultados desde Parquet"""
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+    return results_from_arrow(pq.read_table(path, schema=arrow_schema()))
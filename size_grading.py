@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Escalado de Tallas
+Agrupación geométrica de variantes de talla e inferencia de la escala XS–XXXL
+
+Cada instancia de mesh (nodo con mesh, en espacio de mundo) se describe con
+un vector de forma independiente de la escala: número de vértices (log),
+proporciones de la caja y relación área / caja (log). Las variantes de una misma
+prenda comparten topología y proporciones y difieren en tamaño, así que se
+agrupan por distancia entre descriptores (matriz de distancias completa con
+NumPy, sin bucles por pares) y, dentro de cada grupo, se ordenan por tamaño
+(raíz del área) para asignar las tallas.
+
+Funciona aunque los nombres sean genéricos, dentro de un archivo o sobre un
+lote de archivos (``grade_files``).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from gltf_buffers import GLTFBuffers
+from scene_graph import SceneIndex
+from seam_graph import connected_components
+
+logger = logging.getLogger(__name__)
+
+SIZE_LADDER = ('XS', 'S', 'M', 'L', 'XL', 'XXL', 'XXXL')
+CENTER_SIZE = SIZE_LADDER.index('M')
+
+# Distancia máxima entre descriptores de forma de dos variantes de la misma prenda
+SHAPE_DISTANCE_MAX = 0.12
+# Relación mínima de vértices (menor / mayor) entre variantes
+VERTEX_RATIO_MIN = 0.9
+# Relación mínima de tamaño entre la talla mayor y la menor de un grupo
+GRADING_RANGE_MIN = 1.03
+# Tamaños que difieren menos que esto se consideran la misma talla (instancias repetidas)
+SAME_SIZE_TOLERANCE = 0.02
+
+# Triángulos por mesh para el área: con más se toma una muestra en bloques contiguos
+# repartidos por toda la malla (leen páginas vecinas del buffer). Las variantes comparten
+# topología, así que la muestra cae en los mismos triángulos de cada una
+AREA_SAMPLE_TRIANGLES = 8192
+AREA_SAMPLE_BLOCKS = 16
+
+# Peso de cada componente del descriptor (log vértices, 3 proporciones, log relación de área)
+DESCRIPTOR_WEIGHTS = np.array([0.25, 1.0, 1.0, 1.0, 0.5])
+
+@dataclass
+class GarmentInstances:
+    """Instancias de mesh de uno o varios archivos (una fila por instancia)"""
+    sources: List[str]
+    nodes: np.ndarray = field(repr=False)       # int64, nodo en su archivo
+    names: List[str] = field(repr=False)
+    extents: np.ndarray = field(repr=False)     # float64 (instancias, 3), caja en espacio de mundo
+    areas: np.ndarray = field(repr=False)       # float64, área de superficie en espacio de mundo
+    vertices: np.ndarray = field(repr=False)    # int64
+    exact_area: np.ndarray = field(repr=False)  # bool, área de los triángulos, muestreada en mallas grandes (False: de la caja)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @classmethod
+    def concatenate(cls, parts: List['GarmentInstances']) -> 'GarmentInstances':
+        return cls(
+            sources=[source for part in parts for source in part.sources],
+            nodes=np.concatenate([part.nodes for part in parts]) if parts else np.empty(0, dtype=np.int64),
+            names=[name for part in parts for name in part.names],
+            extents=np.concatenate([part.extents for part in parts]) if parts else np.empty((0, 3)),
+            areas=np.concatenate([part.areas for part in parts]) if parts else np.empty(0),
+            vertices=np.concatenate([part.vertices for part in parts]) if parts else np.empty(0, dtype=np.int64),
+            exact_area=np.concatenate([part.exact_area for part in parts]) if parts else np.empty(0, dtype=bool)
+        )
+
+    def descriptors(self) -> np.ndarray:
+        return shape_descriptors(self.extents, self.areas, self.vertices)
+
+    def sizes(self) -> np.ndarray:
+        """Tamaño lineal de cada instancia (raíz del área)"""
+        return np.sqrt(self.areas)
+
+def shape_descriptors(extents: np.ndarray, areas: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """Descriptor de forma independiente de la escala (instancias, 5)"""
+    scale = np.linalg.norm(extents, axis=1)
+    safe_scale = np.where(scale > 0, scale, 1.0)
+    proportions = extents / safe_scale[:, np.newaxis]
+    # Relación área / caja en escala logarítmica: mallas densas o con pliegues tienen relaciones altas
+    area_ratio = np.log1p(areas / safe_scale ** 2)
+    return np.column_stack([np.log1p(vertices), proportions, area_ratio])
+
+def collect_instances(gltf_data: Dict[str, Any], scene: SceneIndex,
+                      buffers: Optional[GLTFBuffers] = None, source: str = '') -> GarmentInstances:
+    """Instancias de mesh con límites conocidos; área exacta si el buffer está disponible"""
+    nodes = np.flatnonzero(scene.node_mesh >= 0)
+    bounds = scene.instance_bounds(nodes)
+    known = ~np.isnan(bounds).any(axis=(1, 2))
+    nodes, bounds = nodes[known], bounds[known]
+    meshes = scene.node_mesh[nodes]
+    extents = bounds[:, 1] - bounds[:, 0]
+
+    # Vértices por mesh: suma de los count de los accessors POSITION de sus primitivas
+    accessors = gltf_data.get('accessors', [])
+    counts = np.array([accessor.get('count', 0) if isinstance(accessor, dict) else 0 for accessor in accessors] + [0])
+    primitive_mesh = np.repeat(np.arange(len(scene.primitive_offsets) - 1), np.diff(scene.primitive_offsets))
+    mesh_vertices = np.bincount(
+        primitive_mesh, weights=counts[scene.primitive_position], minlength=len(scene.primitive_offsets) - 1
+    )  # el índice -1 (sin POSITION) toma el 0 agregado al final
+
+    vertices = mesh_vertices[meshes].astype(np.int64)
+
+    # Área de la caja como respaldo; la exacta transforma los productos cruz con el cofactor de la matriz.
+    # Solo se lee el buffer de las instancias con alguna pareja posible (el avatar u otras piezas únicas no)
+    x, y, z = extents.T
+    areas = 2 * (x * y + y * z + z * x)
+    exact = np.zeros(len(nodes), dtype=bool)
+    if buffers is not None:
+        cross_by_mesh: Dict[int, Optional[Tuple[np.ndarray, np.ndarray]]] = {}
+        area_by_mesh: Dict[int, float] = {}
+        for row in np.flatnonzero(_pairing_candidates(extents, vertices)).tolist():
+            node, mesh = int(nodes[row]), int(meshes[row])
+            if mesh not in cross_by_mesh:
+                cross_by_mesh[mesh] = _triangle_cross_products(gltf_data, buffers, mesh)
+            if cross_by_mesh[mesh] is None:
+                continue
+            cross, weights = cross_by_mesh[mesh]
+            if mesh not in area_by_mesh:
+                area_by_mesh[mesh] = 0.5 * float(weights @ np.sqrt(np.einsum('ij,ij->i', cross, cross)))
+            linear = scene.world[node, :3, :3]
+            gram = linear.T @ linear
+            if np.allclose(gram, gram[0, 0] * np.eye(3), rtol=1e-6, atol=1e-12):
+                # Semejanza (rotación y escala uniforme): el área escala con el cuadrado del factor
+                areas[row] = area_by_mesh[mesh] * gram[0, 0]
+                exact[row] = True
+                continue
+            determinant = np.linalg.det(linear)
+            if determinant:
+                # (M a) × (M b) = det(M) M^-T (a × b)
+                cofactor = determinant * np.linalg.inv(linear).T
+                areas[row] = 0.5 * float(weights @ np.linalg.norm(cross @ cofactor.T, axis=1))
+                exact[row] = True
+
+    names = [gltf_data['nodes'][node].get('name') or f'node_{node}' for node in nodes.tolist()]
+    return GarmentInstances(
+        sources=[source] * len(nodes),
+        nodes=nodes.astype(np.int64),
+        names=names,
+        extents=extents,
+        areas=areas,
+        vertices=vertices,
+        exact_area=exact
+    )
+
+def _pairing_candidates(extents: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """Instancias con otra de vértices y proporciones compatibles (sin mirar el área)"""
+    similar = _similarity(shape_descriptors(extents, np.zeros(len(extents)), vertices), vertices)
+    np.fill_diagonal(similar, False)
+    return similar.any(axis=1)
+
+def _similarity(descriptors: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """Pares (N × N) con descriptores cercanos y número de vértices compatible"""
+    distances = pairwise_shape_distances(descriptors)
+    vertices = vertices.astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vertex_ratio = np.minimum.outer(vertices, vertices) / np.maximum.outer(vertices, vertices)
+    return (distances <= SHAPE_DISTANCE_MAX) & (np.nan_to_num(vertex_ratio) >= VERTEX_RATIO_MIN)
+
+def _triangle_cross_products(gltf_data: Dict[str, Any], buffers: GLTFBuffers,
+                             mesh: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Productos cruz (float32) de las aristas de los triángulos de la mesh (espacio local)
+
+    Devuelve también el peso de cada fila (triángulos que representa en la muestra).
+    """
+    primitives = [primitive for primitive in gltf_data['meshes'][mesh].get('primitives', [])
+                  if primitive.get('mode', 4) == 4]
+    accessors = gltf_data.get('accessors', [])
+    total = sum(
+        accessors[primitive['indices'] if 'indices' in primitive else primitive['attributes']['POSITION']]['count'] // 3
+        for primitive in primitives
+    ) if all(_triangle_source(primitive, accessors) for primitive in primitives) else None
+    if not total:
+        return None
+    fraction = min(1.0, AREA_SAMPLE_TRIANGLES / total)
+
+    crosses, weights = [], []
+    for primitive in primitives:
+        positions = buffers.read_accessor(primitive['attributes']['POSITION'])
+        if positions is None or positions.ndim != 2 or positions.shape[1] < 3:
+            return None
+        indices = buffers.read_accessor(primitive['indices']) if 'indices' in primitive else None
+        if 'indices' in primitive and indices is None:
+            return None
+        triangles = (indices.ravel() if indices is not None else np.arange(len(positions)))
+        triangles = triangles[:len(triangles) - len(triangles) % 3].reshape(-1, 3)
+        sample = _sample_blocks(triangles, fraction)
+        if not len(sample):
+            continue
+        if sample.max() >= len(positions):
+            return None
+        # Solo se copian los vértices de la muestra
+        origin, first, second = (np.asarray(positions[sample[:, corner], :3], dtype=np.float32) for corner in range(3))
+        first, second = first - origin, second - origin
+        cross = np.empty_like(first)
+        cross[:, 0] = first[:, 1] * second[:, 2] - first[:, 2] * second[:, 1]
+        cross[:, 1] = first[:, 2] * second[:, 0] - first[:, 0] * second[:, 2]
+        cross[:, 2] = first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0]
+        crosses.append(cross)
+        weights.append(np.full(len(sample), len(triangles) / len(sample)))
+    return (np.concatenate(crosses), np.concatenate(weights)) if crosses else None
+
+def _sample_blocks(triangles: np.ndarray, fraction: float) -> np.ndarray:
+    """Fracción de los triángulos en bloques contiguos equiespaciados"""
+    size = max(1, int(len(triangles) * fraction / AREA_SAMPLE_BLOCKS))
+    if fraction >= 1.0 or size * AREA_SAMPLE_BLOCKS >= len(triangles):
+        return triangles
+    starts = np.linspace(0, len(triangles) - size, AREA_SAMPLE_BLOCKS).astype(np.int64)
+    return triangles[(starts[:, np.newaxis] + np.arange(size)).ravel()]
+
+def _triangle_source(primitive: Dict[str, Any], accessors: List[Any]) -> bool:
+    """La primitiva tiene POSITION (e índices, si los declara) con count conocido"""
+    position = (primitive.get('attributes') or {}).get('POSITION')
+    source = primitive.get('indices', position)
+    return (isinstance(position, int) and isinstance(source, int) and 0 <= source < len(accessors)
+            and isinstance(accessors[source], dict) and isinstance(accessors[source].get('count'), int))
+
+def pairwise_shape_distances(descriptors: np.ndarray) -> np.ndarray:
+    """Matriz de distancias euclídeas ponderadas (identidad de Gram, sin tensores N×N×D)"""
+    weighted = descriptors * np.sqrt(DESCRIPTOR_WEIGHTS)
+    squared = (weighted ** 2).sum(axis=1)
+    distances = squared[:, np.newaxis] + squared[np.newaxis, :] - 2 * weighted @ weighted.T
+    return np.sqrt(np.maximum(distances, 0.0))
+
+def ladder_labels(size_levels: int) -> List[str]:
+    """Tallas para ``size_levels`` tamaños ordenados, centradas en M"""
+    if size_levels > len(SIZE_LADDER):
+        # Más niveles que tallas: repartir por cuantiles
+        return [SIZE_LADDER[level * len(SIZE_LADDER) // size_levels] for level in range(size_levels)]
+    start = min(max(CENTER_SIZE - (size_levels - 1) // 2, 0), len(SIZE_LADDER) - size_levels)
+    return list(SIZE_LADDER[start:start + size_levels])
+
+def grade_instances(instances: GarmentInstances) -> Dict[str, Any]:
+    """Agrupar las instancias por forma e inferir la escala de tallas de cada grupo"""
+    if len(instances) < 2:
+        return {'available': False, 'instances': len(instances), 'gradings': []}
+
+    similar = np.triu(_similarity(instances.descriptors(), instances.vertices), k=1)
+    labels = connected_components(len(instances), np.argwhere(similar))
+
+    sizes = instances.sizes()
+    gradings = []
+    for group in np.unique(labels).tolist():
+        members = np.flatnonzero(labels == group)
+        if len(members) < 2:
+            continue
+        member_sizes = sizes[members]
+        if member_sizes.min() <= 0 or member_sizes.max() / member_sizes.min() < GRADING_RANGE_MIN:
+            continue  # mismas dimensiones: instancias repetidas (botones, ojales...), no tallas
+
+        # Niveles de talla: tamaños que difieren menos que la tolerancia comparten talla
+        order = members[np.argsort(member_sizes, kind='stable')]
+        steps = np.diff(np.log(sizes[order])) > np.log1p(SAME_SIZE_TOLERANCE)
+        level = np.concatenate([[0], np.cumsum(steps)])
+        ladder = ladder_labels(int(level[-1]) + 1)
+        # Un escalado agranda la prenda en todos los ejes; si alguno se achica son piezas distintas
+        extents = instances.extents[order]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            axis_growth = extents[1:] / extents[:-1]
+        if np.nanmin(axis_growth) < 1 - SAME_SIZE_TOLERANCE:
+            continue
+
+        level_sizes = np.array([sizes[order[level == i]].mean() for i in range(int(level[-1]) + 1)])
+        gradings.append({
+            'instances': int(len(members)),
+            'sizes': [{
+                'size': ladder[int(lvl)],
+                'node_name': instances.names[member],
+                'node_index': int(instances.nodes[member]),
+                'source': instances.sources[member],
+                'linear_size': round(float(sizes[member]), 4),
+                'extent': [round(float(value), 4) for value in instances.extents[member]]
+            } for member, lvl in zip(order.tolist(), level.tolist())],
+            'ladder': ladder,
+            'grade_steps': [round(float(step), 4) for step in level_sizes[1:] / level_sizes[:-1]],
+            'exact_area': bool(instances.exact_area[members].all()),
+            'files': len({instances.sources[member] for member in members.tolist()})
+        })
+
+    gradings.sort(key=lambda grading: grading['instances'], reverse=True)
+    logger.debug("📐 Escalado de tallas: %d grupos entre %d instancias", len(gradings), len(instances))
+    return {'available': bool(gradings), 'instances': len(instances), 'gradings': gradings}
+
+def analyze_size_grading(gltf_data: Dict[str, Any], scene: SceneIndex,
+                         buffers: Optional[GLTFBuffers] = None, source: str = '') -> Dict[str, Any]:
+    """Escalado de tallas dentro de un archivo"""
+    return grade_instances(collect_instances(gltf_data, scene, buffers, source))
+
+def grade_files(file_paths: List[str]) -> Dict[str, Any]:
+    """Escalado de tallas sobre un lote de archivos (p. ej. una exportación por talla)"""
+    from analyzer_gltf_improved import load_gltf_document
+
+    parts = []
+    for path in file_paths:
+        gltf_data = load_gltf_document(path)
+        parts.append(collect_instances(gltf_data, SceneIndex.from_gltf(gltf_data), GLTFBuffers(gltf_data, path), path))
+    return grade_instances(GarmentInstances.concatenate(parts))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Caché de Etapas
+Re-análisis incremental: huellas por sección del GLTF y caché de resultados por etapa
+
+Cada etapa declara las secciones del documento de las que depende (meshes,
+materials, nodes, textures, images...). Su resultado se guarda con la huella
+de esas secciones, de modo que al volver a subir un archivo con cambios menores
+(un material renombrado, un mesh de cierre agregado) solo se re-ejecutan las
+etapas cuyas entradas cambiaron.
+
+La caché es por proceso (LRU en memoria); se desactiva con MOVING_STAGE_CACHE=0.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import metrics
+
+STAGE_CACHE_ENV_VAR = 'MOVING_STAGE_CACHE'
+
+# Cambiar al modificar la lógica de alguna etapa para invalidar entradas previas
+STAGE_CACHE_VERSION = 7
+
+DEFAULT_MAX_ENTRIES = 512
+
+# Secciones de nivel superior con huella propia
+FINGERPRINT_SECTIONS = (
+    'asset', 'accessors', 'bufferViews', 'buffers', 'meshes', 'materials', 'nodes', 'textures', 'images', 'extras'
+)
+
+STAGE_CACHE_LOOKUPS = metrics.counter(
+    'moving_stage_cache_lookups_total', 'Consultas a la caché de etapas por resultado', ['stage', 'result']
+)
+
+def stage_cache_enabled_from_env() -> bool:
+    return os.getenv(STAGE_CACHE_ENV_VAR, '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+def fingerprint(value: Any) -> str:
+    """Huella estable de un valor JSON (independiente del orden de las claves)"""
+    payload = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+def section_fingerprints(gltf_data: Dict[str, Any], sections: Iterable[str] = FINGERPRINT_SECTIONS) -> Dict[str, str]:
+    """Huella de cada sección del documento (las ausentes tienen la huella de None)"""
+    return {section: fingerprint(gltf_data.get(section)) for section in sections}
+
+class StageCache:
+    """Caché LRU de resultados de etapas indexada por huellas de sus dependencias"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(stage: str, fingerprints: Dict[str, str], depends_on: Iterable[str]) -> Tuple[str, ...]:
+        return (str(STAGE_CACHE_VERSION), stage) + tuple(
+            f"{section}={fingerprints[section]}" for section in sorted(depends_on)
+        )
+
+    def get_or_compute(
+        self,
+        stage: str,
+        fingerprints: Dict[str, str],
+        depends_on: Iterable[str],
+        compute: Callable[[], Any]
+    ) -> Tuple[Any, bool]:
+        """Devolver (resultado, hit); los resultados se copian para que nadie mute la caché"""
+        key = self.key(stage, fingerprints, depends_on)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                value = self._entries[key]
+                self.hits += 1
+                hit = True
+            else:
+                self.misses += 1
+                hit = False
+        STAGE_CACHE_LOOKUPS.labels(stage, 'hit' if hit else 'miss').inc()
+        if hit:
+            return copy.deepcopy(value), True
+
+        value = compute()
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[key] = copy.deepcopy(value)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value, False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+# Caché compartida del proceso (sobrevive a los reruns de Streamlit)
+DEFAULT_STAGE_CACHE = StageCache()
+
+def changed_sections(previous: Dict[str, str], current: Dict[str, str]) -> List[str]:
+    """Secciones cuya huella cambió entre dos análisis"""
+    return sorted(section for section, value in current.items() if previous.get(section) != value)
@@ -23,25 +23,52 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
+import csv
 import json
 import io
+import hashlib
 import tempfile
 import os
 from pathlib import Path
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 # Importar nuestros analizadores
 try:
     from analyzer_main import CLO3DAnalyzer, AnalysisResults
+    from formats import FORMAT_REGISTRY, UnsupportedFormatError
+    from analysis_tiers import INTERACTIVE_LATENCY_BUDGET, TIER_LABELS, TIERS
+    from cancellation import AnalysisCancelled, CancellationToken
     MAIN_ANALYZER_AVAILABLE = True
 except ImportError:
+    st.error("❌ Error: No se pudo importar el analizador principal")
+    st.stop()
+
+import serialization
+from config.logging_config import configure_logging
+
+# Logging de la aplicación (texto o JSON según MOVING_LOG_FORMAT)
+configure_logging()
+
+import metrics
+
+@st.cache_resource
+def get_metrics_server():
+    """Endpoint /metrics compartido por todas las sesiones (solo si MOVING_METRICS_PORT está definido)"""
     try:
-        from analyzer import CLO3DAnalyzer, AnalysisResults
-        MAIN_ANALYZER_AVAILABLE = True
-    except ImportError:
-        st.error("❌ Error: No se pudo importar el analizador principal")
-        st.stop()
+        return metrics.start_metrics_server_from_env()
+    except (OSError, ValueError) as e:
+        st.warning(f"⚠️ No se pudo iniciar el endpoint de métricas: {e}")
+        return None
+
+get_metrics_server()
+
+# Almacén columnar de resultados (histórico de análisis)
+try:
+    from results_store import ResultsWarehouse
+    WAREHOUSE_AVAILABLE = True
+except ImportError:
+    WAREHOUSE_AVAILABLE = False
 
 try:
     from analyzer_gltf_improved import ImprovedGLTFAnalyzer, GLTFAnalysisResult
@@ -213,6 +240,7 @@ def main():
         # Información de formatos con indicadores de calidad
         format_info = {
             ".gltf": {"name": "GLTF 3D Models", "quality": "🟢 Excelente", "features": "Análisis avanzado con IA"},
+            ".glb": {"name": "GLTF Binary Models", "quality": "🟢 Excelente", "features": "Análisis avanzado con IA"},
             ".zprj": {"name": "CLO3D Projects", "quality": "🟡 Básico", "features": "Análisis estructural"},
             ".zpac": {"name": "CLO3D Packages", "quality": "🟡 Básico", "features": "Análisis de metadatos"},
             ".obj": {"name": "Wavefront OBJ", "quality": "🟡 Básico", "features": "Análisis geométrico"}
@@ -222,7 +250,7 @@ def main():
             with st.expander(f"{ext} - {info['name']}"):
                 st.write(f"**Calidad:** {info['quality']}")
                 st.write(f"**Características:** {info['features']}")
-                if ext == ".gltf":
+                if ext in (".gltf", ".glb"):
                     st.success("✨ Análisis mejorado con reducción de falsos positivos")
         
         st.success("**Límite de archivo:** 300MB ⬆️ Aumentado")
@@ -255,15 +283,28 @@ def main():
         if 'total_confidence' not in st.session_state:
             st.session_state.total_confidence = 0.0
         
-        st.header("📊 Estadísticas de Sesión")
+        # Estadísticas del histórico (almacén) con respaldo en los contadores de sesión
+        warehouse_stats = get_warehouse_summary()
+        if warehouse_stats is not None:
+            st.header("📊 Estadísticas del Histórico")
+            total_analyses = warehouse_stats['total_analyses']
+            gltf_analyses = warehouse_stats['gltf_analyses']
+            avg_confidence = warehouse_stats['average_confidence']
+        else:
+            st.header("📊 Estadísticas de Sesión")
+            total_analyses = st.session_state.analyses_count
+            gltf_analyses = st.session_state.gltf_analyses
+            avg_confidence = (
+                st.session_state.total_confidence / total_analyses if total_analyses > 0 else 0.0
+            )
+
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Total análisis", st.session_state.analyses_count)
+            st.metric("Total análisis", total_analyses)
         with col2:
-            st.metric("Análisis GLTF", st.session_state.gltf_analyses)
+            st.metric("Análisis GLTF", gltf_analyses)
         
-        if st.session_state.analyses_count > 0:
-            avg_confidence = st.session_state.total_confidence / st.session_state.analyses_count
+        if total_analyses > 0:
             st.metric("Confianza promedio", f"{avg_confidence:.2f}")
         
         # Información de mejoras
@@ -289,8 +330,8 @@ def main():
     
     uploaded_file = st.file_uploader(
         "Selecciona tu archivo de diseño",
-        type=['zprj', 'zpac', 'gltf', 'obj'],
-        help="Formatos soportados: .zprj, .zpac (recomendado), .gltf, .obj | Límite: 300MB"
+        type=['zprj', 'zpac', 'gltf', 'glb', 'obj'],
+        help="Formatos soportados: .zprj, .zpac (recomendado), .gltf, .glb, .obj | Límite: 300MB"
     )
     
     if uploaded_file is not None:
@@ -326,6 +367,18 @@ def main():
             else:
                 st.success(f"✅ Archivo pequeño ({file_size_mb:.2f} MB) - Análisis rápido")
             
+            # Nivel de análisis (automático según tamaño y complejidad, o forzado)
+            tier_options = {'auto': '🤖 Automático'}
+            tier_options.update({tier: TIER_LABELS[tier] for tier in TIERS})
+            selected_tier = st.selectbox(
+                "🎚️ Nivel de análisis",
+                options=list(tier_options),
+                format_func=tier_options.get,
+                key="analysis_tier",
+                help=f"En modo automático se entrega una primera respuesta en ≤{INTERACTIVE_LATENCY_BUDGET:.0f}s: "
+                     "los niveles superiores solo se ejecutan si queda presupuesto"
+            )
+            
             # Botón de análisis
             if st.button("🚀 Iniciar Análisis de Screening", type="primary", use_container_width=True):
                 # Limpiar análisis anterior
@@ -336,7 +389,7 @@ def main():
                 if 'chat_session_id' in st.session_state:
                     del st.session_state.chat_session_id
                 
-                analyze_file(uploaded_file)
+                analyze_file(uploaded_file, tier=selected_tier)
     
     # MOSTRAR RESULTADOS PERSISTENTES SI EXISTEN
     if st.session_state.analysis_completed and st.session_state.current_analysis_results:
@@ -357,19 +410,96 @@ def main():
         
         display_results(st.session_state.current_analysis_results, st.session_state.current_filename)
 
-def analyze_file(uploaded_file):
+@st.cache_resource
+def get_results_warehouse() -> Optional["ResultsWarehouse"]:
+    """Almacén de resultados compartido por todas las sesiones"""
+    if not WAREHOUSE_AVAILABLE:
+        return None
+    try:
+        return ResultsWarehouse()
+    except (ImportError, OSError) as e:
+        st.warning(f"⚠️ Almacén de resultados no disponible: {e}")
+        return None
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_warehouse_summary() -> Optional[Dict[str, Any]]:
+    """Estadísticas globales del almacén (None si no está disponible)"""
+    warehouse = get_results_warehouse()
+    if warehouse is None:
+        return None
+    try:
+        return warehouse.summary()
+    except Exception:
+        return None
+
+def record_analysis(results: AnalysisResults, filename: str):
+    """Agregar un análisis al almacén sin interrumpir la interfaz si falla"""
+    warehouse = get_results_warehouse()
+    if warehouse is None:
+        return
+    try:
+        warehouse.append(results, file_name=filename)
+        get_warehouse_summary.clear()
+    except Exception as e:
+        st.warning(f"⚠️ No se pudo guardar el análisis en el histórico: {e}")
+
+# Etiquetas de las secciones de resultados parciales
+PROGRESS_SECTION_LABELS = {
+    'asset': "📊 Información del modelo",
+    'garment_elements': "👕 Elementos de prenda",
+    'materials': "🧵 Materiales",
+    'sizes': "📏 Tallas",
+    'accessibility': "♿ Accesibilidad",
+    'deep': "📐 Geometría, texturas y costuras",
+    'screening': "✅ Screening"
+}
+
+def render_partial_results(placeholder, sections: Dict[str, Dict[str, Any]], progress):
+    """Vista previa de los resultados parciales mientras el análisis continúa"""
+    scores = progress.data.get('scores', {})
+    with placeholder.container():
+        st.caption(f"⏳ Resultados parciales ({progress.elapsed_seconds:.1f}s) - las puntuaciones son provisionales")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("🎯 Inclusividad", f"{scores.get('inclusivity_score', 0)}/100")
+        col2.metric("♿ Accesibilidad", f"{scores.get('accessibility_score', 0)}/100")
+        col3.metric("🌱 Sostenibilidad", f"{scores.get('sustainability_score', 0)}/100")
+        
+        for section, data in sections.items():
+            label = PROGRESS_SECTION_LABELS.get(section, section)
+            if section == 'asset':
+                structure = data.get('structure', {})
+                st.write(f"{label}: GLTF v{data.get('gltf_version')} · {structure.get('meshes', 0)} meshes · "
+                         f"{structure.get('materials', 0)} materiales · nivel {TIER_LABELS.get(data.get('analysis_tier'), '')}")
+            elif section == 'garment_elements':
+                st.write(f"{label}: {data['totals']['garment_elements']} detectados")
+            elif section == 'materials':
+                st.write(f"{label}: {data['totals']['materials']} analizados")
+            elif section == 'sizes':
+                st.write(f"{label}: {data['totals']['size_variations']} variaciones")
+            elif section == 'accessibility':
+                st.write(f"{label}: {', '.join(data.get('features', [])) or 'sin características detectadas'}")
+            elif section == 'deep':
+                st.write(f"{label}: {data.get('seams', {}).get('seam_pairs', 0)} pares de costura · "
+                         f"{data.get('textures', {}).get('images', 0)} imágenes")
+
+def analyze_file(uploaded_file, tier: str = 'auto'):
     """Analizar archivo subido"""
     
     # Progress bar
     progress_bar = st.progress(0)
     status_text = st.empty()
+    preview = st.empty()
+    tmp_file_path = None
     
     try:
+        # Rechazar contenido no soportado o corrupto antes de escribir el temporal
+        file_format = FORMAT_REGISTRY.resolve_bytes(uploaded_file.getvalue(), uploaded_file.name)
+        
         # Guardar archivo temporal
         status_text.text("📁 Guardando archivo temporal...")
         progress_bar.progress(10)
         
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp_file:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=file_format.extensions[0]) as tmp_file:
             tmp_file.write(uploaded_file.getvalue())
             tmp_file_path = tmp_file.name
         
@@ -377,13 +507,41 @@ def analyze_file(uploaded_file):
         status_text.text("🔧 Inicializando analizador...")
         progress_bar.progress(20)
         
-        analyzer = CLO3DAnalyzer(debug=False)
+        analyzer = CLO3DAnalyzer(debug=False, tier=tier, latency_budget=INTERACTIVE_LATENCY_BUDGET)
         
-        # Realizar análisis
+        # Realizar análisis mostrando cada sección a medida que termina
         status_text.text("🔍 Analizando archivo de diseño...")
         progress_bar.progress(30)
         
-        results = analyzer.analyze_file(tmp_file_path)
+        sections: Dict[str, Dict[str, Any]] = {}
+        
+        def show_progress(progress):
+            if progress.final:
+                return
+            sections[progress.section] = progress.data
+            progress_bar.progress(30 + int(progress.fraction * 65))
+            status_text.text(f"🔍 {PROGRESS_SECTION_LABELS.get(progress.section, progress.section)} listo...")
+            render_partial_results(preview, sections, progress)
+        
+        # Cancelar el análisis anterior de la sesión si sigue en curso (p. ej. doble clic en "Analizar")
+        previous_token = st.session_state.get('analysis_cancel_token')
+        if previous_token is not None:
+            previous_token.cancel('reemplazado por un nuevo análisis')
+        cancel_token = CancellationToken(timeout=analyzer.timeout)
+        st.session_state.analysis_cancel_token = cancel_token
+        
+        # El análisis corre en un worker; si el script se interrumpe (rerun,
+        # sesión cerrada) cerrar el generador cancela el análisis
+        results = None
+        events = analyzer.iter_analysis(tmp_file_path, cancel_token=cancel_token)
+        try:
+            for progress in events:
+                show_progress(progress)
+                if progress.final:
+                    results = progress.results
+        finally:
+            events.close()
+        preview.empty()
         
         progress_bar.progress(100)
         status_text.text("✅ Análisis completado!")
@@ -403,6 +561,9 @@ def analyze_file(uploaded_file):
             confidence_score = results.screening_report.confidence_levels.get('overall_analysis', 0.0)
         
         st.session_state.total_confidence += confidence_score
+
+        # Registrar el análisis en el almacén histórico
+        record_analysis(results, uploaded_file.name)
         
         # GUARDAR RESULTADOS EN SESSION STATE PARA PERSISTENCIA
         st.session_state.current_analysis_results = results
@@ -412,18 +573,26 @@ def analyze_file(uploaded_file):
         # Mostrar resultados mejorados
         display_results(results, uploaded_file.name)
         
+    except UnsupportedFormatError as e:
+        st.error(f"❌ Archivo no soportado: {str(e)}")
+    
+    except AnalysisCancelled as e:
+        st.warning(f"🛑 {str(e)}")
+    
     except Exception as e:
         st.error(f"❌ Error durante el análisis: {str(e)}")
         st.exception(e)
     
     finally:
-        # Limpiar archivo temporal
-        try:
-            os.unlink(tmp_file_path)
-        except:
-            pass
+        # Limpiar archivo temporal (no existe si el formato se rechazó antes de escribirlo)
+        if tmp_file_path is not None:
+            try:
+                os.unlink(tmp_file_path)
+            except OSError:
+                pass
         progress_bar.empty()
         status_text.empty()
+        preview.empty()
 
 def display_results(results: AnalysisResults, filename: str):
     """Mostrar resultados del análisis mejorados"""
@@ -593,72 +762,98 @@ def display_advanced_analysis_info(results: AnalysisResults, confidence_score: f
         else:
             st.warning(f"⚠️ Archivo generado por: {generator} - Puede requerir validación adicional")
 
+def get_analysis_key(results: AnalysisResults) -> str:
+    """Clave estable de un análisis para cachear artefactos derivados entre reruns"""
+    tech_details = results.technical_details
+    fingerprint = "|".join(str(part) for part in (
+        tech_details.get('file_hash', ''),
+        tech_details.get('analysis_timestamp', ''),
+        results.file_type,
+        results.status,
+        results.processing_time
+    ))
+    return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_scores_figure(analysis_key: str, _results: AnalysisResults, is_advanced: bool):
+    """Gráfico de barras de puntuaciones (cacheado por análisis)"""
+    scores_data = {
+        'Métrica': ['Inclusividad', 'Accesibilidad', 'Sostenibilidad'],
+        'Puntuación': [_results.inclusivity_score, _results.accessibility_score, _results.sustainability_score],
+        'Color': ['#1f77b4', '#ff7f0e', '#2ca02c']
+    }
+    
+    fig = px.bar(
+        scores_data, 
+        x='Métrica', 
+        y='Puntuación',
+        color='Color',
+        color_discrete_map={color: color for color in scores_data['Color']},
+        title=f"Puntuaciones de Screening {'Avanzado' if is_advanced else 'Básico'}",
+        range_y=[0, 100]
+    )
+    
+    fig.add_hline(y=80, line_dash="dash", line_color="green", annotation_text="Excelente (80+)")
+    fig.add_hline(y=60, line_dash="dash", line_color="orange", annotation_text="Bueno (60+)")
+    
+    if not is_advanced:
+        fig.add_annotation(
+            text="⚠️ Análisis Básico - Validación Manual Requerida",
+            xref="paper", yref="paper",
+            x=0.5, y=0.95, showarrow=False,
+            font=dict(color="red", size=12)
+        )
+    
+    fig.update_layout(showlegend=False, height=400)
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_confidence_gauge(analysis_key: str, confidence_score: float):
+    """Indicador de confianza del análisis (cacheado por análisis)"""
+    fig_confidence = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = confidence_score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Confianza del Análisis"},
+        delta = {'reference': 0.8},
+        gauge = {
+            'axis': {'range': [None, 1]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 0.5], 'color': "lightgray"},
+                {'range': [0.5, 0.8], 'color': "yellow"},
+                {'range': [0.8, 1], 'color': "green"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 0.8
+            }
+        }
+    ))
+    
+    fig_confidence.update_layout(height=300)
+    return fig_confidence
+
 def create_scores_chart(results: AnalysisResults, is_advanced: bool = False, confidence_score: float = 0.0):
     """Crear gráfico de puntuaciones mejorado"""
     
     st.header("📊 Visualización de Puntuaciones")
     
+    analysis_key = get_analysis_key(results)
+    
     # Crear dos gráficos: uno para puntuaciones y otro para confianza
     col1, col2 = st.columns([2, 1])
     
     with col1:
         # Gráfico de barras principal
-        scores_data = {
-            'Métrica': ['Inclusividad', 'Accesibilidad', 'Sostenibilidad'],
-            'Puntuación': [results.inclusivity_score, results.accessibility_score, results.sustainability_score],
-            'Color': ['#1f77b4', '#ff7f0e', '#2ca02c']
-        }
-        
-        fig = px.bar(
-            scores_data, 
-            x='Métrica', 
-            y='Puntuación',
-            color='Color',
-            color_discrete_map={color: color for color in scores_data['Color']},
-            title=f"Puntuaciones de Screening {'Avanzado' if is_advanced else 'Básico'}",
-            range_y=[0, 100]
-        )
-        
-        fig.add_hline(y=80, line_dash="dash", line_color="green", annotation_text="Excelente (80+)")
-        fig.add_hline(y=60, line_dash="dash", line_color="orange", annotation_text="Bueno (60+)")
-        
-        if not is_advanced:
-            fig.add_annotation(
-                text="⚠️ Análisis Básico - Validación Manual Requerida",
-                xref="paper", yref="paper",
-                x=0.5, y=0.95, showarrow=False,
-                font=dict(color="red", size=12)
-            )
-        
-        fig.update_layout(showlegend=False, height=400)
+        fig = build_scores_figure(analysis_key, results, is_advanced)
         st.plotly_chart(fig, use_container_width=True, key="scores_main_chart")
     
     with col2:
         if is_advanced and confidence_score > 0:
             # Gráfico de confianza
-            fig_confidence = go.Figure(go.Indicator(
-                mode = "gauge+number+delta",
-                value = confidence_score,
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': "Confianza del Análisis"},
-                delta = {'reference': 0.8},
-                gauge = {
-                    'axis': {'range': [None, 1]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 0.5], 'color': "lightgray"},
-                        {'range': [0.5, 0.8], 'color': "yellow"},
-                        {'range': [0.8, 1], 'color': "green"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 0.8
-                    }
-                }
-            ))
-            
-            fig_confidence.update_layout(height=300)
+            fig_confidence = build_confidence_gauge(analysis_key, confidence_score)
             st.plotly_chart(fig_confidence, use_container_width=True, key="confidence_gauge_chart")
         else:
             st.info("📊 Métricas de confianza no disponibles para análisis básico")
@@ -783,24 +978,7 @@ def display_score_methodology(results: AnalysisResults, is_advanced: bool, confi
         st.markdown("---")
         st.subheader("📈 Interpretación de Scores")
         
-        interpretation_data = {
-            'Rango': ['80-100', '60-79', '40-59', '0-39'],
-            'Indicador': ['🟢 Excelente', '🟡 Bueno', '🟠 Regular', '🔴 Deficiente'],
-            'Descripción': [
-                'Alta confianza, múltiples características detectadas',
-                'Confianza media, algunas características detectadas', 
-                'Baja confianza o pocas características',
-                'Análisis básico o muy pocas características'
-            ],
-            'Acción Recomendada': [
-                'Validación ligera recomendada',
-                'Validación moderada necesaria',
-                'Validación completa requerida',
-                'Análisis manual completo crítico'
-            ]
-        }
-        
-        df_interpretation = pd.DataFrame(interpretation_data)
+        df_interpretation = build_score_interpretation_table()
         st.dataframe(df_interpretation, use_container_width=True, hide_index=True, key="score_interpretation_table")
         
         # Nota importante
@@ -811,6 +989,27 @@ def display_score_methodology(results: AnalysisResults, is_advanced: bool, confi
         La metodología está optimizada para archivos GLTF generados por software de moda como CLO3D.
         """)
 
+@st.cache_data(show_spinner=False)
+def build_score_interpretation_table() -> pd.DataFrame:
+    """Tabla estática de interpretación de scores"""
+    interpretation_data = {
+        'Rango': ['80-100', '60-79', '40-59', '0-39'],
+        'Indicador': ['🟢 Excelente', '🟡 Bueno', '🟠 Regular', '🔴 Deficiente'],
+        'Descripción': [
+            'Alta confianza, múltiples características detectadas',
+            'Confianza media, algunas características detectadas', 
+            'Baja confianza o pocas características',
+            'Análisis básico o muy pocas características'
+        ],
+        'Acción Recomendada': [
+            'Validación ligera recomendada',
+            'Validación moderada necesaria',
+            'Validación completa requerida',
+            'Análisis manual completo crítico'
+        ]
+    }
+    return pd.DataFrame(interpretation_data)
+
 def display_detailed_analysis(results: AnalysisResults):
     """Mostrar análisis detallado"""
     
@@ -882,24 +1081,18 @@ def display_detailed_analysis(results: AnalysisResults):
             st.metric("Diseño ergonómico", "✅ Sí" if results.comfort.ergonomic_design else "❌ No")
             st.metric("Diseño universal", "✅ Sí" if results.comfort.universal_design else "❌ No")
 
-def display_screening_report(results: AnalysisResults):
-    """Mostrar reporte de screening para validación humana"""
-    
-    st.header("🔍 Reporte de Screening - REQUIERE VALIDACIÓN HUMANA")
-    
-    screening = results.screening_report
-    
-    # Información general del screening
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("⏰ Tiempo estimado validación", f"{screening.estimated_validation_time} min")
-    with col2:
-        st.metric("👥 Tipos de expertos", len(screening.recommended_experts))
-    with col3:
-        st.metric("📋 Items a validar", len(screening.validation_checklist))
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_screening_artifacts(analysis_key: str, _results: AnalysisResults) -> Dict[str, Any]:
+    """Tablas y gráficos del reporte de screening (cacheados por análisis)"""
+    screening = _results.screening_report
+    artifacts = {
+        'confidence_figure': None,
+        'checklist': None,
+        'priority_summary': None,
+        'priority_figure': None
+    }
     
     # Niveles de confianza
-    st.subheader("📊 Niveles de Confianza del Screening")
     confidence_data = []
     for key, confidence in screening.confidence_levels.items():
         confidence_data.append({
@@ -911,7 +1104,6 @@ def display_screening_report(results: AnalysisResults):
     if confidence_data:
         df_confidence = pd.DataFrame(confidence_data)
         
-        # Gráfico de confianza
         fig = px.bar(
             df_confidence, 
             x='Aspecto', 
@@ -921,7 +1113,66 @@ def display_screening_report(results: AnalysisResults):
             title="Niveles de Confianza del Análisis Automático"
         )
         fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True, key="confidence_levels_chart")
+        artifacts['confidence_figure'] = fig
+    
+    # Checklist de validación
+    df_checklist = build_checklist_dataframe(_results)
+    
+    if not df_checklist.empty:
+        artifacts['checklist'] = df_checklist
+        
+        priority_summary = df_checklist.groupby('Prioridad').agg({
+            'Tiempo (min)': 'sum',
+            'Categoría': 'count'
+        }).rename(columns={'Categoría': 'Cantidad'})
+        artifacts['priority_summary'] = priority_summary
+        artifacts['priority_figure'] = px.pie(
+            values=priority_summary['Cantidad'],
+            names=priority_summary.index,
+            title="Distribución de Items por Prioridad"
+        )
+    
+    return artifacts
+
+CHECKLIST_COLUMNS = ['Prioridad', 'Categoría', 'Hallazgo', 'Validación Requerida', 'Tiempo (min)', 'Experto']
+
+def iter_checklist_rows(results: AnalysisResults):
+    """Filas del checklist de validación humana, una por item"""
+    for item in results.screening_report.validation_checklist:
+        yield (
+            item.priority,
+            item.category,
+            item.finding,
+            item.validation_needed,
+            item.estimated_time_minutes,
+            item.expert_type.replace('_', ' ').title()
+        )
+
+def build_checklist_dataframe(results: AnalysisResults) -> pd.DataFrame:
+    """DataFrame del checklist de validación humana"""
+    return pd.DataFrame.from_records(iter_checklist_rows(results), columns=CHECKLIST_COLUMNS)
+
+def display_screening_report(results: AnalysisResults):
+    """Mostrar reporte de screening para validación humana"""
+    
+    st.header("🔍 Reporte de Screening - REQUIERE VALIDACIÓN HUMANA")
+    
+    screening = results.screening_report
+    artifacts = build_screening_artifacts(get_analysis_key(results), results)
+    
+    # Información general del screening
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("⏰ Tiempo estimado validación", f"{screening.estimated_validation_time} min")
+    with col2:
+        st.metric("👥 Tipos de expertos", len(screening.recommended_experts))
+    with col3:
+        st.metric("📋 Items a validar", len(screening.validation_checklist))
+    
+    # Niveles de confianza
+    st.subheader("📊 Niveles de Confianza del Screening")
+    if artifacts['confidence_figure'] is not None:
+        st.plotly_chart(artifacts['confidence_figure'], use_container_width=True, key="confidence_levels_chart")
     
     # Banderas de riesgo
     if screening.risk_flags:
@@ -938,21 +1189,8 @@ def display_screening_report(results: AnalysisResults):
     # Checklist de validación
     st.subheader("📋 Checklist de Validación Humana")
     
-    # Crear DataFrame para el checklist
-    checklist_data = []
-    for item in screening.validation_checklist:
-        checklist_data.append({
-            'Prioridad': item.priority,
-            'Categoría': item.category,
-            'Hallazgo': item.finding,
-            'Validación Requerida': item.validation_needed,
-            'Tiempo (min)': item.estimated_time_minutes,
-            'Experto': item.expert_type.replace('_', ' ').title()
-        })
-    
-    if checklist_data:
-        df_checklist = pd.DataFrame(checklist_data)
-        
+    df_checklist = artifacts['checklist']
+    if df_checklist is not None:
         # Filtros
         col1, col2 = st.columns(2)
         with col1:
@@ -967,7 +1205,7 @@ def display_screening_report(results: AnalysisResults):
             )
         
         # Aplicar filtros
-        filtered_df = df_checklist.copy()
+        filtered_df = df_checklist
         if priority_filter != "Todas":
             filtered_df = filtered_df[filtered_df['Prioridad'] == priority_filter]
         if category_filter != "Todas":
@@ -983,21 +1221,12 @@ def display_screening_report(results: AnalysisResults):
         
         # Resumen por prioridad
         st.subheader("📊 Resumen por Prioridad")
-        priority_summary = df_checklist.groupby('Prioridad').agg({
-            'Tiempo (min)': 'sum',
-            'Categoría': 'count'
-        }).rename(columns={'Categoría': 'Cantidad'})
         
         col1, col2 = st.columns(2)
         with col1:
-            st.dataframe(priority_summary, key="priority_summary_table")
+            st.dataframe(artifacts['priority_summary'], key="priority_summary_table")
         with col2:
-            fig = px.pie(
-                values=priority_summary['Cantidad'],
-                names=priority_summary.index,
-                title="Distribución de Items por Prioridad"
-            )
-            st.plotly_chart(fig, use_container_width=True, key="priority_distribution_pie_chart")
+            st.plotly_chart(artifacts['priority_figure'], use_container_width=True, key="priority_distribution_pie_chart")
 
 def display_recommendations(results: AnalysisResults):
     """Mostrar recomendaciones automáticas"""
@@ -1030,61 +1259,109 @@ def display_technical_details(results: AnalysisResults):
             st.text(f"Hash del archivo: {tech_details.get('file_hash', 'N/A')[:16]}...")
             st.text(f"Timestamp: {tech_details.get('analysis_timestamp', 'N/A')}")
             
+            if 'analysis_tier' in tech_details:
+                decision = tech_details.get('tier_decision', {})
+                st.text(f"Nivel de análisis: {TIER_LABELS.get(tech_details['analysis_tier'], tech_details['analysis_tier'])}")
+                st.caption(f"Motivo: {decision.get('reason', 'N/A')}")
+                if decision.get('downgraded_from'):
+                    st.warning(f"⏱️ Nivel reducido desde {TIER_LABELS.get(decision['downgraded_from'])} por presupuesto de latencia")
+            
             # Información específica del formato
             if 'zpac_structure' in tech_details:
                 zpac_info = tech_details['zpac_structure']
                 st.metric("Imágenes embebidas", zpac_info.get('embedded_images', 0))
                 st.metric("Secciones de datos", zpac_info.get('data_sections', 0))
+        
+        # Desglose de tiempos por etapa
+        stage_breakdown = tech_details.get('stage_breakdown')
+        if stage_breakdown and stage_breakdown.get('stages'):
+            st.subheader("⏱️ Tiempo por Etapa")
+            stages_df = pd.DataFrame([{
+                'Etapa': ('  ' * stage['depth']) + stage['name'],
+                'Tiempo (ms)': round(stage['seconds'] * 1000, 2),
+                '% del total': round(stage['share'] * 100, 1),
+                **({'Pico memoria (KB)': stage['peak_memory_kb']} if 'peak_memory_kb' in stage else {})
+            } for stage in stage_breakdown['stages']])
+            st.dataframe(stages_df, use_container_width=True, hide_index=True, key="stage_breakdown_table")
+            st.caption(f"Tiempo total: {stage_breakdown['total_seconds'] * 1000:.1f} ms")
+            
+            if stage_breakdown.get('profile'):
+                st.dataframe(pd.DataFrame(stage_breakdown['profile']), use_container_width=True, hide_index=True, key="stage_profile_table")
+
+def _write_text_payload(write: Callable[[io.TextIOBase], None]) -> bytes:
+    """Escribir un payload de texto de forma incremental y devolverlo en UTF-8"""
+    buffer = io.BytesIO()
+    stream = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+    write(stream)
+    stream.flush()
+    stream.detach()
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_json_download(analysis_key: str, _results: AnalysisResults) -> bytes:
+    """JSON completo del análisis (generado al hacer click, cacheado por análisis)"""
+    return _write_text_payload(lambda stream: serialization.dump_json(_results, stream, indent=2))
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_checklist_csv_download(analysis_key: str, _results: AnalysisResults) -> bytes:
+    """Checklist en CSV escrito fila a fila (sin construir un DataFrame)"""
+    def write_rows(stream):
+        writer = csv.writer(stream, lineterminator='\n')
+        writer.writerow(CHECKLIST_COLUMNS)
+        for row in iter_checklist_rows(_results):
+            writer.writerow(row)
+    
+    return _write_text_payload(write_rows)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_summary_download(analysis_key: str, _results: AnalysisResults, filename: str) -> bytes:
+    """Reporte resumido en texto (generado al hacer click, cacheado por análisis)"""
+    return generate_summary_report(_results, filename).encode('utf-8')
 
 def display_download_options(results: AnalysisResults, filename: str):
-    """Opciones de descarga de resultados"""
+    """Opciones de descarga de resultados
+    
+    Los payloads se generan de forma diferida: Streamlit ejecuta el callable
+    solo cuando el usuario hace click en el botón de descarga.
+    """
     
     st.header("💾 Descargar Resultados")
     
+    analysis_key = get_analysis_key(results)
+    file_stem = Path(filename).stem
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         # JSON completo
-        json_data = json.dumps(results.__dict__, default=str, indent=2, ensure_ascii=False)
         st.download_button(
             label="📄 Descargar JSON completo",
-            data=json_data,
-            file_name=f"analysis_{Path(filename).stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json"
+            data=lambda: build_json_download(analysis_key, results),
+            file_name=f"analysis_{file_stem}_{timestamp}.json",
+            mime="application/json",
+            key="download_json"
         )
     
     with col2:
         # Checklist para expertos
         if results.screening_report.validation_checklist:
-            checklist_data = []
-            for item in results.screening_report.validation_checklist:
-                checklist_data.append({
-                    'Prioridad': item.priority,
-                    'Categoría': item.category,
-                    'Hallazgo': item.finding,
-                    'Validación Requerida': item.validation_needed,
-                    'Tiempo (min)': item.estimated_time_minutes,
-                    'Experto': item.expert_type.replace('_', ' ').title()
-                })
-            
-            df_checklist = pd.DataFrame(checklist_data)
-            csv_data = df_checklist.to_csv(index=False)
-            
             st.download_button(
                 label="📋 Descargar Checklist CSV",
-                data=csv_data,
-                file_name=f"checklist_{Path(filename).stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                data=lambda: build_checklist_csv_download(analysis_key, results),
+                file_name=f"checklist_{file_stem}_{timestamp}.csv",
+                mime="text/csv",
+                key="download_checklist_csv"
             )
     
     with col3:
         # Reporte resumido
-        summary_report = generate_summary_report(results, filename)
         st.download_button(
             label="📊 Descargar Reporte Resumido",
-            data=summary_report,
-            file_name=f"summary_{Path(filename).stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-            mime="text/plain"
+            data=lambda: build_summary_download(analysis_key, results, filename),
+            file_name=f"summary_{file_stem}_{timestamp}.txt",
+            mime="text/plain",
+            key="download_summary"
         )
 
 def generate_summary_report(results: AnalysisResults, filename: str) -> str:
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar los niveles de análisis (quick / standard / deep)
+"""
+
+from analysis_tiers import DEEP, QUICK, STANDARD, TierThresholds, choose_tier
+from analyzer_main import CLO3DAnalyzer
+
+def _stage_names(results):
+    return {stage['name'] for stage in results.technical_details['stage_breakdown']['stages']}
+
+def test_automatic_tier_selection():
+    """El nivel automático baja con el tamaño y la complejidad"""
+    print("🎚️ Probando selección automática...")
+    thresholds = TierThresholds()
+    assert choose_tier(1.0, {'accessors': 100}).tier == DEEP
+    assert choose_tier(thresholds.deep_max_mb + 1, {}).tier == STANDARD
+    assert choose_tier(thresholds.standard_max_mb + 1, {}).tier == QUICK
+    assert choose_tier(1.0, {'accessors': thresholds.standard_max_elements + 1}).tier == QUICK
+    assert choose_tier(500.0, {}, requested='deep').tier == DEEP
+
+    results = CLO3DAnalyzer().analyze_file('test01.gltf')
+    assert results.technical_details['analysis_tier'] == DEEP
+    assert 'gltf.seams' in _stage_names(results)
+    assert results.technical_details['deep_analysis']['seams']['seam_pairs'] == 199
+    print("   ✅ Tamaño, elementos y override")
+
+def test_quick_tier_skips_name_and_material_analysis():
+    """El screening rápido solo usa estructura y metadatos de accessors"""
+    print("\n⚡ Probando nivel quick...")
+    results = CLO3DAnalyzer(tier='quick').analyze_file('test01.gltf')
+    stages = _stage_names(results)
+    assert 'gltf.structure' in stages
+    assert 'gltf.fabric_properties' not in stages and 'gltf.geometry' not in stages
+    summary = results.technical_details['structure_summary']
+    assert summary['accessors'] == 512 and summary['materials'] == 174
+    assert summary['vertices'] > 0 and summary['triangles'] > 0
+    assert results.raw_data_summary['materials_analyzed'] == 0
+
+    standard = CLO3DAnalyzer(tier='standard').analyze_file('test01.gltf')
+    assert 'gltf.fabric_properties' in _stage_names(standard)
+    assert 'deep_analysis' not in standard.technical_details
+    print("   ✅ Etapas según nivel")
+
+def test_latency_budget_downgrades_automatic_tier():
+    """Con el presupuesto agotado se entrega el nivel quick"""
+    print("\n⏱️ Probando presupuesto de latencia...")
+    results = CLO3DAnalyzer(latency_budget=0.0).analyze_file('test01.gltf')
+    decision = results.technical_details['tier_decision']
+    assert decision['tier'] == QUICK and decision['downgraded_from'] == DEEP
+
+    # Un nivel pedido explícitamente no se reduce
+    forced = CLO3DAnalyzer(tier='deep', latency_budget=0.0).analyze_file('test01.gltf')
+    assert forced.technical_details['analysis_tier'] == DEEP
+    print("   ✅ Reducción solo en modo automático")
+
+if __name__ == "__main__":
+    print("🧪 Test de Niveles de Análisis")
+    print("=" * 60)
+    test_automatic_tier_selection()
+    test_quick_tier_skips_name_and_material_analysis()
+    test_latency_budget_downgrades_automatic_tier()
+    print("\n🎉 ¡Todos los tests de niveles pasaron!")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el índice persistente de texturas
+"""
+
+import os
+import tempfile
+
+from asset_index import AssetIndex
+from gltf_buffers import GLTFBuffers
+from test_texture_analysis import _write_textures
+from texture_analysis import TextureStatsCache, analyze_texture_images
+
+def test_index_shared_between_processes():
+    """Una caché nueva (otro proceso) reutiliza las texturas del índice sin decodificar"""
+    print("🗂️ Probando índice de assets...")
+    with tempfile.TemporaryDirectory() as directory:
+        gltf_data, path = _write_textures(directory)
+        index_path = os.path.join(directory, 'index', 'asset_index.sqlite')
+
+        first_index = AssetIndex(index_path)
+        first = analyze_texture_images(gltf_data, GLTFBuffers(gltf_data, path),
+                                       cache=TextureStatsCache(index=first_index))
+        first_index.close()
+
+        second_index = AssetIndex(index_path)
+        second = analyze_texture_images(gltf_data, GLTFBuffers(gltf_data, path),
+                                        cache=TextureStatsCache(index=second_index))
+        summary = second_index.summary()
+        top = second_index.most_referenced(1)[0]
+        second_index.close()
+
+    assert first['decoded'] == 2 and second['decoded'] == 0 and second['cache_hits'] == 2
+    assert second['details'] == first['details']
+    assert summary == {'unique_textures': 2, 'references': 4}
+    assert top['references'] == 2 and top['stats']['surface_class'] in ('lisa', 'rugosa')
+    print(f"   ✅ {summary['unique_textures']} texturas únicas, {summary['references']} referencias")
+
+if __name__ == "__main__":
+    print("🧪 Test de Índice de Assets")
+    print("=" * 60)
+    test_index_shared_between_processes()
+    print("\n🎉 ¡Todos los tests del índice de assets pasaron!")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el generador sintético y el harness de benchmarks
+"""
+
+import json
+import tempfile
+from dataclasses import replace
+
+from analyzer_main import CLO3DAnalyzer
+from benchmarks import PROFILES, generate_gltf, write_gltf
+from benchmarks.pipeline_benchmark import compare_reports, load_baseline, run_benchmark, save_baseline
+
+def test_generator_is_deterministic():
+    """La misma especificación produce el mismo archivo; otra semilla cambia el contenido"""
+    print("🎲 Probando determinismo del generador...")
+    spec = PROFILES['tiny']
+    assert generate_gltf(spec) == generate_gltf(spec)
+    assert generate_gltf(spec) != generate_gltf(replace(spec, seed=1))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        first = open(write_gltf(spec, tmp_dir, 'a')[:-5] + '.bin', 'rb').read()
+        second = open(write_gltf(spec, tmp_dir, 'b')[:-5] + '.bin', 'rb').read()
+        assert first == second
+        assert len(first) == spec.bin_size_bytes
+
+def test_test01_profile_matches_reference():
+    """El perfil 'test01' reproduce los conteos estructurales de test01.gltf"""
+    with open('test01.gltf', 'r', encoding='utf-8') as f:
+        reference = json.load(f)
+    synthetic = generate_gltf(PROFILES['test01'])
+
+    for key in ['accessors', 'bufferViews', 'materials', 'meshes', 'nodes', 'images']:
+        assert len(synthetic[key]) == len(reference[key]), key
+    metadata = synthetic['extras']['MetaData']
+    assert len(metadata['SeamLinePairList']) == len(reference['extras']['MetaData']['SeamLinePairList'])
+    assert abs(synthetic['buffers'][0]['byteLength'] - reference['buffers'][0]['byteLength']) < 0.05 * reference['buffers'][0]['byteLength']
+
+def test_synthetic_file_is_analyzable():
+    """El archivo sintético pasa por el pipeline completo"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = CLO3DAnalyzer().analyze_file(write_gltf(PROFILES['tiny'], tmp_dir))
+    assert results.file_type.startswith("GLTF")
+    assert results.closures.closure_types
+
+def test_benchmark_and_baseline_comparison():
+    """El harness mide todas las etapas y detecta regresiones contra el baseline"""
+    print("\n⏱️ Probando harness de benchmarks...")
+    report = run_benchmark('tiny', repeat=2)
+    names = [case.name for case in report.cases]
+    assert 'gltf.load_json' in names and 'pipeline.analyze_file' in names
+    assert all(case.min_seconds <= case.median_seconds <= case.max_seconds for case in report.cases)
+
+    with tempfile.TemporaryDirectory() as baseline_dir:
+        save_baseline(report, baseline_dir)
+        baseline = load_baseline('tiny', baseline_dir)
+        assert compare_reports(report, baseline) == []
+
+        slower = replace(report, cases=[replace(case, min_seconds=case.min_seconds + 1.0) for case in report.cases])
+        assert len(compare_reports(slower, baseline)) == len(report.cases)
+
+if __name__ == "__main__":
+    print("🧪 Test de Benchmarks del Pipeline")
+    print("=" * 60)
+    test_generator_is_deterministic()
+    test_test01_profile_matches_reference()
+    test_synthetic_file_is_analyzable()
+    test_benchmark_and_baseline_comparison()
+    print("\n🎉 ¡Todos los tests de benchmarks pasaron!")
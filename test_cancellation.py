@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar la cancelación cooperativa de análisis
+"""
+
+import time
+
+from analyzer_main import CLO3DAnalyzer
+from cancellation import AnalysisCancelled, CancellationToken
+
+def test_cancel_and_timeout_abort_analysis():
+    """Un token cancelado o un plazo vencido interrumpen el análisis entre etapas"""
+    print("🛑 Probando cancelación y plazo máximo...")
+    token = CancellationToken()
+    analyzer = CLO3DAnalyzer(tier='deep', use_stage_cache=False)
+
+    def cancel_after_asset(progress):
+        if progress.section == 'asset':
+            token.cancel('prueba')
+
+    try:
+        analyzer.analyze_file('test01.gltf', on_progress=cancel_after_asset, cancel_token=token)
+        raise AssertionError("Se esperaba AnalysisCancelled")
+    except AnalysisCancelled as e:
+        assert e.reason == 'prueba'
+
+    try:
+        CLO3DAnalyzer(tier='deep', use_stage_cache=False, timeout=0.0).analyze_file('test01.gltf')
+        raise AssertionError("Se esperaba AnalysisCancelled")
+    except AnalysisCancelled as e:
+        assert e.reason == 'plazo máximo superado'
+
+    # Sin cancelación el análisis termina normalmente
+    results = CLO3DAnalyzer(tier='deep', timeout=60.0).analyze_file('test01.gltf')
+    assert results.technical_details['analysis_tier'] == 'deep'
+    print("   ✅ Cancelación, plazo y análisis normal")
+
+def test_abandoned_generator_cancels_worker():
+    """Cerrar el generador de parciales cancela el análisis del worker"""
+    print("\n🚪 Probando abandono del consumidor...")
+    token = CancellationToken()
+    events = CLO3DAnalyzer(tier='deep', use_stage_cache=False).iter_analysis('test01.gltf', cancel_token=token)
+    first = next(events)
+    assert first.section == 'asset'
+
+    started = time.perf_counter()
+    events.close()
+    assert token.cancelled and token.reason == 'el consumidor abandonó el análisis'
+    assert time.perf_counter() - started < 0.1
+    print("   ✅ Worker cancelado al cerrar el generador")
+
+if __name__ == "__main__":
+    print("🧪 Test de Cancelación de Análisis")
+    print("=" * 60)
+    test_cancel_and_timeout_abort_analysis()
+    test_abandoned_generator_cancels_worker()
+    print("\n🎉 ¡Todos los tests de cancelación pasaron!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar la detección de herrajes de cierre por material y geometría
+"""
+
+import json
+
+from analyzer_gltf_improved import ImprovedGLTFAnalyzer
+from closure_hardware import detect_closure_hardware, name_role
+from scene_graph import SceneIndex
+
+def _cloth_with_hardware():
+    """Cloth_mesh de CLO con nombres genéricos: panel, 5 botones, 2 broches y las dos cadenas de una cremallera"""
+    parts = [
+        ((0.5, 0.7, 0.02), 0, 6000),      # panel de tela
+        *[((0.015, 0.015, 0.003), 1, 120)] * 5,
+        *[((0.01, 0.01, 0.006), 1, 80)] * 2,
+        *[((0.008, 0.3, 0.003), 1, 400)] * 2
+    ]
+    accessors, primitives = [], []
+    for extent, material, count in parts:
+        primitives.append({'attributes': {'POSITION': len(accessors)}, 'material': material})
+        accessors.append({'componentType': 5126, 'count': count, 'type': 'VEC3',
+                          'min': [0.0, 0.0, 0.0], 'max': list(extent)})
+    return {
+        'asset': {'version': '2.0'},
+        'accessors': accessors,
+        'materials': [
+            {'name': 'FABRIC 1_3463', 'pbrMetallicRoughness': {'metallicFactor': 0.0, 'roughnessFactor': 0.8}},
+            {'name': '190808_147567', 'pbrMetallicRoughness': {'metallicFactor': 0.9, 'roughnessFactor': 0.2}}
+        ],
+        'meshes': [{'name': 'Cloth_mesh', 'primitives': primitives}],
+        'nodes': [{'name': 'Cloth', 'mesh': 0}],
+        'scenes': [{'nodes': [0]}]
+    }
+
+def test_hardware_from_geometry():
+    """Sin nombres indicativos: discos planos → botones, piezas gruesas → broches, tiras → cremallera"""
+    print("🔘 Probando herrajes por geometría...")
+    gltf_data = _cloth_with_hardware()
+    result = detect_closure_hardware(gltf_data, SceneIndex.from_gltf(gltf_data))
+
+    assert result['counts'] == {'zipper': 1, 'button': 5, 'snap': 2}
+    assert result['parts'] == 10 and result['hardware_parts'] == 9
+    buttons = next(closure for closure in result['closures'] if closure['type'] == 'button')
+    assert buttons['evidence'] == ['metallic'] and buttons['repeated'] and buttons['size_mm'] == 15.0
+    assert name_role('Zipper 1_Slider_151247') == name_role('Cursor') != name_role('Zipper 1_Puller_151266')
+    print(f"   ✅ {result['counts']}")
+
+def test_named_zipper_is_counted_once():
+    """Las piezas Zipper_1_* de test01 son una sola cremallera (antes, una característica por mesh)"""
+    print("\n🤐 Probando cremallera de test01...")
+    with open('test01.gltf', 'r', encoding='utf-8') as f:
+        gltf_data = json.load(f)
+    analyzer = ImprovedGLTFAnalyzer()
+    features = analyzer._analyze_accessibility_features(
+        gltf_data, analyzer._analyze_garment_elements_contextual(gltf_data)
+    )
+
+    assert len(features) == 1
+    zipper = features[0]
+    assert zipper['type'] == 'closure_hardware' and zipper['element'] == 'zipper' and zipper['count'] == 1
+    assert zipper['evidence'] == ['name', 'metallic'] and zipper['validated']
+    print(f"   ✅ 1 cremallera ({zipper['mesh_name']})")
+
+if __name__ == "__main__":
+    print("🧪 Test de Herrajes de Cierre")
+    print("=" * 60)
+    test_hardware_from_geometry()
+    test_named_zipper_is_counted_once()
+    print("\n🎉 ¡Todos los tests de herrajes de cierre pasaron!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar las tablas compactas de resultados (vistas de diccionario y pickle)
+"""
+
+import json
+import pickle
+from collections.abc import Mapping
+
+from analyzer_gltf_improved import ImprovedGLTFAnalyzer
+from compact_results import MaterialTable, SizeVariationTable
+
+def test_views_match_dict_results():
+    """Los consumidores leen las filas como antes; pickle es más pequeño que las listas de diccionarios"""
+    print("🗜️ Probando tablas compactas con test01...")
+    with open('test01.gltf', 'r', encoding='utf-8') as f:
+        gltf_data = json.load(f)
+    analyzer = ImprovedGLTFAnalyzer()
+    elements = analyzer._analyze_garment_elements_contextual(gltf_data)
+    materials = analyzer._analyze_fabric_properties_advanced(gltf_data)['materials']
+
+    cloth = next(element for element in elements if element['mesh_name'] == 'Cloth_mesh')
+    assert isinstance(cloth, Mapping) and cloth.get('validation_context') == {}
+    closures = next(category for category in cloth['detected_elements'] if category['category'] == 'closures')
+    assert closures['elements'][0]['element'] == 'zipper' and closures['elements'][0]['primitives'] == 4
+    assert cloth['primitives']['count'] == 96 and 'mesh_name' in cloth and 'missing' not in cloth
+    try:
+        cloth['mesh_name'] = 'otro'
+        raise AssertionError("las vistas deben ser de solo lectura")
+    except TypeError:
+        pass
+
+    for table, plain in ((elements, elements.to_list()), (materials, materials.to_dict())):
+        restored = pickle.loads(pickle.dumps(table))
+        assert restored == table == plain
+        assert len(pickle.dumps(table)) < len(pickle.dumps(plain))
+    name = next(iter(materials))
+    assert materials[name]['properties'] == plain[name]['properties'] and name in str(materials[name])
+    print(f"   ✅ {len(elements)} elementos y {len(materials)} materiales sin diferencias tras pickle")
+
+def test_tables_share_repeated_values():
+    """Materiales con la misma firma comparten análisis; los nombres repetidos se reemplazan"""
+    print("\n♻️ Probando valores compartidos...")
+    analysis = {'name': 'Jersey_1', 'index': 0, 'properties': {'fabric_type': 'knit'}, 'confidence': 0.8,
+                'validation_sources': ['PBR_analysis']}
+    materials = MaterialTable()
+    materials.add('Jersey_1', 0, analysis, signature=('jersey',))
+    materials.add('Jersey_2', 1, analysis, signature=('jersey',))
+    materials.add('Jersey_1', 2, analysis, signature=('jersey',))
+
+    assert list(materials) == ['Jersey_1', 'Jersey_2'] and len(materials.confidence) == 1
+    first, second = materials['Jersey_1'], materials['Jersey_2']
+    assert (first['index'], second['index']) == (2, 1) and second['name'] == 'Jersey_2'
+    assert first['properties'] == second['properties'] and first['properties'] is not second['properties']
+
+    sizes = SizeVariationTable.from_records([{
+        'node_name': 'Jacket M', 'node_index': 3, 'confidence': 1.0,
+        'size_indicators': [{'type': 'explicit_sizes', 'value': 'm', 'confidence': 0.8}],
+        'geometric_validation': {'has_scale': True, 'meshes': [0, 4]}
+    }])
+    restored = pickle.loads(pickle.dumps(sizes))[0]
+    assert restored['geometric_validation'] == {'has_scale': True, 'meshes': [0, 4]}
+    assert restored['size_indicators'][0]['value'] == 'm' and sizes[-1] == restored
+    print("   ✅ 3 materiales, 1 análisis")
+
+if __name__ == "__main__":
+    print("🧪 Test de Resultados Compactos")
+    print("=" * 60)
+    test_views_match_dict_results()
+    test_tables_share_repeated_values()
+    print("\n🎉 ¡Todos los tests de resultados compactos pasaron!")
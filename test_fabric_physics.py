@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el análisis de propiedades físicas de telas (PhysicalPropertyList)
+"""
+
+import json
+
+from analyzer_gltf_improved import ImprovedGLTFAnalyzer, _classify_fabric_cached
+from analyzer_main import CLO3DAnalyzer
+from fabric_physics import FabricPhysicsTable, join_materials
+
+def test_physics_table_classifies_catalogue():
+    """Todas las telas se clasifican en un solo paso, con NaN para datos ausentes"""
+    print("🧪 Probando tabla de propiedades físicas...")
+    table = FabricPhysicsTable.from_records([
+        {'PhysicalPropertyName': 'Elastane_Rib', 'Stretch-Warp': 8000.0, 'Stretch-Weft': 12000.0,
+         'Bending-Warp': 200.0, 'Bending-Weft': 150.0, 'Density': 0.00012},
+        {'PhysicalPropertyName': 'Denim_Twill', 'Stretch-Warp': 150000.0, 'Stretch-Weft': 120000.0,
+         'Bending-Warp': 9000.0, 'Bending-Weft': 7000.0, 'Density': 0.0004},
+        {'PhysicalPropertyName': 'Sin_Datos'}
+    ])
+    classes = table.classify()
+    assert list(classes['stretch_class']) == ['alta', 'baja', 'desconocida']
+    assert list(classes['drape_class']) == ['fluida', 'rígida', 'desconocida']
+    assert list(classes['weight_class']) == ['ligera', 'pesada', 'desconocida']
+
+    record = table.record(0)
+    assert record['has_stretch'] and record['weight_gsm'] == 120.0
+    assert table.record(2)['weight_gsm'] is None
+    print("   ✅ Elasticidad, caída y peso")
+
+def test_materials_joined_through_mesh_list():
+    """Los materiales de test01 reciben las propiedades del patrón que los usa"""
+    print("\n🔗 Probando unión materiales ↔ propiedades físicas...")
+    with open('test01.gltf', 'r', encoding='utf-8') as f:
+        gltf_data = json.load(f)
+    table = FabricPhysicsTable.from_gltf(gltf_data)
+    assert table.names == ['Trim_Hardware_0', 'Default_0']
+
+    rows, by_pattern = join_materials(table, gltf_data, ['FABRIC 1_3463', 'Zipper 1_Teeth_151309', 'Default_0', 'otro'])
+    assert rows.tolist() == [0, 1, 1, -1]
+    assert by_pattern['FABRIC 1_3463'] == 'Trim_Hardware_0'
+
+    results = CLO3DAnalyzer(tier='standard', use_stage_cache=False).analyze_file('test01.gltf')
+    assert results.fabrics.elasticity.startswith('Elasticidad baja')
+    assert '300 g/m²' in results.fabrics.weight_info
+    assert not results.fabrics.stretch_properties
+    print(f"   ✅ {len(by_pattern)} materiales con propiedades físicas")
+
+def test_repeated_materials_classified_once():
+    """Los materiales con la misma firma se analizan una vez y conservan nombre e índice"""
+    print("\n♻️ Probando deduplicación de materiales...")
+    pbr = {'roughnessFactor': 0.9, 'metallicFactor': 0.0}
+    gltf_data = {'materials': [
+        {'name': 'Cotton Twill_3463', 'pbrMetallicRoughness': dict(pbr)},
+        {'name': 'Cotton Twill_3464', 'pbrMetallicRoughness': dict(pbr)},
+        {'name': 'Cotton Twill_3465', 'pbrMetallicRoughness': {'roughnessFactor': 0.2, 'metallicFactor': 0.0}}
+    ]}
+    analyzer = ImprovedGLTFAnalyzer()
+    analysis = analyzer._analyze_fabric_properties_advanced(gltf_data)
+    assert analysis['unique_materials'] == 2
+    first, second = analysis['materials']['Cotton Twill_3463'], analysis['materials']['Cotton Twill_3464']
+    assert (first['index'], second['index']) == (0, 1)
+    assert first['properties']['fabric_type'] == second['properties']['fabric_type'] == 'cotton'
+    assert first['properties'] is not second['properties']
+    assert analysis['validation_methods'] == ['PBR_analysis'] * 3
+
+    # La clasificación memorizada se comparte entre archivos
+    hits = _classify_fabric_cached.cache_info().hits
+    ImprovedGLTFAnalyzer()._analyze_fabric_properties_advanced(gltf_data)
+    assert _classify_fabric_cached.cache_info().hits == hits + 2
+    print("   ✅ 3 materiales, 2 clasificaciones")
+
+if __name__ == "__main__":
+    print("🧪 Test de Propiedades Físicas de Telas")
+    print("=" * 60)
+    test_physics_table_classifies_catalogue()
+    test_materials_joined_through_mesh_list()
+    test_repeated_materials_classified_once()
+    print("\n🎉 ¡Todos los tests de propiedades físicas pasaron!")
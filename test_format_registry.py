@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el registro de formatos, la detección por contenido y la carga diferida
+"""
+
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+from analyzer_main import CLO3DAnalyzer
+from formats import FORMAT_REGISTRY, UnsupportedFormatError
+from formats.sniffing import sniff_bytes
+
+def _glb(json_chunk: bytes) -> bytes:
+    """Archivo GLB con un único chunk JSON"""
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    total = 12 + 8 + len(json_chunk)
+    return b'glTF' + struct.pack('<II', 2, total) + struct.pack('<I', len(json_chunk)) + b'JSON' + json_chunk
+
+def test_handlers_load_lazily():
+    """Importar el analizador no importa los parsers de cada formato"""
+    print("💤 Probando carga diferida de handlers...")
+    code = (
+        "import sys, analyzer_main; "
+        "assert 'formats.gltf' not in sys.modules; "
+        "assert 'analyzer_gltf_improved' not in sys.modules; "
+        "analyzer_main.CLO3DAnalyzer().analyze_file('test01.gltf'); "
+        "assert 'formats.gltf' in sys.modules; "
+        "assert 'formats.basic' not in sys.modules"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=Path(__file__).parent)
+    print("   ✅ Handler GLTF importado solo al analizar")
+
+def test_dispatch_by_content():
+    """El formato se decide por contenido; la extensión solo desempata"""
+    print("\n🧭 Probando resolución de formatos...")
+    assert FORMAT_REGISTRY.resolve('test01.gltf').name == 'gltf'
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # glTF subido con extensión equivocada
+        mislabeled = Path(tmp_dir) / 'modelo.obj'
+        shutil.copy('test01.gltf', mislabeled)
+        results = CLO3DAnalyzer().analyze_file(str(mislabeled))
+        assert results.file_type.startswith('GLTF 3D Model (v')
+
+        # GLB mínimo con chunk JSON
+        glb_file = Path(tmp_dir) / 'modelo.glb'
+        glb_file.write_bytes(_glb(b'{"asset":{"version":"2.0"},"meshes":[]}'))
+        assert FORMAT_REGISTRY.resolve(str(glb_file)).name == 'glb'
+        assert CLO3DAnalyzer().analyze_file(str(glb_file)).file_type == 'GLTF 3D Model (v2.0)'
+
+        # ZIP: .zprj y .zpac comparten contenido, decide la extensión
+        package = Path(tmp_dir) / 'prenda.zpac'
+        with zipfile.ZipFile(package, 'w') as archive:
+            archive.writestr('prenda.xml', '<garment/>')
+        assert FORMAT_REGISTRY.resolve(str(package)).name == 'zpac'
+
+        obj_file = Path(tmp_dir) / 'prenda.obj'
+        obj_file.write_text('# prenda\no prenda\nv 0 0 0\n')
+        results = CLO3DAnalyzer().analyze_file(str(obj_file))
+        assert results.file_type == 'Wavefront OBJ'
+        assert 'analysis_timestamp' in results.technical_details
+    print("   ✅ glTF mal etiquetado, GLB, ZIP y OBJ")
+
+def test_rejects_unsupported_and_corrupt_files():
+    """Contenido no soportado o corrupto se rechaza antes del hash"""
+    print("\n🛑 Probando rechazo temprano...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cases = {
+            'vacio.gltf': b'',
+            'binario.gltf': b'\x89PNG\r\n\x1a\n\x00\x00',
+            'notas.obj': b'hola mundo\n',
+            'lista.gltf': b'[1, 2, 3]',
+            'truncado.glb': _glb(b'{"asset":{}}')[:-4],
+            'truncado.zprj': b'PK\x03\x04' + b'\x00' * 100
+        }
+        for name, content in cases.items():
+            path = Path(tmp_dir) / name
+            path.write_bytes(content)
+            analyzer = CLO3DAnalyzer()
+            try:
+                analyzer.analyze_file(str(path))
+                raise AssertionError(f"Se esperaba rechazo para {name}")
+            except UnsupportedFormatError:
+                pass
+            assert analyzer.file_hash is None, name
+            assert [stage.name for stage in analyzer.timer.stages] == ['sniff'], name
+
+        assert sniff_bytes(b'o prenda\nv 0 0 0\n') == 'obj-text'
+    print("   ✅ Vacío, binario, texto, JSON no glTF, GLB y ZIP truncados")
+
+if __name__ == "__main__":
+    print("🧪 Test de Registro de Formatos")
+    print("=" * 60)
+    test_handlers_load_lazily()
+    test_dispatch_by_content()
+    test_rejects_unsupported_and_corrupt_files()
+    print("\n🎉 ¡Todos los tests de formatos pasaron!")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el desglose de tiempos por etapa del análisis
+"""
+
+import time
+
+from analyzer_main import CLO3DAnalyzer
+from instrumentation import StageTimer
+
+def test_stage_breakdown_in_technical_details():
+    """analyze_file publica el desglose por etapa en technical_details"""
+    print("⏱️ Probando desglose por etapa...")
+    results = CLO3DAnalyzer(profile=False, trace_memory=False).analyze_file('test01.gltf')
+    breakdown = results.technical_details['stage_breakdown']
+    names = [stage['name'] for stage in breakdown['stages']]
+
+    for expected in ['hash', 'analysis', 'gltf.parse', 'gltf.fabric_properties', 'gltf.false_positives', 'convert']:
+        assert expected in names, expected
+    assert breakdown['total_seconds'] == round(results.processing_time, 6)
+    top_level = sum(stage['seconds'] for stage in breakdown['stages'] if stage['depth'] == 0)
+    assert top_level <= results.processing_time
+    assert 'profile' not in breakdown
+    print(f"  {len(names)} etapas, total {breakdown['total_seconds'] * 1000:.1f}ms")
+
+def test_optional_profiling_capture():
+    """Con los flags activos se capturan cProfile y picos de memoria"""
+    print("\n🔬 Probando captura de cProfile y tracemalloc...")
+    results = CLO3DAnalyzer(profile=True, trace_memory=True).analyze_file('test01.gltf')
+    breakdown = results.technical_details['stage_breakdown']
+
+    assert breakdown['profile']
+    assert all('peak_memory_kb' in stage for stage in breakdown['stages'])
+    parse = next(stage for stage in breakdown['stages'] if stage['name'] == 'gltf.parse')
+    analysis = next(stage for stage in breakdown['stages'] if stage['name'] == 'analysis')
+    # El pico de la etapa padre incluye el de sus hijas
+    assert analysis['peak_memory_kb'] >= parse['peak_memory_kb'] > 0
+
+def test_nested_stages():
+    """Las etapas anidadas registran su profundidad"""
+    timer = StageTimer()
+    with timer.stage('outer'):
+        with timer.stage('inner'):
+            time.sleep(0.01)
+    outer, inner = timer.stages
+    assert (outer.depth, inner.depth) == (0, 1)
+    assert outer.seconds >= inner.seconds >= 0.01
+    assert timer.total_seconds == outer.seconds
+
+if __name__ == "__main__":
+    print("🧪 Test de Instrumentación por Etapas")
+    print("=" * 60)
+    test_stage_breakdown_in_technical_details()
+    test_optional_profiling_capture()
+    test_nested_stages()
+    print("\n🎉 ¡Todos los tests de instrumentación pasaron!")
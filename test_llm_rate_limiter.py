@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el limitador de concurrencia y tasa de LLM
+Usa un proveedor simulado local (httpx.MockTransport) que aplica sus propios límites
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from config.llm_config import LLMConfig, LLMProvider
+from chatbot.llm_client import LLMClient
+from chatbot.rate_limiter import ProviderRateLimiter, parse_retry_after
+
+class MockProvider:
+    """Proveedor simulado que responde 429 si se supera su límite de concurrencia"""
+
+    def __init__(self, max_concurrent: int, latency: float = 0.05):
+        self.max_concurrent = max_concurrent
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self.rejected = 0
+        self.served = 0
+        self._lock = threading.Lock()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            over_limit = self.in_flight > self.max_concurrent
+        try:
+            if over_limit:
+                with self._lock:
+                    self.rejected += 1
+                return httpx.Response(429, headers={"Retry-After": "0.05"}, json={"error": "rate limited"})
+            await asyncio.sleep(self.latency)
+            with self._lock:
+                self.served += 1
+            return httpx.Response(200, json={"choices": [{"message": {"content": "OK"}}]})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+def _make_client(provider: MockProvider, limiter: ProviderRateLimiter) -> LLMClient:
+    config = LLMConfig(
+        provider=LLMProvider.GROQ,
+        api_key="test-key",
+        base_url="http://mock-provider.local/v1",
+        model="mock-model",
+        max_retries=5
+    )
+    return LLMClient(
+        LLMProvider.GROQ,
+        config=config,
+        rate_limiter=limiter,
+        transport=httpx.MockTransport(provider.handler)
+    )
+
+def test_concurrency_limit_respected():
+    """El limitador nunca supera el límite de concurrencia del proveedor"""
+    print("🔧 Probando límite de concurrencia...")
+    provider = MockProvider(max_concurrent=2)
+    limiter = ProviderRateLimiter("mock", max_concurrent=2, requests_per_minute=6000)
+    client = _make_client(provider, limiter)
+
+    async def run():
+        messages = [{"role": "user", "content": "Test"}]
+        return await asyncio.gather(*[client.chat_completion(messages) for _ in range(10)])
+
+    responses = asyncio.run(run())
+    stats = limiter.stats()
+
+    print(f"  Pico en proveedor: {provider.peak} | Rechazos: {provider.rejected}")
+    print(f"  Cola máxima: {stats.max_queue_depth} | Espera media: {stats.average_wait_seconds:.3f}s")
+    assert len(responses) == 10
+    assert provider.peak <= 2
+    assert provider.rejected == 0
+    assert stats.total_requests == 10
+    assert stats.max_queue_depth > 0
+    assert stats.in_flight == 0
+
+def test_retry_after_backoff():
+    """Un proveedor más estricto que el limitador provoca reintentos que terminan con éxito"""
+    print("\n🔁 Probando reintentos con Retry-After...")
+    provider = MockProvider(max_concurrent=1)
+    limiter = ProviderRateLimiter("mock", max_concurrent=3, requests_per_minute=6000)
+    client = _make_client(provider, limiter)
+
+    async def run():
+        messages = [{"role": "user", "content": "Test"}]
+        return await asyncio.gather(*[client.chat_completion(messages) for _ in range(4)])
+
+    responses = asyncio.run(run())
+    stats = limiter.stats()
+
+    print(f"  Respuestas 429: {stats.throttled_responses} | Reintentos: {stats.retries}")
+    assert all(client.get_response_text(r) == "OK" for r in responses)
+    assert stats.throttled_responses == provider.rejected > 0
+    assert provider.served == 4
+
+def test_limit_shared_across_event_loops():
+    """Sesiones en hilos distintos (un loop cada una) comparten el mismo límite"""
+    print("\n🧵 Probando límite compartido entre event loops...")
+    provider = MockProvider(max_concurrent=2)
+    limiter = ProviderRateLimiter("mock", max_concurrent=2, requests_per_minute=6000)
+    client = _make_client(provider, limiter)
+    errors = []
+
+    async def run():
+        messages = [{"role": "user", "content": "Test"}]
+        await asyncio.gather(*[client.chat_completion(messages) for _ in range(3)])
+
+    def session():
+        try:
+            asyncio.run(asyncio.wait_for(run(), timeout=10))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=session) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"  Pico en proveedor: {provider.peak} | Errores: {len(errors)}")
+    assert not errors
+    assert provider.peak <= 2
+    assert provider.served == 12
+
+def test_token_bucket_rate():
+    """El token bucket espacia las solicitudes según requests_per_minute"""
+    print("\n🪣 Probando token bucket...")
+    provider = MockProvider(max_concurrent=10, latency=0.0)
+    limiter = ProviderRateLimiter("mock", max_concurrent=10, requests_per_minute=600, burst=1)
+    client = _make_client(provider, limiter)
+
+    async def run():
+        messages = [{"role": "user", "content": "Test"}]
+        await asyncio.gather(*[client.chat_completion(messages) for _ in range(5)])
+
+    start = time.monotonic()
+    asyncio.run(run())
+    elapsed = time.monotonic() - start
+
+    # 600 rpm = 10 req/s con ráfaga de 1 -> 5 solicitudes tardan al menos ~0.4s
+    print(f"  Tiempo total: {elapsed:.2f}s")
+    assert elapsed >= 0.35
+
+def test_parse_retry_after():
+    """Retry-After acepta segundos y fechas HTTP"""
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("0.5") == 0.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("no-es-fecha") is None
+
+if __name__ == "__main__":
+    print("🧪 Test de Rate Limiting LLM - Proveedor simulado")
+    print("=" * 60)
+    test_concurrency_limit_respected()
+    test_retry_after_backoff()
+    test_limit_shared_across_event_loops()
+    test_token_bucket_rate()
+    test_parse_retry_after()
+    print("\n🎉 ¡Todos los tests de rate limiting pasaron!")
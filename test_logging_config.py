@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el logging estructurado (JSON, contexto y niveles)
+"""
+
+import io
+import json
+import logging
+import subprocess
+import sys
+
+from config.logging_config import SUBSYSTEM_LOGGERS, configure_logging, log_context
+
+class CountingArg:
+    """Argumento que cuenta cuántas veces se formatea"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "valor"
+
+def _restore_root(handler: logging.Handler, previous_level: int):
+    logging.getLogger().removeHandler(handler)
+    logging.getLogger().setLevel(previous_level)
+
+def test_import_does_not_configure_root_logger():
+    """Importar los analizadores no agrega handlers al logger raíz"""
+    print("📥 Probando import sin basicConfig...")
+    code = (
+        "import logging, analyzer_main, analyzer_gltf_improved, analyzer; "
+        "print(len(logging.getLogger().handlers))"
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == '0'
+
+def test_json_records_include_context_fields():
+    """En modo JSON cada análisis emite líneas con file_hash y stage como campos"""
+    print("\n🧾 Probando formato JSON con contexto...")
+    from analyzer_main import CLO3DAnalyzer
+
+    stream = io.StringIO()
+    previous_level = logging.getLogger().level
+    handler = configure_logging(fmt='json', level='DEBUG', stream=stream)
+    try:
+        CLO3DAnalyzer().analyze_file('test01.gltf')
+    finally:
+        _restore_root(handler, previous_level)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records
+    completed = [r for r in records if r['logger'] == 'analyzer_main' and 'completado' in r['msg']]
+    assert completed and len(completed[0]['file_hash']) == 16
+    assert completed[0]['file_name'] == 'test01.gltf'
+    assert any(r.get('stage') == 'gltf.fabric_properties' for r in records)
+
+def test_lazy_formatting_and_subsystem_levels():
+    """Los mensajes filtrados por nivel no se formatean"""
+    print("\n💤 Probando formateo diferido y niveles por subsistema...")
+    stream = io.StringIO()
+    previous_level = logging.getLogger().level
+    handler = configure_logging(fmt='json', level='INFO', levels={'analyzer': 'WARNING'}, stream=stream)
+    try:
+        arg = CountingArg()
+        logging.getLogger('analyzer_gltf_improved').info("Mensaje %s", arg)
+        assert arg.formatted == 0
+        assert stream.getvalue() == ''
+        # El alias llega también a los módulos de análisis vectorizado
+        assert logging.getLogger('size_grading').getEffectiveLevel() == logging.WARNING
+
+        with log_context(session='abc'):
+            logging.getLogger('chatbot.llm_client').info("Mensaje %s", arg)
+        record = json.loads(stream.getvalue())
+        assert record['msg'] == 'Mensaje valor' and record['session'] == 'abc'
+    finally:
+        _restore_root(handler, previous_level)
+        for name in SUBSYSTEM_LOGGERS['analyzer']:
+            logging.getLogger(name).setLevel(logging.NOTSET)
+    assert logging.getLogger('formats').level == logging.NOTSET
+
+if __name__ == "__main__":
+    print("🧪 Test de Logging Estructurado")
+    print("=" * 60)
+    test_import_does_not_configure_root_logger()
+    test_json_records_include_context_fields()
+    test_lazy_formatting_and_subsystem_levels()
+    print("\n🎉 ¡Todos los tests de logging pasaron!")
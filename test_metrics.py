@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el registro de métricas y el endpoint Prometheus
+"""
+
+import asyncio
+import urllib.request
+
+import httpx
+
+import metrics
+from analyzer_main import CLO3DAnalyzer
+from chatbot.llm_client import LLMClient
+from chatbot.rate_limiter import ProviderRateLimiter
+from config.llm_config import LLMConfig, LLMProvider
+
+def _sample(text: str, prefix: str) -> float:
+    """Valor de la primera línea de exposición que empieza con prefix"""
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(' ', 1)[1])
+    return 0.0
+
+def test_text_exposition_format():
+    """Counters, gauges e histogramas se exponen en formato Prometheus"""
+    print("📈 Probando formato de exposición...")
+    registry = metrics.MetricsRegistry()
+    requests = metrics.counter('demo_requests_total', 'Solicitudes', ['route'], registry=registry)
+    latency = metrics.histogram('demo_latency_seconds', 'Latencia', buckets=(0.1, 1.0), registry=registry)
+    in_progress = metrics.gauge('demo_in_progress', 'En curso', registry=registry)
+
+    requests.labels('/a"b').inc()
+    requests.labels(route='/a"b').inc(2)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+    in_progress.set(3)
+
+    text = registry.render()
+    assert '# TYPE demo_requests_total counter' in text
+    assert 'demo_requests_total{route="/a\\"b"} 3' in text
+    assert 'demo_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_latency_seconds_bucket{le="1"} 2' in text
+    assert 'demo_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert 'demo_latency_seconds_count 3' in text
+    assert 'demo_in_progress 3' in text
+    # Registrar de nuevo devuelve la misma métrica (recargas de Streamlit)
+    assert metrics.counter('demo_requests_total', 'Solicitudes', ['route'], registry=registry) is requests
+
+def test_analyzer_and_llm_are_instrumented():
+    """analyze_file, las etapas GLTF y chat_completion alimentan el registro global"""
+    print("\n🔍 Probando instrumentación del analizador y del cliente LLM...")
+    before = metrics.REGISTRY.render()
+    CLO3DAnalyzer().analyze_file('test01.gltf')
+
+    async def handler(request):
+        return httpx.Response(200, json={"choices": [{"message": {"content": "OK"}}]})
+
+    config = LLMConfig(provider=LLMProvider.GROQ, api_key="k", base_url="http://mock.local/v1", model="m")
+    client = LLMClient(LLMProvider.GROQ, config=config,
+                       rate_limiter=ProviderRateLimiter("groq", requests_per_minute=6000),
+                       transport=httpx.MockTransport(handler))
+    asyncio.run(client.chat_completion([{"role": "user", "content": "Hola"}]))
+
+    after = metrics.REGISTRY.render()
+    key = 'moving_analyses_total{file_type="gltf",outcome="success"}'
+    assert _sample(after, key) == _sample(before, key) + 1
+    assert 'moving_stage_duration_seconds_count{stage="gltf.fabric_properties"}' in after
+    assert 'moving_analysis_duration_seconds_bucket{file_type="gltf",le="+Inf"}' in after
+    key = 'moving_llm_requests_total{provider="groq",outcome="success"}'
+    assert _sample(after, key) == _sample(before, key) + 1
+
+def test_http_endpoint():
+    """El endpoint /metrics sirve el registro por HTTP"""
+    print("\n🌐 Probando endpoint HTTP...")
+    registry = metrics.MetricsRegistry()
+    metrics.counter('demo_hits_total', 'Hits', registry=registry).inc()
+    server = metrics.start_metrics_server(0, registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode('utf-8')
+            assert response.headers['Content-Type'].startswith('text/plain')
+        assert 'demo_hits_total 1' in body
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    print("🧪 Test de Métricas Prometheus")
+    print("=" * 60)
+    test_text_exposition_format()
+    test_analyzer_and_llm_are_instrumented()
+    test_http_endpoint()
+    print("\n🎉 ¡Todos los tests de métricas pasaron!")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el análisis por primitiva (material, accessors y clase geométrica)
+"""
+
+from analyzer_gltf_improved import ImprovedGLTFAnalyzer
+from primitive_analysis import PrimitiveTable
+from scene_graph import SceneIndex
+
+def _cloth_gltf():
+    """Cloth_mesh con patrones nombrados en MeshList y un avatar"""
+    extents = [(0.5, 0.7, 0.1), (0.2, 0.6, 0.15), (0.2, 0.6, 0.15), (0.02, 0.4, 0.01), (0.015, 0.015, 0.003),
+               (0.08, 0.06, 0.01)]
+    accessors = [{'componentType': 5126, 'count': 300, 'type': 'VEC3', 'min': [0.0, 0.0, 0.0], 'max': list(extent)}
+                 for extent in extents]
+    accessors.append({'componentType': 5125, 'count': 900, 'type': 'SCALAR'})
+    return {
+        'asset': {'version': '2.0'},
+        'accessors': accessors,
+        'materials': [{'name': 'FABRIC 1_3463'}, {'name': 'Zipper 1_Teeth_151309'}, {'name': 'Button_Horn'}],
+        'meshes': [
+            {'name': 'Cloth_mesh', 'primitives': [
+                {'attributes': {'POSITION': 0}, 'indices': 6, 'material': 0},
+                {'attributes': {'POSITION': 1}, 'material': 0},
+                {'attributes': {'POSITION': 2}, 'material': 0},
+                {'attributes': {'POSITION': 3}, 'material': 1},
+                {'attributes': {'POSITION': 4}, 'material': 2},
+                {'attributes': {'POSITION': 5}, 'material': 0, 'mode': 1}
+            ]},
+            {'name': 'Obj_Avatar_Shape', 'primitives': [{'attributes': {'POSITION': 0}}]}
+        ],
+        'nodes': [{'name': 'Cloth', 'mesh': 0}, {'name': 'Avatar', 'mesh': 1}],
+        'extras': {'MetaData': {'MeshList': [
+            {'MeshIndex': 0, 'MeshName': 'Front'},
+            {'MeshIndex': 1, 'MeshName': 'Sleeve_L'},
+            {'MeshIndex': 2, 'MeshName': 'Sleeve_R'},
+            {'MeshIndex': 5, 'MeshName': 'Pocket flap'}
+        ]}}
+    }
+
+def test_primitive_table():
+    """Una fila por primitiva: patrón, triángulos y clase geométrica"""
+    print("🧱 Probando tabla de primitivas...")
+    gltf_data = _cloth_gltf()
+    table = PrimitiveTable.from_gltf(gltf_data, SceneIndex.from_gltf(gltf_data))
+
+    assert len(table) == 7
+    assert table.pattern.tolist() == ['Front', 'Sleeve_L', 'Sleeve_R', '', '', 'Pocket flap', '']
+    assert table.triangles.tolist() == [300, 100, 100, 100, 100, 0, 100]
+    summary = table.mesh_summary(0)
+    assert summary['classes'] == {'panel': 3, 'strip': 1, 'detail': 1, 'small_part': 1}
+    assert summary['unique_materials'] == 3 and summary['columns']['geometric_class'][4] == 'small_part'
+    assert table.class_counts(table.mesh_rows(1)) == {'avatar': 1}
+    print(f"   ✅ {summary['count']} primitivas: {summary['classes']}")
+
+def test_elements_from_primitive_names():
+    """Los nombres de patrón y de material revelan elementos dentro de Cloth_mesh"""
+    print("\n👕 Probando elementos por primitiva...")
+    elements = ImprovedGLTFAnalyzer()._analyze_garment_elements_contextual(_cloth_gltf())
+
+    assert [element['mesh_name'] for element in elements] == ['Cloth_mesh']
+    detected = {
+        category['category']: {element['element']: element['primitives'] for element in category['elements']}
+        for category in elements[0]['detected_elements']
+    }
+    assert detected == {'closures': {'zipper': 1, 'button': 1}, 'body_parts': {'sleeve': 2, 'front': 1}}
+    print(f"   ✅ {detected}")
+
+if __name__ == "__main__":
+    print("🧪 Test de Análisis por Primitiva")
+    print("=" * 60)
+    test_primitive_table()
+    test_elements_from_primitive_names()
+    print("\n🎉 ¡Todos los tests de análisis por primitiva pasaron!")
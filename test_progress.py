@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar los resultados parciales del análisis
+"""
+
+from analyzer_main import CLO3DAnalyzer
+
+def test_progress_callback_emits_sections_in_order():
+    """Cada sección se emite al terminar, con puntuaciones provisionales"""
+    print("📡 Probando callback de progreso...")
+    events = []
+    results = CLO3DAnalyzer(tier='deep').analyze_file('test01.gltf', on_progress=events.append)
+
+    sections = [event.section for event in events]
+    assert sections == ['asset', 'garment_elements', 'materials', 'sizes', 'accessibility', 'deep', 'screening']
+    assert events[0].data['structure']['materials'] == 174
+    assert all('scores' in event.data for event in events)
+    assert [event.fraction for event in events] == sorted(event.fraction for event in events)
+
+    final = events[-1]
+    assert final.final and final.results is results
+    assert final.data['scores']['inclusivity_score'] == results.inclusivity_score
+    assert not any(event.final for event in events[:-1])
+    print(f"   ✅ {len(events)} secciones emitidas")
+
+def test_iter_analysis_generator():
+    """El generador entrega los parciales y termina con los resultados completos"""
+    print("\n🔁 Probando generador de resultados parciales...")
+    events = list(CLO3DAnalyzer(tier='quick').iter_analysis('test01.gltf'))
+    assert [event.section for event in events] == ['asset', 'screening']
+    assert events[-1].results.technical_details['analysis_tier'] == 'quick'
+
+    try:
+        list(CLO3DAnalyzer().iter_analysis('no_existe.gltf'))
+        raise AssertionError("Se esperaba FileNotFoundError")
+    except FileNotFoundError:
+        pass
+    print("   ✅ Parciales y errores propagados")
+
+if __name__ == "__main__":
+    print("🧪 Test de Resultados Parciales")
+    print("=" * 60)
+    test_progress_callback_emits_sections_in_order()
+    test_iter_analysis_generator()
+    print("\n🎉 ¡Todos los tests de progreso pasaron!")
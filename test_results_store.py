@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el almacén columnar de resultados
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+
+from analyzer_main import CLO3DAnalyzer
+import results_store
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("⚠️ pyarrow no instalado - omitido")
+        return False
+    return True
+
+def test_append_and_query():
+    """Agregar análisis y consultar agregados sin leer el JSON completo"""
+    print("🗄️ Probando almacén de resultados...")
+    if not _has_pyarrow():
+        return
+
+    results = CLO3DAnalyzer().analyze_file('test01.gltf')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        warehouse = results_store.ResultsWarehouse(tmp_dir)
+        assert warehouse.summary()['total_analyses'] == 0
+
+        day = datetime(2025, 1, 30, 12, 0)
+        warehouse.append(results, file_name='a.gltf', analyzed_at=day)
+        warehouse.append(results, file_name='b.gltf', analyzed_at=day + timedelta(days=1))
+        results.closures.closure_types = ['velcro']
+        warehouse.append(results, file_name='c.gltf', analyzed_at=day + timedelta(days=1))
+
+        summary = warehouse.summary()
+        print(f"  Resumen: {summary}")
+        assert summary['total_analyses'] == 3
+        assert summary['gltf_analyses'] == 3
+        assert warehouse.partitions() == ['2025-01-30', '2025-01-31']
+
+        by_generator = warehouse.average_score_by('generator')
+        assert sum(row['analyses'] for row in by_generator) == 3
+
+        velcro = warehouse.find_by_closure('Velcro')
+        assert [row['file_name'] for row in velcro] == ['c.gltf']
+
+        distribution = warehouse.confidence_distribution()
+        assert sum(row['analyses'] for row in distribution) == 3
+        assert {row['day'] for row in distribution} == {'2025-01-30', '2025-01-31'}
+
+        assert len(warehouse.load_results()) == 3
+
+def test_compaction_keeps_rows():
+    """La compactación fusiona archivos por partición sin perder filas"""
+    print("\n🧹 Probando compactación...")
+    if not _has_pyarrow():
+        return
+
+    results = CLO3DAnalyzer().analyze_file('test01.gltf')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        warehouse = results_store.ResultsWarehouse(tmp_dir)
+        for _ in range(5):
+            warehouse.append(results, analyzed_at=datetime(2025, 2, 1))
+
+        assert warehouse.compact() == 5
+        partition_dir = f"{tmp_dir}/analysis_date=2025-02-01"
+        assert len(warehouse._partition_files(partition_dir)) == 1
+        assert warehouse.summary()['total_analyses'] == 5
+
+if __name__ == "__main__":
+    print("🧪 Test de Almacén de Resultados")
+    print("=" * 60)
+    test_append_and_query()
+    test_compaction_keeps_rows()
+    print("\n🎉 ¡Todos los tests del almacén pasaron!")
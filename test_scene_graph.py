@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el índice de escena (jerarquía, transformaciones de mundo y adyacencias)
+"""
+
+import numpy as np
+
+from analyzer_gltf_improved import ImprovedGLTFAnalyzer
+from scene_graph import SceneIndex
+
+def _graded_gltf():
+    """Dos tallas: M hereda la escala 2 del grupo, L declara escala propia 1.5"""
+    return {
+        'asset': {'version': '2.0'},
+        'accessors': [{'componentType': 5126, 'count': 8, 'type': 'VEC3',
+                       'min': [-0.5, -0.5, -0.5], 'max': [0.5, 0.5, 0.5]}],
+        'materials': [{'name': 'Denim'}, {'name': 'Metal'}],
+        'meshes': [{'name': 'Jacket', 'primitives': [
+            {'attributes': {'POSITION': 0}, 'material': 0},
+            {'attributes': {'POSITION': 0}, 'material': 1},
+            {'attributes': {'POSITION': 0}, 'material': 0}
+        ]}],
+        'nodes': [
+            {'name': 'Tallas', 'children': [1, 3], 'scale': [2.0, 2.0, 2.0]},
+            {'name': 'Jacket M', 'children': [2]},
+            {'mesh': 0, 'translation': [1.0, 0.0, 0.0]},
+            {'name': 'Jacket L', 'children': [4], 'scale': [1.5, 1.5, 1.5]},
+            {'mesh': 0, 'rotation': [0.0, 0.7071068, 0.0, 0.7071068]}
+        ]
+    }
+
+def test_scene_index():
+    """Subárboles, matrices de mundo compuestas y adyacencias mesh ↔ material ↔ nodo"""
+    print("🌳 Probando índice de escena...")
+    scene = SceneIndex.from_gltf(_graded_gltf())
+    assert scene.parent.tolist() == [-1, 0, 1, 0, 3] and scene.depth.tolist() == [0, 1, 2, 1, 2]
+    assert scene.subtree(1).tolist() == [1, 2] and scene.subtree(0).tolist() == [0, 1, 2, 3, 4]
+    assert np.allclose(scene.world[2, :3, 3], [2.0, 0.0, 0.0])
+    assert np.allclose(scene.world_scale([2, 4]), [[2.0] * 3, [3.0] * 3])
+    assert scene.scaled.tolist() == [True, True, True, True, True]
+
+    assert scene.nodes_of_mesh(0).tolist() == [2, 4]
+    assert scene.materials_of_mesh(0).tolist() == [0, 1]
+    assert scene.meshes_of_material(1).tolist() == [0]
+    assert scene.primitive_materials(0).tolist() == [0, 1, 0]
+    assert np.allclose(scene.world_bounds(scene.subtree(1)), [[1.0, -1.0, -1.0], [3.0, 1.0, 1.0]])
+    print("   ✅ Jerarquía y transformaciones")
+
+def test_size_variations_use_world_scale():
+    """Las tallas comparan tamaño en espacio de mundo, con la escala heredada del grupo"""
+    print("\n📏 Probando tallas con escala heredada...")
+    variations = ImprovedGLTFAnalyzer()._analyze_size_variations_validated(_graded_gltf())
+    by_name = {variation['node_name']: variation['geometric_validation'] for variation in variations}
+    assert set(by_name) == {'Jacket M', 'Jacket L'}
+
+    medium, large = by_name['Jacket M'], by_name['Jacket L']
+    assert medium['inherited_scale'] and medium['scale_factor'] == 2.0
+    assert not large['inherited_scale'] and large['scale_factor'] == 3.0
+    assert medium['meshes'] == large['meshes'] == [0]
+    assert medium['world_extent'] == [2.0, 2.0, 2.0] and large['world_extent'] == [3.0, 3.0, 3.0]
+    print("   ✅ M: 2.0 m / L: 3.0 m")
+
+if __name__ == "__main__":
+    print("🧪 Test de Índice de Escena")
+    print("=" * 60)
+    test_scene_index()
+    test_size_variations_use_world_scale()
+    print("\n🎉 ¡Todos los tests del índice de escena pasaron!")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el grafo de costuras (SeamLinePairList)
+"""
+
+import base64
+
+import numpy as np
+
+from analyzer_main import CLO3DAnalyzer
+from gltf_buffers import GLTFBuffers
+from seam_graph import analyze_seam_graph, parse_seam_pairs
+
+def _seam(first_mesh, first_points, second_mesh, second_points):
+    return {'BKScale': 1.0, 'FoldAngle': 0.0, 'SeamLine': [
+        {'MeshIndex': first_mesh, 'MeshPointIndex': first_points},
+        {'MeshIndex': second_mesh, 'MeshPointIndex': second_points}
+    ]}
+
+def _two_panel_gltf():
+    """Dos paneles: el 0 con puntos cada 1.0 en X y el 1 cada 1.1 en Y"""
+    panel_0 = np.array([[x, 0.0, 0.0] for x in range(4)], dtype=np.float32)
+    panel_1 = np.array([[0.0, y * 1.1, 0.0] for y in range(4)], dtype=np.float32)
+    data = panel_0.tobytes() + panel_1.tobytes()
+    return {
+        'asset': {'version': '2.0'},
+        'buffers': [{'byteLength': len(data),
+                     'uri': 'data:application/octet-stream;base64,' + base64.b64encode(data).decode()}],
+        'bufferViews': [{'buffer': 0, 'byteLength': 48, 'byteOffset': 0},
+                        {'buffer': 0, 'byteLength': 48, 'byteOffset': 48}],
+        'accessors': [{'bufferView': 0, 'componentType': 5126, 'count': 4, 'type': 'VEC3'},
+                      {'bufferView': 1, 'componentType': 5126, 'count': 4, 'type': 'VEC3'}],
+        'meshes': [{'name': 'Cloth_mesh', 'primitives': [
+            {'attributes': {'POSITION': 0}}, {'attributes': {'POSITION': 1}}
+        ]}],
+        'extras': {'MetaData': {'SeamLinePairList': [
+            _seam(0, '0/1/2/3', 1, '3/2/1/0'),
+            _seam(0, '0/1', 0, '2/3'),
+            _seam(1, '0/1/x', 0, '1/2')  # inválido: se descarta
+        ]}}
+    }
+
+def test_parse_and_measure_seams():
+    """Los puntos quedan en un array plano y las longitudes salen de las posiciones"""
+    print("🧵 Probando parseo y longitudes de costuras...")
+    gltf_data = _two_panel_gltf()
+    seams = parse_seam_pairs(gltf_data['extras']['MetaData']['SeamLinePairList'])
+    assert seams.pair_count == 2 and seams.points.dtype == np.uint32
+    assert seams.offsets.tolist() == [0, 4, 8, 10, 12]
+    assert seams.line_points(1).tolist() == [3, 2, 1, 0]
+
+    summary = analyze_seam_graph(gltf_data, GLTFBuffers(gltf_data))
+    assert summary['panels'] == 2 and summary['connections'] == 1 and summary['self_seams'] == 1
+    assert summary['components'] == 1 and summary['panel_degree'] == {'0': 1, '1': 1}
+    assert summary['lengths_available'] and summary['eased_seams'] == 1
+    assert summary['longest_seams'][0] == {'pair': 0, 'panels': [0, 1], 'length_m': 3.3}
+    assert summary['total_length_m'] == round((3.0 + 3.3) / 2 + 1.0, 4)
+    print("   ✅ Grafo y longitudes")
+
+def test_seam_graph_without_binary_buffer():
+    """Sin el .bin se entrega el grafo sin longitudes"""
+    print("\n📦 Probando test01 sin buffer binario...")
+    results = CLO3DAnalyzer(tier='deep', use_stage_cache=False).analyze_file('test01.gltf')
+    seams = results.technical_details['deep_analysis']['seams']
+    assert seams['seam_pairs'] == 199 and seams['panels'] == 38
+    assert seams['components'] == 1 and not seams['lengths_available']
+    assert '199 costuras entre 38 paneles' in results.comfort.sensory_friendly
+    print("   ✅ Grafo de test01")
+
+if __name__ == "__main__":
+    print("🧪 Test de Grafo de Costuras")
+    print("=" * 60)
+    test_parse_and_measure_seams()
+    test_seam_graph_without_binary_buffer()
+    print("\n🎉 ¡Todos los tests de costuras pasaron!")
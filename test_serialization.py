@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar la serialización tipada de AnalysisResults
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Tuple
+
+from analyzer_main import CLO3DAnalyzer, AnalysisResults, HumanValidationItem, SizingMetrics
+import serialization
+
+def _analyze_sample() -> AnalysisResults:
+    results = CLO3DAnalyzer().analyze_file('test01.gltf')
+    # Asegurar al menos un item de checklist y valores anidados heterogéneos
+    results.screening_report.validation_checklist.append(HumanValidationItem(
+        category="materiales",
+        priority="BAJA",
+        finding="Material FABRIC 1_3463 clasificado con confianza 0.50",
+        validation_needed="Verificar propiedades del material",
+        estimated_time_minutes=3,
+        expert_type="materiales"
+    ))
+    results.technical_details['nested'] = {'values': [1, 2.5, None], 'flag': True}
+    return results
+
+def test_json_round_trip():
+    """JSON: la ida y vuelta reconstruye los dataclasses anidados"""
+    print("📄 Probando JSON...")
+    results = _analyze_sample()
+    restored = serialization.loads_json(serialization.dumps_json(results))
+
+    assert restored == results
+    assert isinstance(restored.sizing, SizingMetrics)
+    assert isinstance(restored.screening_report.validation_checklist[-1], HumanValidationItem)
+    print("✅ JSON sin pérdidas")
+
+def test_json_is_not_repr():
+    """El export ya no contiene reprs de Python de los dataclasses"""
+    payload = serialization.dumps_json(_analyze_sample())
+    assert "SizingMetrics(" not in payload
+    assert "ScreeningReport(" not in payload
+
+@dataclass
+class _Hinted:
+    extensions: Tuple[str, ...]
+    extent: Tuple[int, float]
+    by_index: Dict[int, List[str]]
+    flags: FrozenSet[str]
+
+def test_hint_driven_containers():
+    """Tuplas, conjuntos y claves int se recuperan según la anotación de tipo"""
+    print("\n🧷 Probando tuplas y claves no textuales...")
+    original = _Hinted(
+        extensions=('.gltf', '.glb'), extent=(3, 1.5), by_index={0: ['a'], 12: []}, flags=frozenset({'x', 'y'})
+    )
+    payload = json.dumps(serialization._encode(original))
+    restored = serialization._decode(json.loads(payload), _Hinted)
+    assert restored == original
+    assert isinstance(restored.extensions, tuple) and list(restored.by_index) == [0, 12]
+    print("✅ Contenedores anotados sin pérdidas")
+
+def test_msgpack_round_trip():
+    """MessagePack: ida y vuelta sin pérdidas (si msgpack está instalado)"""
+    print("\n📦 Probando MessagePack...")
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        print("⚠️ msgpack no instalado - omitido")
+        return
+    results = _analyze_sample()
+    assert serialization.loads_msgpack(serialization.dumps_msgpack(results)) == results
+    print("✅ MessagePack sin pérdidas")
+
+def test_parquet_batch_round_trip():
+    """Parquet: un lote de resultados se reconstruye completo (si pyarrow está instalado)"""
+    print("\n🏹 Probando Arrow/Parquet...")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("⚠️ pyarrow no instalado - omitido")
+        return
+    batch = [_analyze_sample(), CLO3DAnalyzer().analyze_file('test01.gltf')]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'batch.parquet')
+        serialization.write_parquet(batch, path)
+        restored = serialization.read_parquet(path)
+    assert restored == batch
+    print("✅ Parquet sin pérdidas")
+
+if __name__ == "__main__":
+    print("🧪 Test de Serialización de Resultados")
+    print("=" * 60)
+    test_json_round_trip()
+    test_json_is_not_repr()
+    test_hint_driven_containers()
+    test_msgpack_round_trip()
+    test_parquet_batch_round_trip()
+    print("\n🎉 ¡Todos los tests de serialización pasaron!")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el escalado de tallas por geometría (nombres genéricos)
+"""
+
+import base64
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from gltf_buffers import GLTFBuffers
+from scene_graph import SceneIndex
+from size_grading import analyze_size_grading, grade_files, ladder_labels
+
+def _box_and_button_gltf(scales, buttons=4):
+    """Una prenda (caja 1 × 2 × 0.5) instanciada a varias escalas y botones repetidos"""
+    corners = np.array([[x, y, z] for x in (0.0, 1.0) for y in (0.0, 2.0) for z in (0.0, 0.5)], dtype=np.float32)
+    faces = np.array([
+        [0, 1, 3], [0, 3, 2], [4, 6, 7], [4, 7, 5], [0, 4, 5], [0, 5, 1],
+        [2, 3, 7], [2, 7, 6], [0, 2, 6], [0, 6, 4], [1, 5, 7], [1, 7, 3]
+    ], dtype=np.uint16)
+    button = np.array([[0, 0, 0], [0.01, 0, 0], [0, 0.01, 0], [0, 0, 0.01]], dtype=np.float32)
+    payload = corners.tobytes() + faces.tobytes() + button.tobytes()
+    uri = 'data:application/octet-stream;base64,' + base64.b64encode(payload).decode('ascii')
+
+    nodes = [{'name': f'Object_{i}', 'mesh': 0, 'scale': [scale] * 3} for i, scale in enumerate(scales)]
+    nodes += [{'name': f'Object_{len(scales) + i}', 'mesh': 1, 'translation': [i * 0.05, 0.0, 0.0]}
+              for i in range(buttons)]
+    return {
+        'asset': {'version': '2.0'},
+        'buffers': [{'byteLength': len(payload), 'uri': uri}],
+        'bufferViews': [
+            {'buffer': 0, 'byteOffset': 0, 'byteLength': corners.nbytes},
+            {'buffer': 0, 'byteOffset': corners.nbytes, 'byteLength': faces.nbytes},
+            {'buffer': 0, 'byteOffset': corners.nbytes + faces.nbytes, 'byteLength': button.nbytes}
+        ],
+        'accessors': [
+            {'bufferView': 0, 'componentType': 5126, 'count': 8, 'type': 'VEC3',
+             'min': [0.0, 0.0, 0.0], 'max': [1.0, 2.0, 0.5]},
+            {'bufferView': 1, 'componentType': 5123, 'count': 36, 'type': 'SCALAR'},
+            {'bufferView': 2, 'componentType': 5126, 'count': 4, 'type': 'VEC3',
+             'min': [0.0, 0.0, 0.0], 'max': [0.01, 0.01, 0.01]}
+        ],
+        'meshes': [
+            {'primitives': [{'attributes': {'POSITION': 0}, 'indices': 1}]},
+            {'primitives': [{'attributes': {'POSITION': 2}}]}
+        ],
+        'nodes': nodes,
+        'scenes': [{'nodes': list(range(len(nodes)))}]
+    }
+
+def test_grading_within_file():
+    """Tres escalas de la misma prenda forman S/M/L; los botones repetidos no son tallas"""
+    print("📐 Probando escalado de tallas en un archivo...")
+    gltf_data = _box_and_button_gltf([1.0, 0.95, 1.06])
+    result = analyze_size_grading(gltf_data, SceneIndex.from_gltf(gltf_data), GLTFBuffers(gltf_data, ''))
+
+    assert result['available'] and result['instances'] == 7 and len(result['gradings']) == 1
+    grading = result['gradings'][0]
+    assert grading['ladder'] == ['S', 'M', 'L'] and grading['exact_area']
+    assert [size['node_name'] for size in grading['sizes']] == ['Object_1', 'Object_0', 'Object_2']
+    assert np.allclose(grading['grade_steps'], [1.0 / 0.95, 1.06], atol=1e-3)
+    # Área exacta de la caja a escala 1: 2 (1·2 + 2·0.5 + 0.5·1) = 7
+    assert np.isclose(grading['sizes'][1]['linear_size'], np.sqrt(7.0), atol=1e-3)
+    print(f"   ✅ {grading['ladder']} con pasos {grading['grade_steps']}")
+
+def test_grading_across_files():
+    """Una exportación por talla: el lote se agrupa igual que un solo archivo"""
+    print("\n🗃️ Probando escalado de tallas en un lote de archivos...")
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for scale in (1.1, 0.9, 1.0, 1.2, 0.8):
+            path = os.path.join(directory, f'export_{scale}.gltf')
+            with open(path, 'w') as f:
+                json.dump(_box_and_button_gltf([scale], buttons=1), f)
+            paths.append(path)
+        result = grade_files(paths)
+
+    grading = result['gradings'][0]
+    assert len(result['gradings']) == 1 and grading['files'] == 5
+    assert grading['ladder'] == ['XS', 'S', 'M', 'L', 'XL']
+    assert [os.path.basename(size['source']) for size in grading['sizes']] == [
+        'export_0.8.gltf', 'export_0.9.gltf', 'export_1.0.gltf', 'export_1.1.gltf', 'export_1.2.gltf'
+    ]
+    assert ladder_labels(2) == ['M', 'L'] and len(ladder_labels(9)) == 9
+    print(f"   ✅ {grading['files']} archivos → {grading['ladder']}")
+
+if __name__ == "__main__":
+    print("🧪 Test de Escalado de Tallas")
+    print("=" * 60)
+    test_grading_within_file()
+    test_grading_across_files()
+    print("\n🎉 ¡Todos los tests de escalado de tallas pasaron!")
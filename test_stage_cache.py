@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el re-análisis incremental con caché de etapas
+"""
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from analyzer_main import CLO3DAnalyzer
+from benchmarks.synthetic_gltf import PROFILES, write_gltf
+from stage_cache import StageCache, changed_sections
+
+def _write_gltf(directory, name, gltf_data):
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(gltf_data, f)
+    return path
+
+def test_only_dependent_stages_rerun():
+    """Al renombrar un material solo se re-ejecutan las etapas que usan materiales"""
+    print("🧩 Probando re-análisis incremental...")
+    with open('test01.gltf', 'r', encoding='utf-8') as f:
+        gltf_data = json.load(f)
+
+    cache = StageCache()
+    with tempfile.TemporaryDirectory() as tmp:
+        original_path = _write_gltf(tmp, 'original.gltf', gltf_data)
+        first = CLO3DAnalyzer(tier='deep', stage_cache=cache).analyze_file(original_path)
+        assert first.technical_details['stage_cache']['hits'] == []
+
+        repeated = CLO3DAnalyzer(tier='deep', stage_cache=cache).analyze_file(original_path)
+        assert repeated.technical_details['stage_cache']['misses'] == []
+        assert repeated.inclusivity_score == first.inclusivity_score
+
+        gltf_data['materials'][0]['name'] = 'Material_Renombrado'
+        edited_path = _write_gltf(tmp, 'edited.gltf', gltf_data)
+        edited = CLO3DAnalyzer(tier='deep', stage_cache=cache).analyze_file(edited_path)
+
+    report = edited.technical_details['stage_cache']
+    # Los elementos por primitiva y los herrajes de cierre usan los nombres de material
+    assert sorted(report['misses']) == [
+        'gltf.accessibility_features', 'gltf.fabric_properties', 'gltf.garment_elements', 'gltf.textures'
+    ]
+    assert 'gltf.size_variations' in report['hits'] and 'gltf.seams' in report['hits']
+    assert edited.raw_data_summary['garment_elements'] == first.raw_data_summary['garment_elements']
+    assert changed_sections(
+        first.technical_details['section_fingerprints'],
+        edited.technical_details['section_fingerprints']
+    ) == ['materials']
+    print(f"   ✅ Reutilizadas {len(report['hits'])} etapas, re-ejecutadas {len(report['misses'])}")
+
+def test_binary_buffer_changes_invalidate_stages():
+    """Un .bin re-exportado con el mismo byteLength re-ejecuta las etapas que leen el buffer"""
+    print("\n💾 Probando cambios en el buffer binario...")
+    cache = StageCache()
+    with tempfile.TemporaryDirectory() as tmp:
+        gltf_path = write_gltf(PROFILES['tiny'], tmp)
+        first = CLO3DAnalyzer(tier='deep', stage_cache=cache).analyze_file(gltf_path)
+
+        # Posiciones escaladas ×3 en el mismo archivo y con el mismo tamaño
+        with open(gltf_path, 'r', encoding='utf-8') as f:
+            gltf_data = json.load(f)
+        bin_path = os.path.join(tmp, gltf_data['buffers'][0]['uri'])
+        payload = bytearray(open(bin_path, 'rb').read())
+        for primitive in (p for mesh in gltf_data['meshes'] for p in mesh['primitives']):
+            view = gltf_data['bufferViews'][gltf_data['accessors'][primitive['attributes']['POSITION']]['bufferView']]
+            start = view.get('byteOffset', 0)
+            positions = np.frombuffer(payload, dtype=np.float32, count=view['byteLength'] // 4, offset=start) * 3
+            payload[start:start + positions.nbytes] = positions.tobytes()
+        with open(bin_path, 'wb') as f:
+            f.write(payload)
+        edited = CLO3DAnalyzer(tier='deep', stage_cache=cache).analyze_file(gltf_path)
+
+    report = edited.technical_details['stage_cache']
+    # Las costuras y el área exacta de las tallas leen las posiciones del buffer
+    assert sorted(report['misses']) == ['gltf.seams', 'gltf.size_grading']
+    before = first.technical_details['deep_analysis']['seams']['total_length_m']
+    after = edited.technical_details['deep_analysis']['seams']['total_length_m']
+    assert np.isclose(after, before * 3, rtol=1e-3)
+    sizes = [
+        [size['linear_size'] for size in results.technical_details['deep_analysis']['size_grading']['gradings'][0]['sizes']]
+        for results in (first, edited)
+    ]
+    assert np.allclose(sizes[1], np.array(sizes[0]) * 3, rtol=1e-3)
+    assert changed_sections(
+        first.technical_details['section_fingerprints'],
+        edited.technical_details['section_fingerprints']
+    ) == ['buffers']
+    print(f"   ✅ Costuras {before:.4f} m → {after:.4f} m")
+
+def test_cache_can_be_disabled():
+    """Sin caché no se calculan huellas ni se reporta el uso de caché"""
+    print("\n🚫 Probando análisis sin caché...")
+    results = CLO3DAnalyzer(tier='deep', use_stage_cache=False).analyze_file('test01.gltf')
+    assert 'stage_cache' not in results.technical_details
+    stages = {stage['name'] for stage in results.technical_details['stage_breakdown']['stages']}
+    assert 'gltf.fingerprint' not in stages
+    print("   ✅ Caché desactivada")
+
+if __name__ == "__main__":
+    print("🧪 Test de Caché de Etapas")
+    print("=" * 60)
+    test_only_dependent_stages_rerun()
+    test_binary_buffer_changes_invalidate_stages()
+    test_cache_can_be_disabled()
+    print("\n🎉 ¡Todos los tests de caché de etapas pasaron!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Script de prueba para verificar el análisis de texturas (decodificación reducida y caché por contenido)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+from gltf_buffers import GLTFBuffers
+from texture_analysis import TextureStatsCache, analyze_texture_images
+
+def _write_textures(directory):
+    """Mapa de normales de pana (canales verticales, 2048 px), su copia y un mapa plano"""
+    x = np.linspace(0, 64 * np.pi, 2048)
+    slope = np.sin(x) * 0.6
+    normals = np.zeros((2048, 2048, 3))
+    normals[..., 0] = slope[np.newaxis, :]
+    normals[..., 2] = np.sqrt(1 - slope ** 2)[np.newaxis, :]
+    corduroy = Image.fromarray(((normals + 1) / 2 * 255).astype(np.uint8))
+    corduroy.save(os.path.join(directory, 'Corduroy_NRM.jpg'), quality=95)
+    shutil.copy(os.path.join(directory, 'Corduroy_NRM.jpg'), os.path.join(directory, 'Corduroy_copy_NRM.jpg'))
+    Image.new('RGB', (64, 64), (128, 128, 255)).save(os.path.join(directory, 'Flat_NRM.png'))
+
+    gltf_data = {
+        'asset': {'version': '2.0'},
+        'images': [{'uri': 'Corduroy_NRM.jpg'}, {'uri': 'Corduroy_copy_NRM.jpg'},
+                   {'uri': 'Flat_NRM.png'}, {'uri': 'Missing.jpg'}],
+        'textures': [{'source': 0}, {'source': 1}, {'source': 2}],
+        'materials': [{'name': 'Pana', 'normalTexture': {'index': 0}},
+                      {'name': 'Pana_2', 'normalTexture': {'index': 1}},
+                      {'name': 'Algodon', 'normalTexture': {'index': 2}}]
+    }
+    path = os.path.join(directory, 'textures.gltf')
+    with open(path, 'w') as f:
+        json.dump(gltf_data, f)
+    return gltf_data, path
+
+def test_normal_map_statistics():
+    """La pana se decodifica reducida y se distingue de la tela lisa"""
+    print("🖼️ Probando estadísticas de mapas de normales...")
+    with tempfile.TemporaryDirectory() as directory:
+        gltf_data, path = _write_textures(directory)
+        summary = analyze_texture_images(gltf_data, GLTFBuffers(gltf_data, path), cache=TextureStatsCache())
+
+    corduroy = summary['details']['Corduroy_NRM.jpg']
+    flat = summary['details']['Flat_NRM.png']
+    assert corduroy['original_size'] == [2048, 2048] and max(corduroy['decoded_size']) <= 256
+    assert corduroy['surface_class'] == 'rugosa' and flat['surface_class'] == 'lisa'
+    assert corduroy['directionality'] > 0.8 and corduroy['coarseness'] > flat['coarseness']
+    assert summary['unavailable'] == ['Missing.jpg'] and summary['analyzed'] == 3
+    print(f"   ✅ Pana: {corduroy['bump_deviation_deg']}° / lisa: {flat['bump_deviation_deg']}°")
+
+def test_content_hash_cache():
+    """Las imágenes idénticas se decodifican una vez y un segundo análisis usa la caché"""
+    print("\n♻️ Probando caché por hash de contenido...")
+    cache = TextureStatsCache()
+    with tempfile.TemporaryDirectory() as directory:
+        gltf_data, path = _write_textures(directory)
+        first = analyze_texture_images(gltf_data, GLTFBuffers(gltf_data, path), cache=cache)
+        second = analyze_texture_images(gltf_data, GLTFBuffers(gltf_data, path), cache=cache, max_workers=1)
+
+    assert first['decoded'] == 2 and first['unique_contents'] == 2 and first['cache_hits'] == 0
+    assert second['decoded'] == 0 and second['cache_hits'] == 2
+    assert second['details'] == first['details']
+    print("   ✅ Copia y re-análisis sin decodificar")
+
+if __name__ == "__main__":
+    print("🧪 Test de Análisis de Texturas")
+    print("=" * 60)
+    test_normal_map_statistics()
+    test_content_hash_cache()
+    print("\n🎉 ¡Todos los tests de texturas pasaron!")
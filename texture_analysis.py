@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Moving Accessibility Analyzer - Análisis de Texturas
+Estadísticas de píxeles de las imágenes del GLTF con decodificación reducida
+
+Las imágenes se leen solo si la etapa se ejecuta (nivel deep). Cada imagen se
+identifica por el hash de su contenido: las repetidas dentro del archivo y las
+ya analizadas en otros archivos se resuelven desde la caché sin decodificar.
+
+La decodificación usa Image.draft (los JPEG se decodifican directamente a
+1/2, 1/4 o 1/8 de resolución en el DCT) y thumbnail, de modo que un mapa 4K
+nunca se expande completo en memoria. Las imágenes se procesan en un pool de
+hilos (Pillow y hashlib liberan el GIL).
+
+- Mapas de normales: desviación media respecto a la normal plana (rugosidad),
+  gradiente medio (grosor del relieve) y direccionalidad (p. ej. canalé, pana)
+- Resto de texturas: color medio, luminancia, contraste y gradiente
+"""
+
+import hashlib
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from asset_index import AssetIndex, AssetKey, asset_index_path_from_env
+from cancellation import NEVER_CANCELLED, CancellationToken
+from gltf_buffers import GLTFBuffers
+
+try:
+    from PIL import Image, UnidentifiedImageError
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Cambiar al modificar el cálculo de estadísticas para invalidar la caché
+TEXTURE_ANALYSIS_VERSION = 1
+
+# Lado máximo (px) de la imagen decodificada
+DECODE_MAX_SIZE = 256
+
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+DEFAULT_CACHE_ENTRIES = 1024
+
+# Desviación media (grados) de las normales: límites entre superficie lisa, texturizada y rugosa
+SMOOTH_MAX_DEVIATION = 5.0
+TEXTURED_MAX_DEVIATION = 15.0
+
+LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+NORMAL_NAME_HINTS = ('_nrm', '_normal', '_norm', '_nor.', '_n.')
+
+# Referencias de textura en un material y su rol
+_MATERIAL_TEXTURE_ROLES = (
+    (('pbrMetallicRoughness', 'baseColorTexture'), 'base_color'),
+    (('pbrMetallicRoughness', 'metallicRoughnessTexture'), 'metallic_roughness'),
+    (('normalTexture',), 'normal'),
+    (('occlusionTexture',), 'occlusion'),
+    (('emissiveTexture',), 'emissive')
+)
+
+class TextureStatsCache:
+    """Caché LRU de estadísticas por hash de contenido (compartida entre análisis)
+
+    Con ``index`` (AssetIndex) las estadísticas se persisten: lo que no está
+    en memoria se busca en el índice y lo nuevo se escribe en ambos.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES, index: Optional[AssetIndex] = None):
+        self.max_entries = max_entries
+        self.index = index
+        self._entries: "OrderedDict[AssetKey, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: List[AssetKey]) -> Dict[AssetKey, Dict[str, Any]]:
+        """Estadísticas de las claves conocidas (memoria y después índice persistente)"""
+        found: Dict[AssetKey, Dict[str, Any]] = {}
+        with self._lock:
+            for key in keys:
+                stats = self._entries.get(key)
+                if stats is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = stats
+        missing = [key for key in keys if key not in found]
+        if missing and self.index is not None:
+            stored = self.index.get_many(missing)
+            self._remember(stored.items())
+            found.update(stored)
+        return found
+
+    def put_many(self, entries: List[Tuple[AssetKey, Dict[str, Any], Optional[str]]]):
+        """Guardar (clave, estadísticas, nombre de la imagen)"""
+        self._remember((key, stats) for key, stats, _ in entries)
+        if self.index is not None:
+            self.index.put_many(entries)
+
+    def clear(self):
+        """Vaciar la memoria (el índice persistente se conserva)"""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, items):
+        with self._lock:
+            for key, stats in items:
+                self._entries[key] = stats
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+def default_texture_cache() -> TextureStatsCache:
+    """Caché del proceso, respaldada por el índice de assets salvo MOVING_ASSET_INDEX=0"""
+    path = asset_index_path_from_env()
+    return TextureStatsCache(index=AssetIndex(path) if path else None)
+
+DEFAULT_TEXTURE_CACHE = default_texture_cache()
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def texture_roles(gltf_data: Dict[str, Any]) -> Dict[int, Set[str]]:
+    """Roles con que los materiales usan cada imagen (normal, base_color...)"""
+    textures = gltf_data.get('textures', [])
+    roles: Dict[int, Set[str]] = {}
+    for material in gltf_data.get('materials', []):
+        for path, role in _MATERIAL_TEXTURE_ROLES:
+            ref = material
+            for key in path:
+                ref = ref.get(key) if isinstance(ref, dict) else None
+            index = ref.get('index') if isinstance(ref, dict) else None
+            if isinstance(index, int) and 0 <= index < len(textures):
+                source = textures[index].get('source')
+                if isinstance(source, int):
+                    roles.setdefault(source, set()).add(role)
+    return roles
+
+def decode_downsampled(data: bytes, max_size: int = DECODE_MAX_SIZE) -> Tuple[np.ndarray, Tuple[int, int], str]:
+    """Decodificar a lo sumo a ``max_size`` px de lado: (píxeles RGB 0-1, tamaño original, formato)"""
+    with Image.open(io.BytesIO(data)) as image:
+        original_size = image.size
+        image_format = image.format or 'desconocido'
+        image.draft('RGB', (max_size, max_size))
+        rgb = image.convert('RGB')
+        rgb.thumbnail((max_size, max_size), Image.Resampling.BILINEAR)
+        pixels = np.asarray(rgb, dtype=np.float32) / 255.0
+    return pixels, original_size, image_format
+
+def normal_map_stats(pixels: np.ndarray) -> Dict[str, Any]:
+    """Rugosidad y grosor del relieve a partir de un mapa de normales (tangent space)"""
+    normals = pixels[..., :3] * 2.0 - 1.0
+    normals /= np.maximum(np.linalg.norm(normals, axis=-1, keepdims=True), 1e-6)
+    deviation = np.degrees(np.arccos(np.clip(normals[..., 2], -1.0, 1.0)))
+    gradient_x = float(np.abs(np.diff(normals[..., :2], axis=1)).mean()) if pixels.shape[1] > 1 else 0.0
+    gradient_y = float(np.abs(np.diff(normals[..., :2], axis=0)).mean()) if pixels.shape[0] > 1 else 0.0
+    mean_deviation = float(deviation.mean())
+
+    if mean_deviation < SMOOTH_MAX_DEVIATION:
+        surface = 'lisa'
+    elif mean_deviation < TEXTURED_MAX_DEVIATION:
+        surface = 'texturizada'
+    else:
+        surface = 'rugosa'
+
+    return {
+        'kind': 'normal',
+        'bump_deviation_deg': round(mean_deviation, 3),
+        'bump_deviation_std': round(float(deviation.std()), 3),
+        'coarseness': round((gradient_x + gradient_y) / 2, 4),
+        'directionality': round(abs(gradient_x - gradient_y) / max(gradient_x + gradient_y, 1e-9), 4),
+        'surface_class': surface
+    }
+
+def color_stats(pixels: np.ndarray) -> Dict[str, Any]:
+    """Color medio, contraste y gradiente de luminancia"""
+    luminance = pixels[..., :3] @ LUMINANCE_WEIGHTS
+    gradient_x = float(np.abs(np.diff(luminance, axis=1)).mean()) if pixels.shape[1] > 1 else 0.0
+    gradient_y = float(np.abs(np.diff(luminance, axis=0)).mean()) if pixels.shape[0] > 1 else 0.0
+    return {
+        'kind': 'color',
+        'mean_color': [round(float(value), 4) for value in pixels[..., :3].mean(axis=(0, 1))],
+        'luminance_mean': round(float(luminance.mean()), 4),
+        'contrast': round(float(luminance.std()), 4),
+        'coarseness': round((gradient_x + gradient_y) / 2, 4)
+    }
+
+def is_normal_map(image: Dict[str, Any], roles: Set[str]) -> bool:
+    if 'normal' in roles:
+        return True
+    name = (image.get('name') or image.get('uri') or '').lower()
+    return any(hint in name for hint in NORMAL_NAME_HINTS)
+
+def analyze_image_bytes(data: bytes, normal: bool, max_size: int = DECODE_MAX_SIZE) -> Dict[str, Any]:
+    """Estadísticas de una imagen codificada (o el error de decodificación)"""
+    try:
+        pixels, original_size, image_format = decode_downsampled(data, max_size)
+    except (UnidentifiedImageError, OSError, ValueError, Image.DecompressionBombError) as e:
+        return {'error': f"No se pudo decodificar: {e}"}
+    stats = normal_map_stats(pixels) if normal else color_stats(pixels)
+    stats.update({
+        'format': image_format,
+        'original_size': list(original_size),
+        'decoded_size': [int(pixels.shape[1]), int(pixels.shape[0])]
+    })
+    return stats
+
+def analyze_texture_images(
+    gltf_data: Dict[str, Any],
+    buffers: GLTFBuffers,
+    cache: Optional[TextureStatsCache] = DEFAULT_TEXTURE_CACHE,
+    max_size: int = DECODE_MAX_SIZE,
+    max_workers: int = MAX_WORKERS,
+    cancel_token: CancellationToken = NEVER_CANCELLED
+) -> Dict[str, Any]:
+    """Analizar las imágenes del documento (las repetidas o ya cacheadas no se decodifican)"""
+    images = gltf_data.get('images', [])
+    if not images:
+        return {'available': False, 'images': 0}
+    if not PIL_AVAILABLE:
+        return {'available': False, 'images': len(images), 'reason': 'Pillow no disponible'}
+
+    roles = texture_roles(gltf_data)
+    names = [image.get('name') or image.get('uri', '')[:120] or f'image_{i}' for i, image in enumerate(images)]
+    kinds = ['normal' if is_normal_map(image, roles.get(i, set())) else 'color' for i, image in enumerate(images)]
+
+    def read(index: int) -> Tuple[Optional[bytes], Optional[str]]:
+        cancel_token.check()
+        data = buffers.read_image(index)
+        return data, content_hash(data) if data is not None else None
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='texture') as pool:
+        # Lectura y hash en paralelo; luego decodificar cada contenido único no cacheado
+        contents = list(pool.map(read, range(len(images))))
+        cancel_token.check()
+
+        keys = [
+            (digest, kind, max_size, TEXTURE_ANALYSIS_VERSION) if digest is not None else None
+            for (_, digest), kind in zip(contents, kinds)
+        ]
+        unique = list(dict.fromkeys(key for key in keys if key is not None))
+        known = cache.get_many(unique) if cache is not None else {}
+        pending = {key: contents[keys.index(key)][0] for key in unique if key not in known}
+
+        futures = {
+            key: pool.submit(_analyze_checked, data, key[1] == 'normal', max_size, cancel_token)
+            for key, data in pending.items()
+        }
+        try:
+            decoded = {key: future.result() for key, future in futures.items()}
+        except BaseException:
+            for future in futures.values():
+                future.cancel()
+            raise
+
+    if cache is not None:
+        cache.put_many([
+            (key, stats, names[keys.index(key)]) for key, stats in decoded.items() if 'error' not in stats
+        ])
+    hits = len(known)
+
+    details: Dict[str, Dict[str, Any]] = {}
+    unavailable: List[str] = []
+    surface_classes: Dict[str, int] = {}
+    errors = 0
+    for i, key in enumerate(keys):
+        if key is None:
+            unavailable.append(names[i])
+            continue
+        digest = key[0]
+        stats = decoded.get(key) or known.get(key) or {}
+        errors += 'error' in stats
+        if 'surface_class' in stats:
+            surface_classes[stats['surface_class']] = surface_classes.get(stats['surface_class'], 0) + 1
+        details[names[i]] = {'content_hash': digest, 'roles': sorted(roles.get(i, set())), **stats}
+
+    logger.debug("🖼️ Texturas: %d decodificadas, %d desde caché, %d no disponibles",
+                 len(decoded), hits, len(unavailable))
+    return {
+        'available': bool(details),
+        'images': len(images),
+        'analyzed': len(details) - errors,
+        'decoded': len(decoded),
+        'cache_hits': hits,
+        'unique_contents': len({detail['content_hash'] for detail in details.values()}),
+        'unavailable': unavailable,
+        'errors': errors,
+        'surface_classes': surface_classes,
+        'details': details
+    }
+
+def _analyze_checked(data: bytes, normal: bool, max_size: int, cancel_token: CancellationToken) -> Dict[str, Any]:
+    cancel_token.check()
+    return analyze_image_bytes(data, normal, max_size)